@@ -1 +1,2 @@
 from omnigibson.envs.env_base import Environment
+from omnigibson.envs.vec_env import EnvironmentInstance, VectorEnvironment
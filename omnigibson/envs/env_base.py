@@ -8,6 +8,7 @@ from omnigibson.tasks import REGISTERED_TASKS
 from omnigibson.scenes import REGISTERED_SCENES
 from omnigibson.utils.gym_utils import GymObservable, recursively_generate_flat_dict
 from omnigibson.utils.config_utils import parse_config
+from omnigibson.utils.profiling_utils import StepProfiler
 from omnigibson.utils.ui_utils import create_module_logger
 from omnigibson.utils.python_utils import assert_valid_key, merge_nested_dicts, create_class_from_registry_and_config,\
     Recreatable
@@ -195,7 +196,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
         Load robots into the scene
         """
         # Only actually load robots if no robot has been imported from the scene loading directly yet
-        if len(self.scene.robots) == 0:
+        if len(self.robots) == 0:
             assert og.sim.is_stopped(), "Simulator must be stopped before loading robots!"
 
             # Iterate over all robots to generate in the robot config
@@ -260,7 +261,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
 
         for robot in self.robots:
             # Load the observation space for the robot
-            obs_space[robot.name] = robot.load_observation_space()
+            obs_space[self._get_robot_key(robot)] = robot.load_observation_space()
 
         # Also load the task obs space
         obs_space["task"] = self._task.load_observation_space()
@@ -280,7 +281,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
         """
         Load action space for each robot
         """
-        action_space = gym.spaces.Dict({robot.name: robot.action_space for robot in self.robots})
+        action_space = gym.spaces.Dict({self._get_robot_key(robot): robot.action_space for robot in self.robots})
 
         # Convert into flattened 1D Box space if requested
         if self._flatten_action_space:
@@ -341,7 +342,7 @@ class Environment(gym.Env, GymObservable, Recreatable):
 
         # Grab all observations from each robot
         for robot in self.robots:
-            obs[robot.name] = robot.get_obs()
+            obs[self._get_robot_key(robot)] = robot.get_obs()
 
         # Add task observations
         obs["task"] = self._task.get_obs(env=self)
@@ -381,42 +382,87 @@ class Environment(gym.Env, GymObservable, Recreatable):
                 - bool: done, i.e. whether this episode is terminated
                 - dict: info, i.e. dictionary with any useful information
         """
+        with StepProfiler.profile("env.step"):
+            self._pre_step(action)
+
+            # Run simulation step
+            og.sim.step()
+
+            obs, reward, done, info = self._post_step(action)
+
+        return obs, reward, done, info
+
+    def _get_robot_key(self, robot):
+        """
+        Args:
+            robot (BaseRobot): Robot in this environment
+
+        Returns:
+            str: Key under which @robot's actions and observations are stored
+        """
+        return robot.name
+
+    def _pre_step(self, action):
+        """
+        Applies robot actions @action, i.e.: everything in step() that happens before the simulator is stepped
+
+        Args:
+            action (gym.spaces.Dict or dict or np.array): robot actions, as specified in step()
+        """
         # If the action is not a dictionary, convert into a dictionary
         if not isinstance(action, dict) and not isinstance(action, gym.spaces.Dict):
             action_dict = dict()
             idx = 0
             for robot in self.robots:
                 action_dim = robot.action_dim
-                action_dict[robot.name] = action[idx: idx + action_dim]
+                action_dict[self._get_robot_key(robot)] = action[idx: idx + action_dim]
                 idx += action_dim
         else:
             # Our inputted action is the action dictionary
             action_dict = action
 
         # Iterate over all robots and apply actions
-        for robot in self.robots:
-            robot.apply_action(action_dict[robot.name])
+        with StepProfiler.profile("env.apply_action"):
+            for robot in self.robots:
+                robot.apply_action(action_dict[self._get_robot_key(robot)])
 
-        # Run simulation step
-        og.sim.step()
+    def _post_step(self, action):
+        """
+        Computes the step outputs after robot actions @action were applied and the simulator was stepped, i.e.:
+        everything in step() that happens after the simulator is stepped
+
+        Args:
+            action (gym.spaces.Dict or dict or np.array): robot actions, as specified in step()
 
+        Returns:
+            4-tuple: (obs, reward, done, info), as returned by step()
+        """
         # Grab observations
-        obs = self.get_obs()
+        with StepProfiler.profile("env.get_obs"):
+            obs = self.get_obs()
 
         # Grab reward, done, and info, and populate with internal info
-        reward, done, info = self.task.step(self, action)
+        with StepProfiler.profile("env.task_step"):
+            reward, done, info = self.task.step(self, action)
         self._populate_info(info)
 
         if done and self._automatic_reset:
             # Add lost observation to our information dict, and reset
             info["last_observation"] = obs
-            obs = self.reset()
+            with StepProfiler.profile("env.reset"):
+                obs = self.reset()
 
         # Increment step
         self._current_step += 1
 
         return obs, reward, done, info
 
+    def reset_scene(self):
+        """
+        Resets the scene this environment runs in. Default is the normal scene reset
+        """
+        self.scene.reset()
+
     def _reset_variables(self):
         """
         Reset bookkeeping variables for the next new episode.
@@ -429,15 +475,30 @@ class Environment(gym.Env, GymObservable, Recreatable):
         """
         Reset episode.
         """
+        self._pre_reset()
+
+        # Run a single simulator step to make sure we can grab updated observations
+        og.sim.step()
+
+        return self._post_reset()
+
+    def _pre_reset(self):
+        """
+        Resets the task and internal variables, i.e.: everything in reset() that happens before the simulator is stepped
+        """
         # Reset the task
         self.task.reset(self)
 
         # Reset internal variables
         self._reset_variables()
 
-        # Run a single simulator step to make sure we can grab updated observations
-        og.sim.step()
+    def _post_reset(self):
+        """
+        Grabs the observations after resetting, i.e.: everything in reset() that happens after the simulator is stepped
 
+        Returns:
+            dict: Keyword-mapped observations, which are possibly nested
+        """
         # Grab and return observations
         obs = self.get_obs()
 
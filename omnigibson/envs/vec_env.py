@@ -0,0 +1,314 @@
+from copy import deepcopy
+
+import gym
+import numpy as np
+
+import omnigibson as og
+from omnigibson.macros import create_module_macros
+from omnigibson.envs.env_base import Environment
+from omnigibson.utils.gym_utils import recursively_stack_dicts
+from omnigibson.utils.profiling_utils import StepProfiler
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Distance (in meters) between the origins of neighboring environment instances, which are laid out on a square grid
+m.INSTANCE_SPACING = 10.0
+
+
+class EnvironmentInstance(Environment):
+    """
+    Single environment instance hosted by a VectorEnvironment. All instances share the same stage and scene, and each
+    instance owns its own robot(s), object(s), and task, offset by its own origin within the scene. Robot and object
+    names are suffixed with the instance index to keep them unique within the scene, while observations and actions
+    are keyed by the un-suffixed names so that all instances share the same observation / action spaces.
+
+    Note that this instance should not be stepped on its own, since stepping the simulator steps all instances
+    """
+    def __init__(
+        self,
+        configs,
+        instance_idn,
+        origin,
+        **kwargs,
+    ):
+        """
+        Args:
+            configs (str or dict or list of str or dict): config_file path(s) or raw config dictionaries.
+                If multiple configs are specified, they will be merged sequentially in the order specified.
+            instance_idn (int): Index of this instance. The instance with index 0 loads the scene shared by all
+                instances, while all other instances are loaded into the already existing scene
+            origin (3-array): (x,y,z) global position of this instance's origin. All robot and object positions
+                specified in @configs are interpreted relative to this origin
+            kwargs (dict): Additional keyword arguments to pass to the Environment constructor
+        """
+        # Store inputs
+        self._instance_idn = instance_idn
+        self._origin = np.array(origin, dtype=float)
+
+        # Initialize other placeholders that will be filled in later
+        self._robot_keys = None                 # Maps (suffixed) robot names to their un-suffixed names
+        self._objects = None                    # Objects (including robots) owned by this instance
+
+        # Run super
+        super().__init__(configs=configs, **kwargs)
+
+    def _load_variables(self):
+        # Run super first
+        super()._load_variables()
+
+        # Instances are only separated by their origins, so the shared scene must not load any objects itself
+        assert self.scene_config["type"] == "Scene", \
+            f"Environment instances can only share a plain Scene, got {self.scene_config['type']}!"
+
+        # Make the robot / object names unique and offset their positions by this instance's origin. This is only done
+        # once, since the config is modified in-place
+        if self._robot_keys is None:
+            self._robot_keys = dict()
+            for i, robot_config in enumerate(self.robots_config):
+                name = robot_config.get("name", f"robot{i}")
+                robot_config["name"] = f"{name}_{self._instance_idn}"
+                robot_config["position"] = self._get_global_position(position=robot_config.get("position", None))
+                self._robot_keys[robot_config["name"]] = name
+            for i, obj_config in enumerate(self.objects_config):
+                obj_config["name"] = f"{obj_config.get('name', f'obj{i}')}_{self._instance_idn}"
+                obj_config["position"] = self._get_global_position(position=obj_config.get("position", None))
+
+    def _get_global_position(self, position):
+        """
+        Args:
+            position (None or 3-array): (x,y,z) position relative to this instance's origin. None corresponds to the
+                origin itself
+
+        Returns:
+            3-array: (x,y,z) global position corresponding to @position
+        """
+        return self._origin.copy() if position is None else self._origin + np.array(position)
+
+    def load(self):
+        """
+        Load this instance's robot(s), object(s), and task, as well as the shared scene if this is the first instance.
+
+        Note: Unlike Environment.load(), this does not reset the instance or load the observation / action spaces, since
+            this requires all instances to be loaded first. See finish_load()
+        """
+        # This environment is not loaded
+        self._loaded = False
+
+        # Load config variables
+        self._load_variables()
+
+        # Only the first instance loads the scene, all others are loaded into the existing scene
+        if self._instance_idn == 0:
+            self._load_scene()
+
+        # Load the robots, objects, and task, keeping track of which objects were added by this instance
+        objs_before = set(self.scene.objects)
+        self._load_robots()
+        self._load_objects()
+        self._load_task()
+        self._objects = [obj for obj in self.scene.objects if obj not in objs_before]
+
+    def finish_load(self):
+        """
+        Resets this instance and loads its observation / action spaces. Should be called once all instances are loaded,
+        while the simulator is playing
+
+        Returns:
+            dict: Keyword-mapped observations after resetting, which are possibly nested
+        """
+        obs = self.reset()
+
+        # Load the obs / action spaces
+        self.load_observation_space()
+        self._load_action_space()
+
+        # Denote that the instance is loaded
+        self._loaded = True
+
+        return obs
+
+    def reset_scene(self):
+        # Only reset the objects owned by this instance, so that the other instances are not affected
+        self.scene.reset_objects(objs=self._objects)
+
+    def _get_robot_key(self, robot):
+        return self._robot_keys[robot.name]
+
+    @property
+    def instance_idn(self):
+        """
+        Returns:
+            int: Index of this instance
+        """
+        return self._instance_idn
+
+    @property
+    def origin(self):
+        """
+        Returns:
+            3-array: (x,y,z) global position of this instance's origin
+        """
+        return self._origin
+
+    @property
+    def objects(self):
+        """
+        Returns:
+            list of BaseObject: Objects (including robots) owned by this instance
+        """
+        return self._objects
+
+    @property
+    def robots(self):
+        """
+        Returns:
+            list of BaseRobot: Robots owned by this instance
+        """
+        return [robot for robot in self.scene.robots if robot.name in self._robot_keys]
+
+
+class VectorEnvironment:
+    """
+    Vectorized environment hosting multiple environment instances side by side within a single stage and scene, all of
+    which are stepped with a single simulator step. Observations, rewards, and dones are returned as batched arrays,
+    with the batch dimension first, and instances whose episode finished are automatically reset.
+
+    Note: The scene itself cannot be cloned, so all instances share the same scene and its objects, while each
+        instance owns its own robot(s), object(s), and task. Instances are laid out on a square grid with
+        m.INSTANCE_SPACING meters between neighboring origins, so only the plain Scene (with a floor plane) is
+        supported, and tasks must not import any objects with fixed names.
+
+        Since the simulator is shared, any simulator step taken while resetting an instance (e.g.: by a task that
+        settles its objects with og.sim.step() during reset) also steps all other instances with their previously
+        deployed actions. Such tasks are not rejected, but their instances are not independent during resets.
+    """
+    def __init__(
+        self,
+        num_envs,
+        configs,
+        action_timestep=1 / 60.0,
+        physics_timestep=1 / 60.0,
+        device=None,
+        automatic_reset=True,
+        flatten_action_space=False,
+        flatten_obs_space=False,
+    ):
+        """
+        Args:
+            num_envs (int): Number of environment instances to host
+            configs (str or dict or list of str or dict): config_file path(s) or raw config dictionaries shared by all
+                instances. If multiple configs are specified, they will be merged sequentially in the order specified.
+            action_timestep (float): environment executes action per action_timestep second
+            physics_timestep: physics timestep for physx
+            device (None or str): specifies the device to be used if running on the gpu with torch backend
+            automatic_reset (bool): whether to automatically reset each instance after its episode finishes
+            flatten_action_space (bool): whether to flatten the action space of each instance as a single 1D-array
+            flatten_obs_space (bool): whether the observation space of each instance should be flattened when generated
+        """
+        assert num_envs > 0, "Must host at least one environment instance!"
+        self.num_envs = num_envs
+        self._automatic_reset = automatic_reset
+
+        # Load all instances, which requires the simulator to be stopped. Each instance modifies its config in-place,
+        # so each one gets its own copy
+        n_cols = int(np.ceil(np.sqrt(num_envs)))
+        self.envs = []
+        for i in range(num_envs):
+            og.sim.stop()
+            self.envs.append(EnvironmentInstance(
+                configs=deepcopy(configs),
+                instance_idn=i,
+                origin=np.array([i % n_cols, i // n_cols, 0]) * m.INSTANCE_SPACING,
+                action_timestep=action_timestep,
+                physics_timestep=physics_timestep,
+                device=device,
+                automatic_reset=False,
+                flatten_action_space=flatten_action_space,
+                flatten_obs_space=flatten_obs_space,
+            ))
+
+        # Reset all instances and load the (batched) observation / action spaces
+        og.sim.play()
+        for env in self.envs:
+            env.finish_load()
+        self.single_observation_space = self.envs[0].observation_space
+        self.single_action_space = self.envs[0].action_space
+        self.observation_space = gym.vector.utils.batch_space(self.single_observation_space, n=num_envs)
+        self.action_space = gym.vector.utils.batch_space(self.single_action_space, n=num_envs)
+
+    def step(self, actions):
+        """
+        Apply each instance's actions @actions and step all instances with a single simulator step
+
+        Args:
+            actions (n-array or list): per-instance robot actions, e.g.: a (num_envs, action_dim) array if the action
+                space is flattened. Each entry should be an action as specified in Environment.step()
+
+        Returns:
+            4-tuple:
+                - dict: batched next observations, with the batch dimension first
+                - n-array: (num_envs,) rewards at the current timestep
+                - n-array: (num_envs,) whether each instance's episode is terminated
+                - list of dict: info of each instance. If an instance was automatically reset, the observation before
+                    resetting is stored under "last_observation"
+        """
+        assert len(actions) == self.num_envs, f"Expected {self.num_envs} actions, got {len(actions)} instead!"
+        with StepProfiler.profile("vec_env.step"):
+            for env, action in zip(self.envs, actions):
+                env._pre_step(action)
+
+            # Run a single simulation step for all instances
+            og.sim.step()
+
+            obs, rewards, dones, infos = [], [], [], []
+            for env, action in zip(self.envs, actions):
+                env_obs, reward, done, info = env._post_step(action)
+                obs.append(env_obs)
+                rewards.append(reward)
+                dones.append(done)
+                infos.append(info)
+
+            # Reset the instances whose episode finished
+            if self._automatic_reset and any(dones):
+                with StepProfiler.profile("vec_env.reset"):
+                    reset_idxs = [i for i, done in enumerate(dones) if done]
+                    for i in reset_idxs:
+                        infos[i]["last_observation"] = obs[i]
+                        self.envs[i]._pre_reset()
+
+                    # Only render instead of stepping, so that the instances that are not reset do not advance
+                    og.sim.render()
+                    for i in reset_idxs:
+                        obs[i] = self.envs[i]._post_reset()
+
+        return recursively_stack_dicts(dics=obs), np.array(rewards, dtype=float), np.array(dones, dtype=bool), infos
+
+    def reset(self):
+        """
+        Reset all instances
+
+        Returns:
+            dict: batched observations after resetting, with the batch dimension first
+        """
+        for env in self.envs:
+            env._pre_reset()
+
+        # Run a single simulator step to make sure we can grab updated observations
+        og.sim.step()
+
+        return recursively_stack_dicts(dics=[env._post_reset() for env in self.envs])
+
+    def close(self):
+        """
+        Clean up the environment and shut down the simulation.
+        """
+        og.shutdown()
+
+    @property
+    def scene(self):
+        """
+        Returns:
+            Scene: Scene shared by all instances
+        """
+        return og.sim.scene
@@ -66,6 +66,9 @@ gm.ENABLE_OBJECT_STATES = True
 # Whether to enable transition rules or not
 gm.ENABLE_TRANSITION_RULES = True
 
+# Whether to record per-phase timings of every simulator / environment step. See omnigibson/utils/profiling_utils.py
+gm.ENABLE_PROFILING = (os.getenv("OMNIGIBSON_ENABLE_PROFILING", 'False').lower() in ('true', '1', 't'))
+
 # Default settings for the omni UI viewer
 gm.DEFAULT_VIEWER_WIDTH = 1280
 gm.DEFAULT_VIEWER_HEIGHT = 720
@@ -1,3 +1,4 @@
+import hashlib
 import os
 
 import numpy as np
@@ -44,6 +45,13 @@ class SegmentationMap(BaseMap):
         self.room_ins_map = None
         self.room_sem_map = None
 
+        # Room pixel indices, mapped from room id. The flattened indices of all pixels of room id i are stored in
+        # self._[...]_pixels[self._[...]_offsets[i]:self._[...]_offsets[i + 1]]
+        self._sem_pixels = None
+        self._sem_offsets = None
+        self._ins_pixels = None
+        self._ins_offsets = None
+
         # Run super call
         super().__init__(map_resolution=map_resolution)
 
@@ -67,14 +75,17 @@ class SegmentationMap(BaseMap):
         with open(room_categories, "r") as fp:
             room_cats = [line.rstrip() for line in fp.readlines()]
 
+        self._sem_pixels, self._sem_offsets, self._ins_pixels, self._ins_offsets = \
+            self.build_room_indices(layout_dir=layout_dir, img_sem=img_sem, img_ins=img_ins)
+
         sem_id_to_ins_id = {}
-        unique_ins_ids = np.unique(img_ins)
-        unique_ins_ids = np.delete(unique_ins_ids, 0)
-        for ins_id in unique_ins_ids:
-            # find one pixel for each ins id
-            x, y = np.where(img_ins == ins_id)
-            # retrieve the correspounding sem id
-            sem_id = img_sem[x[0], y[0]]
+        ins_counts = np.diff(self._ins_offsets)
+        for ins_id in np.nonzero(ins_counts)[0]:
+            # valid ids start from 1
+            if ins_id == 0:
+                continue
+            # find the first pixel (in row-major order) for each ins id and retrieve the corresponding sem id
+            sem_id = img_sem.flat[self._ins_pixels[self._ins_offsets[ins_id]]]
             if sem_id not in sem_id_to_ins_id:
                 sem_id_to_ins_id[sem_id] = []
             sem_id_to_ins_id[sem_id].append(ins_id)
@@ -103,6 +114,114 @@ class SegmentationMap(BaseMap):
 
         return map_size
 
+    @staticmethod
+    def build_room_indices(layout_dir, img_sem, img_ins):
+        """
+        Builds flat per-room pixel indices for the semantic and instance segmentation maps, such that the pixels of
+        any room can be looked up without scanning the whole map
+
+        The indices are cached in @layout_dir as an .npz file, keyed by a hash of @img_sem and @img_ins. Since both
+        maps have already been resized, this key changes whenever the map images or resolution change.
+
+        Args:
+            layout_dir (str): Path to the folder containing the segmentation maps
+            img_sem ((H, W)-array): semantic segmentation map in image form
+            img_ins ((H, W)-array): instance segmentation map in image form
+
+        Returns:
+            4-tuple:
+                - (H * W)-array: flattened indices of all pixels of @img_sem, sorted (stably) by semantic id
+                - (S + 1)-array: offsets into the sorted pixels of each semantic id, where S is the max semantic id + 1
+                - (H * W)-array: flattened indices of all pixels of @img_ins, sorted (stably) by instance id
+                - (I + 1)-array: offsets into the sorted pixels of each instance id, where I is the max instance id + 1
+        """
+        map_hash = hashlib.md5(img_sem.tobytes() + img_ins.tobytes()).hexdigest()
+        index_file = os.path.join(layout_dir, "floor_seg_index_0_{}_{}.npz".format(img_sem.shape[0], map_hash[:16]))
+        if os.path.isfile(index_file):
+            with np.load(index_file) as data:
+                return data["sem_pixels"], data["sem_offsets"], data["ins_pixels"], data["ins_offsets"]
+
+        indices = []
+        for img in (img_sem, img_ins):
+            ids = img.ravel().astype(np.int64)
+            # A stable sort keeps the pixels of each room in row-major order
+            pixels = np.argsort(ids, kind="stable")
+            offsets = np.concatenate([[0], np.cumsum(np.bincount(ids))])
+            indices.extend([pixels, offsets])
+
+        # Write to a temporary file first so that concurrent loaders never see a partially written cache
+        tmp_file = "{}.{}.tmp.npz".format(index_file[:-4], os.getpid())
+        try:
+            np.savez_compressed(tmp_file, sem_pixels=indices[0], sem_offsets=indices[1], ins_pixels=indices[2],
+                                ins_offsets=indices[3])
+            os.replace(tmp_file, index_file)
+        except OSError as e:
+            log.warning("Failed to cache room segmentation indices to {}: {}".format(index_file, e))
+
+        return tuple(indices)
+
+    def _sample_room_pixel(self, pixels, offsets, room_id):
+        """
+        Samples a random pixel of room id @room_id
+
+        Args:
+            pixels (array): flattened pixel indices sorted by room id, see build_room_indices()
+            offsets (array): offsets into @pixels of each room id, see build_room_indices()
+            room_id (int): room id to sample a pixel from
+
+        Returns:
+            2-array: (row, col) randomly sampled pixel of room id @room_id
+        """
+        start, end = offsets[room_id], offsets[room_id + 1]
+        return np.array(np.unravel_index(pixels[np.random.randint(start, end)], self.room_sem_map.shape))
+
+    def _get_room_ids_by_points(self, room_map, xys):
+        """
+        Looks up the room ids of all points @xys on the room segmentation map @room_map in one gather
+
+        Args:
+            room_map ((H, W)-array): semantic or instance room segmentation map
+            xys ((N, 2)-array): 2D locations in world reference frame (in metric space)
+
+        Returns:
+            (N,)-array: room id at each point in @xys, where 0 corresponds to a room boundary or a point that is not
+                on the room segmentation map
+        """
+        xys = np.array(xys, dtype=float).reshape(-1, 2)
+        map_xys = np.flip(xys / self.map_resolution + self.map_size / 2.0, axis=1).astype(int)
+        on_map = np.all((map_xys >= 0) & (map_xys < np.array(room_map.shape)), axis=1)
+        room_ids = np.zeros(len(xys), dtype=room_map.dtype)
+        room_ids[on_map] = room_map[map_xys[on_map, 0], map_xys[on_map, 1]]
+        return room_ids
+
+    def get_room_types_by_points(self, xys):
+        """
+        Return the room types given a batch of points
+
+        Args:
+            xys ((N, 2)-array): 2D locations in world reference frame (in metric space)
+
+        Returns:
+            list of (None or str): room type that each point is in, or None if the point is not on the room
+                segmentation map
+        """
+        return [self.room_sem_id_to_sem_name[sem_id] if sem_id != 0 else None
+                for sem_id in self._get_room_ids_by_points(self.room_sem_map, xys)]
+
+    def get_room_instances_by_points(self, xys):
+        """
+        Return the room instances given a batch of points
+
+        Args:
+            xys ((N, 2)-array): 2D locations in world reference frame (in metric space)
+
+        Returns:
+            list of (None or str): room instance that each point is in, or None if the point is not on the room
+                segmentation map
+        """
+        return [self.room_ins_id_to_ins_name[ins_id] if ins_id != 0 else None
+                for ins_id in self._get_room_ids_by_points(self.room_ins_map, xys)]
+
     def get_random_point_by_room_type(self, room_type):
         """
         Sample a random point on the given a specific room type @room_type.
@@ -120,8 +239,7 @@ class SegmentationMap(BaseMap):
             return None, None
 
         sem_id = self.room_sem_name_to_sem_id[room_type]
-        valid_idx = np.array(np.where(self.room_sem_map == sem_id))
-        random_point_map = valid_idx[:, np.random.randint(valid_idx.shape[1])]
+        random_point_map = self._sample_room_pixel(self._sem_pixels, self._sem_offsets, sem_id)
 
         x, y = self.map_to_world(random_point_map)
         # assume only 1 floor
@@ -146,8 +264,7 @@ class SegmentationMap(BaseMap):
             return None, None
 
         ins_id = self.room_ins_name_to_ins_id[room_instance]
-        valid_idx = np.array(np.where(self.room_ins_map == ins_id))
-        random_point_map = valid_idx[:, np.random.randint(valid_idx.shape[1])]
+        random_point_map = self._sample_room_pixel(self._ins_pixels, self._ins_offsets, ins_id)
 
         x, y = self.map_to_world(random_point_map)
         # assume only 1 floor
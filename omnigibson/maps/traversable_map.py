@@ -1,19 +1,37 @@
+import hashlib
 import os
-import pickle
-import sys
+from collections import OrderedDict
 
 import cv2
-import networkx as nx
 import numpy as np
 from PIL import Image
+from scipy.sparse import csr_matrix
 
+from omnigibson.macros import create_module_macros
 from omnigibson.maps.map_base import BaseMap
-import omnigibson.utils.transform_utils as T
+from omnigibson.utils.grid_utils import (
+    astar_grid,
+    build_grid_adjacency,
+    compute_distance_field,
+    get_largest_connected_component,
+    get_nearest_traversable_pixel,
+    get_nearest_traversable_pixels,
+    trace_distance_field,
+)
 from omnigibson.utils.ui_utils import create_module_logger
 
 # Create module logger
 log = create_module_logger(module_name=__name__)
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Maximum number of geodesic distance fields kept in memory. Least recently used fields are evicted first
+m.DISTANCE_FIELD_CACHE_SIZE = 32
+# If specified, directory in which computed distance fields are additionally stored, so that they can be shared
+# across processes and runs. None disables the on-disk store
+m.DISTANCE_FIELD_CACHE_DIR = None
+
 
 class TraversableMap(BaseMap):
     """
@@ -54,6 +72,12 @@ class TraversableMap(BaseMap):
         self.floor_heights = None
         self.floor_map = None
         self.floor_graph = None
+        self.floor_graph_nodes = None
+        self.floor_nearest_trav_pixels = None
+        self.floor_map_hashes = None
+
+        # Cache of (floor, target pixel) -> geodesic distance field, in least to most recently used order
+        self._distance_fields = OrderedDict()
 
         # Run super method
         super().__init__(map_resolution=map_resolution)
@@ -75,6 +99,11 @@ class TraversableMap(BaseMap):
 
         self.floor_heights = floor_heights
         self.floor_map = []
+        self.floor_graph = []
+        self.floor_graph_nodes = []
+        self.floor_nearest_trav_pixels = []
+        self.floor_map_hashes = []
+        self._distance_fields = OrderedDict()
         map_size = None
         for floor in range(len(self.floor_heights)):
             if self.trav_map_with_objects:
@@ -108,68 +137,65 @@ class TraversableMap(BaseMap):
             # We search for the largest connected areas
             if self.build_graph:
                 # Directly set map size
-                self.floor_graph = self.build_trav_graph(map_size, maps_path, floor, trav_map)
+                self.floor_graph.append(self.build_trav_graph(map_size, maps_path, floor, trav_map))
+                self.floor_graph_nodes.append(np.flatnonzero(trav_map))
+                self.floor_map_hashes.append(hashlib.md5(trav_map.tobytes()).hexdigest())
+
+                # Precompute the closest traversable pixel for every pixel, so that shortest path queries starting or
+                # ending at non-traversable locations can be snapped onto the map with a single lookup
+                self.floor_nearest_trav_pixels.append(get_nearest_traversable_pixels(trav_map))
 
             self.floor_map.append(trav_map)
 
         return map_size
 
-    # TODO: refactor into C++ for speedup
     @staticmethod
     def build_trav_graph(map_size, maps_path, floor, trav_map):
         """
         Build traversibility graph and only take the largest connected component
 
+        The graph is cached in @maps_path as a compressed .npz file storing its nodes and CSR adjacency, keyed by a
+        hash of @trav_map. Since @trav_map has already been resized and eroded, this key changes whenever the map
+        image, resolution or erosion changes, and it is independent of the running python version.
+
         Args:
             map_size (int): Size of the map being generated
             maps_path (str): Path to the folder containing the traversability maps
             floor (int): floor number
             trav_map ((H, W)-array): traversability map in image form
+
+        Returns:
+            csr_matrix: (N, N) weighted 8-connected adjacency matrix between the N nodes of the graph, where node i
+                corresponds to the i-th traversable pixel of the updated @trav_map in row-major order
         """
-        floor_graph = []
-        graph_file = os.path.join(
-            maps_path, "floor_trav_{}_py{}{}.p".format(floor, sys.version_info.major, sys.version_info.minor)
-        )
+        assert trav_map.shape == (map_size, map_size), "trav map does not match the requested map size"
+        map_hash = hashlib.md5(trav_map.tobytes()).hexdigest()
+        graph_file = os.path.join(maps_path, "floor_trav_{}_{}_{}.npz".format(floor, map_size, map_hash[:16]))
         if os.path.isfile(graph_file):
             log.info("Loading traversable graph")
-            with open(graph_file, "rb") as pfile:
-                g = pickle.load(pfile)
+            with np.load(graph_file) as data:
+                nodes = data["nodes"]
+                g = csr_matrix((data["data"], data["indices"], data["indptr"]), shape=(len(nodes), len(nodes)))
         else:
             log.info("Building traversable graph")
-            g = nx.Graph()
-            for i in range(map_size):
-                for j in range(map_size):
-                    if trav_map[i, j] == 0:
-                        continue
-                    g.add_node((i, j))
-                    # 8-connected graph
-                    neighbors = [(i - 1, j - 1), (i, j - 1), (i + 1, j - 1), (i - 1, j)]
-                    for n in neighbors:
-                        if (
-                            0 <= n[0] < map_size
-                            and 0 <= n[1] < map_size
-                            and trav_map[n[0], n[1]] > 0
-                        ):
-                            g.add_edge(n, (i, j), weight=T.l2_distance(n, (i, j)))
-
             # only take the largest connected component
-            largest_cc = max(nx.connected_components(g), key=len)
-            g = g.subgraph(largest_cc).copy()
-            with open(graph_file, "wb") as pfile:
-                pickle.dump(g, pfile)
-
-        floor_graph.append(g)
+            largest_cc = get_largest_connected_component(trav_map)
+            nodes, g = build_grid_adjacency(largest_cc)
+            # Write to a temporary file first so that concurrent loaders never see a partially written cache
+            tmp_file = "{}.{}.tmp.npz".format(graph_file[:-4], os.getpid())
+            try:
+                np.savez_compressed(tmp_file, nodes=nodes, data=g.data, indices=g.indices, indptr=g.indptr)
+                os.replace(tmp_file, graph_file)
+            except OSError as e:
+                log.warning("Failed to cache traversable graph to {}: {}".format(graph_file, e))
 
         # update trav_map accordingly
         # This overwrites the traversability map loaded before
         # It sets everything to zero, then only sets to one the points where we have graph nodes
-        # Dangerous! if the traversability graph is not computed from the loaded map but from a file, it could overwrite
-        # it silently.
         trav_map[:, :] = 0
-        for node in g.nodes:
-            trav_map[node[0], node[1]] = 255
+        trav_map.flat[nodes] = 255
 
-        return floor_graph
+        return g
 
     @property
     def n_floors(self):
@@ -208,21 +234,128 @@ class TraversableMap(BaseMap):
             floor: floor number
             world_xy: 2D location in world reference frame (metric)
         """
-        map_xy = tuple(self.world_to_map(world_xy))
-        g = self.floor_graph[floor]
-        return g.has_node(map_xy)
+        map_xy = self.world_to_map(world_xy)
+        trav_map = self.floor_map[floor]
+        return bool(
+            0 <= map_xy[0] < trav_map.shape[0] and 0 <= map_xy[1] < trav_map.shape[1] and trav_map[tuple(map_xy)] > 0
+        )
 
-    def get_shortest_path(self, floor, source_world, target_world, entire_path=False):
+    def _get_nearest_traversable_pixel(self, floor, map_xy):
+        """
+        Args:
+            floor (int): floor number
+            map_xy (2-array): (row, col) location in map reference frame, possibly non-traversable or out of bounds
+
+        Returns:
+            2-array: (row, col) closest traversable pixel to @map_xy on floor @floor
+        """
+        return get_nearest_traversable_pixel(self.floor_map[floor], self.floor_nearest_trav_pixels[floor], map_xy)
+
+    def _get_distance_field(self, floor, target_node):
+        """
+        Grabs the geodesic distance field towards traversable pixel @target_node, loading it from the in-memory
+        cache or the on-disk store (if m.DISTANCE_FIELD_CACHE_DIR is set) when available, and computing it otherwise
+
+        Args:
+            floor (int): floor number
+            target_node (2-array): (row, col) traversable target pixel
+
+        Returns:
+            2-tuple:
+                - (H * W)-array: geodesic distance (in pixels) from every pixel to @target_node
+                - (H * W)-array: flattened index of the next pixel towards @target_node for every pixel
+        """
+        map_size = self.floor_map[floor].shape
+        target = int(target_node[0]) * map_size[1] + int(target_node[1])
+        key = (floor, target)
+        if key in self._distance_fields:
+            self._distance_fields.move_to_end(key)
+            return self._distance_fields[key]
+
+        field_file = None
+        if m.DISTANCE_FIELD_CACHE_DIR is not None:
+            field_file = os.path.join(
+                m.DISTANCE_FIELD_CACHE_DIR, "dist_field_{}_{}.npz".format(self.floor_map_hashes[floor][:16], target)
+            )
+
+        if field_file is not None and os.path.isfile(field_file):
+            with np.load(field_file) as data:
+                field = (data["dist_field"], data["next_pixels"])
+        else:
+            field = compute_distance_field(self.floor_graph[floor], self.floor_graph_nodes[floor], map_size, target)
+            if field_file is not None:
+                # Write to a temporary file first so that concurrent readers never see a partially written field
+                tmp_file = "{}.{}.tmp.npz".format(field_file[:-4], os.getpid())
+                try:
+                    os.makedirs(m.DISTANCE_FIELD_CACHE_DIR, exist_ok=True)
+                    np.savez(tmp_file, dist_field=field[0], next_pixels=field[1])
+                    os.replace(tmp_file, field_file)
+                except OSError as e:
+                    log.warning("Failed to store distance field to {}: {}".format(field_file, e))
+
+        self._distance_fields[key] = field
+        while len(self._distance_fields) > m.DISTANCE_FIELD_CACHE_SIZE:
+            self._distance_fields.popitem(last=False)
+
+        return field
+
+    def get_geodesic_distance_field(self, floor, target_world):
+        """
+        Get the dense geodesic distance field towards a target point. The field is computed with a single Dijkstra
+        flood over the traversability graph and cached, so that repeated queries towards the same target are free.
+
+        Args:
+            floor (int): floor number
+            target_world (2-array): (x,y) 2D target location in world reference frame (metric)
+
+        Returns:
+            (H, W)-array: geodesic distance (metric) from every pixel of the map to @target_world. Pixels that
+                are not traversable are set to inf
+        """
+        assert self.build_graph, "cannot get geodesic distance field without building the graph"
+        target_map = self.world_to_map(target_world)
+        target_node = self._get_nearest_traversable_pixel(floor, target_map)
+        dist_field, _ = self._get_distance_field(floor, target_node)
+        target_offset = np.linalg.norm(target_node - target_map)
+        return (dist_field.reshape(self.floor_map[floor].shape) + target_offset) * self.map_resolution
+
+    def get_geodesic_distance(self, floor, source_world, target_world):
+        """
+        Get the geodesic distance from one point to another point. This is an O(1) lookup into the cached
+        geodesic distance field towards @target_world, and is consistent with the distance returned by
+        get_shortest_path()
+
+        Args:
+            floor (int): floor number
+            source_world (2-array): (x,y) 2D source location in world reference frame (metric)
+            target_world (2-array): (x,y) 2D target location in world reference frame (metric)
+
+        Returns:
+            float: geodesic distance between @source_world and @target_world
+        """
+        assert self.build_graph, "cannot get geodesic distance without building the graph"
+        source_map = self.world_to_map(source_world)
+        target_map = self.world_to_map(target_world)
+        source_node = self._get_nearest_traversable_pixel(floor, source_map)
+        target_node = self._get_nearest_traversable_pixel(floor, target_map)
+        dist_field, _ = self._get_distance_field(floor, target_node)
+        dist = dist_field[int(source_node[0]) * self.floor_map[floor].shape[1] + int(source_node[1])]
+        dist += np.linalg.norm(source_node - source_map) + np.linalg.norm(target_node - target_map)
+        return dist * self.map_resolution
+
+    def get_shortest_path(self, floor, source_world, target_world, entire_path=False, use_distance_field=False):
         """
         Get the shortest path from one point to another point.
-        If any of the given point is not in the graph, add it to the graph and
-        create an edge between it to its closest node.
+        If any of the given point is not traversable, it is connected to its closest traversable point.
 
         Args:
             floor (int): floor number
             source_world (2-array): (x,y) 2D source location in world reference frame (metric)
             target_world (2-array): (x,y) 2D target location in world reference frame (metric)
             entire_path (bool): whether to return the entire path
+            use_distance_field (bool): whether to answer the query from the cached geodesic distance field towards
+                @target_world (see get_geodesic_distance_field()) instead of running an A* search. This is much
+                faster when many queries share the same target, e.g.: a fixed navigation goal
 
         Returns:
             2-tuple:
@@ -230,25 +363,37 @@ class TraversableMap(BaseMap):
                 - float: geodesic distance of the path
         """
         assert self.build_graph, "cannot get shortest path without building the graph"
-        source_map = tuple(self.world_to_map(source_world))
-        target_map = tuple(self.world_to_map(target_world))
-
-        g = self.floor_graph[floor]
-
-        if not g.has_node(target_map):
-            nodes = np.array(g.nodes)
-            closest_node = tuple(nodes[np.argmin(np.linalg.norm(nodes - target_map, axis=1))])
-            g.add_edge(closest_node, target_map, weight=T.l2_distance(closest_node, target_map))
-
-        if not g.has_node(source_map):
-            nodes = np.array(g.nodes)
-            closest_node = tuple(nodes[np.argmin(np.linalg.norm(nodes - source_map, axis=1))])
-            g.add_edge(closest_node, source_map, weight=T.l2_distance(closest_node, source_map))
+        source_map = self.world_to_map(source_world)
+        target_map = self.world_to_map(target_world)
+
+        # Snap the source and target onto their closest traversable pixels. This does not modify the map, so
+        # subsequent queries are unaffected by previous ones
+        source_node = self._get_nearest_traversable_pixel(floor, source_map)
+        target_node = self._get_nearest_traversable_pixel(floor, target_map)
+
+        if use_distance_field:
+            dist_field, next_pixels = self._get_distance_field(floor, target_node)
+            width = self.floor_map[floor].shape[1]
+            assert not np.isinf(dist_field[int(source_node[0]) * width + int(source_node[1])]), \
+                f"No path exists between {source_world} and {target_world} on floor {floor}!"
+            # Only trace as many pixels as are needed to generate the requested waypoints
+            max_length = None if entire_path else self.num_waypoints * self.waypoint_interval + 1
+            path_map = trace_distance_field(next_pixels, width, source_node, max_length=max_length)
+        else:
+            path_map = astar_grid(self.floor_map[floor], source_node, target_node)
+            assert path_map is not None, f"No path exists between {source_world} and {target_world} on floor {floor}!"
 
-        path_map = np.array(nx.astar_path(g, source_map, target_map, heuristic=T.l2_distance))
+        # If the source or target were not traversable, they are connected to the path via their closest pixels
+        if not np.array_equal(source_node, source_map):
+            path_map = np.concatenate([source_map.reshape(1, 2), path_map], axis=0)
+        if not np.array_equal(target_node, target_map) and np.array_equal(path_map[-1], target_node):
+            path_map = np.concatenate([path_map, target_map.reshape(1, 2)], axis=0)
 
         path_world = self.map_to_world(path_map)
-        geodesic_distance = np.sum(np.linalg.norm(path_world[1:] - path_world[:-1], axis=1))
+        if use_distance_field:
+            geodesic_distance = self.get_geodesic_distance(floor, source_world, target_world)
+        else:
+            geodesic_distance = np.sum(np.linalg.norm(path_world[1:] - path_world[:-1], axis=1))
         path_world = path_world[:: self.waypoint_interval]
 
         if not entire_path:
@@ -6,7 +6,7 @@ import omnigibson as og
 from omnigibson.macros import create_module_macros
 from omnigibson.object_states.aabb import AABB
 from omnigibson.object_states.object_state_base import AbsoluteObjectState
-from omnigibson.utils.sampling_utils import raytest_batch
+from omnigibson.utils.sampling_utils import raytest_batch_arrays
 
 
 # Create settings for this module
@@ -91,7 +91,7 @@ def compute_adjacencies(obj, axes, max_distance):
     ray_endpoints = ray_starts + (directions * max_distance)
 
     # Cast time.
-    ray_results = raytest_batch(
+    ray_results = raytest_batch_arrays(
         ray_starts,
         ray_endpoints,
         only_closest=False,
@@ -101,17 +101,16 @@ def compute_adjacencies(obj, axes, max_distance):
 
     # Add the results to the appropriate lists
     # For now, we keep our result in the dimensionality of (direction, hit_object_order).
-    # We convert the hit link into unique objects encountered
-    objs_by_direction = []
-    for results in ray_results:
-        unique_objs = set()
-        for result in results:
-            # Check if the inferred hit object is not None, we add it to our set
-            obj_prim_path = "/".join(result["rigidBody"].split("/")[:-1])
-            obj = og.sim.scene.object_registry("prim_path", obj_prim_path, None)
-            if obj is not None:
-                unique_objs.add(obj)
-        objs_by_direction.append(unique_objs)
+    # We convert the hit link into unique objects encountered, resolving each unique hit link only once
+    hit_objs = [
+        og.sim.scene.object_registry("prim_path", "/".join(body.split("/")[:-1]), None)
+        for body in ray_results["rigid_bodies"]
+    ]
+    objs_by_direction = [set() for _ in range(len(directions))]
+    for ray_idx, body_idx in zip(ray_results["ray_idx"], ray_results["body_idx"]):
+        # Check if the inferred hit object is not None, we add it to our set
+        if hit_objs[body_idx] is not None:
+            objs_by_direction[ray_idx].add(hit_objs[body_idx])
 
     # Reshape so that these have the following indices:
     # (axis_idx, direction-one-or-zero, hit_idx)
@@ -31,7 +31,7 @@ class ContainedParticles(RelativeObjectState, LinkBasedStateMixin):
     """
     def __init__(self, obj):
         super().__init__(obj)
-        self.check_in_volume = None         # Function to check whether particles are in volume for this container
+        self.check_in_volume = None         # Compiled checker for whether particles are in volume for this container
         self._volume = None                 # Volume of this container
         self._compute_info = None           # Intermediate computation information to store
         self._visual_particle_group = None  # Name corresponding to this object's set of visual particles
@@ -89,7 +89,7 @@ class ContainedParticles(RelativeObjectState, LinkBasedStateMixin):
         self.check_in_volume, calculate_volume = \
             generate_points_in_volume_checker_function(obj=self.obj, volume_link=self.link)
 
-        # Calculate volume
+        # Calculate volume, which is cached across instances of the same model
         self._volume = calculate_volume()
 
         # Grab group name
@@ -1,6 +1,7 @@
 from omnigibson.object_states.object_state_base import AbsoluteObjectState
 from omnigibson.object_states.temperature import Temperature
 from omnigibson.object_states.update_state_mixin import UpdateStateMixin
+from omnigibson.utils.python_utils import classproperty
 import numpy as np
 
 
@@ -15,6 +16,11 @@ class MaxTemperature(AbsoluteObjectState, UpdateStateMixin):
         deps.add(Temperature)
         return deps
 
+    @classproperty
+    def skip_update_if_unchanged(cls):
+        # The max temperature can only change if the temperature itself has changed
+        return True
+
     def __init__(self, obj):
         super(MaxTemperature, self).__init__(obj)
 
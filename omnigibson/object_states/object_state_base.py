@@ -1,6 +1,7 @@
 from abc import ABC
 import inspect
 import omnigibson as og
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.utils.python_utils import classproperty, Serializable, Registerable, Recreatable
 
 
@@ -318,6 +319,8 @@ class BaseObjectState(Serializable, Registerable, Recreatable, ABC):
         self.clear_cache()
         # Set the value
         val = self._set_value(*args, **kwargs)
+        # Make sure any states depending on this one get updated during the next step
+        ObjectStateUpdateScheduler.mark_dirty(self.obj)
         return val
 
     def _set_value(self, *args, **kwargs):
@@ -329,10 +332,10 @@ class BaseObjectState(Serializable, Registerable, Recreatable, ABC):
         """
         pass
 
-    def dump_state(self, serialized=False):
+    def dump_state(self, serialized=False, out=None):
         assert self._initialized
         assert self.stateful
-        return super().dump_state(serialized=serialized)
+        return super().dump_state(serialized=serialized, out=out)
 
     @classproperty
     def _do_not_register_classes(cls):
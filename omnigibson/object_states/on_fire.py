@@ -2,6 +2,7 @@ from omnigibson.macros import create_module_macros
 from omnigibson.object_states.temperature import Temperature
 from omnigibson.object_states.heat_source_or_sink import HeatSourceOrSink
 from omnigibson.object_states.update_state_mixin import UpdateStateMixin
+from omnigibson.utils.python_utils import classproperty
 
 
 # Create settings for this module
@@ -71,6 +72,11 @@ class OnFire(HeatSourceOrSink, UpdateStateMixin):
         deps.add(Temperature)
         return deps
 
+    @classproperty
+    def skip_update_if_unchanged(cls):
+        # Whether we're on fire only depends on the temperature, so nothing needs to be done if it hasn't changed
+        return True
+
     def _update(self):
         # If it's on fire, maintain the fire temperature
         if self.get_value():
@@ -3,7 +3,9 @@ from omnigibson.macros import create_module_macros
 from omnigibson.object_states.heat_source_or_sink import HeatSourceOrSink
 from omnigibson.object_states.object_state_base import AbsoluteObjectState
 from omnigibson.object_states.aabb import AABB
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.object_states.update_state_mixin import UpdateStateMixin
+from omnigibson.utils.geometry_utils import get_points_within_distance
 import omnigibson as og
 
 
@@ -17,6 +19,10 @@ m.DEFAULT_TEMPERATURE = 23.0  # degrees Celsius
 # What fraction of the temperature difference with the default temperature should be decayed every step.
 m.TEMPERATURE_DECAY_SPEED = 0.02  # per second. We'll do the conversion to steps later.
 
+# Temperatures closer than this to the ambient temperature snap to it, after which the object is skipped entirely
+# until a heat source affects it again.
+m.AMBIENT_TEMPERATURE_TOLERANCE = 1e-3  # degrees Celsius
+
 
 class Temperature(AbsoluteObjectState, UpdateStateMixin):
     @classmethod
@@ -44,35 +50,86 @@ class Temperature(AbsoluteObjectState, UpdateStateMixin):
         return True
 
     def _update(self):
+        self.update_all(objs=[self.obj])
+
+    @classmethod
+    def update_all(cls, objs):
         # Avoid circular import
+        from omnigibson.object_states.inside import Inside
         from omnigibson.object_states.on_fire import OnFire
 
-        # Start at the current temperature.
-        new_temperature = self.value
-
-        # Find all heat source objects.
-        affected_by_heat_source = False
-        heat_source_objs = og.sim.scene.get_objects_with_state_recursive(HeatSourceOrSink)
-        for obj2 in heat_source_objs:
-            # Only external heat sources will affect the temperature.
-            if obj2 == self.obj:
-                continue
+        if len(objs) == 0:
+            return
 
-            heat_source = obj2.states.get(OnFire, obj2.states.get(HeatSourceOrSink, None))
+        # Find all heat sources that are currently active. This only needs to happen once per step, not once per object
+        proximity_sources, inside_sources = [], []
+        for source_obj in og.sim.scene.get_objects_with_state_recursive(HeatSourceOrSink):
+            heat_source = source_obj.states.get(OnFire, source_obj.states.get(HeatSourceOrSink, None))
             assert heat_source is not None, "Unknown HeatSourceOrSink subclass"
-
-            # Compute delta to apply if the heat source is actively affecting this object
-            if heat_source.affects_obj(obj=self.obj):
-                new_temperature += (heat_source.temperature - self.value) * heat_source.heating_rate * og.sim.get_rendering_dt()
-                affected_by_heat_source = True
-
-        # Apply temperature decay if not affected by any heat source.
-        if not affected_by_heat_source:
-            new_temperature += (
-                (m.DEFAULT_TEMPERATURE - self.value) * m.TEMPERATURE_DECAY_SPEED * og.sim.get_rendering_dt()
-            )
-
-        self.value = new_temperature
+            if heat_source.get_value():
+                (inside_sources if heat_source.requires_inside else proximity_sources).append(heat_source)
+
+        temperatures = np.array([obj.states[cls].value for obj in objs], dtype=float)
+        heat_sources = proximity_sources + inside_sources
+        obj_idxs, source_idxs = np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+        if len(heat_sources) > 0:
+            aabbs = np.array([obj.states[AABB].get_value() for obj in objs])
+            obj_centers = aabbs.mean(axis=1)
+
+            # Proximity-based sources are bucketed into a spatial grid so that each object is only checked against
+            # the sources nearby. Position is either the AABB center of the default link or the metalink position
+            if len(proximity_sources) > 0:
+                source_positions = np.array([
+                    heat_source.link.aabb_center if heat_source.link == heat_source._default_link
+                    else heat_source.link.get_position() for heat_source in proximity_sources
+                ])
+                distance_thresholds = np.array([heat_source.distance_threshold for heat_source in proximity_sources])
+                obj_idxs, source_idxs = get_points_within_distance(
+                    query_points=obj_centers,
+                    points=source_positions,
+                    distance_thresholds=distance_thresholds,
+                )
+
+            # Inside-based sources first filter by whether the object's AABB center lies within the source's AABB,
+            # which is a necessary condition for Inside, so that the expensive Inside check only runs on candidates
+            inside_obj_idxs, inside_source_idxs = [], []
+            for i, heat_source in enumerate(inside_sources):
+                source_lower, source_upper = heat_source.obj.states[AABB].get_value()
+                in_aabb = np.all((source_lower <= obj_centers) & (obj_centers <= source_upper), axis=1)
+                for obj_idx in np.flatnonzero(in_aabb):
+                    if objs[obj_idx].states[Inside].get_value(heat_source.obj):
+                        inside_obj_idxs.append(obj_idx)
+                        inside_source_idxs.append(len(proximity_sources) + i)
+            obj_idxs = np.concatenate([obj_idxs, np.array(inside_obj_idxs, dtype=int)])
+            source_idxs = np.concatenate([source_idxs, np.array(inside_source_idxs, dtype=int)])
+
+            # Only external heat sources will affect the temperature
+            is_external = np.array([objs[obj_idx] != heat_sources[source_idx].obj
+                                    for obj_idx, source_idx in zip(obj_idxs, source_idxs)], dtype=bool)
+            obj_idxs, source_idxs = obj_idxs[is_external], source_idxs[is_external]
+
+        # Compute the temperature deltas for all objects at once. Objects affected by any heat source receive the sum
+        # of all the sources' contributions, while all other objects decay towards the ambient temperature
+        dt = og.sim.get_rendering_dt()
+        source_temperatures = np.array([heat_source.temperature for heat_source in heat_sources], dtype=float)
+        heating_rates = np.array([heat_source.heating_rate for heat_source in heat_sources], dtype=float)
+        deltas = (m.DEFAULT_TEMPERATURE - temperatures) * m.TEMPERATURE_DECAY_SPEED * dt
+        affected = np.zeros(len(objs), dtype=bool)
+        affected[obj_idxs] = True
+        deltas[affected] = 0.0
+        np.add.at(
+            deltas,
+            obj_idxs,
+            (source_temperatures[source_idxs] - temperatures[obj_idxs]) * heating_rates[source_idxs] * dt,
+        )
+        new_temperatures = temperatures + deltas
+        snap = ~affected & (np.abs(new_temperatures - m.DEFAULT_TEMPERATURE) < m.AMBIENT_TEMPERATURE_TOLERANCE)
+        new_temperatures[snap] = m.DEFAULT_TEMPERATURE
+
+        # Only write back the temperatures that actually changed, so objects at ambient temperature are skipped
+        for idx in np.flatnonzero(new_temperatures != temperatures):
+            objs[idx].states[cls].value = float(new_temperatures[idx])
+            ObjectStateUpdateScheduler.mark_dirty(objs[idx])
 
     @property
     def state_size(self):
@@ -5,6 +5,7 @@ from omnigibson.macros import create_module_macros
 from omnigibson.prims.geom_prim import VisualGeomPrim
 from omnigibson.object_states.link_based_state_mixin import LinkBasedStateMixin
 from omnigibson.object_states.object_state_base import AbsoluteObjectState, BooleanStateMixin
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.object_states.update_state_mixin import UpdateStateMixin
 from omni.isaac.core.utils.bounds import recompute_extents
 from omnigibson.utils.python_utils import classproperty
@@ -27,6 +28,7 @@ class ToggledOn(AbsoluteObjectState, BooleanStateMixin, LinkBasedStateMixin, Upd
         self.value = False
         self.robot_can_toggle_steps = 0
         self.visual_marker = None
+        self._visual_marker_value = None
         self._check_overlap = None
         self._robot_link_paths = None
 
@@ -113,9 +115,13 @@ class ToggledOn(AbsoluteObjectState, BooleanStateMixin, LinkBasedStateMixin, Upd
 
         if self.robot_can_toggle_steps == m.CAN_TOGGLE_STEPS:
             self.value = not self.value
+            ObjectStateUpdateScheduler.mark_dirty(self.obj)
 
-        # Choose which color to apply to the toggle marker
-        self.visual_marker.color = np.array([0, 1.0, 0]) if self.get_value() else np.array([1.0, 0, 0])
+        # Choose which color to apply to the toggle marker, only writing it if the value has flipped
+        value = self.get_value()
+        if value != self._visual_marker_value:
+            self.visual_marker.color = np.array([0, 1.0, 0]) if value else np.array([1.0, 0, 0])
+            self._visual_marker_value = value
 
     @staticmethod
     def get_texture_change_params():
@@ -0,0 +1,166 @@
+import time
+from collections import defaultdict
+
+from omnigibson.utils.profiling_utils import StepProfiler
+
+
+class ObjectStateUpdateScheduler:
+    """
+    Monolithic class for scheduling the per-step object state and visual updates.
+
+    Objects are marked as dirty whenever one of their states changes value, e.g.: their temperature changed, particles
+    were added to / removed from them, a state was toggled, or any of their states was explicitly set or loaded. Update
+    states that declare @skip_update_if_unchanged are then only updated for dirty objects, and visual updates are only
+    issued for dirty objects (or objects whose visuals depend on quantities that are not tracked, see
+    StatefulObject.requires_visual_update_every_step). The set of dirty objects is cleared at the end of every step.
+
+    Per-state timing counters are recorded as well, so that the states dominating each step can be identified.
+    """
+    # Objects that have been marked as dirty since the last scheduler step
+    _DIRTY_OBJECTS = set()
+
+    # Maps object to the number of times it has been marked as dirty. Unlike the dirty set, this is never reset per
+    # step, so consumers can check whether an object changed since an arbitrary earlier point in time
+    _VERSIONS = defaultdict(int)
+
+    # Maps state name (or "update_visuals") to its accumulated timing counters
+    _TIMINGS = defaultdict(lambda: dict(total_time=0.0, n_steps=0, n_updated=0, n_skipped=0))
+
+    @classmethod
+    def mark_dirty(cls, obj):
+        """
+        Marks object @obj as dirty, i.e.: one of its states has changed value since the last scheduler step
+
+        Args:
+            obj (StatefulObject): Object to mark as dirty
+        """
+        cls._DIRTY_OBJECTS.add(obj)
+        cls._VERSIONS[obj] += 1
+
+    @classmethod
+    def is_dirty(cls, obj):
+        """
+        Args:
+            obj (StatefulObject): Object to check
+
+        Returns:
+            bool: Whether @obj has been marked as dirty since the last scheduler step
+        """
+        return obj in cls._DIRTY_OBJECTS
+
+    @classmethod
+    def get_version(cls, obj):
+        """
+        Args:
+            obj (StatefulObject): Object to check
+
+        Returns:
+            int: Number of times @obj has been marked as dirty so far. If this value is unchanged between two points in
+                time, none of @obj's states changed value in between
+        """
+        return cls._VERSIONS.get(obj, 0)
+
+    @classmethod
+    def remove_object(cls, obj):
+        """
+        Stops tracking object @obj, e.g.: when it is removed from the scene, so that it is no longer referenced
+
+        Args:
+            obj (StatefulObject): Object to stop tracking
+        """
+        cls._DIRTY_OBJECTS.discard(obj)
+        cls._VERSIONS.pop(obj, None)
+
+    @classmethod
+    def step(cls, scene, state_types):
+        """
+        Updates all states of type @state_types in global topological order for all initialized objects in @scene,
+        followed by the visuals of any objects that may have changed
+
+        Args:
+            scene (Scene): Scene whose objects should be updated
+            state_types (list of UpdateStateMixin): State types to update, in the order they should be updated
+        """
+        # Avoid circular imports
+        from omnigibson.objects.stateful_object import StatefulObject
+
+        for state_type in state_types:
+            start = time.perf_counter()
+            # Only update objects that have been initialized so far
+            objs = [obj for obj in scene.get_objects_with_state(state_type) if obj.initialized]
+            n_objs = len(objs)
+            if state_type.skip_update_if_unchanged:
+                objs = [obj for obj in objs if obj in cls._DIRTY_OBJECTS]
+            with StepProfiler.profile(f"object_states/{state_type.__name__}"):
+                state_type.update_all(objs=objs)
+            cls._record_timing(
+                name=state_type.__name__,
+                duration=time.perf_counter() - start,
+                n_updated=len(objs),
+                n_skipped=n_objs - len(objs),
+            )
+
+        # Only update visuals for initialized objects whose visual-affecting states may have flipped
+        start = time.perf_counter()
+        n_objs, n_updated = 0, 0
+        with StepProfiler.profile("object_states/update_visuals"):
+            for obj in scene.objects:
+                if isinstance(obj, StatefulObject) and obj.initialized:
+                    n_objs += 1
+                    if obj.requires_visual_update_every_step or obj in cls._DIRTY_OBJECTS:
+                        obj.update_visuals()
+                        n_updated += 1
+        cls._record_timing(
+            name="update_visuals",
+            duration=time.perf_counter() - start,
+            n_updated=n_updated,
+            n_skipped=n_objs - n_updated,
+        )
+
+        # All changes have been propagated, so we start tracking from scratch
+        cls._DIRTY_OBJECTS = set()
+
+    @classmethod
+    def _record_timing(cls, name, duration, n_updated, n_skipped):
+        """
+        Accumulates the timing counters for entry @name
+
+        Args:
+            name (str): Name of the timed entry
+            duration (float): Time spent during this step, in seconds
+            n_updated (int): Number of objects updated during this step
+            n_skipped (int): Number of objects skipped during this step
+        """
+        timing = cls._TIMINGS[name]
+        timing["total_time"] += duration
+        timing["n_steps"] += 1
+        timing["n_updated"] += n_updated
+        timing["n_skipped"] += n_skipped
+
+    @classmethod
+    def get_timings(cls):
+        """
+        Returns:
+            dict: Maps each updated state name (and "update_visuals") to its accumulated timing counters, sorted by
+                decreasing total time. Each entry is a dictionary with keys "total_time" (seconds), "n_steps",
+                "n_updated", "n_skipped", and "mean_time" (seconds per step)
+        """
+        timings = {name: dict(**timing, mean_time=timing["total_time"] / max(timing["n_steps"], 1))
+                   for name, timing in cls._TIMINGS.items()}
+        return dict(sorted(timings.items(), key=lambda item: -item[1]["total_time"]))
+
+    @classmethod
+    def reset_timings(cls):
+        """
+        Resets all accumulated timing counters
+        """
+        cls._TIMINGS.clear()
+
+    @classmethod
+    def clear(cls):
+        """
+        Clears all internal state, e.g.: when the simulator is cleared
+        """
+        cls._DIRTY_OBJECTS = set()
+        cls._VERSIONS = defaultdict(int)
+        cls.reset_timings()
@@ -1,10 +1,21 @@
 from omnigibson.object_states.object_state_base import BaseObjectState
+from omnigibson.utils.python_utils import classproperty
 
 
 class UpdateStateMixin(BaseObjectState):
     """
     A state-mixin that allows for per-sim-step updates via the update() call
     """
+    @classproperty
+    def skip_update_if_unchanged(cls):
+        """
+        Returns:
+            bool: Whether this state's update() only depends on its object's other states, such that it can be
+                skipped at any step where none of its object's states have changed value. See
+                ObjectStateUpdateScheduler for details. Default is False
+        """
+        return False
+
     def update(self):
         """
         Updates the object state. This function will be called for every simulator step
@@ -12,6 +23,19 @@ class UpdateStateMixin(BaseObjectState):
         assert self._initialized, "Cannot update uninitialized state."
         return self._update()
 
+    @classmethod
+    def update_all(cls, objs):
+        """
+        Updates this state for all objects @objs. This function will be called once for every simulator step, and by
+        default simply calls update() on every object's state. Subclasses may override this to update all of their
+        instances at once
+
+        Args:
+            objs (list of StatefulObject): Initialized objects owning this state that should be updated
+        """
+        for obj in objs:
+            obj.states[cls].update()
+
     def _update(self):
         """
         This function will be called once for every simulator step. Must be implemented by subclass.
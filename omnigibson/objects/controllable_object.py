@@ -89,6 +89,8 @@ class ControllableObject(BaseObject):
         self._last_action = None
         self._controllers = None
         self.dof_names_ordered = None
+        self._control_type_vec = None       # n-array of each DOF's ControlType given the current controllers
+        self._control_plans = dict()        # maps (control types, indices) to compiled control deployment plans
 
         # Run super init
         super().__init__(
@@ -186,15 +188,21 @@ class ControllableObject(BaseObject):
         Helper function to force the joints to use the internal specified control mode and gains
         """
         # Update the control modes of each joint based on the outputted control from the controllers
+        # By default, the control type is None - i.e. no control applied
+        self._control_type_vec = np.full(self.n_dof, ControlType.NONE, dtype=int)
         for name in self._controllers:
+            control_type = self._controllers[name].control_type
+            self._control_type_vec[self._controllers[name].dof_idx] = control_type
             for dof in self._controllers[name].dof_idx:
-                control_type = self._controllers[name].control_type
                 self._joints[self.dof_names_ordered[dof]].set_control_type(
                     control_type=control_type,
                     kp=self.default_kp if control_type == ControlType.POSITION else None,
                     kd=self.default_kd if control_type == ControlType.VELOCITY else None,
                 )
 
+        # The controller configuration changed, so any previously compiled plans are stale
+        self._control_plans = dict()
+
     def _generate_controller_config(self, custom_config=None):
         """
         Generates a fully-populated controller config, overriding any default values with the corresponding values
@@ -322,7 +330,7 @@ class ControllableObject(BaseObject):
         Returns:
             2-tuple:
                 - n-array: raw control signals to send to the object's joints
-                - list: control types for each joint
+                - n-array: control types for each joint
         """
         # First, loop over all controllers, and calculate the computed control
         control = dict()
@@ -336,22 +344,19 @@ class ControllableObject(BaseObject):
             controller.update_command(command=action[idx : idx + controller.command_dim])
             control[name] = {
                 "value": controller.step(control_dict=control_dict),
-                "type": controller.control_type,
             }
             # Update idx
             idx += controller.command_dim
 
         # Compose controls
+        # By default, the control value is 0 (np.zeros). The control types only depend on the controllers, so they
+        # are computed once in update_controller_mode() instead of every step
         u_vec = np.zeros(self.n_dof)
-        # By default, the control type is None and the control value is 0 (np.zeros) - i.e. no control applied
-        u_type_vec = np.array([ControlType.NONE] * self.n_dof)
         for group, ctrl in control.items():
-            idx = self._controllers[group].dof_idx
-            u_vec[idx] = ctrl["value"]
-            u_type_vec[idx] = ctrl["type"]
+            u_vec[self._controllers[group].dof_idx] = ctrl["value"]
 
-        # Return control
-        return u_vec, u_type_vec
+        # Return control. The control types are copied, since subclasses may override them for the current step
+        return u_vec, self._control_type_vec.copy()
 
     def deploy_control(self, control, control_type, indices=None, normalized=False):
         """
@@ -367,6 +372,9 @@ class ControllableObject(BaseObject):
             In contrast, use set_joint_XXXX for simulation-specific logic, such as simulator resetting or "magic"
             action implementations.
 
+            Controls are deployed with a single batched call per ControlType, using a plan compiled once for each
+            combination of @control_type and @indices (see _get_control_plan()).
+
         Args:
             control (k- or n-array): control signals to deploy. This should be n-DOF length if all joints are being set,
                 or k-length (k < n) if specific indices are being set. In this case, the length of @control must
@@ -394,55 +402,107 @@ class ControllableObject(BaseObject):
                 "Got {}, {}, and {} respectively.".format(len(control), len(control_type), len(indices))
             )
 
+        # Grab the compiled plan for this combination of control types and indices
+        control_type = np.asarray(control_type, dtype=int)
+        indices = np.asarray(indices, dtype=int)
+        plan = self._get_control_plan(control_type=control_type, indices=indices)
+
         # Standardize normalized input
-        n_indices = len(indices)
-        normalized = normalized if isinstance(normalized, Iterable) else [normalized] * n_indices
+        if isinstance(normalized, Iterable):
+            normalized = np.asarray(normalized, dtype=bool)
+            for group in plan["multi_dof_groups"]:
+                assert len(set(normalized[group])) == 1, \
+                    "Not all normalized were the same when trying to deploy control for a single joint!"
+        control = np.asarray(control, dtype=float)
+
+        # Deploy each control type with a single batched call
+        for ctrl_type, (group, dof_idx) in plan["groups"].items():
+            ctrl = control[group]
+            norm = normalized[group] if isinstance(normalized, np.ndarray) else normalized
+            if ctrl_type == ControlType.EFFORT:
+                if np.any(norm):
+                    ctrl = np.where(norm, self._denormalize_efforts(efforts=ctrl, indices=dof_idx), ctrl)
+                self.set_joint_efforts(efforts=ctrl, indices=dof_idx)
+            elif ctrl_type == ControlType.VELOCITY:
+                if np.any(norm):
+                    ctrl = np.where(norm, self._denormalize_velocities(velocities=ctrl, indices=dof_idx), ctrl)
+                targets = self._dc.get_articulation_dof_velocity_targets(self._handle)
+                targets[dof_idx] = ctrl
+                self._dc.set_articulation_dof_velocity_targets(self._handle, targets.astype(np.float32))
+            else:
+                if np.any(norm):
+                    ctrl = np.where(norm, self._denormalize_positions(positions=ctrl, indices=dof_idx), ctrl)
+                targets = self._dc.get_articulation_dof_position_targets(self._handle)
+                targets[dof_idx] = ctrl
+                self._dc.set_articulation_dof_position_targets(self._handle, targets.astype(np.float32))
 
-        # Loop through controls and deploy
-        # We have to use delicate logic to account for the edge cases where a single joint may contain > 1 DOF
-        # (e.g.: spherical joint)
+    def _get_control_plan(self, control_type, indices):
+        """
+        Grabs the compiled plan for deploying controls with types @control_type onto DOFs @indices, compiling it if
+        this combination has not been deployed since the controllers were last updated. Compiling the plan runs all
+        per-joint sanity checks (i.e.: the joints are driven and use the deployed control types, and joints with more
+        than one DOF such as spherical joints are controlled consistently), so that they are only run once
+
+        Args:
+            control_type (k-array): control types for each DOF being controlled. Each entry should be one of
+                ControlType
+            indices (k-array): DOF indices being controlled
+
+        Returns:
+            dict: Compiled plan with keys:
+                - "groups": maps each ControlType being deployed (i.e.: excluding ControlType.NONE) to a 2-tuple of
+                    the positions within @indices and the corresponding DOF indices controlled with that type
+                - "multi_dof_groups": list of positions within @indices belonging to the same multi-DOF joint
+        """
+        key = (control_type.tobytes(), indices.tobytes())
+        if key in self._control_plans:
+            return self._control_plans[key]
+
+        # Validate the control types
+        for ctrl_type in set(control_type.tolist()):
+            if ctrl_type not in ControlType.VALID_TYPES:
+                raise ValueError("Invalid control type specified: {}".format(ctrl_type))
+
+        # Make sure every controlled joint can be driven with its control type, as checked by JointPrim's
+        # set_pos() / set_vel() (with drive=True) and set_effort() when deploying controls joint by joint
+        for ctrl_type, idx in zip(control_type.tolist(), indices.tolist()):
+            if ctrl_type == ControlType.NONE:
+                continue
+            joint = self._dof_to_joints[idx]
+            assert joint.driven, f"Cannot deploy control for joint {joint.joint_name} that is not driven!"
+            if ctrl_type != ControlType.EFFORT:
+                assert joint.control_type == ctrl_type, \
+                    f"Trying to deploy control type {ctrl_type} for joint {joint.joint_name}, but its control type " \
+                    f"is {joint.control_type}!"
+
+        # Run additional sanity checks for joints with more than one DOF to make sure our control types and indices
+        # all match as expected
+        multi_dof_groups = []
+        n_indices = len(indices)
         cur_indices_idx = 0
         while cur_indices_idx != n_indices:
-            # Grab the current DOF index we're controlling and find the corresponding joint
             joint = self._dof_to_joints[indices[cur_indices_idx]]
-            cur_ctrl_idx = indices[cur_indices_idx]
             joint_dof = joint.n_dof
             if joint_dof > 1:
-                # Run additional sanity checks since the joint has more than one DOF to make sure our controls,
-                # control types, and indices all match as expected
-
-                # Make sure the indices are mapped correctly
-                assert indices[cur_indices_idx + joint_dof] == cur_ctrl_idx + joint_dof, \
+                group = np.arange(cur_indices_idx, cur_indices_idx + joint_dof)
+                assert group[-1] < n_indices and \
+                    np.all(indices[group] == indices[cur_indices_idx] + np.arange(joint_dof)), \
                     "Got mismatched control indices for a single joint!"
-                # Check to make sure all joints, control_types, and normalized as all the same over n-DOF for the joint
-                for group_name, group in zip(
-                        ("joints", "control_types", "normalized"),
-                        (self._dof_to_joints, control_type, normalized),
-                ):
-                    assert len({group[indices[cur_indices_idx + i]] for i in range(joint_dof)}) == 1, \
-                        f"Not all {group_name} were the same when trying to deploy control for a single joint!"
-                # Assuming this all passes, we grab the control subvector, type, and normalized value accordingly
-                ctrl = control[cur_ctrl_idx: cur_ctrl_idx + joint_dof]
-            else:
-                # Grab specific control. No need to do checks since this is a single value
-                ctrl = control[cur_ctrl_idx]
+                assert len(set(control_type[group].tolist())) == 1, \
+                    "Not all control_types were the same when trying to deploy control for a single joint!"
+                multi_dof_groups.append(group)
+            cur_indices_idx += joint_dof
 
-            # Deploy control based on type
-            ctrl_type, norm = control_type[cur_ctrl_idx], normalized[cur_ctrl_idx]       # In multi-DOF joint case all values were already checked to be the same
-            if ctrl_type == ControlType.EFFORT:
-                joint.set_effort(ctrl, normalized=norm)
-            elif ctrl_type == ControlType.VELOCITY:
-                joint.set_vel(ctrl, normalized=norm, drive=True)
-            elif ctrl_type == ControlType.POSITION:
-                joint.set_pos(ctrl, normalized=norm, drive=True)
-            elif ctrl_type == ControlType.NONE:
-                # Do nothing
-                pass
-            else:
-                raise ValueError("Invalid control type specified: {}".format(ctrl_type))
+        # Group the DOFs by control type
+        groups = dict()
+        for ctrl_type in (ControlType.POSITION, ControlType.VELOCITY, ControlType.EFFORT):
+            group = np.flatnonzero(control_type == ctrl_type)
+            if len(group) > 0:
+                groups[ctrl_type] = (group, indices[group])
 
-            # Finally, increment the current index based on how many DOFs were just controlled
-            cur_indices_idx += joint_dof
+        plan = dict(groups=groups, multi_dof_groups=multi_dof_groups)
+        self._control_plans[key] = plan
+        return plan
 
     def get_control_dict(self):
         """
@@ -514,6 +574,16 @@ class ControllableObject(BaseObject):
         # Concatenate and return
         return np.concatenate([state_flat, controller_states_flat]).astype(float)
 
+    def _serialize_into(self, state, out):
+        # Run super first
+        idx = super()._serialize_into(state=state, out=out)
+
+        # Serialize the controller states sequentially
+        for c_name, c in self._controllers.items():
+            idx += c.serialize_into(state=state["controllers"][c_name], out=out[idx:])
+
+        return idx
+
     def _deserialize(self, state):
         # Run super first
         state_dict, idx = super()._deserialize(state=state)
@@ -356,3 +356,11 @@ class PrimitiveObject(StatefulObject):
             state_flat,
             np.array([state["radius"], state["height"], state["size"]]),
         ]).astype(float)
+
+    def _serialize_into(self, state, out):
+        # Run super first
+        idx = super()._serialize_into(state=state, out=out)
+
+        out[idx:idx + 3] = state["radius"], state["height"], state["size"]
+
+        return idx + 3
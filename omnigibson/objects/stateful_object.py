@@ -22,6 +22,7 @@ from omnigibson.object_states.object_state_base import REGISTERED_OBJECT_STATES
 from omnigibson.object_states.heat_source_or_sink import HeatSourceOrSink
 from omnigibson.object_states.on_fire import OnFire
 from omnigibson.object_states.particle_modifier import ParticleRemover
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.objects.object_base import BaseObject
 from omnigibson.renderer_settings.renderer_settings import RendererSettings
 from omnigibson.utils.constants import PrimType, EmitterType
@@ -104,6 +105,7 @@ class StatefulObject(BaseObject):
         self._states = None
         self._emitters = dict()
         self._visual_states = None
+        self._requires_visual_update_every_step = None
         self._current_texture_state = None
         self._include_default_states = include_default_states
 
@@ -155,6 +157,16 @@ class StatefulObject(BaseObject):
         states_set = set(self.states)
         self._visual_states = states_set & get_visual_states()
 
+        # Heat sources that need to be closed depend on the object's joint configuration, which is not tracked by
+        # the state update scheduler, so their visuals need to be checked every step
+        self._requires_visual_update_every_step = any(
+            isinstance(self.states[state_type], HeatSourceOrSink) and self.states[state_type].requires_closed
+            for state_type in self._visual_states
+        )
+
+        # Make sure all states get updated during the next step
+        ObjectStateUpdateScheduler.mark_dirty(self)
+
         # If we require visual updates, possibly create additional APIs
         if len(self._visual_states) > 0:
             if len(states_set & get_steam_states()) > 0:
@@ -185,6 +197,15 @@ class StatefulObject(BaseObject):
         """
         return self._states
 
+    @property
+    def requires_visual_update_every_step(self):
+        """
+        Returns:
+            bool: Whether this object's visuals need to be updated every step, even if none of its states have been
+                marked as changed by the state update scheduler
+        """
+        return self._requires_visual_update_every_step
+
     @property
     def abilities(self):
         """
@@ -496,6 +517,9 @@ class StatefulObject(BaseObject):
         # Clear cache after loading state
         self.clear_states_cache()
 
+        # Make sure all states get updated during the next step
+        ObjectStateUpdateScheduler.mark_dirty(self)
+
     def _serialize(self, state):
         # Call super method first
         state_flat = super()._serialize(state=state)
@@ -509,6 +533,16 @@ class StatefulObject(BaseObject):
         # Combine these two arrays
         return np.concatenate([state_flat, non_kin_state_flat]).astype(float)
 
+    def _serialize_into(self, state, out):
+        # Call super method first
+        idx = super()._serialize_into(state=state, out=out)
+
+        # Iterate over all states and serialize them individually
+        for state_name, state_dict in state["non_kin"].items():
+            idx += self._states[REGISTERED_OBJECT_STATES[state_name]].serialize_into(state=state_dict, out=out[idx:])
+
+        return idx
+
     def _deserialize(self, state):
         # Call super method first
         state_dic, idx = super()._deserialize(state=state)
@@ -1,11 +1,7 @@
-import os
-import tempfile
-
-import omnigibson as og
 from omnigibson.objects.stateful_object import StatefulObject
 from omnigibson.utils.constants import PrimType
 from omnigibson.utils.usd_utils import add_asset_to_stage
-from omnigibson.utils.asset_utils import decrypt_file
+from omnigibson.utils.asset_utils import DecryptedAssetCache
 
 
 class USDObject(StatefulObject):
@@ -67,6 +63,7 @@ class USDObject(StatefulObject):
         """
         self._usd_path = usd_path
         self._encrypted = encrypted
+        self._decrypted_usd_path = None     # Decrypted asset referenced by this object, if encrypted
         super().__init__(
             prim_path=prim_path,
             name=name,
@@ -91,20 +88,22 @@ class USDObject(StatefulObject):
         """
         usd_path = self._usd_path
         if self._encrypted:
-            # Create a temporary file to store the decrytped asset, load it, and then delete it
+            # Grab the cached decrypted asset, which is shared by all objects loaded from the same asset. We keep a
+            # reference to it until this object is removed
             encrypted_filename = self._usd_path.replace(".usd", ".encrypted.usd")
-            decrypted_fd, usd_path = tempfile.mkstemp(os.path.basename(self._usd_path), dir=og.tempdir)
-            decrypt_file(encrypted_filename, usd_path)
+            usd_path = DecryptedAssetCache.acquire(encrypted_filename)
+            self._decrypted_usd_path = usd_path
 
-        prim = add_asset_to_stage(asset_path=usd_path, prim_path=self._prim_path)
+        return add_asset_to_stage(asset_path=usd_path, prim_path=self._prim_path)
 
-        if self._encrypted:
-            os.close(decrypted_fd)
-            # On Windows, Isaac Sim won't let go of the file until the prim is removed, so we can't delete it.
-            if os.name == "posix":
-                os.remove(usd_path)
+    def remove(self):
+        # Run super first
+        super().remove()
 
-        return prim
+        # Release the decrypted asset, if any
+        if self._decrypted_usd_path is not None:
+            DecryptedAssetCache.release(self._decrypted_usd_path)
+            self._decrypted_usd_path = None
 
     def _create_prim_with_same_kwargs(self, prim_path, name, load_config):
         # Add additional kwargs
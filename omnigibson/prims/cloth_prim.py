@@ -554,6 +554,19 @@ class ClothPrim(GeomPrim):
             state["particle_velocities"].reshape(-1),
         ]).astype(float)
 
+    def _serialize_into(self, state, out):
+        # Run super first
+        idx = super()._serialize_into(state=state, out=out)
+
+        out[idx:idx + 2] = state["particle_group"], state["n_particles"]
+        idx += 2
+        for key in ("particle_positions", "particle_velocities"):
+            val = state[key].reshape(-1)
+            out[idx:idx + len(val)] = val
+            idx += len(val)
+
+        return idx
+
     def _deserialize(self, state):
         # Run super first
         state_dict, idx = super()._deserialize(state=state)
@@ -19,7 +19,7 @@ from omnigibson.prims.rigid_prim import RigidPrim
 from omnigibson.prims.xform_prim import XFormPrim
 from omnigibson.utils.constants import PrimType, GEOM_TYPES, JointType, JointAxis
 from omnigibson.utils.ui_utils import suppress_omni_log
-from omnigibson.utils.usd_utils import BoundingBoxAPI
+from omnigibson.utils.usd_utils import BoundingBoxAPI, PhysicsStateCacheAPI
 
 from omnigibson.macros import gm
 
@@ -60,6 +60,12 @@ class EntityPrim(XFormPrim):
         self._materials = None
         self._visual_only = None
 
+        # Cached physics state reads, each a (version, value) tuple, see PhysicsStateCacheAPI
+        self._dof_states_cache = None           # All DOF states (positions, velocities, efforts)
+        self._root_pose_cache = None            # Root link (position, orientation)
+        self._state_cache_hits = 0
+        self._state_cache_misses = 0
+
         # This needs to be initialized to be used for _load() of PrimitiveObject
         self._prim_type = load_config["prim_type"] if load_config is not None and "prim_type" in load_config else PrimType.RIGID
         assert self._prim_type in iter(PrimType), f"Unknown prim type {self._prim_type}!"
@@ -560,7 +566,7 @@ class EntityPrim(XFormPrim):
             positions = self._denormalize_positions(positions=positions, indices=indices)
 
         # Grab current DOF states
-        dof_states = self._dc.get_articulation_dof_states(self._handle, _dynamic_control.STATE_POS)
+        dof_states = self._get_dof_states().copy()
 
         # Possibly set specific values in the array if indies are specified
         if indices is None:
@@ -576,6 +582,7 @@ class EntityPrim(XFormPrim):
         if not drive:
             self._dc.set_articulation_dof_states(self._handle, dof_states, _dynamic_control.STATE_POS)
             BoundingBoxAPI.clear()
+            PhysicsStateCacheAPI.clear()
 
         # Also set the target
         self._dc.set_articulation_dof_position_targets(self._handle, new_positions.astype(np.float32))
@@ -606,7 +613,7 @@ class EntityPrim(XFormPrim):
             velocities = self._denormalize_velocities(velocities=velocities, indices=indices)
 
         # Grab current DOF states
-        dof_states = self._dc.get_articulation_dof_states(self._handle, _dynamic_control.STATE_VEL)
+        dof_states = self._get_dof_states().copy()
 
         # Possibly set specific values in the array if indies are specified
         if indices is None:
@@ -619,6 +626,7 @@ class EntityPrim(XFormPrim):
         dof_states["vel"] = new_velocities
         if not drive:
             self._dc.set_articulation_dof_states(self._handle, dof_states, _dynamic_control.STATE_VEL)
+            PhysicsStateCacheAPI.clear()
 
         # Also set the target
         self._dc.set_articulation_dof_velocity_targets(self._handle, new_velocities.astype(np.float32))
@@ -646,7 +654,7 @@ class EntityPrim(XFormPrim):
             efforts = self._denormalize_efforts(efforts=efforts, indices=indices)
 
         # Grab current DOF states
-        dof_states = self._dc.get_articulation_dof_states(self._handle, _dynamic_control.STATE_EFFORT)
+        dof_states = self._get_dof_states().copy()
 
         # Possibly set specific values in the array if indies are specified
         if indices is None:
@@ -658,6 +666,7 @@ class EntityPrim(XFormPrim):
         # Set the DOF states
         dof_states["effort"] = new_efforts
         self._dc.set_articulation_dof_states(self._handle, dof_states, _dynamic_control.STATE_EFFORT)
+        PhysicsStateCacheAPI.clear()
 
     def _normalize_positions(self, positions, indices=None):
         """
@@ -763,12 +772,49 @@ class EntityPrim(XFormPrim):
         """
         return efforts * self.max_joint_efforts if indices is None else efforts * self.max_joint_efforts[indices]
 
+    def _get_dof_states(self):
+        """
+        Grabs all DOF states (positions, velocities, and efforts) of this entity with a single dynamic control call,
+        re-using the values read earlier if the physics state has not changed since then
+
+        Returns:
+            np.ndarray: Structured array with fields "pos", "vel", and "effort". Should NOT be modified in-place
+        """
+        version = PhysicsStateCacheAPI.get_version()
+        if self._dof_states_cache is None or self._dof_states_cache[0] != version:
+            self._state_cache_misses += 1
+            self._dof_states_cache = \
+                (version, self._dc.get_articulation_dof_states(self._handle, _dynamic_control.STATE_ALL))
+        else:
+            self._state_cache_hits += 1
+        return self._dof_states_cache[1]
+
+    @property
+    def state_cache_stats(self):
+        """
+        Returns:
+            dict: Statistics of the cached physics state reads of this entity (joint states and root pose), with keys
+                "hits" (reads served from the cache) and "misses" (reads that queried the physics engine)
+        """
+        return dict(hits=self._state_cache_hits, misses=self._state_cache_misses)
+
+    def reset_state_cache_stats(self):
+        """
+        Resets the statistics of the cached physics state reads of this entity
+        """
+        self._state_cache_hits = 0
+        self._state_cache_misses = 0
+
     def update_handles(self):
         """
         Updates all internal handles for this prim, in case they change since initialization
         """
         assert og.sim.is_playing(), "Simulator must be playing if updating handles!"
 
+        # Any cached physics state reads were made with the old handles
+        self._dof_states_cache = None
+        self._root_pose_cache = None
+
         # Grab the handle -- we know it might not return a valid value, so we suppress omni's warning here
         self._handle = None if self.articulation_root_path is None else \
             self._dc.get_articulation(self.articulation_root_path)
@@ -807,7 +853,7 @@ class EntityPrim(XFormPrim):
         assert self._handle is not None, "handles are not initialized yet!"
         assert self.n_joints > 0, "Tried to call method not intended for entity prim with no joints!"
 
-        joint_positions = self._dc.get_articulation_dof_states(self._handle, _dynamic_control.STATE_POS)["pos"]
+        joint_positions = self._get_dof_states()["pos"].copy()
 
         # Possibly normalize values when returning
         return self._normalize_positions(positions=joint_positions) if normalized else joint_positions
@@ -826,7 +872,7 @@ class EntityPrim(XFormPrim):
         assert self._handle is not None, "handles are not initialized yet!"
         assert self.n_joints > 0, "Tried to call method not intended for entity prim with no joints!"
 
-        joint_velocities = self._dc.get_articulation_dof_states(self._handle, _dynamic_control.STATE_VEL)["vel"]
+        joint_velocities = self._get_dof_states()["vel"].copy()
 
         # Possibly normalize values when returning
         return self._normalize_velocities(velocities=joint_velocities) if normalized else joint_velocities
@@ -845,7 +891,7 @@ class EntityPrim(XFormPrim):
         assert self._handle is not None, "handles are not initialized yet!"
         assert self.n_joints > 0, "Tried to call method not intended for entity prim with no joints!"
 
-        joint_efforts = self._dc.get_articulation_dof_states(self._handle, _dynamic_control.STATE_EFFORT)["effort"]
+        joint_efforts = self._get_dof_states()["effort"].copy()
 
         # Possibly normalize values when returning
         return self._normalize_efforts(efforts=joint_efforts) if normalized else joint_efforts
@@ -905,6 +951,7 @@ class EntityPrim(XFormPrim):
                 super().set_position_orientation(position=position, orientation=orientation)
 
         BoundingBoxAPI.clear()
+        PhysicsStateCacheAPI.clear()
 
     def get_position_orientation(self):
         if self._prim_type == PrimType.CLOTH:
@@ -915,7 +962,15 @@ class EntityPrim(XFormPrim):
         else:
             if self._root_handle is not None and self._root_handle != _dynamic_control.INVALID_HANDLE and \
                     self._dc is not None and self._dc.is_simulating():
-                return self.root_link.get_position_orientation()
+                # Re-use the root pose read earlier if the physics state has not changed since then
+                version = PhysicsStateCacheAPI.get_version()
+                if self._root_pose_cache is None or self._root_pose_cache[0] != version:
+                    self._state_cache_misses += 1
+                    self._root_pose_cache = (version, self.root_link.get_position_orientation())
+                else:
+                    self._state_cache_hits += 1
+                pos, ori = self._root_pose_cache[1]
+                return pos.copy(), ori.copy()
             else:
                 return super().get_position_orientation()
 
@@ -1391,6 +1446,14 @@ class EntityPrim(XFormPrim):
 
         return np.concatenate(state_flat).astype(float)
 
+    def _serialize_into(self, state, out):
+        # We serialize by writing the root link state and then all joint states sequentially into @out
+        idx = self.root_link.serialize_into(state=state["root_link"], out=out)
+        for prim_name, prim in self._joints.items():
+            idx += prim.serialize_into(state=state["joints"][prim_name], out=out[idx:])
+
+        return idx
+
     def _deserialize(self, state):
         # We deserialize by first de-flattening the root link state and then iterating over all joints and
         # sequentially grabbing from the flattened state array, incrementing along the way
@@ -20,7 +20,7 @@ from omnigibson.utils.usd_utils import create_joint
 from omnigibson.utils.constants import JointType, JointAxis
 from omnigibson.utils.python_utils import assert_valid_key
 import omnigibson.utils.transform_utils as T
-from omnigibson.utils.usd_utils import BoundingBoxAPI
+from omnigibson.utils.usd_utils import BoundingBoxAPI, PhysicsStateCacheAPI
 
 from omnigibson.controllers.controller_base import ControlType
 
@@ -801,6 +801,9 @@ class JointPrim(BasePrim):
             # We set the position target in either case
             self._dc.set_dof_position_target(dof_handle, p)
 
+        if not drive:
+            PhysicsStateCacheAPI.clear()
+
     def set_vel(self, vel, normalized=False, drive=False):
         """
         Set the velocity of this joint in metric space
@@ -835,6 +838,9 @@ class JointPrim(BasePrim):
             # We set the target in either case
             self._dc.set_dof_velocity_target(dof_handle, v)
 
+        if not drive:
+            PhysicsStateCacheAPI.clear()
+
     def set_effort(self, effort, normalized=False):
         """
         Set the effort of this joint in metric space
@@ -860,6 +866,7 @@ class JointPrim(BasePrim):
         # Set the DOF(s) in this joint
         for dof_handle, e in zip(self._dof_handles, effort):
             self._dc.set_dof_effort(dof_handle, e)
+        PhysicsStateCacheAPI.clear()
 
     def keep_still(self):
         """
@@ -898,6 +905,12 @@ class JointPrim(BasePrim):
             state["target_vel"],
         ]).astype(float)
 
+    def _serialize_into(self, state, out):
+        # We serialize deterministically in the same order of values -- pos, vel, effort, target_pos, target_vel
+        for i, key in enumerate(("pos", "vel", "effort", "target_pos", "target_vel")):
+            out[i * self.n_dof:(i + 1) * self.n_dof] = state[key]
+        return 5 * self.n_dof
+
     def _deserialize(self, state):
         # We deserialize deterministically by knowing the order of values -- pos, vel, effort
         return dict(
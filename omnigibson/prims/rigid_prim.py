@@ -11,7 +11,7 @@ from omnigibson.prims.xform_prim import XFormPrim
 from omnigibson.prims.geom_prim import CollisionGeomPrim, VisualGeomPrim
 from omnigibson.utils.constants import GEOM_TYPES
 from omnigibson.utils.sim_utils import CsRawData
-from omnigibson.utils.usd_utils import get_mesh_volume_and_com
+from omnigibson.utils.usd_utils import get_mesh_volume_and_com, PhysicsStateCacheAPI
 import omnigibson.utils.transform_utils as T
 from omnigibson.utils.ui_utils import create_module_logger
 
@@ -98,6 +98,8 @@ class RigidPrim(XFormPrim):
             self._physx_contact_report_api_api = PhysxSchema.PhysxContactReportAPI(self._prim) if \
                 self._prim.HasAPI(PhysxSchema.PhysxContactReportAPI) else \
                 PhysxSchema.PhysxContactReportAPI.Apply(self._prim)
+            # Report all contacts regardless of their force, since RigidContactAPI reads contacts from these reports
+            self._physx_contact_report_api_api.CreateThresholdAttr().Set(0.0)
 
         # Store references to owned visual / collision meshes
         # We iterate over all children of this object's prim,
@@ -253,6 +255,7 @@ class RigidPrim(XFormPrim):
             self._dc.set_rigid_body_linear_velocity(self._handle, velocity)
         else:
             self._rigid_api.GetVelocityAttr().Set(Gf.Vec3f(velocity.tolist()))
+        PhysicsStateCacheAPI.clear()
 
     def get_linear_velocity(self):
         """
@@ -276,6 +279,7 @@ class RigidPrim(XFormPrim):
             self._dc.set_rigid_body_angular_velocity(self._handle, velocity)
         else:
             self._rigid_api.GetAngularVelocityAttr().Set(Gf.Vec3f(velocity.tolist()))
+        PhysicsStateCacheAPI.clear()
 
     def get_angular_velocity(self):
         """
@@ -299,6 +303,7 @@ class RigidPrim(XFormPrim):
         else:
             # Call super method by default
             super().set_position_orientation(position=position, orientation=orientation)
+        PhysicsStateCacheAPI.clear()
 
     def get_position_orientation(self):
         if self.dc_is_accessible:
@@ -691,6 +696,15 @@ class RigidPrim(XFormPrim):
             state["ang_vel"],
         ]).astype(float)
 
+    def _serialize_into(self, state, out):
+        # Run super first
+        idx = super()._serialize_into(state=state, out=out)
+
+        out[idx:idx + 3] = state["lin_vel"]
+        out[idx + 3:idx + 6] = state["ang_vel"]
+
+        return idx + 6
+
     def _deserialize(self, state):
         # Call supermethod first
         state_dic, idx = super()._deserialize(state=state)
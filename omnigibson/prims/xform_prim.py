@@ -405,6 +405,11 @@ class XFormPrim(BasePrim):
     def _serialize(self, state):
         return np.concatenate([state["pos"], state["ori"]]).astype(float)
 
+    def _serialize_into(self, state, out):
+        out[0:3] = state["pos"]
+        out[3:7] = state["ori"]
+        return 7
+
     def _deserialize(self, state):
         # We deserialize deterministically by knowing the order of values -- pos, ori
         return dict(pos=state[0:3], ori=state[3:7]), 7
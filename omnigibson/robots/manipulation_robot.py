@@ -1267,6 +1267,10 @@ class ManipulationRobot(BaseRobot):
         # TODO AG
         return state_flat
 
+    def _serialize_into(self, state, out):
+        # No additional state is serialized on top of super, see _serialize()
+        return super()._serialize_into(state=state, out=out)
+
     def _deserialize(self, state):
         # Call super first
         state_dict, idx = super()._deserialize(state=state)
@@ -39,7 +39,8 @@ class InteractiveTraversableScene(TraversableScene):
             scene_model (str): Scene model name, e.g.: Rs_int
             scene_instance (None or str): name of json file to load (without .json); if None,
                 defaults to og_dataset/scenes/<scene_model>/json/<scene_instance>.urdf
-            scene_file (None or str): If specified, full path of JSON file to load (with .json).
+            scene_file (None or str): If specified, full path of JSON file (with .json) or binary snapshot file (with
+                .ogsnap) to load.
                 This will override scene_instance and scene_model!
             trav_map_resolution (float): traversability map resolution
             trav_map_erosion (float): erosion radius of traversability areas, should be robot footprint radius
@@ -1,5 +1,5 @@
-import json
 from abc import ABC
+from collections import OrderedDict
 from itertools import combinations
 from omni.isaac.core.objects.ground_plane import GroundPlane
 import numpy as np
@@ -9,6 +9,7 @@ from omnigibson.prims.xform_prim import XFormPrim
 from omnigibson.utils.python_utils import classproperty, Serializable, Registerable, Recreatable, \
     create_object_from_init_info
 from omnigibson.utils.registry_utils import SerializableRegistry
+from omnigibson.utils.snapshot_utils import get_scene_file, load_scene_info
 from omnigibson.utils.ui_utils import create_module_logger
 from omnigibson.objects.object_base import BaseObject
 from omnigibson.systems.system_base import SYSTEM_REGISTRY, clear_all_systems, get_system
@@ -24,6 +25,9 @@ m = create_module_macros(module_path=__file__)
 # Default texture to use for skybox
 m.DEFAULT_SKYBOX_TEXTURE = f"{gm.ASSET_PATH}/models/background/sky.jpg"
 
+# Maximum number of in-memory state checkpoints to keep per scene. Once exceeded, the oldest checkpoint is evicted
+m.MAX_CHECKPOINTS = 16
+
 # Global dicts that will contain mappings
 REGISTERED_SCENES = dict()
 
@@ -43,7 +47,8 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
     ):
         """
         Args:
-            scene_file (None or str): If specified, full path of JSON file to load (with .json).
+            scene_file (None or str): If specified, full path of JSON file (with .json) or binary snapshot file (with
+                .ogsnap) to load.
                 None results in no additional objects being loaded into the scene
             use_floor_plane (bool): whether to load a flat floor plane into the simulator
             floor_plane_visible (bool): whether to render the additionally added floor plane
@@ -57,6 +62,9 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         self._registry = None
         self._world_prim = None
         self._initial_state = None
+        self._initial_checkpoint = None                 # Flattened counterpart of @self._initial_state
+        self._checkpoints = OrderedDict()               # Maps checkpoint ID to flattened state snapshot
+        self._checkpoint_counter = 0
         self._objects_info = None                       # Information associated with this scene
         self._use_floor_plane = use_floor_plane
         self._floor_plane_visible = floor_plane_visible
@@ -191,12 +199,12 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         Loads scene objects based on metadata information found in the current USD stage's scene info
         (information stored in the world prim's CustomData)
         """
-        # Grab objects info from the scene file
-        with open(self.scene_file, "r") as f:
-            scene_info = json.load(f)
-        init_info = scene_info["objects_info"]["init_info"]
-        init_state = scene_info["state"]["object_registry"]
-        init_systems = scene_info["state"]["system_registry"].keys()
+        # Grab objects info from the scene file. The states are loaded lazily, so that the states of objects that are
+        # filtered out are never loaded
+        scene_file = get_scene_file(self.scene_file)
+        init_info = scene_file.load(keys=["objects_info/init_info"])["objects_info"]["init_info"]
+        init_state = scene_file.load_lazy("state/object_registry")
+        init_systems = scene_file.load_lazy("state/system_registry").keys()
 
         # Create desired systems
         for system_name in init_systems:
@@ -222,8 +230,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         """
         Loads metadata from self.scene_file and stores it within the world prim's CustomData
         """
-        with open(self.scene_file, "r") as f:
-            scene_info = json.load(f)
+        scene_info = load_scene_info(self.scene_file, keys=["metadata"])
 
         # Write the metadata
         for key, data in scene_info.get("metadata", dict()).items():
@@ -283,6 +290,9 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         # Clears systems so they can be re-initialized
         clear_all_systems()
 
+        # Checkpoints reference this scene's objects, so they are invalid from here on
+        self.clear_checkpoints()
+
     def _initialize(self):
         """
         Initializes state of this scene and sets up any references necessary post-loading. Should be implemented by
@@ -308,12 +318,11 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         if self.scene_file is None:
             init_state = self.dump_state(serialized=False)
         else:
-            with open(self.scene_file, "r") as f:
-                scene_info = json.load(f)
-            init_state = scene_info["state"]
+            init_state = load_scene_info(self.scene_file, keys=["state"])["state"]
             og.sim.load_state(init_state, serialized=False)
 
         self._initial_state = init_state
+        self._initial_checkpoint = self._dump_checkpoint()
 
     def _create_registry(self):
         """
@@ -465,10 +474,186 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         assert og.sim.is_playing(), "Simulator must be playing in order to reset the scene!"
 
         # Reset the states of all objects (including robots), including (non-)kinematic states and internal variables.
+        # Only the objects / systems whose states changed since the initial state are actually restored
         assert self._initial_state is not None
-        self.load_state(self._initial_state)
+        self._restore_checkpoint(checkpoint=self._initial_checkpoint)
         og.sim.step()
 
+    def reset_objects(self, objs):
+        """
+        Resets only objects @objs (including robots) to their initial states. Unlike reset(), the simulator is not
+        stepped afterwards, so that multiple groups of objects can be reset before a single simulator step / render
+
+        Args:
+            objs (list of BaseObject): Objects to reset
+
+        Returns:
+            list of str: Names of the objects whose states were restored
+        """
+        # Make sure the simulator is playing
+        assert og.sim.is_playing(), "Simulator must be playing in order to reset objects!"
+        assert self._initial_state is not None
+        return self._restore_checkpoint(checkpoint=self._initial_checkpoint, names={obj.name for obj in objs})
+
+    def checkpoint(self, name=None):
+        """
+        Stores the current state of this scene as an in-memory checkpoint, which can later be restored with
+        rollback(). At most m.MAX_CHECKPOINTS checkpoints are kept, after which the oldest checkpoint is evicted and
+        its buffer is re-used.
+
+        Args:
+            name (None or str): If specified, name of the checkpoint. An existing checkpoint with the same name will be
+                overwritten. None results in the checkpoint being numbered automatically
+
+        Returns:
+            str or int: ID of the stored checkpoint, which is @name if specified
+        """
+        if name is None:
+            name = self._checkpoint_counter
+            self._checkpoint_counter += 1
+
+        # Evict the oldest checkpoint(s) if we're at capacity, re-using its buffer
+        out = self._checkpoints.pop(name)["state"] if name in self._checkpoints else None
+        while len(self._checkpoints) >= m.MAX_CHECKPOINTS:
+            _, evicted = self._checkpoints.popitem(last=False)
+            out = evicted["state"] if out is None else out
+        self._checkpoints[name] = self._dump_checkpoint(out=out)
+
+        return name
+
+    def rollback(self, checkpoint_id=None):
+        """
+        Restores this scene to the state stored in checkpoint @checkpoint_id. Only the objects / systems whose states
+        differ from the checkpoint are restored. Note that a simulator step is required for some non-kinematic states
+        to be updated.
+
+        Args:
+            checkpoint_id (None or str or int): ID of the checkpoint to restore, as returned by checkpoint(). None
+                results in the most recent checkpoint being restored
+
+        Returns:
+            list of str: Names of the objects / systems whose states were restored
+        """
+        assert len(self._checkpoints) > 0, "No checkpoints have been stored for this scene!"
+        checkpoint_id = next(reversed(self._checkpoints)) if checkpoint_id is None else checkpoint_id
+        assert checkpoint_id in self._checkpoints, f"Got invalid checkpoint ID: {checkpoint_id}. Valid options are: " \
+                                                   f"{list(self._checkpoints.keys())}"
+        return self._restore_checkpoint(checkpoint=self._checkpoints[checkpoint_id])
+
+    def get_checkpoint_diff(self, checkpoint_id, other_checkpoint_id=None):
+        """
+        Computes which objects / systems have different states between checkpoint @checkpoint_id and
+        @other_checkpoint_id
+
+        Args:
+            checkpoint_id (str or int): ID of the checkpoint to compare
+            other_checkpoint_id (None or str or int): ID of the other checkpoint to compare against. None results in
+                the current state of the scene being used
+
+        Returns:
+            list of str: Names of the objects / systems whose states differ. This includes objects / systems that only
+                exist in one of the two states
+        """
+        other = self._dump_checkpoint() if other_checkpoint_id is None else self._checkpoints[other_checkpoint_id]
+        return [name for name, _ in self._get_checkpoint_diff(checkpoint=self._checkpoints[checkpoint_id], other=other)]
+
+    def remove_checkpoint(self, checkpoint_id):
+        """
+        Removes checkpoint @checkpoint_id
+
+        Args:
+            checkpoint_id (str or int): ID of the checkpoint to remove
+        """
+        self._checkpoints.pop(checkpoint_id)
+
+    def clear_checkpoints(self):
+        """
+        Removes all stored checkpoints
+        """
+        self._checkpoints = OrderedDict()
+        self._checkpoint_counter = 0
+
+    @property
+    def checkpoint_ids(self):
+        """
+        Returns:
+            list of str or int: IDs of all stored checkpoints, from oldest to newest
+        """
+        return list(self._checkpoints.keys())
+
+    def _dump_checkpoint(self, out=None):
+        """
+        Dumps the current flattened state of all objects and systems in this scene
+
+        Args:
+            out (None or n-array): If specified, buffer to re-use for storing the flattened state. Will only be used
+                if it is large enough
+
+        Returns:
+            dict: Checkpoint with keys "state", the flattened state of the scene, and "layout", which maps each
+                object / system name to a (entry, slice) tuple, where entry is the object / system and slice is its
+                corresponding slice within "state"
+        """
+        state_size = self.state_size
+        out = np.empty(state_size) if out is None or len(out) < state_size else out
+        layout, idx = dict(), 0
+        for registry in self._registry.objects:
+            for entry in registry.objects:
+                n = len(entry.dump_state(serialized=True, out=out[idx:]))
+                layout[entry.name] = (entry, slice(idx, idx + n))
+                idx += n
+
+        return dict(state=out, layout=layout)
+
+    def _get_checkpoint_diff(self, checkpoint, other):
+        """
+        Computes which objects / systems have different states between @checkpoint and @other
+
+        Args:
+            checkpoint (dict): Checkpoint to compare, as returned by _dump_checkpoint()
+            other (dict): Other checkpoint to compare against, as returned by _dump_checkpoint()
+
+        Returns:
+            list of str: Names of the objects / systems whose states differ, including the ones that only exist in one
+                of the two checkpoints
+        """
+        diff = []
+        for name, (_, state_slice) in checkpoint["layout"].items():
+            if name not in other["layout"] or \
+                    not np.array_equal(checkpoint["state"][state_slice], other["state"][other["layout"][name][1]]):
+                diff.append(name)
+        diff += [name for name in other["layout"].keys() if name not in checkpoint["layout"]]
+        return diff
+
+    def _restore_checkpoint(self, checkpoint, names=None):
+        """
+        Restores @checkpoint, only loading the states of the objects / systems that differ from the current state
+
+        Args:
+            checkpoint (dict): Checkpoint to restore, as returned by _dump_checkpoint()
+            names (None or set of str): If specified, only the objects / systems with these names are restored.
+                Default is None, which restores all of them
+
+        Returns:
+            list of str: Names of the objects / systems whose states were restored
+        """
+        current = self._dump_checkpoint()
+        restored = []
+        for name in self._get_checkpoint_diff(checkpoint=checkpoint, other=current):
+            if names is not None and name not in names:
+                continue
+            # Currently the objects and the checkpoint don't have to match, i.e. objects may have been added to or
+            # removed from the scene since the checkpoint was stored. For both cases, restoring is skipped
+            if name not in checkpoint["layout"]:
+                log.warning(f"Object '{name}' is not in the checkpoint to restore from. Skip restoring its state.")
+            elif name not in current["layout"]:
+                log.warning(f"Object '{name}' from the checkpoint is no longer in the scene. Skip restoring its state.")
+            else:
+                entry = current["layout"][name][0]
+                entry.load_state(checkpoint["state"][checkpoint["layout"][name][1]], serialized=True)
+                restored.append(name)
+        return restored
+
     @property
     def n_floors(self):
         """
@@ -520,7 +705,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         """
         raise NotImplementedError()
 
-    def get_shortest_path(self, floor, source_world, target_world, entire_path=False):
+    def get_shortest_path(self, floor, source_world, target_world, entire_path=False, use_distance_field=False):
         """
         Get the shortest path from one point to another point.
 
@@ -529,6 +714,8 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
             source_world (2-array): (x,y) 2D source location in world reference frame (metric)
             target_world (2-array): (x,y) 2D target location in world reference frame (metric)
             entire_path (bool): whether to return the entire path
+            use_distance_field (bool): whether to answer the query from a cached geodesic distance field towards
+                @target_world, which is faster when many queries share the same target
 
         Returns:
             2-tuple:
@@ -599,6 +786,7 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         Updates the initial state for this scene (which the scene will get reset to upon calling reset())
         """
         self._initial_state = self.dump_state(serialized=False)
+        self._initial_checkpoint = self._dump_checkpoint()
 
     def update_objects_info(self):
         """
@@ -645,6 +833,10 @@ class Scene(Serializable, Registerable, Recreatable, ABC):
         # Default state for the scene is from the registry alone
         return self._registry.serialize(state=state)
 
+    def _serialize_into(self, state, out):
+        # Default state for the scene is from the registry alone
+        return self._registry.serialize_into(state=state, out=out)
+
     def _deserialize(self, state):
         # Default state for the scene is from the registry alone
         # We split this into two explicit steps, because the actual registry state size might dynamically change
@@ -33,7 +33,8 @@ class StaticTraversableScene(TraversableScene):
         """
         Args:
             scene_model (str): Scene model name, e.g.: Adrian
-            scene_file (None or str): If specified, full path of JSON file to load (with .json).
+            scene_file (None or str): If specified, full path of JSON file (with .json) or binary snapshot file (with
+                .ogsnap) to load.
                 None results in no additional objects being loaded into the scene
             trav_map_resolution (float): traversability map resolution
             trav_map_erosion (float): erosion radius of traversability areas, should be robot footprint radius
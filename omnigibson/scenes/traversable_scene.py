@@ -29,7 +29,8 @@ class TraversableScene(Scene):
         """
         Args:
             scene_model (str): Scene model name, e.g.: Adrian or Rs_int
-            scene_file (None or str): If specified, full path of JSON file to load (with .json).
+            scene_file (None or str): If specified, full path of JSON file (with .json) or binary snapshot file (with
+                .ogsnap) to load.
                 None results in no additional objects being loaded into the scene
             trav_map_resolution (float): traversability map resolution
             trav_map_erosion (float): erosion radius of traversability areas, should be robot footprint radius
@@ -78,7 +79,7 @@ class TraversableScene(Scene):
     def get_random_point(self, floor=None):
         return self._trav_map.get_random_point(floor=floor)
 
-    def get_shortest_path(self, floor, source_world, target_world, entire_path=False):
+    def get_shortest_path(self, floor, source_world, target_world, entire_path=False, use_distance_field=False):
         assert self._trav_map.build_graph, "cannot get shortest path without building the graph"
 
         return self._trav_map.get_shortest_path(
@@ -86,4 +87,5 @@ class TraversableScene(Scene):
             source_world=source_world,
             target_world=target_world,
             entire_path=entire_path,
+            use_distance_field=use_distance_field,
         )
@@ -1,6 +1,7 @@
 import numpy as np
 import time
 import gym
+from concurrent.futures import ThreadPoolExecutor
 
 import omnigibson as og
 from omnigibson.sensors.sensor_base import BaseSensor
@@ -32,6 +33,8 @@ def render():
     """
     Refreshes the Isaac Sim app rendering components including UI elements and view ports..etc.
     """
+    # Rendering overwrites the rendered data, so make sure no asynchronous readbacks are still in flight
+    VisionSensor.wait_readback_requests()
     set_carb_setting(og.app._carb_settings, "/app/player/playSimulations", False)
     og.app.update()
     set_carb_setting(og.app._carb_settings, "/app/player/playSimulations", True)
@@ -66,6 +69,12 @@ class VisionSensor(BaseSensor):
         image_width (int): Width of generated images, in pixels
         viewport_name (None or str): If specified, will link this camera to the specified viewport, overriding its
             current camera. Otherwise, creates a new viewport
+        async_obs (bool): Whether to read back observations asynchronously. If True, the readback of each modality is
+            posted right after every rendered simulator step and runs in a background thread, overlapping with
+            whatever happens until the next simulator step (e.g.: post-processing and applying the next action).
+            get_obs() then delivers the observations of the previous rendered step, or the latest ones if
+            await_obs() is called first. Image modalities (except segmentations) are returned in reusable
+            preallocated buffers, which stay valid until the readback after the next one overwrites them
     """
     _SENSOR_HELPERS = dict(
         rgb=sensors_util.get_rgb,
@@ -98,6 +107,14 @@ class VisionSensor(BaseSensor):
     # Persistent dictionary of sensors, mapped from prim_path to sensor
     SENSORS = dict()
 
+    # Modalities whose observations are fixed-size images that are read back without touching the stage, and can
+    # therefore be read back in the background and copied into preallocated buffers. Note that the segmentation
+    # modalities are excluded, since parsing / remapping their ids queries the stage
+    _IMAGE_MODALITIES = {"rgb", "depth", "depth_linear", "normal", "flow"}
+
+    # Background thread executing the asynchronous readbacks of all sensors, created upon first use
+    _READBACK_EXECUTOR = None
+
     def __init__(
         self,
         prim_path,
@@ -109,6 +126,7 @@ class VisionSensor(BaseSensor):
         image_height=128,
         image_width=128,
         viewport_name=None,
+        async_obs=False,
     ):
         # Create load config from inputs
         load_config = dict() if load_config is None else load_config
@@ -119,6 +137,14 @@ class VisionSensor(BaseSensor):
         # Create variables that will be filled in later at runtime
         self._sd = None             # synthetic data interface
         self._viewport = None       # Viewport from which to grab data
+        self._raw_sensors = set()   # Raw sensors that have been initialized so far
+
+        # Asynchronous readback variables
+        self._async_obs = async_obs
+        self._pending_readback = None       # (non-image obs, future of image obs) posted after the latest render
+        self._ready_obs = None              # Observations of the latest completed readback
+        self._obs_buffers = [dict(), dict()]     # Alternating preallocated image buffers, mapped by modality
+        self._obs_buffer_idx = 0            # Index of the buffers to use for the next readback
 
         # Run super method
         super().__init__(
@@ -202,14 +228,21 @@ class VisionSensor(BaseSensor):
             names (str or list of str): Name of the raw sensor(s) to initialize.
                 If they are not part of self._RAW_SENSOR_TYPES' keys, we will simply pass over them
         """
-        # Standardize the input and grab the intersection with all possible raw sensors
+        # Standardize the input and grab the intersection with all possible raw sensors. Sensors that were already
+        # initialized do not need to be initialized (and rendered) again
         names = set([names]) if isinstance(names, str) else set(names)
-        names = names.intersection(set(self._RAW_SENSOR_TYPES.keys()))
+        names = names.intersection(set(self._RAW_SENSOR_TYPES.keys())) - self._raw_sensors
+        if len(names) == 0:
+            return
 
         # Initialize sensors
         sensors = []
         for name in names:
             sensors.append(sensors_util.create_or_retrieve_sensor(self._viewport.viewport_api, self._RAW_SENSOR_TYPES[name]))
+        self._raw_sensors.update(names)
+
+        # Any pending readback may not contain the new modalities
+        self._reset_readback()
 
         # Suppress syntheticdata warning here because we know the first render is invalid
         with suppress_omni_log(channels=["omni.syntheticdata.plugin"]):
@@ -223,18 +256,135 @@ class VisionSensor(BaseSensor):
         # Run super first to grab any upstream obs
         obs = super()._get_obs()
 
+        if self._async_obs:
+            # Deliver the latest completed readback, only waiting for the pending one if there is none yet
+            if self._ready_obs is None:
+                self.await_obs()
+            if self._ready_obs is not None:
+                obs.update(self._ready_obs)
+                return obs
+
+        obs.update(self._read_modalities())
+
+        return obs
+
+    def _read_modalities(self, modalities=None, buffers=None):
+        """
+        Reads back the data of modalities @modalities from the latest render
+
+        Args:
+            modalities (None or set of str): Modalities to read back. None results in all of this sensor's modalities
+                being read back
+            buffers (None or dict): If specified, maps image modalities to preallocated arrays that the corresponding
+                data should be copied into. Missing buffers are allocated and added to @buffers
+
+        Returns:
+            dict: Keyword-mapped observations mapping modality names to their data
+        """
+        obs = dict()
+
         # Process each sensor modality individually
-        for modality in self.modalities:
+        for modality in (self.modalities if modalities is None else modalities):
             mod_kwargs = dict()
             mod_kwargs["viewport"] = self._viewport.viewport_api
             if modality == "seg_instance":
                 mod_kwargs.update({"parsed": True, "return_mapping": False})
             elif modality == "bbox_3d":
                 mod_kwargs.update({"parsed": True, "return_corners": True})
-            obs[modality] = self._SENSOR_HELPERS[modality](**mod_kwargs)
+            data = self._SENSOR_HELPERS[modality](**mod_kwargs)
+            if buffers is not None and modality in self._IMAGE_MODALITIES:
+                buffer = buffers.get(modality, None)
+                if buffer is None or buffer.shape != data.shape or buffer.dtype != data.dtype:
+                    buffer = np.empty_like(data)
+                    buffers[modality] = buffer
+                np.copyto(buffer, data)
+                data = buffer
+            obs[modality] = data
 
         return obs
 
+    def _post_readback(self):
+        """
+        Posts an asynchronous readback of all modalities from the latest render, after collecting the previous one
+        """
+        # Collect the previous readback first, since it is the one delivered until the new one is awaited
+        self._collect_readback()
+        buffers = self._obs_buffers[self._obs_buffer_idx]
+        self._obs_buffer_idx = 1 - self._obs_buffer_idx
+
+        # Only the image modalities are read back in the background. The other ones (including segmentations) query
+        # the stage, which may be modified in the meantime and is not thread-safe, so they are read back right away
+        image_modalities = self.modalities & self._IMAGE_MODALITIES
+        obs = self._read_modalities(modalities=self.modalities - image_modalities)
+        if VisionSensor._READBACK_EXECUTOR is None:
+            VisionSensor._READBACK_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vision_readback")
+        future = VisionSensor._READBACK_EXECUTOR.submit(self._read_modalities, modalities=image_modalities, buffers=buffers)
+        self._pending_readback = (obs, future)
+
+    def _collect_readback(self):
+        """
+        Waits for the pending readback (if any) to finish, and stores its observations as the latest ones
+        """
+        if self._pending_readback is not None:
+            obs, future = self._pending_readback
+            obs.update(future.result())
+            self._ready_obs = obs
+            self._pending_readback = None
+
+    def _reset_readback(self):
+        """
+        Waits for any pending readback and discards all asynchronously read observations
+        """
+        if self._pending_readback is not None:
+            self._pending_readback[1].result()
+            self._pending_readback = None
+        self._ready_obs = None
+
+    def await_obs(self):
+        """
+        Waits for the pending asynchronous readback (if any), so that the next call to get_obs() delivers the
+        observations of the latest render. Only relevant if this sensor reads back observations asynchronously
+        """
+        self._collect_readback()
+
+    @classmethod
+    def post_readback_requests(cls):
+        """
+        Posts asynchronous readbacks for all initialized and enabled sensors reading back observations asynchronously.
+        Should be called right after rendering
+        """
+        for sensor in cls.SENSORS.values():
+            if sensor._async_obs and sensor.initialized and sensor.enabled:
+                sensor._post_readback()
+
+    @classmethod
+    def wait_readback_requests(cls):
+        """
+        Waits for the asynchronous readbacks of all sensors to finish, e.g.: before rendering again, since rendering
+        overwrites the data being read back
+        """
+        for sensor in cls.SENSORS.values():
+            sensor._collect_readback()
+
+    @property
+    def async_obs(self):
+        """
+        Returns:
+            bool: Whether this sensor reads back observations asynchronously
+        """
+        return self._async_obs
+
+    @async_obs.setter
+    def async_obs(self, async_obs):
+        """
+        Sets whether this sensor should read back observations asynchronously
+
+        Args:
+            async_obs (bool): Whether this sensor should read back observations asynchronously
+        """
+        self._reset_readback()
+        self._async_obs = async_obs
+
     def add_modality(self, modality):
         # Check if we already have this modality (if so, no need to initialize it explicitly)
         should_initialize = modality not in self._modalities
@@ -246,6 +396,16 @@ class VisionSensor(BaseSensor):
         if should_initialize:
             self.initialize_sensors(names=modality)
 
+        # Any pending readback does not contain the new modality
+        self._reset_readback()
+
+    def remove_modality(self, modality):
+        # Run super
+        super().remove_modality(modality=modality)
+
+        # Any pending readback still contains the removed modality
+        self._reset_readback()
+
     def get_local_pose(self):
         # We have to overwrite this because camera prims can't set their quat for some reason ):
         xform_translate_op = self.get_attribute("xformOp:translate")
@@ -253,6 +413,9 @@ class VisionSensor(BaseSensor):
         return np.array(xform_translate_op), euler2quat(np.array(xform_orient_op))
 
     def remove(self):
+        # Make sure no readback is still in flight
+        self._reset_readback()
+
         # Remove from global sensors dictionary
         self.SENSORS.pop(self._prim_path)
 
@@ -437,6 +600,8 @@ class VisionSensor(BaseSensor):
         all objects on the stage are destroyed
         """
         for sensor in cls.SENSORS.values():
+            # Make sure no readback is still in flight
+            sensor._reset_readback()
             # Destroy any sensor that is not attached to the main viewport window
             if sensor._viewport.name != "Viewport":
                 sensor._viewport.destroy()
@@ -2,6 +2,7 @@ from collections import defaultdict
 import itertools
 import contextlib
 import os
+from copy import deepcopy
 from pathlib import Path
 
 import numpy as np
@@ -22,9 +23,12 @@ import omnigibson as og
 from omnigibson.macros import gm, create_module_macros
 from omnigibson.utils.constants import LightingMode
 from omnigibson.utils.config_utils import NumpyEncoder
+from omnigibson.utils.profiling_utils import StepProfiler
 from omnigibson.utils.python_utils import clear as clear_pu, create_object_from_init_info, Serializable
 from omnigibson.utils.sim_utils import meets_minimum_isaac_version
-from omnigibson.utils.usd_utils import clear as clear_uu, BoundingBoxAPI, FlatcacheAPI, RigidContactAPI
+from omnigibson.utils.snapshot_utils import SNAPSHOT_FILE_EXTENSION, load_scene_info, save_snapshot
+from omnigibson.utils.usd_utils import clear as clear_uu, BoundingBoxAPI, FlatcacheAPI, RigidContactAPI, \
+    PhysicsStateCacheAPI
 from omnigibson.utils.ui_utils import CameraMover, disclaimer, create_module_logger, suppress_omni_log
 from omnigibson.scenes import Scene
 from omnigibson.objects.object_base import BaseObject
@@ -32,6 +36,7 @@ from omnigibson.objects.stateful_object import StatefulObject
 from omnigibson.object_states.contact_subscribed_state_mixin import ContactSubscribedStateMixin
 from omnigibson.object_states.joint_break_subscribed_state_mixin import JointBreakSubscribedStateMixin
 from omnigibson.object_states.factory import get_states_by_dependency_order
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.object_states.update_state_mixin import UpdateStateMixin
 from omnigibson.sensors.vision_sensor import VisionSensor
 from omnigibson.transition_rules import TransitionRuleAPI
@@ -319,6 +324,10 @@ class Simulator(SimulationContext, Serializable):
         # Clear the existing scene if any
         self.clear()
 
+        # Keep the transition rules' object candidates up to date as objects are imported / removed
+        self.add_callback_on_import_obj(name="transition_rules", callback=TransitionRuleAPI.add_object)
+        self.add_callback_on_remove_obj(name="transition_rules", callback=TransitionRuleAPI.remove_object)
+
         self._scene = scene
         self._scene.load()
 
@@ -394,12 +403,15 @@ class Simulator(SimulationContext, Serializable):
         self._scene.remove_object(obj)
         self.app.update()
 
+        # Stop tracking the state changes of the removed object
+        ObjectStateUpdateScheduler.remove_object(obj)
+
         # Re-initialize the physics view if we're playing because the number of objects has changed
         if og.sim.is_playing():
             RigidContactAPI.initialize_view()
 
-        # Refresh all current rules
-        TransitionRuleAPI.prune_active_rules()
+        # Refresh all rules affected by the removal
+        TransitionRuleAPI.refresh_updated_rules()
 
     def _reset_variables(self):
         """
@@ -414,65 +426,71 @@ class Simulator(SimulationContext, Serializable):
         if self._scene is None:
             return
 
-        # Update omni
-        self._omni_update_step()
-
-        # If we're playing we, also run additional logic
-        if self.is_playing():
-            # Check to see if any objects should be initialized (only done IF we're playing)
-            n_objects_to_initialize = len(self._objects_to_initialize)
-            if n_objects_to_initialize > 0 and self.is_playing():
-                # We iterate through the objects to initialize
-                # Note that we don't explicitly do for obj in self._objects_to_initialize because additional objects
-                # may be added mid-iteration!!
-                # For this same reason, after we finish the loop, we keep any objects that are yet to be initialized
-                # First call zero-physics step update, so that handles are properly propagated
-                og.sim.pi.update_simulation(elapsedStep=0, currentTime=og.sim.current_time)
-                for i in range(n_objects_to_initialize):
-                    obj = self._objects_to_initialize[i]
-                    obj.initialize()
-                    if len(obj.states.keys() & self.object_state_types_on_contact) > 0:
-                        self._objects_require_contact_callback = True
-                    if len(obj.states.keys() & self.object_state_types_on_joint_break) > 0:
-                        self._objects_require_joint_break_callback = True
-
-                self._objects_to_initialize = self._objects_to_initialize[n_objects_to_initialize:]
-
-                # Re-initialize the physics view because the number of objects has changed
-                RigidContactAPI.initialize_view()
-
-                # Also refresh the transition rules that are currently active
-                TransitionRuleAPI.refresh_all_rules()
-
-            # Update any system-related state
-            for system in self.scene.systems:
-                system.update()
-
-            # Propagate states if the feature is enabled
-            if gm.ENABLE_OBJECT_STATES:
-                # Step the object states in global topological order (if the scene exists)
-                for state_type in self.object_state_types_requiring_update:
-                    for obj in self.scene.get_objects_with_state(state_type):
-                        # Only update objects that have been initialized so far
-                        if obj.initialized:
-                            obj.states[state_type].update()
-
-                for obj in self.scene.objects:
-                    # Only update visuals for objects that have been initialized so far
-                    if isinstance(obj, StatefulObject) and obj.initialized:
-                        obj.update_visuals()
-
-            # Possibly run transition rule step
-            if gm.ENABLE_TRANSITION_RULES:
-                TransitionRuleAPI.step()
+        with StepProfiler.profile("sim.non_physics_step"):
+            # Update omni
+            with StepProfiler.profile("sim.omni_update"):
+                self._omni_update_step()
+
+            # If we're playing we, also run additional logic
+            if self.is_playing():
+                # Check to see if any objects should be initialized (only done IF we're playing)
+                n_objects_to_initialize = len(self._objects_to_initialize)
+                if n_objects_to_initialize > 0 and self.is_playing():
+                    with StepProfiler.profile("sim.initialize_objects"):
+                        # We iterate through the objects to initialize
+                        # Note that we don't explicitly do for obj in self._objects_to_initialize because additional
+                        # objects may be added mid-iteration!!
+                        # For this same reason, after we finish the loop, we keep any objects that are yet to be
+                        # initialized
+                        # First call zero-physics step update, so that handles are properly propagated
+                        og.sim.pi.update_simulation(elapsedStep=0, currentTime=og.sim.current_time)
+                        for i in range(n_objects_to_initialize):
+                            obj = self._objects_to_initialize[i]
+                            obj.initialize()
+                            if len(obj.states.keys() & self.object_state_types_on_contact) > 0:
+                                self._objects_require_contact_callback = True
+                            if len(obj.states.keys() & self.object_state_types_on_joint_break) > 0:
+                                self._objects_require_joint_break_callback = True
+
+                        self._objects_to_initialize = self._objects_to_initialize[n_objects_to_initialize:]
+
+                        # Re-initialize the physics view because the number of objects has changed
+                        RigidContactAPI.initialize_view()
+
+                        # Also refresh the transition rules whose candidates may have changed
+                        TransitionRuleAPI.refresh_updated_rules()
+
+                # Update any system-related state
+                with StepProfiler.profile("sim.systems"):
+                    for system in self.scene.systems:
+                        with StepProfiler.profile(f"systems/{system.name}"):
+                            system.update()
+
+                # Propagate states if the feature is enabled
+                if gm.ENABLE_OBJECT_STATES:
+                    # Step the object states in global topological order (if the scene exists)
+                    # States that only depend on other states are skipped for objects that haven't changed, and visuals
+                    # are only updated for objects that may have changed
+                    with StepProfiler.profile("sim.object_states"):
+                        ObjectStateUpdateScheduler.step(
+                            scene=self.scene,
+                            state_types=self.object_state_types_requiring_update,
+                        )
+
+                # Possibly run transition rule step
+                if gm.ENABLE_TRANSITION_RULES:
+                    with StepProfiler.profile("sim.transition_rules"):
+                        TransitionRuleAPI.step()
 
     def _omni_update_step(self):
         """
         Step any omni-related things
         """
-        # Clear the bounding box and contact caches so that they get updated during the next time they're called
+        # Clear the bounding box, contact, and physics state caches so that they get updated during the next time
+        # they're called
         BoundingBoxAPI.clear()
         RigidContactAPI.clear()
+        PhysicsStateCacheAPI.clear()
 
     def play(self):
         if not self.is_playing():
@@ -565,24 +583,41 @@ class Simulator(SimulationContext, Serializable):
         Args:
             render (bool): Whether rendering should occur or not
         """
-        # If we have imported any objects within the last timestep, we render the app once, since otherwise calling
-        # step() may not step physics
-        if len(self._objects_to_initialize) > 0:
-            self.render()
+        with StepProfiler.profile("sim.step"):
+            # Rendering overwrites the rendered data, so make sure no asynchronous readbacks are still in flight
+            VisionSensor.wait_readback_requests()
+
+            # If we have imported any objects within the last timestep, we render the app once, since otherwise
+            # calling step() may not step physics
+            if len(self._objects_to_initialize) > 0:
+                self.render()
+
+            # Note that when rendering, the physics and rendering updates cannot be timed separately
+            if render:
+                with StepProfiler.profile("sim.physics_and_render"):
+                    super().step(render=True)
+                # Start reading back the asynchronous observations of the new render
+                VisionSensor.post_readback_requests()
+            else:
+                with StepProfiler.profile("sim.physics"):
+                    for i in range(self.n_physics_timesteps_per_render):
+                        super().step(render=False)
 
-        if render:
-            super().step(render=True)
-        else:
-            for i in range(self.n_physics_timesteps_per_render):
-                super().step(render=False)
-
-        # Additionally run non physics things
-        self._non_physics_step()
+            # Additionally run non physics things
+            self._non_physics_step()
 
         # TODO (eric): After stage changes (e.g. pose, texture change), it will take two super().step(render=True) for
         #  the result to propagate to the rendering. We could have called super().render() here but it will introduce
         #  a big performance regression.
 
+    def render(self):
+        """
+        Refreshes the rendering components including UI elements and viewports
+        """
+        # Rendering overwrites the rendered data, so make sure no asynchronous readbacks are still in flight
+        VisionSensor.wait_readback_requests()
+        super().render()
+
     def step_physics(self):
         """
         Step the physics a single step.
@@ -887,13 +922,15 @@ class Simulator(SimulationContext, Serializable):
             self._camera_mover.clear()
             self._camera_mover = None
 
-        # Clear all transition rules if being used
-        if gm.ENABLE_TRANSITION_RULES:
-            TransitionRuleAPI.clear()
+        # Clear all transition rules, including their object candidates which are tracked regardless of whether
+        # transition rules are being used
+        TransitionRuleAPI.clear()
 
         # Clear uniquely named items and other internal states
         clear_pu()
         clear_uu()
+        ObjectStateUpdateScheduler.clear()
+        StepProfiler.clear()
         self._objects_to_initialize = []
         self._objects_require_contact_callback = False
         self._objects_require_joint_break_callback = False
@@ -931,17 +968,17 @@ class Simulator(SimulationContext, Serializable):
         Restore a simulation environment from @json_path.
 
         Args:
-            json_path (str): Full path of JSON file to load, which contains information
-                to recreate a scene.
+            json_path (str): Full path of JSON file (with .json) or binary snapshot file (with .ogsnap) to load, which
+                contains information to recreate a scene.
         """
-        if not json_path.endswith(".json"):
+        if not json_path.endswith((".json", SNAPSHOT_FILE_EXTENSION)):
             log.error(f"You have to define the full json_path to load from. Got: {json_path}")
             return
 
-        # Load the info from the json
-        with open(json_path, "r") as f:
-            scene_info = json.load(f)
-        init_info = scene_info["init_info"]
+        # Load the info from the scene file. The loaded info is shared with the scene, so we copy the init info before
+        # modifying it
+        scene_info = load_scene_info(json_path, keys=["init_info", "state"])
+        init_info = deepcopy(scene_info["init_info"])
         state = scene_info["state"]
 
         # Override the init info with our json path
@@ -968,8 +1005,9 @@ class Simulator(SimulationContext, Serializable):
         Saves the current simulation environment to @json_path.
 
         Args:
-            json_path (str): Full path of JSON file to save (should end with .json), which contains information
-                to recreate the current scene.
+            json_path (str): Full path of JSON file (should end with .json) or binary snapshot file (should end with
+                .ogsnap) to save, which contains information to recreate the current scene. Snapshot files are
+                significantly smaller and faster to save / load, see omnigibson.utils.snapshot_utils for details.
         """
         # Make sure the sim is not stopped, since we need to grab joint states
         assert not self.is_stopped(), "Simulator cannot be stopped when saving to USD!"
@@ -982,7 +1020,7 @@ class Simulator(SimulationContext, Serializable):
         if not self.scene:
             log.warning("Scene has not been loaded. Nothing to save.")
             return
-        if not json_path.endswith(".json"):
+        if not json_path.endswith((".json", SNAPSHOT_FILE_EXTENSION)):
             log.error(f"You have to define the full json_path to save the scene to. Got: {json_path}")
             return
 
@@ -997,13 +1035,49 @@ class Simulator(SimulationContext, Serializable):
             "objects_info": self.scene.get_objects_info(),
         }
 
-        # Write this to the json file
-        Path(os.path.dirname(json_path)).mkdir(parents=True, exist_ok=True)
-        with open(json_path, "w+") as f:
-            json.dump(scene_info, f, cls=NumpyEncoder, indent=4)
+        # Write this to the scene file
+        if json_path.endswith(SNAPSHOT_FILE_EXTENSION):
+            save_snapshot(json_path, data=scene_info)
+        else:
+            Path(os.path.dirname(json_path)).mkdir(parents=True, exist_ok=True)
+            with open(json_path, "w+") as f:
+                json.dump(scene_info, f, cls=NumpyEncoder, indent=4)
 
         log.info("The current simulation environment saved.")
 
+    def checkpoint(self, name=None):
+        """
+        Stores the current state of the active scene as an in-memory checkpoint, which can later be restored with
+        rollback(). See Scene.checkpoint() for details.
+
+        Args:
+            name (None or str): If specified, name of the checkpoint. None results in the checkpoint being numbered
+                automatically
+
+        Returns:
+            str or int: ID of the stored checkpoint
+        """
+        # Make sure the sim is not stopped, since we need to grab joint states
+        assert not self.is_stopped(), "Simulator cannot be stopped when storing a checkpoint!"
+        assert self.scene is not None, "A scene must be imported in order to store a checkpoint!"
+        return self.scene.checkpoint(name=name)
+
+    def rollback(self, checkpoint_id=None):
+        """
+        Restores the active scene to the state stored in checkpoint @checkpoint_id, only restoring the objects /
+        systems whose states have changed. See Scene.rollback() for details.
+
+        Args:
+            checkpoint_id (None or str or int): ID of the checkpoint to restore. None results in the most recent
+                checkpoint being restored
+
+        Returns:
+            list of str: Names of the objects / systems whose states were restored
+        """
+        # We need to make sure the simulator is playing since joint states only get updated when playing
+        assert self.is_playing(), "Simulator must be playing in order to rollback to a checkpoint!"
+        return self.scene.rollback(checkpoint_id=checkpoint_id)
+
     def _open_new_stage(self):
         """
         Opens a new stage
@@ -1179,6 +1253,10 @@ class Simulator(SimulationContext, Serializable):
         # Default state is from the scene
         return self._scene.serialize(state=state)
 
+    def _serialize_into(self, state, out):
+        # Default state is from the scene
+        return self._scene.serialize_into(state=state, out=out)
+
     def _deserialize(self, state):
         # Default state is from the scene
         return self._scene.deserialize(state=state), self._scene.state_size
@@ -161,12 +161,22 @@ class MacroParticleSystem(BaseSystem):
         super()._load_state(state=state)
 
         # Set particle scales
-        for particle, scale in zip(cls.particles.values(), state["scales"]):
-            particle.scale = scale
+        cls._set_particle_scales(scales=state["scales"])
 
         # Set particle counter
         cls._particle_counter = state["particle_counter"]
 
+    @classmethod
+    def _set_particle_scales(cls, scales):
+        """
+        Sets the scales of all particles in this system
+
+        Args:
+            scales ((n, 3)-array): Per-particle (x,y,z) scales, ordered the same way as cls.particles
+        """
+        for particle, scale in zip(cls.particles.values(), scales):
+            particle.scale = scale
+
     @classmethod
     def _serialize(cls, state):
         # Run super first
@@ -338,10 +348,27 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
     # NOTE: face_id will only exist for particles on cloths
     _particles_info = None
 
-    # Pre-cached information about visual particles so that we have efficient runtime computations
-    # Maps particle name to local pose matrix for computing global poses for the particle
+    # Pre-cached information about visual particles so that we have efficient runtime computations. Per-particle
+    # quantities are stored in contiguous arrays so that batched pose computations are a single gather + matmul
+    # Maps particle name to its row in the per-particle arrays below, and the inverse mapping as a list
+    _particles_slot = None
+    _particles_slot_names = None
+
+    # (N, 4, 4) array of per-particle local pose matrices (expressed in the parent's scaled frame) for computing
+    # global poses for the particles
     _particles_local_mat = None
 
+    # (N,) array of per-particle indices into @_particles_parents
+    _particles_parent_idx = None
+
+    # (N, 3) array of per-particle (x,y,z) scales
+    _particles_scale = None
+
+    # List of (prim, is_cloth) tuples of all particle parents, i.e.: the link a particle is attached to, or the object
+    # itself if the object is a cloth, as well as a mapping from each parent prim to its index in the list
+    _particles_parents = None
+    _particles_parent2idx = None
+
     # Maps group name to array of face_ids where particles are located if the group object is a cloth type
     # Maps group name to np.array of face IDs (int) that particles are attached to
     _cloth_face_ids = None
@@ -365,7 +392,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
 
         # Initialize mutable class variables so they don't automatically get overridden by children classes
         cls._particles_info = dict()
-        cls._particles_local_mat = dict()
+        cls._reset_particle_arrays()
         cls._cloth_face_ids = dict()
 
     @classmethod
@@ -392,7 +419,8 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
                 orientations = T.axisangle2quat(T.vecs2axisangle(z_up, normals))
                 z_extent = cls._particle_object.aabb_extent[2]
                 if not cls._CLIP_INTO_OBJECTS and z_extent > 0:
-                    z_offsets = np.array([z_extent * particle.scale[2] for particle in cls._group_particles[group].values()]) / 2.0
+                    slots = cls._get_particle_slots(particles=cls._group_particles[group])
+                    z_offsets = z_extent * cls._particles_scale[slots, 2] / 2.0
                     # Shift the particles halfway up
                     positions += normals * z_offsets.reshape(-1, 1)
 
@@ -431,7 +459,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
 
         # Clear all groups as well
         cls._particles_info = dict()
-        cls._particles_local_mat = dict()
+        cls._reset_particle_arrays()
         cls._cloth_face_ids = dict()
 
     @classmethod
@@ -454,7 +482,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         parent_obj = cls._particles_info[name]["obj"]
         group = cls.get_group_name(obj=parent_obj)
         cls._group_particles[group].pop(name)
-        cls._particles_local_mat.pop(name)
+        cls._untrack_particle(name=name)
         particle_info = cls._particles_info.pop(name)
         if cls._is_cloth_obj(obj=parent_obj):
             # Also remove from cloth face ids
@@ -526,6 +554,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
             # Add to group
             cls._group_particles[group][particle.name] = particle
             cls._particles_info[particle.name] = dict(obj=cls._group_objects[group], link=link)
+            cls._track_particle(name=particle.name, obj=obj, link=link)
 
             # Set the pose
             cls.set_particle_position_orientation(idx=-1, position=position, orientation=orientation)
@@ -608,6 +637,136 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
 
         return success
 
+    @classmethod
+    def _reset_particle_arrays(cls):
+        """
+        Resets the array-backed per-particle bookkeeping, discarding all tracked particles
+        """
+        cls._particles_slot = dict()
+        cls._particles_slot_names = []
+        cls._particles_local_mat = np.zeros((0, 4, 4))
+        cls._particles_parent_idx = np.zeros(0, dtype=int)
+        cls._particles_scale = np.zeros((0, 3))
+        cls._particles_parents = []
+        cls._particles_parent2idx = dict()
+
+    @classmethod
+    def _track_particle(cls, name, obj, link=None):
+        """
+        Adds particle @name to the array-backed per-particle bookkeeping. The particle's current local pose and scale
+        are read once here, after which they are only kept in sync through this class's pose setters
+
+        Args:
+            name (str): Name of the particle to track
+            obj (BaseObject): Object that the particle is attached to
+            link (None or RigidPrim): Link that the particle is attached to. Should be None if @obj is a cloth, in
+                which case the particle is attached to @obj itself
+        """
+        parent = obj if link is None else link
+        if parent not in cls._particles_parent2idx:
+            cls._particles_parent2idx[parent] = len(cls._particles_parents)
+            cls._particles_parents.append((parent, link is None))
+
+        # Grow the arrays geometrically so that adding particles one at a time stays amortized O(1)
+        slot = len(cls._particles_slot_names)
+        if slot == len(cls._particles_local_mat):
+            n_new = max(slot, 16)
+            cls._particles_local_mat = np.concatenate([cls._particles_local_mat, np.zeros((n_new, 4, 4))])
+            cls._particles_parent_idx = np.concatenate([cls._particles_parent_idx, np.zeros(n_new, dtype=int)])
+            cls._particles_scale = np.concatenate([cls._particles_scale, np.zeros((n_new, 3))])
+
+        particle = cls.particles[name]
+        cls._particles_slot[name] = slot
+        cls._particles_slot_names.append(name)
+        cls._particles_parent_idx[slot] = cls._particles_parent2idx[parent]
+        cls._particles_scale[slot] = particle.scale
+        local_pos, local_quat = particle.get_local_pose()
+        parent_scale = cls._get_parents_scale(parents=[cls._particles_parents[cls._particles_parent_idx[slot]]])[0]
+        cls._particles_local_mat[slot] = T.pose2mat((local_pos * parent_scale, local_quat))
+
+    @classmethod
+    def _untrack_particle(cls, name):
+        """
+        Removes particle @name from the array-backed per-particle bookkeeping
+
+        Args:
+            name (str): Name of the particle to untrack
+        """
+        slot = cls._particles_slot.pop(name)
+        last_name = cls._particles_slot_names.pop()
+        if last_name != name:
+            # Move the last particle into the freed slot to keep the arrays contiguous
+            last_slot = len(cls._particles_slot_names)
+            cls._particles_local_mat[slot] = cls._particles_local_mat[last_slot]
+            cls._particles_parent_idx[slot] = cls._particles_parent_idx[last_slot]
+            cls._particles_scale[slot] = cls._particles_scale[last_slot]
+            cls._particles_slot[last_name] = slot
+            cls._particles_slot_names[slot] = last_name
+
+    @classmethod
+    def _set_particle_scales(cls, scales):
+        # Run super first
+        super()._set_particle_scales(scales=scales)
+
+        # Keep the cached scales of all tracked particles in sync with their prims
+        names = list(cls.particles.keys())
+        scales = np.array(scales).reshape(-1, 3)
+        idxs = [i for i, name in enumerate(names) if name in cls._particles_slot]
+        cls._particles_scale[cls._get_particle_slots(particles=[names[i] for i in idxs])] = scales[idxs]
+
+    @classmethod
+    def _get_particle_slots(cls, particles):
+        """
+        Args:
+            particles (Iterable of str): Names of particles to grab array slots for
+
+        Returns:
+            n-array: Per-particle row index into the per-particle arrays
+        """
+        return np.fromiter((cls._particles_slot[name] for name in particles), dtype=int, count=len(particles))
+
+    @classmethod
+    def _get_parents_tf(cls, parents):
+        """
+        Args:
+            parents (list of 2-tuple): (prim, is_cloth) particle parents to grab global transforms for
+
+        Returns:
+            (n, 4, 4)-array: Per-parent global homogeneous transform
+        """
+        # For cloths, we want World --> obj transform, NOT the World --> root_link transform, since these particles
+        # do NOT exist under a link but rather the object prim itself. So we use XFormPrim to directly get the
+        # transform, and not obj.get_local_pose() which will give us the local pose of the root link!
+        return np.array([T.pose2mat(XFormPrim.get_local_pose(parent) if is_cloth else parent.get_position_orientation())
+                         for parent, is_cloth in parents]).reshape(-1, 4, 4)
+
+    @classmethod
+    def _get_parents_scale(cls, parents):
+        """
+        Args:
+            parents (list of 2-tuple): (prim, is_cloth) particle parents to grab scales for
+
+        Returns:
+            (n, 3)-array: Per-parent (x,y,z) scale. Cloths are always treated as having unit scale
+        """
+        return np.array([np.ones(3) if is_cloth else parent.scale for parent, is_cloth in parents]).reshape(-1, 3)
+
+    @classmethod
+    def _get_particles_parents(cls, slots):
+        """
+        Grabs the unique parents of the particles at @slots, so that each parent's pose only needs to be queried once
+
+        Args:
+            slots (n-array): Per-particle row index into the per-particle arrays
+
+        Returns:
+            2-tuple:
+                - list of 2-tuple: Unique (prim, is_cloth) parents of the particles
+                - n-array: Per-particle index into the unique parents list
+        """
+        parent_idxs, inverse = np.unique(cls._particles_parent_idx[slots], return_inverse=True)
+        return [cls._particles_parents[parent_idx] for parent_idx in parent_idxs], inverse
+
     @classmethod
     def _compute_batch_particles_position_orientation(cls, particles, local=False):
         """
@@ -626,37 +785,20 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         if n_particles == 0:
             return (np.array([]).reshape(0, 3), np.array([]).reshape(0, 4))
 
+        # Gather the cached local poses, and query each unique parent only once
+        slots = cls._get_particle_slots(particles=particles)
+        parents, inverse = cls._get_particles_parents(slots=slots)
+        poses = cls._particles_local_mat[slots]
         if local:
-            poses = np.zeros((n_particles, 4, 4))
-            for i, name in enumerate(particles):
-                poses[i] = T.pose2mat(cls.particles[name].get_local_pose())
+            # Cached local poses are expressed in the parent's scaled frame, so we undo the scaling
+            positions = poses[:, :3, 3] / cls._get_parents_scale(parents=parents)[inverse]
         else:
-            # Iterate over all particles and compute link tfs programmatically, then batch the matrix transform
-            link_tfs = dict()
-            link_tfs_batch = np.zeros((n_particles, 4, 4))
-            particle_local_poses_batch = np.zeros_like(link_tfs_batch)
-            for i, name in enumerate(particles):
-                obj = cls._particles_info[name]["obj"]
-                is_cloth = cls._is_cloth_obj(obj=obj)
-                if is_cloth:
-                    if obj not in link_tfs:
-                        # We want World --> obj transform, NOT the World --> root_link transform, since these particles
-                        # do NOT exist under a link but rather the object prim itself. So we use XFormPrim to directly
-                        # get the transform, and not obj.get_local_pose() which will give us the local pose of the
-                        # root link!
-                        link_tfs[obj] = T.pose2mat(XFormPrim.get_local_pose(obj))
-                else:
-                    link = cls._particles_info[name]["link"]
-                    if link not in link_tfs:
-                        link_tfs[link] = T.pose2mat(link.get_position_orientation())
-                link_tfs_batch[i] = link_tfs[link]
-                particle_local_poses_batch[i] = cls._particles_local_mat[name]
-
             # Compute once
-            poses = np.matmul(link_tfs_batch, particle_local_poses_batch)
+            poses = np.matmul(cls._get_parents_tf(parents=parents)[inverse], poses)
+            positions = poses[:, :3, 3]
 
         # Decompose back into positions and orientations
-        return poses[:, :3, 3], T.mat2quat(poses[:, :3, :3])
+        return positions, T.mat2quat(poses[:, :3, :3])
 
     @classmethod
     def get_particles_position_orientation(cls):
@@ -677,16 +819,9 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
     @classmethod
     def get_particle_position_orientation(cls, idx):
         name = list(cls.particles.keys())[idx]
-        # First, get local pose, scale it by the parent link's scale, and then convert into a matrix
         # Note that particles_local_mat already takes the parent scale into account when computing the transform!
-        parent_obj = cls._particles_info[name]["obj"]
-        is_cloth = cls._is_cloth_obj(obj=parent_obj)
-        local_mat = cls._particles_local_mat[name]
-        link_tf = T.pose2mat(XFormPrim.get_local_pose(parent_obj)) if is_cloth else \
-            T.pose2mat(cls._particles_info[name]["link"].get_position_orientation())
-
-        # Multiply the local pose by the link's global transform, then return as pos, quat tuple
-        return T.mat2pose(link_tf @ local_mat)
+        positions, orientations = cls._compute_batch_particles_position_orientation(particles=[name], local=False)
+        return positions[0], orientations[0]
 
     @classmethod
     def get_particle_local_pose(cls, idx):
@@ -718,38 +853,29 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         lens = np.array([len(particles), len(positions), len(orientations)])
         assert lens.min() == lens.max(), "Got mismatched particles, positions, and orientations!"
 
-        particle_local_poses_batch = np.zeros((cls.n_particles, 4, 4))
+        particle_local_poses_batch = np.zeros((n_particles, 4, 4))
         particle_local_poses_batch[:, -1, -1] = 1.0
         particle_local_poses_batch[:, :3, 3] = positions
         particle_local_poses_batch[:, :3, :3] = T.quat2mat(orientations)
 
-        if not local:
-            # Iterate over all particles and compute link tfs programmatically, then batch the matrix transform
-            link_tfs = dict()
-            link_tfs_batch = np.zeros((cls.n_particles, 4, 4))
-            for i, name in enumerate(particles):
-                obj = cls._particles_info[name]["obj"]
-                is_cloth = cls._is_cloth_obj(obj=obj)
-                if is_cloth:
-                    if obj not in link_tfs:
-                        # We want World --> obj transform, NOT the World --> root_link transform, since these particles
-                        # do NOT exist under a link but rather the object prim itself. So we use XFormPrim to directly
-                        # get the transform, and not obj.get_local_pose() which will give us the local pose of the
-                        # root link!
-                        link_tfs[obj] = T.pose2mat(XFormPrim.get_local_pose(obj))
-                    link_tf = link_tfs[obj]
-                else:
-                    link = cls._particles_info[name]["link"]
-                    if link not in link_tfs:
-                        link_tfs[link] = T.pose2mat(link.get_position_orientation())
-                    link_tf = link_tfs[link]
-                link_tfs_batch[i] = link_tf
-
+        # Query each unique parent only once
+        slots = cls._get_particle_slots(particles=particles)
+        parents, inverse = cls._get_particles_parents(slots=slots)
+        scales = cls._get_parents_scale(parents=parents)[inverse]
+        if local:
+            # Cached local poses are expressed in the parent's scaled frame
+            particle_local_poses_batch[:, :3, 3] *= scales
+        else:
             # particle_local_poses_batch = np.matmul(np.linalg.inv(link_tfs_batch), particle_local_poses_batch)
-            particle_local_poses_batch = np.linalg.solve(link_tfs_batch, particle_local_poses_batch)
+            particle_local_poses_batch = np.linalg.solve(
+                cls._get_parents_tf(parents=parents)[inverse], particle_local_poses_batch)
 
-        for i, name in enumerate(particles):
-            cls._modify_particle_local_mat(name=name, mat=particle_local_poses_batch[i], ignore_scale=local)
+        # Store updated values, and write the unscaled local poses to the particle prims
+        cls._particles_local_mat[slots] = particle_local_poses_batch
+        local_positions = particle_local_poses_batch[:, :3, 3] / scales
+        local_orientations = T.mat2quat(particle_local_poses_batch[:, :3, :3])
+        for name, local_pos, local_quat in zip(particles, local_positions, local_orientations):
+            cls.particles[name].set_local_pose(local_pos, local_quat)
 
     @classmethod
     def set_particles_position_orientation(cls, positions=None, orientations=None):
@@ -775,18 +901,12 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
             orientation = ori if orientation is None else orientation
 
         name = list(cls.particles.keys())[idx]
-        global_mat = np.zeros((4, 4))
-        global_mat[-1, -1] = 1.0
-        global_mat[:3, 3] = position
-        global_mat[:3, :3] = T.quat2mat(orientation)
-        # First, get global pose, scale it by the parent link's scale, and then convert into a matrix
-        parent_obj = cls._particles_info[name]["obj"]
-        is_cloth = cls._is_cloth_obj(obj=parent_obj)
-        link_tf = T.pose2mat(XFormPrim.get_local_pose(parent_obj)) if is_cloth else \
-            T.pose2mat(cls._particles_info[name]["link"].get_position_orientation())
-        local_mat = np.linalg.inv(link_tf) @ global_mat
-
-        cls._modify_particle_local_mat(name=name, mat=local_mat, ignore_scale=False)
+        cls._modify_batch_particles_position_orientation(
+            particles=[name],
+            positions=np.array([position]),
+            orientations=np.array([orientation]),
+            local=False,
+        )
 
     @classmethod
     def set_particle_local_pose(cls, idx, position=None, orientation=None):
@@ -796,11 +916,12 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
             orientation = ori if orientation is None else orientation
 
         name = list(cls.particles.keys())[idx]
-        local_mat = np.zeros((4, 4))
-        local_mat[-1, -1] = 1.0
-        local_mat[:3, 3] = position
-        local_mat[:3, :3] = T.quat2mat(orientation)
-        cls._modify_particle_local_mat(name=name, mat=local_mat, ignore_scale=True)
+        cls._modify_batch_particles_position_orientation(
+            particles=[name],
+            positions=np.array([position]),
+            orientations=np.array([orientation]),
+            local=True,
+        )
 
     @classmethod
     def _is_cloth_obj(cls, obj):
@@ -815,47 +936,6 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
         """
         return obj.prim_type == PrimType.CLOTH
 
-    @classmethod
-    def _compute_particle_local_mat(cls, name, ignore_scale=False):
-        """
-        Computes particle @name's local transform as a homogeneous 4x4 matrix
-
-        Args:
-            name (str): Name of the particle to compute local transform matrix for
-            ignore_scale (bool): Whether to ignore the parent_link scale when computing the local transform
-
-        Returns:
-            np.array: (4, 4) homogeneous transform matrix
-        """
-        particle = cls.particles[name]
-        parent_obj = cls._particles_info[name]["obj"]
-        is_cloth = cls._is_cloth_obj(obj=parent_obj)
-        scale = np.ones(3) if is_cloth else cls._particles_info[name]["link"].scale
-        local_pos, local_quat = particle.get_local_pose()
-        local_pos = local_pos if ignore_scale else local_pos * scale
-        return T.pose2mat((local_pos, local_quat))
-
-    @classmethod
-    def _modify_particle_local_mat(cls, name, mat, ignore_scale=False):
-        """
-        Sets particle @name's local transform as a homogeneous 4x4 matrix
-
-        Args:
-            name (str): Name of the particle to compute local transform matrix for
-            mat (n-array): (4, 4) homogeneous transform matrix
-            ignore_scale (bool): Whether to ignore the parent_link scale when setting the local transform
-        """
-        particle = cls.particles[name]
-        parent_obj = cls._particles_info[name]["obj"]
-        is_cloth = cls._is_cloth_obj(obj=parent_obj)
-        scale = np.ones(3) if is_cloth else cls._particles_info[name]["link"].scale
-        local_pos, local_quat = T.mat2pose(mat)
-        local_pos = local_pos if ignore_scale else local_pos / scale
-        particle.set_local_pose(local_pos, local_quat)
-
-        # Store updated value
-        cls._particles_local_mat[name] = mat
-
     @classmethod
     def _sync_particle_groups(
         cls,
@@ -931,6 +1011,7 @@ class MacroVisualParticleSystem(MacroParticleSystem, VisualParticleSystem):
                     cls._particles_info[particle.name]["face_id"] = int(reference)
                 else:
                     cls._particles_info[particle.name]["link"] = obj.links[reference]
+                cls._track_particle(name=particle.name, obj=obj, link=None if is_cloth else obj.links[reference])
 
             # Also store the cloth face IDs as a vector
             if is_cloth:
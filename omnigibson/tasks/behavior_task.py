@@ -11,15 +11,20 @@ from bddl.activity import (
 )
 
 import omnigibson as og
+from omnigibson.controllers import IsGraspingState
 from omnigibson.macros import gm
-from omnigibson.object_states import Pose
+from omnigibson.object_states import ContactBodies, Pose
 from omnigibson.reward_functions.potential_reward import PotentialReward
 from omnigibson.robots.robot_base import BaseRobot
 from omnigibson.systems.system_base import get_system, add_callback_on_system_init, add_callback_on_system_clear, \
     REGISTERED_SYSTEMS
 from omnigibson.scenes.interactive_traversable_scene import InteractiveTraversableScene
-from omnigibson.utils.bddl_utils import OmniGibsonBDDLBackend, BDDLEntity, BEHAVIOR_ACTIVITIES, BDDLSampler
+from omnigibson.utils.bddl_utils import OmniGibsonBDDLBackend, BDDLEntity, BEHAVIOR_ACTIVITIES, BDDLSampler, \
+    BDDLPredicateCache
 from omnigibson.tasks.task_base import BaseTask
+from omnigibson.utils.activity_cache_utils import get_activity_cache_dir, get_activity_instance_filename, \
+    get_cached_activity_instances, get_objects_signature
+from omnigibson.utils.snapshot_utils import get_scene_file
 from omnigibson.termination_conditions.predicate_goal import PredicateGoal
 from omnigibson.termination_conditions.timeout import Timeout
 import omnigibson.utils.transform_utils as T
@@ -39,11 +44,15 @@ class BehaviorTask(BaseTask):
         activity_definition_id (int): Specification to load for the desired task. For a given Behavior Task, multiple task
             specifications can be used (i.e.: differing goal conditions, or "ways" to complete a given task). This
             ID determines which specification to use
-        activity_instance_id (int): Specific pre-configured instance of a scene to load for this BehaviorTask. This
-            will be used only if @online_object_sampling is False.
+        activity_instance_id (None or int): Specific pre-configured instance of a scene to load for this BehaviorTask.
+            This will be used only if @online_object_sampling is False. If None, a random pre-validated instance is
+            picked from the activity cache (see omnigibson.utils.activity_cache_utils)
         predefined_problem (None or str): If specified, specifies the raw string definition of the Behavior Task to
             load. This will automatically override @activity_name and @activity_definition_id.
         online_object_sampling (bool): whether to sample object locations online at runtime or not
+        randomize_activity_instance (bool): whether to load a random pre-validated instance from the activity cache
+            at every reset. Only instances containing exactly the same objects as the loaded scene can be swapped in
+            this way, since only their states are loaded. Only used if @online_object_sampling is False
         debug_object_sampling (bool): whether to debug placement functionality
         highlight_task_relevant_objects (bool): whether to overlay task-relevant objects in the scene with a colored mask
         termination_config (None or dict): Keyword-mapped configuration to use to generate termination conditions. This
@@ -62,6 +71,7 @@ class BehaviorTask(BaseTask):
             activity_instance_id=0,
             predefined_problem=None,
             online_object_sampling=False,
+            randomize_activity_instance=False,
             debug_object_sampling=False,
             highlight_task_relevant_objects=False,
             termination_config=None,
@@ -98,6 +108,8 @@ class BehaviorTask(BaseTask):
         # Object info
         self.debug_object_sampling = debug_object_sampling                      # bool
         self.online_object_sampling = online_object_sampling                    # bool
+        self.randomize_activity_instance = randomize_activity_instance          # bool
+        self._objects_signature = None                                          # None or str
         self.highlight_task_relevant_objs = highlight_task_relevant_objects     # bool
         self.object_scope = None                                                # Maps str to BDDLEntity
         self.object_instance_to_category = None                                 # Maps str to str
@@ -109,6 +121,10 @@ class BehaviorTask(BaseTask):
         self.currently_viewed_instruction = None                                # tuple of str
         self.activity_natural_language_goal_conditions = None                   # str
 
+        # Low dim observation info
+        self._low_dim_obs_layout = None                                         # dict, see _build_low_dim_obs_layout()
+        self._low_dim_obs_buffer = None                                         # np.array of float
+
         # Load the initial behavior configuration
         self.update_activity(activity_name=activity_name, activity_definition_id=activity_definition_id, predefined_problem=predefined_problem)
 
@@ -129,7 +145,12 @@ class BehaviorTask(BaseTask):
         Returns:
             str: Filename which, if exists, should include the cached activity scene
         """
-        return f"{scene_model}_task_{activity_name}_{activity_definition_id}_{activity_instance_id}_template"
+        return get_activity_instance_filename(
+            scene_model=scene_model,
+            activity_name=activity_name,
+            activity_definition_id=activity_definition_id,
+            activity_instance_id=activity_instance_id,
+        )
 
     @classmethod
     def verify_scene_and_task_config(cls, scene_cfg, task_cfg):
@@ -141,6 +162,17 @@ class BehaviorTask(BaseTask):
         activity_name = task_cfg["predefined_problem"].split("problem ")[-1].split("-")[0] if \
             task_cfg.get("predefined_problem", None) is not None else task_cfg["activity_name"]
         if scene_file is None and scene_instance is None and not task_cfg["online_object_sampling"]:
+            # Pick a random pre-validated instance from the activity cache if no specific instance is requested
+            if "activity_instance_id" in task_cfg and task_cfg["activity_instance_id"] is None:
+                records = get_cached_activity_instances(
+                    scene_model=scene_cfg["scene_model"],
+                    activity_name=activity_name,
+                    activity_definition_id=task_cfg.get("activity_definition_id", 0),
+                )
+                assert len(records) > 0, f"No pre-validated cached instances of activity {activity_name} found for " \
+                                         f"scene {scene_cfg['scene_model']}! Generate them with " \
+                                         f"scripts/sample_activity_cache.py first."
+                task_cfg["activity_instance_id"] = records[np.random.randint(len(records))]["instance_id"]
             scene_instance = cls.get_cached_activity_scene_filename(
                 scene_model=scene_cfg["scene_model"],
                 activity_name=activity_name,
@@ -163,6 +195,47 @@ class BehaviorTask(BaseTask):
         # Load from sim
         return og.sim.get_metadata(key="task")
 
+    def load_random_activity_instance(self, env):
+        """
+        Loads the state of a random pre-validated instance of the current activity from the activity cache into the
+        current scene, and updates the object scope accordingly. Only instances containing exactly the same objects as
+        the current scene are considered. The loaded state becomes the scene's new initial state
+
+        Args:
+            env (Environment): Current active environment instance
+
+        Returns:
+            bool: Whether a new instance was loaded
+        """
+        scene_model = og.sim.scene.scene_model
+        records = [
+            record for record in get_cached_activity_instances(
+                scene_model=scene_model,
+                activity_name=self.activity_name,
+                activity_definition_id=self.activity_definition_id,
+            ) if record["objects_signature"] == self._objects_signature
+        ]
+        if len(records) == 0:
+            return False
+        record = records[np.random.randint(len(records))]
+        if record["instance_id"] == self.activity_instance_id:
+            return False
+
+        # Load the instance's state. Its scene file is parsed once and cached, so repeated resets are cheap
+        scene_info = get_scene_file(os.path.join(get_activity_cache_dir(scene_model=scene_model), record["fname"])) \
+            .load(keys=["metadata", "state"])
+        og.sim.load_state(scene_info["state"], serialized=False)
+        og.sim.scene.update_initial_state()
+        self.activity_instance_id = record["instance_id"]
+
+        # Re-assign the object scope and re-generate the goal conditions
+        self.assign_object_scope_with_cache(env, inst_to_name=scene_info["metadata"]["task"]["inst_to_name"])
+        self._generate_goal_conditions()
+        self._low_dim_obs_layout = None
+        self._low_dim_obs_buffer = None
+
+        return True
+
     def _create_termination_conditions(self):
         # Initialize termination conditions dict and fill in with Timeout and PredicateGoal
         terminations = dict()
@@ -203,6 +276,11 @@ class BehaviorTask(BaseTask):
         add_callback_on_system_init(name=callback_name, callback=self._update_bddl_scope_from_system_init)
         add_callback_on_system_clear(name=callback_name, callback=self._update_bddl_scope_from_system_clear)
 
+        # Store the signature of the loaded objects, which determines which cached instances can be swapped in
+        if self.randomize_activity_instance and not self.online_object_sampling:
+            og.sim.scene.update_objects_info()
+            self._objects_signature = get_objects_signature(og.sim.scene.get_objects_info()["init_info"])
+
     def _load_non_low_dim_observation_space(self):
         # No non-low dim observations so we return an empty dict
         return dict()
@@ -256,6 +334,10 @@ class BehaviorTask(BaseTask):
         self.currently_viewed_instruction = self.instruction_order[self.currently_viewed_index]
         self.activity_natural_language_goal_conditions = get_natural_goal_conditions(self.activity_conditions)
 
+        # The object scope may have changed, so the low dim observation layout needs to be rebuilt
+        self._low_dim_obs_layout = None
+        self._low_dim_obs_buffer = None
+
     def get_potential(self, env):
         """
         Compute task-specific potential: distance to the goal
@@ -311,11 +393,17 @@ class BehaviorTask(BaseTask):
             self.assign_object_scope_with_cache(env)
 
         # Generate goal condition with the fully populated self.object_scope
+        self._generate_goal_conditions()
+        return accept_scene, feedback
+
+    def _generate_goal_conditions(self):
+        """
+        Generates the goal conditions from the current (fully populated) object scope
+        """
         self.activity_goal_conditions = get_goal_conditions(self.activity_conditions, self.backend, self.object_scope)
         self.ground_goal_state_options = get_ground_goal_state_options(
             self.activity_conditions, self.backend, self.object_scope, self.activity_goal_conditions
         )
-        return accept_scene, feedback
 
     def get_agent(self, env):
         """
@@ -330,15 +418,18 @@ class BehaviorTask(BaseTask):
         # We assume the relevant agent is the first agent in the scene
         return env.robots[0]
 
-    def assign_object_scope_with_cache(self, env):
+    def assign_object_scope_with_cache(self, env, inst_to_name=None):
         """
         Assigns objects within the current object scope
 
         Args:
             env (Environment): Current active environment instance
+            inst_to_name (None or dict): If specified, maps each BDDL object instance to its corresponding object or
+                system name. Otherwise, this is loaded from the current task metadata
         """
         # Load task metadata
-        inst_to_name = self.load_task_metadata()["inst_to_name"]
+        if inst_to_name is None:
+            inst_to_name = self.load_task_metadata()["inst_to_name"]
 
         # Assign object_scope based on a cached scene
         for obj_inst in self.object_scope:
@@ -355,41 +446,114 @@ class BehaviorTask(BaseTask):
                 entity=entity,
             )
 
-    def _get_obs(self, env):
-        low_dim_obs = dict()
+    def _build_low_dim_obs_layout(self, env):
+        """
+        Builds the fixed layout of the low dim observations for the current object scope. For every (non-system)
+        scoped entity, the observations are, in order: "<inst>_real" (1), "<inst>_pos" (3), "<inst>_ori_cos" (3),
+        "<inst>_ori_sin" (3), and "<inst>_in_gripper_<arm>" (1) for each of the agent's arms, unless the entity is the
+        agent itself
 
-        # Batch rpy calculations for much better efficiency
-        objs_exist = {obj: obj.exists for obj in self.object_scope.values() if not obj.is_system}
-        objs_rpy = T.quat2euler(np.array([obj.states[Pose].get_value()[1] if obj_exist else np.array([0, 0, 0, 1.0])
-                                          for obj, obj_exist in objs_exist.items()]))
-        objs_rpy_cos = np.cos(objs_rpy)
-        objs_rpy_sin = np.sin(objs_rpy)
+        Args:
+            env (Environment): Current active environment instance
 
-        # Always add agent info first
+        Returns:
+            dict: Layout with keys "entities" (list of scoped BDDLEntity), "slices" (dict mapping each observation name
+                to its slice in the flattened low dim observation), "real", "pos", "ori_cos", "ori_sin" (per-entity
+                index arrays into the flattened observation, of shape (N,) or (N, 3)), "in_gripper" (dict mapping each
+                arm name to a (N,) index array, where -1 denotes no entry) and "size" (total size)
+        """
         agent = self.get_agent(env=env)
+        entities = [entity for entity in self.object_scope.values() if not entity.is_system]
+        n = len(entities)
+        slices = dict()
+        idxs = {name: np.zeros((n, 3), dtype=int) for name in ("pos", "ori_cos", "ori_sin")}
+        idxs["real"] = np.zeros(n, dtype=int)
+        idxs["in_gripper"] = {arm: -np.ones(n, dtype=int) for arm in agent.arm_names}
+        idx = 0
+        for i, entity in enumerate(entities):
+            for name, size in (("real", 1), ("pos", 3), ("ori_cos", 3), ("ori_sin", 3)):
+                slices[f"{entity.bddl_inst}_{name}"] = slice(idx, idx + size)
+                idxs[name][i] = np.arange(idx, idx + size) if size > 1 else idx
+                idx += size
+            if entity.synset != "agent.n.01":
+                for arm in agent.arm_names:
+                    slices[f"{entity.bddl_inst}_in_gripper_{arm}"] = slice(idx, idx + 1)
+                    idxs["in_gripper"][arm][i] = idx
+                    idx += 1
+
+        return dict(entities=entities, slices=slices, size=idx, **idxs)
+
+    @property
+    def low_dim_obs_layout(self):
+        """
+        Returns:
+            None or dict: Maps each low dim observation name to its corresponding slice within the flattened low dim
+                observation, or None if the layout has not been built yet (i.e.: no observations have been
+                computed yet)
+        """
+        return None if self._low_dim_obs_layout is None else self._low_dim_obs_layout["slices"]
+
+    def _compute_low_dim_obs(self, env):
+        """
+        Computes the flattened low dim observations in-place into the internal buffer
+
+        Args:
+            env (Environment): Current active environment instance
 
-        for (obj, obj_exist), obj_rpy, obj_rpy_cos, obj_rpy_sin in zip(objs_exist.items(), objs_rpy, objs_rpy_cos, objs_rpy_sin):
-
-            # TODO: May need to update checking here to USDObject? Or even baseobject?
-            # TODO: How to handle systems as part of obs?
-            if obj_exist:
-                low_dim_obs[f"{obj.bddl_inst}_real"] = np.array([1.0])
-                low_dim_obs[f"{obj.bddl_inst}_pos"] = obj.states[Pose].get_value()[0]
-                low_dim_obs[f"{obj.bddl_inst}_ori_cos"] = obj_rpy_cos
-                low_dim_obs[f"{obj.bddl_inst}_ori_sin"] = obj_rpy_sin
-                if obj.name != agent.name:
-                    for arm in agent.arm_names:
-                        grasping_object = agent.is_grasping(arm=arm, candidate_obj=obj.wrapped_obj)
-                        low_dim_obs[f"{obj.bddl_inst}_in_gripper_{arm}"] = np.array([float(grasping_object)])
+        Returns:
+            n-array: Internal (N,)-shaped buffer containing the flattened low dim observations
+        """
+        if self._low_dim_obs_layout is None:
+            self._low_dim_obs_layout = self._build_low_dim_obs_layout(env=env)
+            self._low_dim_obs_buffer = np.zeros(self._low_dim_obs_layout["size"])
+        layout, obs = self._low_dim_obs_layout, self._low_dim_obs_buffer
+        obs.fill(0.0)
+
+        # Gather the poses of all existing entities at once and batch the rpy calculations for much better efficiency
+        exists = np.array([entity.exists for entity in layout["entities"]], dtype=bool)
+        existing_entities = [entity for entity, exist in zip(layout["entities"], exists) if exist]
+        if len(existing_entities) > 0:
+            poses = [entity.states[Pose].get_value() for entity in existing_entities]
+            objs_pos = np.array([pos for pos, _ in poses])
+            objs_rpy = T.quat2euler(np.array([quat for _, quat in poses]))
+            obs[layout["real"][exists]] = 1.0
+            obs[layout["pos"][exists]] = objs_pos
+            obs[layout["ori_cos"][exists]] = np.cos(objs_rpy)
+            obs[layout["ori_sin"][exists]] = np.sin(objs_rpy)
+
+        # Check each arm once, and only query individual entities if their values may differ from the arm's general
+        # grasping state. With physical grasping, each entity's value is determined by its contacts with the fingers
+        # unless the state is UNKNOWN. Otherwise, no entity can be grasped if the arm is not grasping anything
+        agent = self.get_agent(env=env)
+        for arm, arm_idxs in layout["in_gripper"].items():
+            valid = exists & (arm_idxs >= 0)
+            is_grasping = agent.is_grasping(arm=arm)
+            valid_entities = [entity for entity, entity_valid in zip(layout["entities"], valid) if entity_valid]
+            if is_grasping != IsGraspingState.UNKNOWN and agent.grasping_mode == "physical":
+                # Equivalent to agent.is_grasping(arm=arm, candidate_obj=obj), without re-querying the controller
+                finger_links = set(agent.finger_links[arm])
+                obs[arm_idxs[valid]] = [
+                    float(len(entity.wrapped_obj.states[ContactBodies].get_value().intersection(finger_links)) > 0)
+                    for entity in valid_entities
+                ]
+            elif is_grasping == IsGraspingState.TRUE:
+                obs[arm_idxs[valid]] = [float(agent.is_grasping(arm=arm, candidate_obj=entity.wrapped_obj))
+                                        for entity in valid_entities]
             else:
-                low_dim_obs[f"{obj.bddl_inst}_real"] = np.zeros(1)
-                low_dim_obs[f"{obj.bddl_inst}_pos"] = np.zeros(3)
-                low_dim_obs[f"{obj.bddl_inst}_ori_cos"] = np.zeros(3)
-                low_dim_obs[f"{obj.bddl_inst}_ori_sin"] = np.zeros(3)
-                for arm in agent.arm_names:
-                    low_dim_obs[f"{obj.bddl_inst}_in_gripper_{arm}"] = np.zeros(1)
+                obs[arm_idxs[valid]] = float(is_grasping)
+
+        return obs
 
-        return low_dim_obs, dict()
+    def _get_obs(self, env):
+        # Provide named views into the flattened low dim observations
+        low_dim_obs = self._compute_low_dim_obs(env=env).copy()
+        return {name: low_dim_obs[obs_slice] for name, obs_slice in self.low_dim_obs_layout.items()}, dict()
+
+    def get_obs(self, env, flatten_low_dim=True):
+        # Directly return the flattened low dim observations, skipping the intermediate dictionary entirely
+        if not flatten_low_dim:
+            return super().get_obs(env=env, flatten_low_dim=flatten_low_dim)
+        return dict(low_dim=self._compute_low_dim_obs(env=env).copy())
 
     def _step_termination(self, env, action, info=None):
         # Run super first
@@ -400,6 +564,24 @@ class BehaviorTask(BaseTask):
 
         return done, info
 
+    def reset(self, env):
+        # Any memoized predicate values are invalid after the scene is reset
+        BDDLPredicateCache.clear()
+
+        # Possibly swap in a different pre-validated activity instance, which becomes the state the scene is reset to
+        if self.randomize_activity_instance and not self.online_object_sampling:
+            self.load_random_activity_instance(env=env)
+
+        # Run super
+        super().reset(env=env)
+
+    def step(self, env, action):
+        # Memoize predicate evaluations, so that each grounded goal predicate is evaluated at most once while computing
+        # the termination conditions, rewards, and goal status, and only re-evaluated in later steps if any of its
+        # arguments changed
+        with BDDLPredicateCache.enabled():
+            return super().step(env=env, action=action)
+
     def _update_bddl_scope_from_added_obj(self, obj):
         """
         Internal callback function to be called when sim.import_object() is called to potentially update internal
@@ -490,7 +672,7 @@ class BehaviorTask(BaseTask):
 
         Args:
             path (None or str): If specified, absolute fpath to the desired path to write the .json. Default is
-                <gm.DATASET_PATH/scenes/<SCENE_MODEL>/json/...>
+                <gm.DATASET_PATH/scenes/<SCENE_MODEL>/json/...>, see get_activity_cache_dir()
             override (bool): Whether to override any files already found at the path to write the task .json
         """
         if path is None:
@@ -500,7 +682,7 @@ class BehaviorTask(BaseTask):
                 activity_definition_id=self.activity_definition_id,
                 activity_instance_id=self.activity_instance_id,
             )
-            path = os.path.join(gm.DATASET_PATH, "scenes", og.sim.scene.scene_model, "json", f"{fname}.json")
+            path = os.path.join(get_activity_cache_dir(scene_model=og.sim.scene.scene_model), f"{fname}.json")
 
         if os.path.exists(path) and not override:
             log.warning(f"Scene json already exists at {path}. Use override=True to force writing of new json.")
@@ -134,12 +134,12 @@ class BaseTask(GymObservable, Registerable, metaclass=ABCMeta):
 
     def _reset_scene(self, env):
         """
-        Task-specific scene reset. Default is the normal scene reset
+        Task-specific scene reset. Default is the environment's scene reset
 
         Args:
             env (Environment): environment instance
         """
-        env.scene.reset()
+        env.reset_scene()
 
     def _reset_agent(self, env):
         """
@@ -11,8 +11,10 @@ from omnigibson.macros import gm, create_module_macros
 from omnigibson.systems import get_system, is_system_active, PhysicalParticleSystem, VisualParticleSystem, REGISTERED_SYSTEMS
 from omnigibson.objects.dataset_object import DatasetObject
 from omnigibson.object_states import *
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.utils.asset_utils import get_all_object_category_models
 from omnigibson.utils.constants import PrimType
+from omnigibson.utils.profiling_utils import StepProfiler
 from omnigibson.utils.python_utils import Registerable, classproperty, subclass_factory
 from omnigibson.utils.registry_utils import Registry
 import omnigibson.utils.transform_utils as T
@@ -34,6 +36,11 @@ m.OBJECT_GRAVEYARD_POS = (100.0, 100.0, 100.0)
 # Default "trash" system if an invalid mixing rule transition occurs
 m.DEFAULT_GARBAGE_SYSTEM = "sludge"
 
+# Position (m) and orientation (quaternion component) resolutions at which object poses are compared when checking
+# whether the contents of a recipe container may have changed
+m.RECIPE_SIGNATURE_POS_RESOLUTION = 1e-3
+m.RECIPE_SIGNATURE_ORI_RESOLUTION = 1e-3
+
 # Tuple of attributes of objects created in transitions.
 # `states` field is dict mapping object state class to arguments to pass to setter for that class
 _attrs_fields = ["category", "model", "name", "scale", "obj", "pos", "orn", "bb_pos", "bb_orn", "states", "callback"]
@@ -62,20 +69,99 @@ class TransitionRuleAPI:
     # "callback": None or function to execute when the object is initialized
     _INIT_INFO = dict()
 
+    # ObjectCandidateIndex over all registered objects in the current scene. Maintained incrementally via
+    # add_object() / remove_object(), which are called whenever an object is imported into / removed from the simulator
+    _CANDIDATE_INDEX = None
+
+    # Maps registered rule to its (unpruned) object candidates, i.e.: dict mapping filter name to list of objects
+    # satisfying that filter. Updated in-place whenever an object is added / removed
+    _RULE_CANDIDATES = dict()
+
+    # Set of rules that need to be refreshed because their candidates (or the objects they depend on) have changed
+    _UPDATED_RULES = set()
+
+    # RigidContactAPI idx mapping version that the active rules were last refreshed with
+    _CONTACT_IDX_MAPPING_VERSION = None
+
+    @classmethod
+    def _get_candidate_index(cls):
+        """
+        Returns:
+            ObjectCandidateIndex: Index over all registered objects in the current scene, built from scratch if it
+                does not exist yet
+        """
+        if cls._CANDIDATE_INDEX is None:
+            cls._CANDIDATE_INDEX = ObjectCandidateIndex(objects=og.sim.scene.objects)
+        return cls._CANDIDATE_INDEX
+
+    @classmethod
+    def add_object(cls, obj):
+        """
+        Adds object @obj to the internal candidate index, and incrementally updates the candidates of every rule that
+        @obj is relevant for. This should be called whenever an object is imported into the simulator
+
+        Args:
+            obj (BaseObject): Object that was added
+        """
+        # Skip objects that are not registered in the scene (e.g.: the skybox), since they are never valid candidates
+        if og.sim.scene.object_registry("name", obj.name) is not obj:
+            return
+
+        index = cls._get_candidate_index()
+        if obj in index:
+            return
+        index.add(obj)
+
+        for rule, candidates in cls._RULE_CANDIDATES.items():
+            if rule.requires_refresh_on_object_change:
+                cls._UPDATED_RULES.add(rule)
+            for filter_name, f in rule.candidate_filters.items():
+                if f(obj):
+                    candidates[filter_name].append(obj)
+                    cls._UPDATED_RULES.add(rule)
+
     @classmethod
-    def get_rule_candidates(cls, rule, objects):
+    def remove_object(cls, obj):
+        """
+        Removes object @obj from the internal candidate index, and incrementally updates the candidates of every rule
+        that @obj was relevant for. This should be called whenever an object is removed from the simulator
+
+        Args:
+            obj (BaseObject): Object that was removed
+        """
+        if cls._CANDIDATE_INDEX is None or obj not in cls._CANDIDATE_INDEX:
+            return
+        cls._CANDIDATE_INDEX.remove(obj)
+
+        for rule, candidates in cls._RULE_CANDIDATES.items():
+            if rule.requires_refresh_on_object_change:
+                cls._UPDATED_RULES.add(rule)
+            for objs in candidates.values():
+                if obj in objs:
+                    objs.remove(obj)
+                    cls._UPDATED_RULES.add(rule)
+
+    @classmethod
+    def get_rule_candidates(cls, rule):
         """
         Computes valid input object candidates for transition rule @rule, if any exist
 
         Args:
             rule (BaseTransitionRule): Transition rule whose candidates should be computed
-            objects (list of BaseObject): List of objects that will be used to compute object candidates
 
         Returns:
             None or dict: None if no valid candidates are found, otherwise mapping from filter key to list of object
                 instances that satisfy that filter
         """
-        obj_candidates = rule.get_object_candidates(objects=objects)
+        # Only compile candidates if all active system requirements are met
+        if not np.all([is_system_active(system_name=name) for name in rule.required_systems]):
+            return None
+
+        # Candidates are only computed from scratch once per rule, and are updated incrementally afterwards
+        if rule not in cls._RULE_CANDIDATES:
+            cls._RULE_CANDIDATES[rule] = rule.get_object_candidates(index=cls._get_candidate_index())
+        obj_candidates = {filter_name: list(objs) for filter_name, objs in cls._RULE_CANDIDATES[rule].items()}
+
         n_filters_satisfied = sum(len(candidates) > 0 for candidates in obj_candidates.values())
         # Return object candidates if all filters are met, otherwise return None
         return obj_candidates if n_filters_satisfied == len(rule.candidate_filters) else None
@@ -92,16 +178,40 @@ class TransitionRuleAPI:
     @classmethod
     def refresh_all_rules(cls):
         """
-        Refreshes all registered rules given the current set of objects in the scene
+        Refreshes all registered rules given the current set of objects in the scene, recomputing all rule candidates
+        from scratch
         """
         global RULES_REGISTRY
 
-        # Clear all active rules
+        # Clear all active rules and cached candidates
         cls.ACTIVE_RULES = set()
+        cls._CANDIDATE_INDEX = None
+        cls._RULE_CANDIDATES = dict()
 
         # Refresh all registered rules
         cls.refresh_rules(rules=RULES_REGISTRY.objects)
 
+    @classmethod
+    def refresh_updated_rules(cls):
+        """
+        Refreshes only the registered rules whose candidates may have changed since they were last refreshed, i.e.:
+        rules that have never been refreshed, or rules whose candidates were updated by add_object() / remove_object().
+        If the rigid body idx mapping from RigidContactAPI changed, all active rules are refreshed as well, since their
+        conditions may be caching rigid body idxs
+        """
+        global RULES_REGISTRY
+
+        contact_idx_mapping_version = RigidContactAPI.get_idx_mapping_version()
+        refresh_active_rules = contact_idx_mapping_version != cls._CONTACT_IDX_MAPPING_VERSION
+        cls._CONTACT_IDX_MAPPING_VERSION = contact_idx_mapping_version
+
+        rules = [rule for rule in RULES_REGISTRY.objects if
+                 rule not in cls._RULE_CANDIDATES or
+                 rule in cls._UPDATED_RULES or
+                 (refresh_active_rules and rule in cls.ACTIVE_RULES)]
+        cls._UPDATED_RULES = set()
+        cls.refresh_rules(rules=rules)
+
     @classmethod
     def refresh_rules(cls, rules):
         """
@@ -112,10 +222,9 @@ class TransitionRuleAPI:
         Args:
             rules (list of BaseTransitionRule): List of transition rules whose candidate lists should be refreshed
         """
-        objects = og.sim.scene.objects
         for rule in rules:
             # Check if rule is still valid, if so, update its entry
-            object_candidates = cls.get_rule_candidates(rule=rule, objects=objects)
+            object_candidates = cls.get_rule_candidates(rule=rule)
 
             # Update candidates if valid, otherwise pop the entry if it exists in cls.ACTIVE_RULES
             if object_candidates is not None:
@@ -147,7 +256,8 @@ class TransitionRuleAPI:
         added_obj_attrs = []
         removed_objs = []
         for rule in tuple(cls.ACTIVE_RULES):
-            output = rule.step()
+            with StepProfiler.profile(f"transition_rules/{rule.__name__}"):
+                output = rule.step()
             # Store objects to be added / removed if we have a valid output
             if output is not None:
                 added_obj_attrs += output.add
@@ -209,6 +319,103 @@ class TransitionRuleAPI:
         # Clear internal dictionaries
         cls.ACTIVE_RULES = set()
         cls._INIT_INFO = dict()
+        cls._CANDIDATE_INDEX = None
+        cls._RULE_CANDIDATES = dict()
+        cls._UPDATED_RULES = set()
+        cls._CONTACT_IDX_MAPPING_VERSION = None
+
+
+class ObjectCandidateIndex:
+    """
+    Index over a set of objects keyed by category and ability, used to efficiently infer which objects satisfy a given
+    ObjectCandidateFilter without having to iterate over all objects. The index is maintained incrementally as
+    objects are added / removed.
+    """
+    def __init__(self, objects=None):
+        """
+        Args:
+            objects (None or list of BaseObject): If specified, initial objects to add to this index
+        """
+        # Maps every indexed object to a monotonically increasing insertion counter, so that candidates are always
+        # returned in the same order in which objects were added
+        self._objects = dict()
+        self._counter = 0
+
+        # Maps category / ability to the set of indexed objects with that category / ability
+        self._category_to_objects = defaultdict(set)
+        self._ability_to_objects = defaultdict(set)
+
+        for obj in ([] if objects is None else objects):
+            self.add(obj)
+
+    def add(self, obj):
+        """
+        Adds object @obj to this index
+
+        Args:
+            obj (BaseObject): Object to add
+        """
+        self._objects[obj] = self._counter
+        self._counter += 1
+        self._category_to_objects[obj.category].add(obj)
+        for ability in obj._abilities:
+            self._ability_to_objects[ability].add(obj)
+
+    def remove(self, obj):
+        """
+        Removes object @obj from this index
+
+        Args:
+            obj (BaseObject): Object to remove
+        """
+        self._objects.pop(obj)
+        self._category_to_objects[obj.category].discard(obj)
+        for ability in obj._abilities:
+            self._ability_to_objects[ability].discard(obj)
+
+    def get_objects_with_category(self, category):
+        """
+        Args:
+            category (str): Category to query
+
+        Returns:
+            set of BaseObject: All indexed objects with category @category
+        """
+        return set(self._category_to_objects.get(category, set()))
+
+    def get_objects_with_ability(self, ability):
+        """
+        Args:
+            ability (str): Ability to query
+
+        Returns:
+            set of BaseObject: All indexed objects with ability @ability
+        """
+        return set(self._ability_to_objects.get(ability, set()))
+
+    def sort(self, objects):
+        """
+        Args:
+            objects (iterable of BaseObject): Indexed objects to sort
+
+        Returns:
+            list of BaseObject: @objects, sorted by the order in which they were added to this index
+        """
+        return sorted(objects, key=self._objects.__getitem__)
+
+    @property
+    def objects(self):
+        """
+        Returns:
+            list of BaseObject: All indexed objects, in the order in which they were added to this index
+        """
+        return list(self._objects.keys())
+
+    def __contains__(self, obj):
+        return obj in self._objects
+
+    def __len__(self):
+        return len(self._objects)
 
 
 class ObjectCandidateFilter(metaclass=ABCMeta):
@@ -224,6 +431,28 @@ class ObjectCandidateFilter(metaclass=ABCMeta):
         """Returns true if the given object passes the filter."""
         return False
 
+    @property
+    def is_indexed(self):
+        """
+        Returns:
+            bool: Whether this filter's candidates can be directly inferred from an ObjectCandidateIndex, without
+                having to evaluate the filter on every indexed object
+        """
+        return False
+
+    def get_candidates(self, index):
+        """
+        Computes all objects from @index that pass this filter
+
+        Args:
+            index (ObjectCandidateIndex): Index over the objects to filter
+
+        Returns:
+            set of BaseObject: All indexed objects that pass the filter
+        """
+        # By default, we evaluate the filter on every object
+        return set(obj for obj in index.objects if self(obj))
+
 
 class CategoryFilter(ObjectCandidateFilter):
     """Filter for object categories."""
@@ -234,6 +463,13 @@ class CategoryFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return obj.category == self.category
 
+    @property
+    def is_indexed(self):
+        return True
+
+    def get_candidates(self, index):
+        return index.get_objects_with_category(self.category)
+
 
 class AbilityFilter(ObjectCandidateFilter):
     """Filter for object abilities."""
@@ -244,6 +480,13 @@ class AbilityFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return self.ability in obj._abilities
 
+    @property
+    def is_indexed(self):
+        return True
+
+    def get_candidates(self, index):
+        return index.get_objects_with_ability(self.ability)
+
 
 class NameFilter(ObjectCandidateFilter):
     """Filter for object names."""
@@ -263,6 +506,9 @@ class NotFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return not self.f(obj)
 
+    def get_candidates(self, index):
+        return set(index.objects) - self.f.get_candidates(index)
+
 
 class OrFilter(ObjectCandidateFilter):
     """Logical-or of a set of filters."""
@@ -273,6 +519,13 @@ class OrFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return any(f(obj) for f in self.filters)
 
+    @property
+    def is_indexed(self):
+        return all(f.is_indexed for f in self.filters)
+
+    def get_candidates(self, index):
+        return set.union(set(), *(f.get_candidates(index) for f in self.filters))
+
 
 class AndFilter(ObjectCandidateFilter):
     """Logical-and of a set of filters."""
@@ -283,6 +536,20 @@ class AndFilter(ObjectCandidateFilter):
     def __call__(self, obj):
         return all(f(obj) for f in self.filters)
 
+    @property
+    def is_indexed(self):
+        return any(f.is_indexed for f in self.filters)
+
+    def get_candidates(self, index):
+        indexed_filters = [f for f in self.filters if f.is_indexed]
+        if len(indexed_filters) == 0:
+            return super().get_candidates(index)
+
+        # Intersect the candidates from all indexed filters, and only evaluate the remaining filters on those
+        candidates = set.intersection(*(f.get_candidates(index) for f in indexed_filters))
+        other_filters = [f for f in self.filters if not f.is_indexed]
+        return set(obj for obj in candidates if all(f(obj) for f in other_filters))
+
 
 class RuleCondition:
     """
@@ -375,12 +642,12 @@ class TouchingAnyCondition(RuleCondition):
         objs = []
 
         if self._optimized:
-            # Get all impulses
-            impulses = RigidContactAPI.get_all_impulses()
+            # Get all bodies touching any of the filter 2 bodies -- this only scales with the number of active contacts
             idxs_to_check = np.concatenate([self._filter_2_idxs[obj] for obj in object_candidates[self._filter_2_name]])
-            # Batch check for each object
+            touching_idxs = RigidContactAPI.get_contacting_body_idxs(idxs_to_check)
+            # Check each object against the touching bodies
             for obj in object_candidates[self._filter_1_name]:
-                if np.any(impulses[self._filter_1_idxs[obj]][:, idxs_to_check]):
+                if any(idx in touching_idxs for idx in self._filter_1_idxs[obj]):
                     objs.append(obj)
         else:
             # Manually check contact
@@ -601,30 +868,29 @@ class BaseTransitionRule(Registerable):
         """
         raise NotImplementedError
 
+    @classproperty
+    def requires_refresh_on_object_change(cls):
+        """
+        Returns:
+            bool: Whether this rule should be refreshed whenever any object is added to / removed from the scene, and
+                not only when its own object candidates change. Should be True for rules that cache information about
+                scene objects other than their candidates
+        """
+        return False
+
     @classmethod
-    def get_object_candidates(cls, objects):
+    def get_object_candidates(cls, index):
         """
-        Given the set of objects @objects, compute the valid object candidate combinations that may be valid for
+        Given the objects indexed by @index, compute the valid object candidate combinations that may be valid for
         this TransitionRule
 
         Args:
-            objects (list of BaseObject): Objects to filter for valid transition rule candidates
+            index (ObjectCandidateIndex): Index over the objects to filter for valid transition rule candidates
 
         Returns:
             dict: Maps filter name to valid object(s) that satisfy that filter
         """
-        # Iterate over all objects and add to dictionary if valid
-        filters = cls.candidate_filters
-        obj_dict = {filter_name: [] for filter_name in filters.keys()}
-
-        # Only compile candidates if all active system requirements are met
-        if np.all([is_system_active(system_name=name) for name in cls.required_systems]):
-            for obj in objects:
-                for fname, f in filters.items():
-                    if f(obj):
-                        obj_dict[fname].append(obj)
-
-        return obj_dict
+        return {filter_name: index.sort(f.get_candidates(index)) for filter_name, f in cls.candidate_filters.items()}
 
     @classmethod
     def refresh(cls, object_candidates):
@@ -884,6 +1150,10 @@ class RecipeRule(BaseTransitionRule):
     # Maps object to idx within the _OBJECTS array
     _OBJECTS_TO_IDX = None
 
+    # Maps container to 2-tuple (contents signature, name of the executable recipe or None) from the last time its
+    # recipes were checked, see _compute_container_contents_signature()
+    _CONTAINER_RECIPES = None
+
     def __init_subclass__(cls, **kwargs):
         # Run super first
         super().__init_subclass__(**kwargs)
@@ -1112,7 +1382,18 @@ class RecipeRule(BaseTransitionRule):
         # Compute all relevant object AABB positions
         obj_positions = np.array([obj.aabb_center for obj in cls._OBJECTS])
 
-        return dict(obj_positions=obj_positions)
+        # Compute the container-independent part of the contents signatures: all (quantized) object positions and the
+        # number of particles of every system. The systems are also stored, since whether each of them is contained
+        # is part of every container's signature
+        systems, contents_signature = None, None
+        if cls.cache_container_recipes:
+            systems = [system for system in og.sim.scene.system_registry.objects if system.name != "cloth"]
+            contents_signature = (
+                np.round(obj_positions / m.RECIPE_SIGNATURE_POS_RESOLUTION).astype(int).tobytes(),
+                tuple(system.n_particles for system in systems),
+            )
+
+        return dict(obj_positions=obj_positions, systems=systems, contents_signature=contents_signature)
 
     @classmethod
     def _compute_container_info(cls, object_candidates, container, global_info):
@@ -1142,6 +1423,81 @@ class RecipeRule(BaseTransitionRule):
 
         return dict(in_volume=in_volume)
 
+    @classmethod
+    def _compute_container_contents_signature(cls, container, global_info):
+        """
+        Helper function to compute a signature of the contents of @container without checking which objects are
+        actually within its volume. Recipe executability is determined by the objects within @container's volume and
+        the systems it contains. The former can only change if @container itself moved, articulated, or had any of
+        its states change value, or any object moved. The latter is tracked by @container's Contains state for every
+        system, since particles can flow into / out of @container without any system's number of particles changing.
+        So recipes only need to be re-checked, and the container info only needs to be re-computed, when this
+        signature changes
+
+        Args:
+            container (StatefulObject): Relevant container object for computing information
+            global_info (dict): Output of @cls._compute_global_rule_info(); global information which includes the
+                container-independent part of the signature
+
+        Returns:
+            tuple: Hashable signature of the state relevant to the contents of @container
+        """
+        pos, ori = container.get_position_orientation()
+        joint_pos = container.get_joint_positions() if container.n_joints > 0 else np.zeros(0)
+        return (
+            ObjectStateUpdateScheduler.get_version(container),
+            np.round(pos / m.RECIPE_SIGNATURE_POS_RESOLUTION).astype(int).tobytes(),
+            np.round(ori / m.RECIPE_SIGNATURE_ORI_RESOLUTION).astype(int).tobytes(),
+            np.round(joint_pos / m.RECIPE_SIGNATURE_ORI_RESOLUTION).astype(int).tobytes(),
+            tuple(container.states[Contains].get_value(system=system) for system in global_info["systems"]),
+            global_info["contents_signature"],
+        )
+
+    @classmethod
+    def _find_executable_recipe(cls, object_candidates, container, global_info):
+        """
+        Finds the first active recipe that is executable in @container. If @cls.cache_container_recipes is set and the
+        contents signature of @container did not change since the last time its recipes were checked, the previous
+        result is returned without computing the container info or re-checking any recipe
+
+        Args:
+            object_candidates (dict): Dictionary mapping corresponding keys from @cls.filters to list of individual
+                object instances where the filter is satisfied
+            container (StatefulObject): Container in which the recipes may be executed
+            global_info (dict): Output of @cls._compute_global_rule_info(); global information which may be
+                relevant for computing whether recipe is executable
+
+        Returns:
+            2-tuple:
+                - None or str: Name of the executable recipe if one is found, else None
+                - None or dict: Output of @cls._compute_container_info() if it was computed, else None
+        """
+        signature = None
+        if cls.cache_container_recipes:
+            signature = cls._compute_container_contents_signature(container=container, global_info=global_info)
+            cached_signature, recipe_name = cls._CONTAINER_RECIPES.get(container, (None, None))
+            if signature == cached_signature:
+                return recipe_name, None
+
+        # Compute container info
+        container_info = cls._compute_container_info(
+            object_candidates=object_candidates,
+            container=container,
+            global_info=global_info,
+        )
+
+        # Check every recipe to find if any is valid
+        recipe_name = None
+        for name, recipe in cls._ACTIVE_RECIPES.items():
+            if cls._is_recipe_executable(recipe=recipe, container=container, global_info=global_info, container_info=container_info):
+                recipe_name = name
+                break
+
+        if signature is not None:
+            cls._CONTAINER_RECIPES[container] = (signature, recipe_name)
+
+        return recipe_name, container_info
+
     @classmethod
     def refresh(cls, object_candidates):
         # Run super first
@@ -1153,6 +1509,9 @@ class RecipeRule(BaseTransitionRule):
         cls._OBJECTS = []
         cls._OBJECTS_TO_IDX = dict()
 
+        # Any previously checked contents are no longer valid since the set of objects / active recipes may change
+        cls._CONTAINER_RECIPES = dict()
+
         # Prune any recipes whose objects / system requirements are not met by the current set of objects / systems
         objects_by_category = og.sim.scene.object_registry.get_dict("category")
 
@@ -1188,28 +1547,33 @@ class RecipeRule(BaseTransitionRule):
         # Iterate over all fillable objects, to execute recipes for each one
         for container in object_candidates["container"]:
             recipe_results = None
-            # Compute container info
-            container_info = cls._compute_container_info(
+            # Check every recipe to find if any is valid
+            name, container_info = cls._find_executable_recipe(
                 object_candidates=object_candidates,
                 container=container,
                 global_info=global_info,
             )
 
-            # Check every recipe to find if any is valid
-            for name, recipe in cls._ACTIVE_RECIPES.items():
-                if cls._is_recipe_executable(recipe=recipe, container=container, global_info=global_info, container_info=container_info):
-                    # Otherwise, all conditions met, we found a valid recipe and so we execute and terminate early
-                    og.log.info(f"Executing recipe: {name} in container {container.name}!")
-
-                    # Take the transform and terminate early
-                    recipe_results = cls._execute_recipe(
-                        container=container,
-                        recipe=recipe,
-                        in_volume=container_info["in_volume"],
-                    )
-                    objs_to_add += recipe_results.add
-                    objs_to_remove += recipe_results.remove
-                    break
+            # The container info is only needed (and computed, if it was skipped) if we're transforming its contents
+            if container_info is None and (name is not None or cls.use_garbage_fallback_recipe):
+                container_info = cls._compute_container_info(
+                    object_candidates=object_candidates,
+                    container=container,
+                    global_info=global_info,
+                )
+
+            if name is not None:
+                # All conditions met, we found a valid recipe and so we execute it
+                og.log.info(f"Executing recipe: {name} in container {container.name}!")
+
+                # Take the transform
+                recipe_results = cls._execute_recipe(
+                    container=container,
+                    recipe=cls._ACTIVE_RECIPES[name],
+                    in_volume=container_info["in_volume"],
+                )
+                objs_to_add += recipe_results.add
+                objs_to_remove += recipe_results.remove
 
             # Otherwise, if we didn't find a valid recipe, we execute a garbage transition instead if requested
             if recipe_results is None and cls.use_garbage_fallback_recipe:
@@ -1312,6 +1676,21 @@ class RecipeRule(BaseTransitionRule):
         # Return transition results
         return TransitionResults(add=objs_to_add, remove=objs_to_remove)
 
+    @classproperty
+    def requires_refresh_on_object_change(cls):
+        # Recipes are validated against all scene objects, not only the containers
+        return True
+
+    @classproperty
+    def cache_container_recipes(cls):
+        """
+        Returns:
+            bool: Whether the result of checking the recipes in a given container should be re-used as long as its
+                contents do not change. Should only be True if recipe executability is fully determined by
+                @cls._compute_container_contents_signature()
+        """
+        return True
+
     @classproperty
     def ignore_nonrecipe_objects(cls):
         """
@@ -1617,6 +1996,12 @@ class CookingRule(RecipeRule):
         cls._RECIPES[name]["heatsource_categories"] = None if heatsource_categories is None else set(heatsource_categories)
         cls._RECIPES[name]["n_heat_steps"] = n_heat_steps
 
+    @classproperty
+    def cache_container_recipes(cls):
+        # Recipe executability additionally depends on the active heat sources and the number of consecutive heating
+        # steps, so recipes must be re-checked every step
+        return False
+
     @classproperty
     def candidate_filters(cls):
         # Add mixing tool filter as well
@@ -0,0 +1,524 @@
+"""
+A set of utility functions for building and querying a cache of pre-sampled BEHAVIOR activity instances.
+
+Sampling a BEHAVIOR activity online (see BDDLSampler) imports all task-relevant objects, matches them to the scene, and
+samples all of the activity's initial conditions, which can take minutes and sometimes fails. Instead, many instances
+of each (scene, activity, definition) can be sampled offline across a pool of processes, each with its own simulator
+and random seed. Every sampled instance is validated (its initial conditions must still hold after letting physics
+settle) and saved as a regular cached activity scene file, and all instances are tracked in a per-scene index file,
+from which BehaviorTask can then pick a random pre-validated instance instead of sampling online.
+
+The cache can be populated from the command line, e.g.:
+
+    python scripts/sample_activity_cache.py --scene Rs_int --activity prepare_sea_salt_soak -n 32 -w 4
+
+Note that importing this module imports the omnigibson package, which launches omniverse unless the
+OMNIGIBSON_NO_OMNIVERSE environment variable is set. Sampling itself only orchestrates the workers, so the launcher
+script sets it before importing this module, and each sampling worker is started with it cleared (and in headless mode)
+so that it launches its own simulator. For the same reason, this module should not import anything that requires
+omniverse at module level.
+"""
+import argparse
+import glob
+import hashlib
+import json
+import logging
+import multiprocessing as mp
+import multiprocessing.connection
+import os
+import random
+import time
+import traceback
+from copy import deepcopy
+from pathlib import Path
+
+import numpy as np
+
+from omnigibson.macros import gm, create_module_macros
+
+
+# Create module logger. Note that ui_utils' create_module_logger cannot be used, since it requires omniverse
+log = logging.getLogger(__name__)
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Filename of the index file tracking all cached activity instances within a cache directory
+m.INDEX_FNAME = "activity_cache_index.json"
+
+# Number of physics steps to take after sampling an instance before checking whether its initial conditions still hold
+m.N_VALIDATION_STEPS = 30
+
+# Maximum time (in seconds) to wait for each sampling worker to return before terminating it and treating its instance
+# as failed
+m.SAMPLING_TIMEOUT = 1800.0
+
+# Maximum time (in seconds) to wait for a terminated sampling worker to exit before killing it
+m.WORKER_TERMINATE_TIMEOUT = 10.0
+
+
+def get_activity_cache_dir(scene_model):
+    """
+    Args:
+        scene_model (str): Name of the scene (e.g.: Rs_int)
+
+    Returns:
+        str: Default directory containing the cached activity scene files (and their index) for @scene_model
+    """
+    return os.path.join(gm.DATASET_PATH, "scenes", scene_model, "json")
+
+
+def get_activity_instance_filename(scene_model, activity_name, activity_definition_id, activity_instance_id):
+    """
+    Args:
+        scene_model (str): Name of the scene (e.g.: Rs_int)
+        activity_name (str): Name of the task activity (e.g.: putting_away_halloween_decorations)
+        activity_definition_id (int): ID of the task definition
+        activity_instance_id (int): ID of the task instance
+
+    Returns:
+        str: Filename (without the .json extension) of the cached activity scene
+    """
+    return f"{scene_model}_task_{activity_name}_{activity_definition_id}_{activity_instance_id}_template"
+
+
+def get_activity_cache_index_key(scene_model, activity_name, activity_definition_id):
+    """
+    Args:
+        scene_model (str): Name of the scene (e.g.: Rs_int)
+        activity_name (str): Name of the task activity
+        activity_definition_id (int): ID of the task definition
+
+    Returns:
+        str: Key under which the instances of the given activity are stored in the index
+    """
+    return f"{scene_model}/{activity_name}/{activity_definition_id}"
+
+
+def load_activity_cache_index(cache_dir):
+    """
+    Loads the index of all cached activity instances within @cache_dir. The index maps each key (see
+    get_activity_cache_index_key()) to a dictionary mapping each (stringified) instance ID to its record, as returned
+    by the sampling workers
+
+    Args:
+        cache_dir (str): Directory containing the cached activity scene files
+
+    Returns:
+        dict: Loaded index, or an empty dictionary if no index exists yet
+    """
+    fpath = os.path.join(cache_dir, m.INDEX_FNAME)
+    if not os.path.exists(fpath):
+        return dict()
+    with open(fpath, "r") as f:
+        return json.load(f)
+
+
+def _update_activity_cache_index(cache_dir, key, records):
+    """
+    Merges records @records into the index within @cache_dir under key @key and writes it back to disk. The index is
+    written to a temporary file first, so that interrupted writes never leave a corrupted index behind
+
+    Args:
+        cache_dir (str): Directory containing the cached activity scene files
+        key (str): Index key, see get_activity_cache_index_key()
+        records (list of dict): Records to add / overwrite, each of which must contain "instance_id"
+    """
+    index = load_activity_cache_index(cache_dir=cache_dir)
+    entries = index.setdefault(key, dict())
+    for record in records:
+        entries[str(record["instance_id"])] = record
+
+    Path(cache_dir).mkdir(parents=True, exist_ok=True)
+    fpath = os.path.join(cache_dir, m.INDEX_FNAME)
+    tmp_fpath = f"{fpath}.{os.getpid()}.tmp"
+    with open(tmp_fpath, "w+") as f:
+        json.dump(index, f, indent=4)
+    os.replace(tmp_fpath, fpath)
+
+
+def get_cached_activity_instances(scene_model, activity_name, activity_definition_id=0, cache_dir=None,
+                                  validated_only=True):
+    """
+    Grabs the records of all cached instances of the given activity whose scene files exist
+
+    Args:
+        scene_model (str): Name of the scene (e.g.: Rs_int)
+        activity_name (str): Name of the task activity
+        activity_definition_id (int): ID of the task definition
+        cache_dir (None or str): Directory containing the cached activity scene files. None corresponds to the
+            default directory, see get_activity_cache_dir()
+        validated_only (bool): Whether to only return instances that were successfully sampled and validated
+
+    Returns:
+        list of dict: Records of the cached instances, sorted by instance ID. Each record contains "instance_id",
+            "seed", "fname", "valid", "feedback", "objects_signature", and "sampling_time"
+    """
+    cache_dir = get_activity_cache_dir(scene_model=scene_model) if cache_dir is None else cache_dir
+    key = get_activity_cache_index_key(
+        scene_model=scene_model,
+        activity_name=activity_name,
+        activity_definition_id=activity_definition_id,
+    )
+    records = load_activity_cache_index(cache_dir=cache_dir).get(key, dict()).values()
+    return sorted(
+        [record for record in records if (record["valid"] or not validated_only) and
+         (record["fname"] is None or os.path.exists(os.path.join(cache_dir, record["fname"])))],
+        key=lambda record: record["instance_id"],
+    )
+
+
+def get_objects_signature(objects_init_info):
+    """
+    Computes a signature of the set of objects within a scene. Two activity instances with the same signature contain
+    exactly the same objects (up to their states), so either instance's state can be loaded into a scene that was
+    loaded from the other one
+
+    Args:
+        objects_init_info (dict): Maps each object name to its init info, e.g.: the "init_info" entry of
+            Scene.get_objects_info()
+
+    Returns:
+        str: Hex digest signature of the objects
+    """
+    entries = sorted(
+        (name, info["class_name"], str(info["args"].get("category", None)), str(info["args"].get("model", None)))
+        for name, info in objects_init_info.items()
+    )
+    return hashlib.sha1(json.dumps(entries).encode()).hexdigest()
+
+
+def _validate_activity_instance(env, n_steps):
+    """
+    Validates the activity instance currently loaded in @env by letting physics settle and checking whether all of its
+    (non-future) initial conditions still hold
+
+    Args:
+        env (Environment): Environment with a loaded BehaviorTask
+        n_steps (int): Number of physics steps to take before checking the initial conditions
+
+    Returns:
+        2-tuple:
+            - bool: Whether the instance is valid
+            - None or str: Feedback if the instance is invalid
+    """
+    import omnigibson as og
+    from bddl.activity import evaluate_goal_conditions
+
+    for _ in range(n_steps):
+        og.sim.step()
+
+    conditions = [cond for cond in env.task.activity_initial_conditions if cond.body[0] != "future"]
+    success, results = evaluate_goal_conditions(conditions)
+    if not success:
+        unsatisfied = [conditions[i].body for i in results["unsatisfied"]]
+        return False, f"Initial conditions no longer hold after {n_steps} physics steps: {unsatisfied}"
+    return True, None
+
+
+def _sample_activity_instance(config, cache_dir, activity_instance_id, seed, n_validation_steps, snapshot_sidecar):
+    """
+    Samples, validates, and saves a single activity instance. Intended to be run within its own (spawned) sampling
+    worker process, since each instance requires its own simulator
+
+    Args:
+        config (dict): Environment config to use. Its task config specifies the activity to sample
+        cache_dir (str): Directory to write the sampled activity scene file to
+        activity_instance_id (int): ID of the instance to sample
+        seed (int): Random seed to use for sampling
+        n_validation_steps (int): Number of physics steps to take before validating the sampled instance
+        snapshot_sidecar (bool): Whether to additionally write a binary snapshot sidecar for faster loading, see
+            omnigibson.utils.snapshot_utils.convert_scene_file()
+
+    Returns:
+        dict: Record of the sampled instance, see get_cached_activity_instances()
+    """
+    random.seed(seed)
+    np.random.seed(seed)
+    start = time.time()
+    record = dict(
+        instance_id=activity_instance_id,
+        seed=seed,
+        fname=None,
+        valid=False,
+        feedback=None,
+        objects_signature=None,
+        sampling_time=None,
+    )
+
+    try:
+        import omnigibson as og
+        from omnigibson.utils.snapshot_utils import convert_scene_file
+
+        gm.ENABLE_OBJECT_STATES = True
+        env = og.Environment(configs=config)
+        task = env.task
+        if task.feedback is not None:
+            record["feedback"] = str(task.feedback)
+        else:
+            record["valid"], record["feedback"] = _validate_activity_instance(env=env, n_steps=n_validation_steps)
+
+        if record["valid"]:
+            task.activity_instance_id = activity_instance_id
+            fname = get_activity_instance_filename(
+                scene_model=og.sim.scene.scene_model,
+                activity_name=task.activity_name,
+                activity_definition_id=task.activity_definition_id,
+                activity_instance_id=activity_instance_id,
+            )
+            fpath = os.path.join(cache_dir, f"{fname}.json")
+            task.save_task(path=fpath, override=True)
+            if snapshot_sidecar:
+                convert_scene_file(fpath)
+            record["fname"] = f"{fname}.json"
+            record["objects_signature"] = get_objects_signature(og.sim.scene.get_objects_info()["init_info"])
+    except Exception:
+        record["valid"] = False
+        record["feedback"] = traceback.format_exc()
+
+    record["sampling_time"] = time.time() - start
+    return record
+
+
+def _sampling_worker(pipe, kwargs):
+    """
+    Entry point of a single (spawned) sampling worker process. Samples a single activity instance and sends its record
+    back to the parent process
+
+    Args:
+        pipe (Connection): Child end of the pipe to the parent process
+        kwargs (dict): Keyword arguments to pass to _sample_activity_instance()
+    """
+    pipe.send(_sample_activity_instance(**kwargs))
+    pipe.close()
+
+
+def _start_sampling_worker(ctx, kwargs):
+    """
+    Starts a new sampling worker process sampling the instance specified by @kwargs. Workers inherit the environment
+    variables at the time they are started, so the omniverse-related ones are explicitly set for each worker: every
+    worker launches its own headless simulator, even if the parent process itself does not launch omniverse
+
+    Args:
+        ctx (BaseContext): Multiprocessing context to start the worker with
+        kwargs (dict): Keyword arguments to pass to _sample_activity_instance()
+
+    Returns:
+        2-tuple:
+            - Process: Started worker process
+            - Connection: Parent end of the pipe to the worker, through which its record is sent
+    """
+    parent_pipe, child_pipe = ctx.Pipe(duplex=False)
+    process = ctx.Process(target=_sampling_worker, args=(child_pipe, kwargs), daemon=True)
+    env_vars = {var: os.environ.get(var, None) for var in ("OMNIGIBSON_HEADLESS", "OMNIGIBSON_NO_OMNIVERSE")}
+    os.environ["OMNIGIBSON_HEADLESS"] = "1"
+    os.environ.pop("OMNIGIBSON_NO_OMNIVERSE", None)
+    try:
+        process.start()
+    finally:
+        for var, val in env_vars.items():
+            if val is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = val
+    # Close the parent's copy of the child end, so that the parent end is notified if the worker dies
+    child_pipe.close()
+    return process, parent_pipe
+
+
+def _stop_sampling_worker(process, pipe):
+    """
+    Stops sampling worker @process if it is still running, killing it if it does not exit in time
+
+    Args:
+        process (Process): Worker process to stop
+        pipe (Connection): Parent end of the pipe to the worker
+    """
+    if process.is_alive():
+        process.terminate()
+        process.join(timeout=m.WORKER_TERMINATE_TIMEOUT)
+        if process.is_alive():
+            process.kill()
+    process.join()
+    pipe.close()
+
+
+def _remove_activity_instance_files(cache_dir, fname):
+    """
+    Removes any (possibly partially written) files of the activity scene @fname within @cache_dir, including its
+    snapshot sidecar and temporary files
+
+    Args:
+        cache_dir (str): Directory containing the cached activity scene files
+        fname (str): Filename (without the .json extension) of the activity scene
+    """
+    for fpath in glob.glob(os.path.join(glob.escape(cache_dir), glob.escape(f"{fname}.json")) + "*"):
+        os.remove(fpath)
+
+
+def sample_activity_instances(
+        scene_model,
+        activity_name,
+        activity_definition_id=0,
+        n_instances=1,
+        n_workers=1,
+        config=None,
+        cache_dir=None,
+        seed=0,
+        n_validation_steps=None,
+        snapshot_sidecar=True,
+):
+    """
+    Samples @n_instances new instances of the given activity across a pool of @n_workers processes, each of which
+    samples a single instance with its own simulator and random seed. Validated instances are saved to @cache_dir, and
+    all (including failed) attempts are recorded in the index, which is updated as soon as each attempt finishes so that
+    interrupted runs keep their progress. New instances are numbered after the highest instance ID already in the index
+
+    Args:
+        scene_model (str): Name of the scene (e.g.: Rs_int)
+        activity_name (str): Name of the task activity
+        activity_definition_id (int): ID of the task definition
+        n_instances (int): Number of instances to attempt to sample
+        n_workers (int): Number of sampling processes to run in parallel
+        config (None or dict): Environment config to use. None corresponds to the default fetch_behavior.yaml config.
+            The scene and task entries are overridden to sample the requested activity online
+        cache_dir (None or str): Directory to write the cached activity scene files and index to. None corresponds to
+            the default directory, see get_activity_cache_dir()
+        seed (int): Base random seed. Instance i is sampled with seed @seed + i
+        n_validation_steps (None or int): Number of physics steps to take before validating each sampled instance.
+            None corresponds to m.N_VALIDATION_STEPS
+        snapshot_sidecar (bool): Whether to additionally write a binary snapshot sidecar for each saved instance
+
+    Returns:
+        list of dict: Records of all sampling attempts, sorted by instance ID
+    """
+    import yaml
+
+    if config is None:
+        config_fpath = os.path.join(os.path.dirname(os.path.dirname(__file__)), "configs", "fetch_behavior.yaml")
+        with open(config_fpath, "r") as f:
+            config = yaml.load(f, Loader=yaml.FullLoader)
+    config = deepcopy(config)
+    config["scene"].update(dict(scene_model=scene_model, scene_instance=None, scene_file=None))
+    config["task"].update(dict(
+        activity_name=activity_name,
+        activity_definition_id=activity_definition_id,
+        predefined_problem=None,
+        online_object_sampling=True,
+    ))
+    cache_dir = get_activity_cache_dir(scene_model=scene_model) if cache_dir is None else cache_dir
+    n_validation_steps = m.N_VALIDATION_STEPS if n_validation_steps is None else n_validation_steps
+
+    # Number new instances after the existing ones
+    key = get_activity_cache_index_key(
+        scene_model=scene_model,
+        activity_name=activity_name,
+        activity_definition_id=activity_definition_id,
+    )
+    existing_ids = [int(inst_id) for inst_id in load_activity_cache_index(cache_dir=cache_dir).get(key, dict())]
+    start_id = max(existing_ids) + 1 if len(existing_ids) > 0 else 0
+
+    # Omniverse does not support forking, and each worker only samples a single instance so that no simulator state is
+    # carried over between instances. Workers that crash or time out are terminated, so that they can neither block
+    # the remaining instances nor write their scene files afterwards
+    ctx = mp.get_context("spawn")
+    pending_ids = list(range(start_id, start_id + n_instances))
+    workers = dict()        # Maps instance ID to its (process, pipe, start time)
+    records = []
+    try:
+        while len(pending_ids) > 0 or len(workers) > 0:
+            while len(pending_ids) > 0 and len(workers) < n_workers:
+                inst_id = pending_ids.pop(0)
+                process, pipe = _start_sampling_worker(ctx=ctx, kwargs=dict(
+                    config=config,
+                    cache_dir=cache_dir,
+                    activity_instance_id=inst_id,
+                    seed=seed + inst_id,
+                    n_validation_steps=n_validation_steps,
+                    snapshot_sidecar=snapshot_sidecar,
+                ))
+                workers[inst_id] = (process, pipe, time.time())
+
+            # Wait until any worker returns or the earliest deadline passes
+            deadline = min(start + m.SAMPLING_TIMEOUT for _, _, start in workers.values())
+            pipes = [pipe for _, pipe, _ in workers.values()]
+            ready = mp.connection.wait(pipes, timeout=max(deadline - time.time(), 0.0))
+
+            for inst_id, (process, pipe, start) in list(workers.items()):
+                sampling_time = time.time() - start
+                if pipe in ready:
+                    try:
+                        record = pipe.recv()
+                    except EOFError:
+                        process.join()
+                        record = None
+                        feedback = f"Sampling worker exited unexpectedly with exit code {process.exitcode}"
+                elif sampling_time >= m.SAMPLING_TIMEOUT:
+                    record = None
+                    feedback = f"Sampling timed out after {m.SAMPLING_TIMEOUT} seconds"
+                else:
+                    continue
+
+                _stop_sampling_worker(process=process, pipe=pipe)
+                del workers[inst_id]
+                if record is None:
+                    record = dict(instance_id=inst_id, seed=seed + inst_id, fname=None, valid=False,
+                                  feedback=feedback, objects_signature=None, sampling_time=sampling_time)
+                if not record["valid"]:
+                    # Make sure no partially written scene file is left behind
+                    _remove_activity_instance_files(cache_dir=cache_dir, fname=get_activity_instance_filename(
+                        scene_model=scene_model,
+                        activity_name=activity_name,
+                        activity_definition_id=activity_definition_id,
+                        activity_instance_id=inst_id,
+                    ))
+                _update_activity_cache_index(cache_dir=cache_dir, key=key, records=[record])
+                records.append(record)
+                log.info(f"Sampled {key} instance {inst_id}: valid={record['valid']}, "
+                         f"time={record['sampling_time']:.1f}s")
+    finally:
+        for process, pipe, _ in workers.values():
+            _stop_sampling_worker(process=process, pipe=pipe)
+
+    n_valid = sum(record["valid"] for record in records)
+    log.info(f"Sampled {n_valid} / {n_instances} valid instances of {key}")
+    return sorted(records, key=lambda record: record["instance_id"])
+
+
+def main():
+    """
+    Command line entry point. Should be run through scripts/sample_activity_cache.py, so that the parent process does
+    not launch omniverse
+    """
+    parser = argparse.ArgumentParser(description="Pre-sample a cache of validated BEHAVIOR activity instances.")
+    parser.add_argument("--scene", required=True, help="Name of the scene to sample in, e.g.: Rs_int")
+    parser.add_argument("--activity", required=True, nargs="+", help="Name(s) of the activities to sample")
+    parser.add_argument("--definition-id", type=int, default=0, help="ID of the activity definition to sample")
+    parser.add_argument("-n", "--n-instances", type=int, default=1, help="Number of instances to sample per activity")
+    parser.add_argument("-w", "--n-workers", type=int, default=1, help="Number of parallel sampling processes")
+    parser.add_argument("--config", default=None, help="Environment config to use. Default is fetch_behavior.yaml")
+    parser.add_argument("--cache-dir", default=None, help="Output directory. Default is the scene's json directory")
+    parser.add_argument("--seed", type=int, default=0, help="Base random seed")
+    parser.add_argument("--no-sidecar", action="store_true", help="Do not write binary snapshot sidecars")
+    args = parser.parse_args()
+
+    config = None
+    if args.config is not None:
+        import yaml
+        with open(args.config, "r") as f:
+            config = yaml.load(f, Loader=yaml.FullLoader)
+
+    logging.basicConfig(level=logging.INFO)
+    for activity_name in args.activity:
+        sample_activity_instances(
+            scene_model=args.scene,
+            activity_name=activity_name,
+            activity_definition_id=args.definition_id,
+            n_instances=args.n_instances,
+            n_workers=args.n_workers,
+            config=config,
+            cache_dir=args.cache_dir,
+            seed=args.seed,
+            snapshot_sidecar=not args.no_sidecar,
+        )
+
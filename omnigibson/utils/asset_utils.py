@@ -1,10 +1,12 @@
 import argparse
+import hashlib
 import json
 import os
 import subprocess
 import tempfile
 import contextlib
 import inspect
+from collections import OrderedDict
 from copy import deepcopy
 from pathlib import Path
 from cryptography.fernet import Fernet
@@ -13,14 +15,27 @@ from urllib.request import urlretrieve
 import yaml
 import progressbar
 import omnigibson as og
-from omnigibson.macros import gm
+from omnigibson.macros import gm, create_module_macros
 from omnigibson.utils.ui_utils import create_module_logger
 if os.getenv("OMNIGIBSON_NO_OMNIVERSE", default=0) != "1":
-    from pxr import Usd
+    from pxr import Usd, UsdGeom, UsdPhysics
 
 # Create module logger
 log = create_module_logger(module_name=__name__)
 
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Directory in which decrypted assets are cached. None results in a subdirectory of og.tempdir being used
+m.DECRYPTED_ASSET_CACHE_DIR = None
+
+# Maximum total size (in MB) of the decrypted assets kept in the cache. Only assets that are no longer referenced are
+# evicted, least recently used first, so the cache may temporarily exceed this size
+m.DECRYPTED_ASSET_CACHE_SIZE_MB = 2048
+
+# Path to the persistent per-model metadata index. None disables persisting the index
+m.MODEL_METADATA_INDEX_PATH = os.path.join(os.path.expanduser("~"), ".cache", "omnigibson", "model_metadata_index.json")
+
 pbar = None
 
 def show_progress(block_num, block_size, total_size):
@@ -266,16 +281,206 @@ def get_all_object_category_models_with_abilities(category, abilities):
                 return False
         return True
 
+    # Check each model against its indexed prim summary, so that no USD stage needs to be opened unless the model is
+    # not indexed yet
     for model in all_models:
         usd_path = DatasetObject.get_usd_path(category=category, model=model)
         usd_path = usd_path.replace(".usd", ".encrypted.usd")
-        with decrypted(usd_path) as fpath:
+        metadata = ModelMetadataIndex.get(usd_path=usd_path, save=False)
+        if supports_state_types(state_types_and_params, AssetPrimSummary.from_dict(metadata["prim"])):
+            valid_models.append(model)
+    ModelMetadataIndex.save()
+
+    return valid_models
+
+
+class AssetPrimSummary:
+    """
+    Lightweight, serializable summary of the top levels of an asset's prim hierarchy. This mirrors the subset of the
+    Usd.Prim API used by BaseObjectState.is_compatible_asset (GetName(), GetTypeName(), and GetChildren()), so that
+    asset compatibility can be checked without opening the asset's USD stage
+    """
+    def __init__(self, name, type_name, children=None):
+        """
+        Args:
+            name (str): Name of the prim
+            type_name (str): Type name of the prim, e.g.: "Xform"
+            children (None or list of AssetPrimSummary): Summaries of the prim's children, if any
+        """
+        self._name = name
+        self._type_name = type_name
+        self._children = [] if children is None else children
+
+    def GetName(self):
+        return self._name
+
+    def GetTypeName(self):
+        return self._type_name
+
+    def GetChildren(self):
+        return self._children
+
+    @classmethod
+    def from_prim(cls, prim, depth=2):
+        """
+        Args:
+            prim (Usd.Prim): Prim to summarize
+            depth (int): Number of levels of descendants of @prim to include in the summary
+
+        Returns:
+            AssetPrimSummary: Summary of @prim
+        """
+        children = [cls.from_prim(child, depth=depth - 1) for child in prim.GetChildren()] if depth > 0 else None
+        return cls(name=prim.GetName(), type_name=prim.GetTypeName(), children=children)
+
+    @classmethod
+    def from_dict(cls, info):
+        """
+        Args:
+            info (dict): Serialized summary, as generated by to_dict()
+
+        Returns:
+            AssetPrimSummary: Deserialized summary
+        """
+        return cls(name=info["name"], type_name=info["type"], children=[cls.from_dict(child) for child in info["children"]])
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: JSON-serializable version of this summary
+        """
+        return dict(name=self._name, type=self._type_name, children=[child.to_dict() for child in self._children])
+
+
+class ModelMetadataIndex:
+    """
+    Monolithic class for maintaining a persistent index of per-model asset metadata, which is stored at
+    m.MODEL_METADATA_INDEX_PATH. For each model, this contains:
+
+        - "prim": AssetPrimSummary of the model's default prim, used to check which abilities the model supports
+        - "links": Names of the model's links, i.e.: its children Xforms that are rigid bodies
+        - "metalinks": Names of the model's metalinks, i.e.: its children Xforms that are not rigid bodies
+        - "link_bounding_boxes": Maps link / metalink name to its (unscaled) axis-aligned bounding box, expressed in
+            the model's frame as [[x_min, y_min, z_min], [x_max, y_max, z_max]]
+
+    Entries are keyed by the model's USD path, and recomputed whenever the USD file is modified
+    """
+    # Maps USD path to the corresponding model's metadata, loaded from disk upon first use
+    _INDEX = None
+
+    # Whether the index contains entries that have not been saved to disk yet
+    _MODIFIED = False
+
+    @classmethod
+    def _load(cls):
+        """
+        Loads the index from disk if it has not been loaded yet
+        """
+        if cls._INDEX is not None:
+            return
+        cls._INDEX = dict()
+        if m.MODEL_METADATA_INDEX_PATH is not None and os.path.isfile(m.MODEL_METADATA_INDEX_PATH):
+            try:
+                with open(m.MODEL_METADATA_INDEX_PATH, "r") as f:
+                    cls._INDEX = json.load(f)
+            except (OSError, ValueError) as e:
+                log.warning(f"Failed to load model metadata index from {m.MODEL_METADATA_INDEX_PATH}: {e}")
+
+    @classmethod
+    def get(cls, usd_path, save=True):
+        """
+        Grabs the metadata of the model whose (possibly encrypted) USD file is @usd_path, computing it if it is not
+        indexed yet or if the USD file has been modified since it was indexed
+
+        Args:
+            usd_path (str): Absolute path to the model's USD file
+            save (bool): Whether to save the index to disk if the metadata had to be computed
+
+        Returns:
+            dict: Metadata of the model, see ModelMetadataIndex for the available keys
+        """
+        cls._load()
+        stat = os.stat(usd_path)
+        signature = [stat.st_mtime_ns, stat.st_size]
+        key = os.path.abspath(usd_path)
+        metadata = cls._INDEX.get(key, None)
+        if metadata is None or metadata["signature"] != signature:
+            metadata = cls._compute(usd_path=usd_path)
+            metadata["signature"] = signature
+            cls._INDEX[key] = metadata
+            cls._MODIFIED = True
+            if save:
+                cls.save()
+        return metadata
+
+    @classmethod
+    def _compute(cls, usd_path):
+        """
+        Computes the metadata of the model whose (possibly encrypted) USD file is @usd_path
+
+        Args:
+            usd_path (str): Absolute path to the model's USD file
+
+        Returns:
+            dict: Metadata of the model, see ModelMetadataIndex for the available keys
+        """
+        with decrypted(usd_path) if ".encrypted" in os.path.basename(usd_path) else contextlib.nullcontext(usd_path) as fpath:
             stage = Usd.Stage.Open(fpath)
             prim = stage.GetDefaultPrim()
-            if supports_state_types(state_types_and_params, prim):
-                valid_models.append(model)
+            bbox_cache = UsdGeom.BBoxCache(Usd.TimeCode.Default(), [UsdGeom.Tokens.default_, UsdGeom.Tokens.render])
+            links, metalinks, link_bboxes = [], [], dict()
+            for child in prim.GetChildren():
+                if child.GetTypeName() != "Xform":
+                    continue
+                (links if child.HasAPI(UsdPhysics.RigidBodyAPI) else metalinks).append(child.GetName())
+                bbox = bbox_cache.ComputeRelativeBound(child, prim).ComputeAlignedRange()
+                if not bbox.IsEmpty():
+                    link_bboxes[child.GetName()] = [list(bbox.GetMin()), list(bbox.GetMax())]
+            metadata = dict(
+                prim=AssetPrimSummary.from_prim(prim).to_dict(),
+                links=links,
+                metalinks=metalinks,
+                link_bounding_boxes=link_bboxes,
+            )
+        return metadata
+
+    @classmethod
+    def save(cls):
+        """
+        Saves the index to disk if it contains any unsaved entries, merging it with any entries that were saved by
+        other processes in the meantime
+        """
+        if not cls._MODIFIED or m.MODEL_METADATA_INDEX_PATH is None:
+            return
+        index = dict()
+        if os.path.isfile(m.MODEL_METADATA_INDEX_PATH):
+            try:
+                with open(m.MODEL_METADATA_INDEX_PATH, "r") as f:
+                    index = json.load(f)
+            except (OSError, ValueError):
+                pass
+        index.update(cls._INDEX)
+
+        # Write to a temporary file first so that concurrent readers never see a partially written index
+        tmp_path = f"{m.MODEL_METADATA_INDEX_PATH}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(m.MODEL_METADATA_INDEX_PATH), exist_ok=True)
+            with open(tmp_path, "w+") as f:
+                json.dump(index, f)
+            os.replace(tmp_path, m.MODEL_METADATA_INDEX_PATH)
+        except OSError as e:
+            log.warning(f"Failed to store model metadata index to {m.MODEL_METADATA_INDEX_PATH}: {e}")
+            return
+        cls._INDEX = index
+        cls._MODIFIED = False
 
-    return valid_models
+    @classmethod
+    def clear(cls):
+        """
+        Clears the in-memory index, so that it is reloaded from disk upon next use
+        """
+        cls._INDEX = None
+        cls._MODIFIED = False
 
 
 def get_og_assets_version():
@@ -440,15 +645,19 @@ def change_data_path():
             yaml.dump(global_config, f)
 
 
-def decrypt_file(encrypted_filename, decrypted_filename):
+def _decrypt(encrypted):
     with open(gm.KEY_PATH, "rb") as filekey:
         key = filekey.read()
     fernet = Fernet(key)
 
+    return fernet.decrypt(encrypted)
+
+
+def decrypt_file(encrypted_filename, decrypted_filename):
     with open(encrypted_filename, "rb") as enc_f:
         encrypted = enc_f.read()
 
-    decrypted = fernet.decrypt(encrypted)
+    decrypted = _decrypt(encrypted)
 
     with open(decrypted_filename, "wb") as decrypted_file:
         decrypted_file.write(decrypted)
@@ -471,12 +680,133 @@ def encrypt_file(original_filename, encrypted_filename=None, encrypted_file=None
             encrypted_file.write(encrypted)
 
 
+class DecryptedAssetCache:
+    """
+    Monolithic class for caching decrypted assets, so that repeatedly loading the same encrypted asset (e.g.: multiple
+    copies of the same object model) only decrypts it once.
+
+    Decrypted files are content-addressed, i.e.: keyed by a digest of the encrypted file's contents, and reference
+    counted. Files that are no longer referenced are kept for reuse, and are only evicted (least recently used first)
+    once the total size of the cache exceeds m.DECRYPTED_ASSET_CACHE_SIZE_MB
+    """
+    # Maps (encrypted file path, mtime, size) to the digest of the encrypted file's contents
+    _DIGESTS = dict()
+
+    # Maps digest to dict(path, size, refcount) of the corresponding decrypted file, in least recently used order
+    _ENTRIES = OrderedDict()
+
+    # Maps decrypted file path to its digest
+    _PATHS = dict()
+
+    @classmethod
+    def _get_cache_dir(cls):
+        """
+        Returns:
+            str: Directory in which decrypted assets are stored
+        """
+        return os.path.join(og.tempdir, "decrypted_assets") if m.DECRYPTED_ASSET_CACHE_DIR is None else \
+            m.DECRYPTED_ASSET_CACHE_DIR
+
+    @classmethod
+    def acquire(cls, encrypted_filename):
+        """
+        Grabs a reference to the decrypted version of @encrypted_filename, decrypting it if it is not cached yet.
+        Each call should be paired with a corresponding call to release()
+
+        Args:
+            encrypted_filename (str): Absolute path to the encrypted asset
+
+        Returns:
+            str: Absolute path to the decrypted asset
+        """
+        stat = os.stat(encrypted_filename)
+        signature = (os.path.abspath(encrypted_filename), stat.st_mtime_ns, stat.st_size)
+        encrypted = None
+        digest = cls._DIGESTS.get(signature, None)
+        if digest is None:
+            with open(encrypted_filename, "rb") as f:
+                encrypted = f.read()
+            digest = hashlib.sha1(encrypted).hexdigest()
+            cls._DIGESTS[signature] = digest
+
+        entry = cls._ENTRIES.get(digest, None)
+        if entry is None or not os.path.isfile(entry["path"]):
+            if encrypted is None:
+                with open(encrypted_filename, "rb") as f:
+                    encrypted = f.read()
+            decrypted = _decrypt(encrypted)
+
+            # Write to a temporary file first so that the cached file is never partially written
+            fpath = Path(encrypted_filename)
+            path = os.path.join(cls._get_cache_dir(), f"{digest[:16]}_{fpath.name.replace('.encrypted', '')}")
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.tmp", "wb") as f:
+                f.write(decrypted)
+            os.replace(f"{path}.tmp", path)
+            entry = dict(path=path, size=len(decrypted), refcount=0 if entry is None else entry["refcount"])
+            cls._ENTRIES[digest] = entry
+            cls._PATHS[path] = digest
+
+        entry["refcount"] += 1
+        cls._ENTRIES.move_to_end(digest)
+        cls._evict()
+
+        return entry["path"]
+
+    @classmethod
+    def release(cls, decrypted_filename):
+        """
+        Releases a reference to the decrypted asset @decrypted_filename, as returned by acquire()
+
+        Args:
+            decrypted_filename (str): Absolute path to the decrypted asset
+        """
+        digest = cls._PATHS.get(decrypted_filename, None)
+        if digest is None or digest not in cls._ENTRIES:
+            return
+        entry = cls._ENTRIES[digest]
+        entry["refcount"] = max(entry["refcount"] - 1, 0)
+        cls._evict()
+
+    @classmethod
+    def _evict(cls):
+        """
+        Evicts unreferenced decrypted assets, least recently used first, until the total size of the cache is within
+        m.DECRYPTED_ASSET_CACHE_SIZE_MB
+        """
+        max_size = m.DECRYPTED_ASSET_CACHE_SIZE_MB * 1024 * 1024
+        total_size = sum(entry["size"] for entry in cls._ENTRIES.values())
+        for digest, entry in list(cls._ENTRIES.items()):
+            if total_size <= max_size:
+                break
+            if entry["refcount"] > 0:
+                continue
+            try:
+                os.remove(entry["path"])
+            except OSError:
+                # E.g.: on Windows, Isaac Sim may still hold the file open, so we try again later
+                continue
+            cls._ENTRIES.pop(digest)
+            cls._PATHS.pop(entry["path"], None)
+            total_size -= entry["size"]
+
+    @classmethod
+    def clear(cls):
+        """
+        Clears all internal state. Note that this does not remove any decrypted files
+        """
+        cls._DIGESTS = dict()
+        cls._ENTRIES = OrderedDict()
+        cls._PATHS = dict()
+
+
 @contextlib.contextmanager
 def decrypted(encrypted_filename):
-    fpath = Path(encrypted_filename)
-    decrypted_filename = os.path.join(og.tempdir, f"{fpath.stem}.tmp{fpath.suffix}")
-    decrypt_file(encrypted_filename=encrypted_filename, decrypted_filename=decrypted_filename)
-    yield decrypted_filename
+    decrypted_filename = DecryptedAssetCache.acquire(encrypted_filename)
+    try:
+        yield decrypted_filename
+    finally:
+        DecryptedAssetCache.release(decrypted_filename)
 
 
 if __name__ == "__main__":
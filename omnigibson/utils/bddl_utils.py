@@ -4,6 +4,7 @@ import os
 import numpy as np
 import networkx as nx
 from collections import defaultdict
+from contextlib import contextmanager
 from bddl.activity import (
     get_goal_conditions,
     get_ground_goal_state_options,
@@ -23,6 +24,7 @@ from omnigibson.objects.dataset_object import DatasetObject
 from omnigibson.robots import BaseRobot
 from omnigibson import object_states
 from omnigibson.object_states.factory import _KINEMATIC_STATE_SET
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.systems.system_base import is_system_active, get_system
 
 # Create module logger
@@ -35,6 +37,158 @@ m = create_module_macros(module_path=__file__)
 m.MIN_DYNAMIC_SCALE = 0.5
 m.DYNAMIC_SCALE_INCREMENT = 0.1
 
+# Tolerances below which an object is considered to not have moved since a cached predicate value was computed
+m.PREDICATE_CACHE_POS_TOLERANCE = 1e-4
+m.PREDICATE_CACHE_ORI_TOLERANCE = 1e-4
+m.PREDICATE_CACHE_JOINT_TOLERANCE = 1e-4
+
+
+class BDDLPredicateCache:
+    """
+    Monolithic class for memoizing the evaluation of grounded BDDL state predicates, e.g.: ontop(bowl_1, table_1).
+
+    While enabled (see enabled()), each grounded predicate is evaluated at most once per simulator step, so that
+    multiple consumers evaluating overlapping goal conditions during the same step (e.g.: reward, termination, and
+    info["goal_status"] of BehaviorTask) share the same results. Moreover, values are carried over to subsequent steps
+    and only re-evaluated if any of the predicate's argument objects moved, articulated, or had any of its states
+    change value since the value was computed (see ObjectStateUpdateScheduler.get_version()). Predicates with any
+    system argument are re-evaluated every step.
+
+    NOTE: Carrying values over assumes that a predicate only depends on its argument objects. This holds for all
+    supported predicates up to the physics engine's contact / raycast resolution, e.g.: a third object being placed in
+    between two objects that did not move does not invalidate a cached nextto() value.
+    """
+    # Whether the cache is currently in use
+    _ENABLED = False
+
+    # Simulator step index the per-step caches below correspond to
+    _STEP = None
+
+    # Maps object to its (version, position, orientation, joint positions) signature for the current step
+    _STEP_SIGNATURES = dict()
+
+    # Maps grounded predicate key to its value, computed during the current step
+    _STEP_VALUES = dict()
+
+    # Maps grounded predicate key to (value, signatures), where signatures are the argument objects' signatures at the
+    # time the value was computed
+    _VALUES = dict()
+
+    # Evaluation statistics
+    _N_EVALUATED = 0
+    _N_CACHED = 0
+
+    @classmethod
+    @contextmanager
+    def enabled(cls):
+        """
+        Context within which predicate evaluations are memoized. The scene is assumed not to be modified from within
+        this context, e.g.: no objects are moved or states set
+        """
+        was_enabled, cls._ENABLED = cls._ENABLED, True
+        try:
+            yield
+        finally:
+            cls._ENABLED = was_enabled
+
+    @classmethod
+    def evaluate(cls, state_class, entities, evaluate_fcn):
+        """
+        Evaluates grounded predicate corresponding to @state_class and argument @entities, using memoized values if
+        possible
+
+        Args:
+            state_class (BaseObjectState): Object state evaluated by the predicate
+            entities (tuple of BDDLEntity): Arguments of the predicate, in order
+            evaluate_fcn (function): Function evaluating the predicate if no valid value is memoized. Should have the
+                signature:
+
+                    value = evaluate_fcn()
+
+        Returns:
+            bool: Value of the predicate
+        """
+        if not cls._ENABLED:
+            return evaluate_fcn()
+
+        # Reset the per-step caches if we're at a new step
+        if og.sim.current_time_step_index != cls._STEP:
+            cls._STEP = og.sim.current_time_step_index
+            cls._STEP_SIGNATURES = dict()
+            cls._STEP_VALUES = dict()
+
+        key = (state_class, *(entity.wrapped_obj for entity in entities))
+        if key in cls._STEP_VALUES:
+            cls._N_CACHED += 1
+            return cls._STEP_VALUES[key]
+
+        # Predicates over systems or non-existent entities are never carried over between steps
+        signatures = None if any(entity.is_system or not entity.exists for entity in entities) else \
+            tuple(cls._get_signature(obj=entity.wrapped_obj) for entity in entities)
+        if signatures is not None and key in cls._VALUES and \
+                all(cls._signatures_match(a, b) for a, b in zip(signatures, cls._VALUES[key][1])):
+            cls._N_CACHED += 1
+            value = cls._VALUES[key][0]
+        else:
+            cls._N_EVALUATED += 1
+            value = evaluate_fcn()
+            if signatures is not None:
+                cls._VALUES[key] = (value, signatures)
+
+        cls._STEP_VALUES[key] = value
+        return value
+
+    @classmethod
+    def _get_signature(cls, obj):
+        """
+        Args:
+            obj (BaseObject): Object whose signature should be computed
+
+        Returns:
+            4-tuple: (version, position, orientation, joint positions) signature of @obj at the current step
+        """
+        if obj not in cls._STEP_SIGNATURES:
+            pos, ori = obj.get_position_orientation()
+            joint_pos = obj.get_joint_positions() if obj.n_joints > 0 else np.zeros(0)
+            cls._STEP_SIGNATURES[obj] = (ObjectStateUpdateScheduler.get_version(obj), pos, ori, joint_pos)
+        return cls._STEP_SIGNATURES[obj]
+
+    @classmethod
+    def _signatures_match(cls, signature, other):
+        """
+        Args:
+            signature (4-tuple): Object signature, as returned by _get_signature()
+            other (4-tuple): Other object signature to compare against
+
+        Returns:
+            bool: Whether @signature and @other are equivalent up to the configured tolerances
+        """
+        return signature[0] == other[0] and \
+            np.allclose(signature[1], other[1], atol=m.PREDICATE_CACHE_POS_TOLERANCE) and \
+            np.allclose(signature[2], other[2], atol=m.PREDICATE_CACHE_ORI_TOLERANCE) and \
+            np.allclose(signature[3], other[3], atol=m.PREDICATE_CACHE_JOINT_TOLERANCE)
+
+    @classmethod
+    def get_stats(cls):
+        """
+        Returns:
+            dict: Evaluation statistics, with keys "n_evaluated" (number of predicate evaluations that were computed)
+                and "n_cached" (number of predicate evaluations served from the cache)
+        """
+        return dict(n_evaluated=cls._N_EVALUATED, n_cached=cls._N_CACHED)
+
+    @classmethod
+    def clear(cls):
+        """
+        Clears all memoized values and statistics, e.g.: when the scene is reset
+        """
+        cls._STEP = None
+        cls._STEP_SIGNATURES = dict()
+        cls._STEP_VALUES = dict()
+        cls._VALUES = dict()
+        cls._N_EVALUATED = 0
+        cls._N_CACHED = 0
+
 
 class UnsampleablePredicate:
     def _sample(self, *args, **kwargs):
@@ -66,7 +220,13 @@ class ObjectStateUnaryPredicate(UnaryAtomicFormula):
     STATE_NAME = None
 
     def _evaluate(self, entity, **kwargs):
-        return entity.get_state(self.STATE_CLASS, **kwargs)
+        if kwargs:
+            return entity.get_state(self.STATE_CLASS, **kwargs)
+        return BDDLPredicateCache.evaluate(
+            state_class=self.STATE_CLASS,
+            entities=(entity,),
+            evaluate_fcn=lambda: entity.get_state(self.STATE_CLASS),
+        )
 
     def _sample(self, entity, binary_state, **kwargs):
         return entity.set_state(self.STATE_CLASS, binary_state, **kwargs)
@@ -77,7 +237,13 @@ class ObjectStateBinaryPredicate(BinaryAtomicFormula):
     STATE_NAME = None
 
     def _evaluate(self, entity1, entity2, **kwargs):
-        return entity1.get_state(self.STATE_CLASS, entity2.wrapped_obj, **kwargs) if entity2.exists else False
+        if kwargs or not entity2.exists:
+            return entity1.get_state(self.STATE_CLASS, entity2.wrapped_obj, **kwargs) if entity2.exists else False
+        return BDDLPredicateCache.evaluate(
+            state_class=self.STATE_CLASS,
+            entities=(entity1, entity2),
+            evaluate_fcn=lambda: entity1.get_state(self.STATE_CLASS, entity2.wrapped_obj),
+        )
 
     def _sample(self, entity1, entity2, binary_state, **kwargs):
         return entity1.set_state(self.STATE_CLASS, entity2.wrapped_obj, binary_state, **kwargs) if entity2.exists else None
@@ -0,0 +1,564 @@
+"""
+A set of utility classes for running multiple environments in parallel, each in its own subprocess with its own
+simulator.
+
+Note that importing this module imports the omnigibson package, which launches omniverse unless the
+OMNIGIBSON_NO_OMNIVERSE environment variable is set. A parent process that only orchestrates the workers can therefore
+set it before importing this module, since each worker is started with it explicitly set or cleared (see
+EnvironmentPool's @start_omniverse). For the same reason, this module should not import anything that requires
+omniverse at module level, since it is also imported by workers that run without omniverse (e.g.: when using
+FakeEnvironment)
+"""
+import logging
+import multiprocessing as mp
+import os
+import time
+import traceback
+from multiprocessing import shared_memory
+
+import gym
+import numpy as np
+
+from omnigibson.macros import create_module_macros
+
+
+# Create module logger. Note that ui_utils' create_module_logger cannot be used, since it requires omniverse
+log = logging.getLogger(__name__)
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Maximum time (in seconds) to wait for a worker to respond before assuming it hangs and restarting it
+m.WORKER_TIMEOUT = 600.0
+
+# Interval (in seconds) at which to check whether a worker is still alive while waiting for it to respond
+m.POLL_INTERVAL = 0.1
+
+# Maximum number of times each worker can be restarted before giving up
+m.MAX_RESTARTS = 3
+
+
+class SharedSpaceBuffer:
+    """
+    Batched buffer for the values of a (possibly nested) gym space, backed by a single shared memory block so that
+    values can be transported between processes without pickling them.
+
+    Each leaf space (gym.spaces.Box or gym.spaces.Discrete) of the space is laid out as a contiguous (batch_size, *shape)
+    array within the shared memory block, where entry i corresponds to the value of environment i.
+    """
+    def __init__(self, space, batch_size, name=None):
+        """
+        Args:
+            space (gym.spaces.Space): Space whose values should be stored. Should be a gym.spaces.Box,
+                gym.spaces.Discrete, or (possibly nested) gym.spaces.Dict of these
+            batch_size (int): Number of values to store, e.g.: the number of environments
+            name (None or str): If specified, name of the existing shared memory block to attach to. Otherwise, a new
+                block is created
+        """
+        self.space = space
+        self.batch_size = batch_size
+
+        # Compute the layout of all leaf spaces
+        self._layout = dict()
+        size = 0
+        for key, leaf_space in self._get_leaf_spaces(space=space).items():
+            if isinstance(leaf_space, gym.spaces.Discrete):
+                shape, dtype = (), np.dtype(np.int64)
+            else:
+                assert isinstance(leaf_space, gym.spaces.Box), \
+                    f"Only Box and Discrete spaces are supported, got {type(leaf_space)} for key {key}!"
+                shape, dtype = leaf_space.shape, np.dtype(leaf_space.dtype)
+            # Align each array to its dtype
+            size = int(np.ceil(size / dtype.itemsize)) * dtype.itemsize
+            self._layout[key] = (size, shape, dtype)
+            size += int(np.prod(shape, dtype=int)) * batch_size * dtype.itemsize
+
+        # Create or attach to the shared memory block. Shared memory blocks cannot be empty
+        self._owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=max(size, 1))
+
+        # Create the array views into the block
+        self._arrays = {key: np.ndarray((batch_size, *shape), dtype=dtype, buffer=self._shm.buf, offset=offset)
+                        for key, (offset, shape, dtype) in self._layout.items()}
+
+    @classmethod
+    def _get_leaf_spaces(cls, space, prefix=None):
+        """
+        Args:
+            space (gym.spaces.Space): Space to flatten
+            prefix (None or tuple of str): Key prefix of @space within the top-level space
+
+        Returns:
+            dict: Maps the key tuple of each leaf space within @space to the leaf space. A non-Dict @space results in a
+                single entry with an empty key tuple
+        """
+        prefix = () if prefix is None else prefix
+        if not isinstance(space, gym.spaces.Dict):
+            return {prefix: space}
+        leaf_spaces = dict()
+        for k, sub_space in space.spaces.items():
+            leaf_spaces.update(cls._get_leaf_spaces(space=sub_space, prefix=(*prefix, k)))
+        return leaf_spaces
+
+    def write(self, value, idx):
+        """
+        Writes @value into entry @idx of this buffer
+
+        Args:
+            value (any): Value of this buffer's space, e.g.: a (possibly nested) dictionary of arrays
+            idx (int): Index of the entry to write into
+        """
+        for key, array in self._arrays.items():
+            leaf_value = value
+            for k in key:
+                leaf_value = leaf_value[k]
+            array[idx] = leaf_value
+
+    def read(self, idx=None):
+        """
+        Reads a copy of entry @idx of this buffer, or of all entries if @idx is not specified
+
+        Args:
+            idx (None or int): Index of the entry to read. None results in the whole batch being read
+
+        Returns:
+            any: Value of this buffer's space, e.g.: a (possibly nested) dictionary of arrays. If @idx is None, each
+                array has an additional leading batch dimension
+        """
+        out = dict()
+        for key, array in self._arrays.items():
+            leaf_value = array.copy() if idx is None else array[idx].copy()
+            if len(key) == 0:
+                return leaf_value
+            dic = out
+            for k in key[:-1]:
+                dic = dic.setdefault(k, dict())
+            dic[key[-1]] = leaf_value
+        return out
+
+    def close(self):
+        """
+        Closes this buffer, additionally freeing the shared memory block if this buffer created it
+        """
+        # Drop the views before closing, since the block cannot be closed while views into it exist
+        self._arrays = dict()
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+    @property
+    def name(self):
+        """
+        Returns:
+            str: Name of the shared memory block, which can be used to attach to this buffer from another process
+        """
+        return self._shm.name
+
+
+def _worker(idx, env_fn, pipe, automatic_reset):
+    """
+    Main loop of a single environment worker. Creates the environment, sends its observation and action spaces to the
+    parent, attaches to the shared buffers, and then executes the received commands until told to close
+
+    Args:
+        idx (int): Index of this worker's environment within the pool
+        env_fn (function): Function creating the environment
+        pipe (Connection): Pipe connected to the parent process
+        automatic_reset (bool): Whether to automatically reset the environment after an episode finishes
+    """
+    obs_buf, action_buf = None, None
+    try:
+        env = env_fn()
+        pipe.send((env.observation_space, env.action_space))
+        obs_buf_name, action_buf_name, batch_size = pipe.recv()
+        obs_buf = SharedSpaceBuffer(space=env.observation_space, batch_size=batch_size, name=obs_buf_name)
+        action_buf = SharedSpaceBuffer(space=env.action_space, batch_size=batch_size, name=action_buf_name)
+
+        while True:
+            cmd = pipe.recv()
+            if cmd == "step":
+                obs, reward, done, info = env.step(action_buf.read(idx=idx))
+                if done and automatic_reset:
+                    # Add lost observation to our information dict, and reset
+                    info["last_observation"] = obs
+                    obs = env.reset()
+                obs_buf.write(obs, idx=idx)
+                pipe.send((reward, done, info))
+            elif cmd == "reset":
+                obs_buf.write(env.reset(), idx=idx)
+                pipe.send(None)
+            elif cmd == "close":
+                env.close()
+                break
+            else:
+                raise ValueError(f"Got invalid worker command: {cmd}")
+    except (KeyboardInterrupt, EOFError):
+        pass
+    except Exception:
+        log.error(f"Environment worker {idx} failed:\n{traceback.format_exc()}")
+        raise
+    finally:
+        for buf in (obs_buf, action_buf):
+            if buf is not None:
+                buf.close()
+        pipe.close()
+
+
+def create_omnigibson_env(configs, **kwargs):
+    """
+    Creates an OmniGibson environment. Intended to be used (wrapped with functools.partial) as the environment creation
+    function of an EnvironmentPool, so that omnigibson is only imported within the workers
+
+    Args:
+        configs (str or dict or list of str or dict): config_file path(s) or raw config dictionaries
+        kwargs (dict): Additional keyword arguments to pass to the Environment constructor
+
+    Returns:
+        Environment: Created environment
+    """
+    import omnigibson as og
+    return og.Environment(configs=configs, **kwargs)
+
+
+class EnvironmentPool:
+    """
+    Pool of environments, each running in its own subprocess with its own simulator, following the gym vector
+    environment interface (step_async() / step_wait()).
+
+    Actions and observations are transported through preallocated shared memory buffers laid out from each
+    environment's action / observation space, so only the (small) rewards, dones, and infos are pickled. Workers that
+    crash or hang are automatically restarted, in which case their environment is reset, done is set to True, and
+    "worker_restarted" is set in their info.
+    """
+    def __init__(self, env_fns, automatic_reset=True, start_omniverse=True, context="spawn"):
+        """
+        Args:
+            env_fns (list of function): Picklable functions creating each environment, e.g.:
+                functools.partial(create_omnigibson_env, configs=cfg). All environments must have the same observation
+                and action spaces
+            automatic_reset (bool): whether to automatically reset each environment after its episode finishes
+            start_omniverse (bool): Whether the workers should start omniverse upon importing omnigibson. Should only be
+                False if the environments do not require the simulator, e.g.: FakeEnvironment
+            context (str): Multiprocessing start method to use. Omniverse does not support forking, so this should
+                usually be "spawn"
+        """
+        assert len(env_fns) > 0, "Must specify at least one environment!"
+        self.num_envs = len(env_fns)
+        self._env_fns = env_fns
+        self._automatic_reset = automatic_reset
+        self._start_omniverse = start_omniverse
+        self._ctx = mp.get_context(context)
+
+        # Internal placeholders
+        self._processes = [None] * self.num_envs
+        self._pipes = [None] * self.num_envs
+        self._obs_buf = None
+        self._action_buf = None
+        self._waiting = False
+        self._closed = False
+        self.n_restarts = [0] * self.num_envs
+
+        # Start all workers first so that the environments are created in parallel, then connect to them
+        for i in range(self.num_envs):
+            self._start_worker(idx=i)
+        spaces = [self._receive_spaces(idx=i) for i in range(self.num_envs)]
+        self.single_observation_space, self.single_action_space = spaces[0]
+        for obs_space, action_space in spaces[1:]:
+            assert obs_space == self.single_observation_space and action_space == self.single_action_space, \
+                "All environments must have the same observation and action spaces!"
+        self.observation_space = gym.vector.utils.batch_space(self.single_observation_space, n=self.num_envs)
+        self.action_space = gym.vector.utils.batch_space(self.single_action_space, n=self.num_envs)
+
+        # Create the shared buffers and let the workers attach to them
+        self._obs_buf = SharedSpaceBuffer(space=self.single_observation_space, batch_size=self.num_envs)
+        self._action_buf = SharedSpaceBuffer(space=self.single_action_space, batch_size=self.num_envs)
+        for i in range(self.num_envs):
+            self._send_buffers(idx=i)
+
+    def _start_worker(self, idx):
+        """
+        Starts the worker for environment @idx
+
+        Args:
+            idx (int): Index of the environment
+        """
+        parent_pipe, child_pipe = self._ctx.Pipe()
+        process = self._ctx.Process(
+            target=_worker,
+            args=(idx, self._env_fns[idx], child_pipe, self._automatic_reset),
+            daemon=True,
+        )
+        # Workers inherit the environment variables at the time they are started, so the omniverse-related ones are
+        # explicitly set for each worker, regardless of whether the parent process itself launched omniverse
+        env_vars = {var: os.environ.get(var, None) for var in ("OMNIGIBSON_HEADLESS", "OMNIGIBSON_NO_OMNIVERSE")}
+        os.environ["OMNIGIBSON_HEADLESS"] = "1"
+        if self._start_omniverse:
+            os.environ.pop("OMNIGIBSON_NO_OMNIVERSE", None)
+        else:
+            os.environ["OMNIGIBSON_NO_OMNIVERSE"] = "1"
+        try:
+            process.start()
+        finally:
+            for var, val in env_vars.items():
+                if val is None:
+                    os.environ.pop(var, None)
+                else:
+                    os.environ[var] = val
+        child_pipe.close()
+        self._processes[idx], self._pipes[idx] = process, parent_pipe
+
+    def _receive(self, idx, timeout=None):
+        """
+        Waits for the response of worker @idx, checking whether the worker is still alive in the meantime
+
+        Args:
+            idx (int): Index of the environment
+            timeout (None or float): Maximum time (in seconds) to wait. None results in m.WORKER_TIMEOUT being used
+
+        Returns:
+            2-tuple:
+                - bool: Whether a response was received, i.e.: the worker neither crashed nor timed out
+                - any: Received response, or None if no response was received
+        """
+        timeout = m.WORKER_TIMEOUT if timeout is None else timeout
+        pipe, process = self._pipes[idx], self._processes[idx]
+        start = time.time()
+        try:
+            while not pipe.poll(m.POLL_INTERVAL):
+                if not process.is_alive():
+                    log.warning(f"Environment worker {idx} crashed with exit code {process.exitcode}.")
+                    return False, None
+                if time.time() - start > timeout:
+                    log.warning(f"Environment worker {idx} did not respond within {timeout} seconds.")
+                    return False, None
+            return True, pipe.recv()
+        except (EOFError, OSError):
+            log.warning(f"Lost connection to environment worker {idx}.")
+            return False, None
+
+    def _receive_spaces(self, idx):
+        """
+        Receives the observation and action spaces of the freshly started worker @idx
+
+        Args:
+            idx (int): Index of the environment
+
+        Returns:
+            2-tuple: Observation space and action space of the environment
+        """
+        success, spaces = self._receive(idx=idx)
+        if not success:
+            raise RuntimeError(f"Failed to create environment {idx}!")
+        return spaces
+
+    def _send_buffers(self, idx):
+        """
+        Lets the freshly started worker @idx attach to the shared buffers
+
+        Args:
+            idx (int): Index of the environment
+        """
+        self._pipes[idx].send((self._obs_buf.name, self._action_buf.name, self.num_envs))
+
+    def _restart_worker(self, idx):
+        """
+        Restarts the crashed or hanging worker @idx and resets its environment
+
+        Args:
+            idx (int): Index of the environment
+        """
+        self.n_restarts[idx] += 1
+        if self.n_restarts[idx] > m.MAX_RESTARTS:
+            raise RuntimeError(f"Environment worker {idx} exceeded the maximum number of restarts ({m.MAX_RESTARTS})!")
+        log.warning(f"Restarting environment worker {idx} ({self.n_restarts[idx]} / {m.MAX_RESTARTS}).")
+
+        # Make sure the old worker is dead
+        self._terminate_worker(idx=idx)
+
+        # Start the new worker and reset its environment
+        self._start_worker(idx=idx)
+        self._receive_spaces(idx=idx)
+        self._send_buffers(idx=idx)
+        self._pipes[idx].send("reset")
+        if not self._receive(idx=idx)[0]:
+            raise RuntimeError(f"Failed to reset restarted environment worker {idx}!")
+
+    def _terminate_worker(self, idx):
+        """
+        Terminates worker @idx if it is still running
+
+        Args:
+            idx (int): Index of the environment
+        """
+        process, pipe = self._processes[idx], self._pipes[idx]
+        if process.is_alive():
+            process.terminate()
+        process.join()
+        pipe.close()
+
+    def step_async(self, actions):
+        """
+        Sends actions @actions to all environments, without waiting for the results
+
+        Args:
+            actions (any): Batched actions, i.e.: value of self.action_space
+        """
+        assert not self._waiting, "step_async() was already called! Call step_wait() first."
+        for i in range(self.num_envs):
+            self._action_buf.write(self._get_batch_entry(value=actions, idx=i), idx=i)
+            self._pipes[i].send("step")
+        self._waiting = True
+
+    def step_wait(self, timeout=None):
+        """
+        Waits for the results of the actions sent with step_async(), restarting any crashed or hanging workers
+
+        Args:
+            timeout (None or float): Maximum time (in seconds) to wait for each worker. None results in
+                m.WORKER_TIMEOUT being used
+
+        Returns:
+            4-tuple:
+                - any: batched next observations, i.e.: value of self.observation_space
+                - n-array: (num_envs,) rewards at the current timestep
+                - n-array: (num_envs,) whether each environment's episode is terminated
+                - list of dict: info of each environment
+        """
+        assert self._waiting, "step_async() must be called before step_wait()!"
+        rewards, dones, infos = np.zeros(self.num_envs), np.zeros(self.num_envs, dtype=bool), [None] * self.num_envs
+        for i in range(self.num_envs):
+            success, result = self._receive(idx=i, timeout=timeout)
+            if success:
+                rewards[i], dones[i], infos[i] = result
+            else:
+                self._restart_worker(idx=i)
+                dones[i], infos[i] = True, dict(worker_restarted=True)
+        self._waiting = False
+
+        return self._obs_buf.read(), rewards, dones, infos
+
+    def step(self, actions):
+        """
+        Steps all environments with actions @actions
+
+        Args:
+            actions (any): Batched actions, i.e.: value of self.action_space
+
+        Returns:
+            4-tuple: (obs, rewards, dones, infos), as returned by step_wait()
+        """
+        self.step_async(actions=actions)
+        return self.step_wait()
+
+    def reset(self):
+        """
+        Resets all environments
+
+        Returns:
+            any: batched observations after resetting, i.e.: value of self.observation_space
+        """
+        assert not self._waiting, "Cannot reset while waiting for step results! Call step_wait() first."
+        for pipe in self._pipes:
+            pipe.send("reset")
+        for i in range(self.num_envs):
+            if not self._receive(idx=i)[0]:
+                # Restarting already resets the environment
+                self._restart_worker(idx=i)
+        return self._obs_buf.read()
+
+    def close(self):
+        """
+        Closes all environments and frees the shared buffers
+        """
+        if self._closed:
+            return
+        # Construction may have failed before all workers were started
+        started = [i for i in range(self.num_envs) if self._processes[i] is not None]
+        for i in started:
+            if self._processes[i].is_alive():
+                try:
+                    self._pipes[i].send("close")
+                except (BrokenPipeError, OSError):
+                    pass
+        for i in started:
+            self._processes[i].join(timeout=m.WORKER_TIMEOUT)
+            self._terminate_worker(idx=i)
+        for buf in (self._obs_buf, self._action_buf):
+            if buf is not None:
+                buf.close()
+        self._closed = True
+
+    @classmethod
+    def _get_batch_entry(cls, value, idx):
+        """
+        Args:
+            value (any): Batched value, e.g.: a (possibly nested) dictionary of arrays with a leading batch dimension
+            idx (int): Index of the entry to grab
+
+        Returns:
+            any: Entry @idx of @value
+        """
+        return {k: cls._get_batch_entry(value=v, idx=idx) for k, v in value.items()} if isinstance(value, dict) \
+            else value[idx]
+
+    def __del__(self):
+        # Construction may have failed before the internal placeholders were even created
+        if getattr(self, "_processes", None) is not None:
+            self.close()
+
+
+class FakeEnvironment(gym.Env):
+    """
+    Lightweight stand-in for Environment that does not require omniverse or the simulator, e.g.: for testing
+    EnvironmentPool. Observations are nested like the ones of an Environment with a single robot, and are computed
+    deterministically from the current step and the last action
+    """
+    def __init__(self, obs_dim=4, action_dim=2, episode_length=10, crash_at_step=None):
+        """
+        Args:
+            obs_dim (int): Dimension of the fake robot proprioception
+            action_dim (int): Dimension of the action space
+            episode_length (int): Number of steps after which each episode is done
+            crash_at_step (None or int): If specified, the process running this environment exits abruptly upon
+                reaching this step in any episode, which can be used to emulate a crashing simulator
+        """
+        self._episode_length = episode_length
+        self._crash_at_step = crash_at_step
+        self._current_step = 0
+        self.observation_space = gym.spaces.Dict({
+            "robot0": gym.spaces.Dict({
+                "proprio": gym.spaces.Box(low=-np.inf, high=np.inf, shape=(obs_dim,), dtype=np.float64),
+            }),
+            "task": gym.spaces.Dict({
+                "low_dim": gym.spaces.Box(low=-np.inf, high=np.inf, shape=(action_dim,), dtype=np.float64),
+            }),
+        })
+        self.action_space = gym.spaces.Box(low=-1.0, high=1.0, shape=(action_dim,), dtype=np.float32)
+
+    def _get_obs(self, action):
+        """
+        Args:
+            action (n-array): Last executed action
+
+        Returns:
+            dict: Keyword-mapped observations
+        """
+        return {
+            "robot0": {"proprio": np.full(self.observation_space["robot0"]["proprio"].shape, self._current_step,
+                                          dtype=np.float64)},
+            "task": {"low_dim": np.array(action, dtype=np.float64)},
+        }
+
+    def step(self, action):
+        self._current_step += 1
+        if self._crash_at_step is not None and self._current_step == self._crash_at_step:
+            os._exit(1)
+        done = self._current_step >= self._episode_length
+        return self._get_obs(action=action), float(np.sum(action)), done, dict(episode_length=self._current_step)
+
+    def reset(self):
+        self._current_step = 0
+        return self._get_obs(action=np.zeros(self.action_space.shape))
+
+    def close(self):
+        pass
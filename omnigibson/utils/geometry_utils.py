@@ -1,10 +1,85 @@
 """
 A set of helper utility functions for dealing with 3D geometry
 """
+import hashlib
+import itertools
+import json
+import os
+
 import numpy as np
+from omnigibson.macros import create_module_macros
 import omnigibson.utils.transform_utils as T
+from omnigibson.utils.ui_utils import create_module_logger
 from omnigibson.utils.usd_utils import mesh_prim_to_trimesh_mesh
 
+# Create module logger
+log = create_module_logger(module_name=__name__)
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# If specified, directory in which computed container volumes are stored, so that they can be shared across processes
+# and runs. None disables the on-disk store
+m.VOLUME_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "omnigibson", "container_volumes")
+
+
+def get_points_within_distance(query_points, points, distance_thresholds):
+    """
+    Finds all (query point, point) pairs for which the query point lies within the distance threshold of the point.
+    @points are bucketed into a uniform spatial hash grid whose cell size is the largest threshold, so that each query
+    point is only compared against the points in its own and its 26 neighboring cells instead of against all points
+
+    Args:
+        query_points ((N, 3)-array): (x,y,z) positions to query
+        points ((M, 3)-array): (x,y,z) positions to be bucketed
+        distance_thresholds (float or (M,)-array): per-point maximum distance at which a query point is considered
+            to be within range of that point
+
+    Returns:
+        2-tuple:
+            - (K,)-array: indices into @query_points of each pair found
+            - (K,)-array: indices into @points of each pair found
+    """
+    query_points = np.asarray(query_points, dtype=float).reshape(-1, 3)
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    distance_thresholds = np.broadcast_to(np.asarray(distance_thresholds, dtype=float), (len(points),))
+    if len(query_points) == 0 or len(points) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+
+    # Shift the grid origin by one cell so that the neighboring cells of every point have non-negative coordinates,
+    # which lets us encode each cell as a single integer key
+    cell_size = max(distance_thresholds.max(), 1e-6)
+    origin = np.minimum(query_points.min(axis=0), points.min(axis=0)) - cell_size
+    point_cells = np.floor((points - origin) / cell_size).astype(np.int64)
+    query_cells = np.floor((query_points - origin) / cell_size).astype(np.int64)
+    grid_dims = np.maximum(point_cells.max(axis=0), query_cells.max(axis=0)) + 2
+    encode = lambda cells: (cells[:, 0] * grid_dims[1] + cells[:, 1]) * grid_dims[2] + cells[:, 2]
+
+    point_order = np.argsort(encode(point_cells), kind="stable")
+    sorted_point_keys = encode(point_cells)[point_order]
+
+    query_idxs, point_idxs = [], []
+    for offset in itertools.product((-1, 0, 1), repeat=3):
+        keys = encode(query_cells + np.array(offset))
+        starts = np.searchsorted(sorted_point_keys, keys, side="left")
+        counts = np.searchsorted(sorted_point_keys, keys, side="right") - starts
+        n_candidates = counts.sum()
+        if n_candidates == 0:
+            continue
+        # Expand each query's [start, start + count) range of bucketed points into explicit candidate pairs
+        candidate_query_idxs = np.repeat(np.arange(len(query_points)), counts)
+        candidate_positions = np.arange(n_candidates) - np.repeat(np.cumsum(counts) - counts, counts) + \
+            np.repeat(starts, counts)
+        query_idxs.append(candidate_query_idxs)
+        point_idxs.append(point_order[candidate_positions])
+
+    if len(query_idxs) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    query_idxs, point_idxs = np.concatenate(query_idxs), np.concatenate(point_idxs)
+    in_range = np.linalg.norm(query_points[query_idxs] - points[point_idxs], axis=1) <= distance_thresholds[point_idxs]
+
+    return query_idxs[in_range], point_idxs[in_range]
+
 
 def get_particle_positions_in_frame(pos, quat, scale, particle_positions):
     """
@@ -207,70 +282,290 @@ def check_points_in_convex_hull_mesh(mesh_face_centroids, mesh_face_normals, pos
     return in_range
 
 
-def _generate_convex_hull_volume_checker_functions(convex_hull_mesh):
-    """
-    An internal helper function used to programmatically generate lambda funtions to check for particle
-    points within a convex hull mesh defined by face centroids @mesh_face_centroids and @mesh_face_normals.
 
-    Note that this is needed as an EXTERNAL helper function to @generate_points_in_volume_checker_function
-    because we "bake" certain arguments as part of the lambda internal scope, and
-    directly generating functions in a for loop results in these local variables being overwritten each time
-    (meaning that all the generated lambda functions reference the SAME variables!!)
 
-    Args:
-        convex_hull_mesh (Usd.Prim): Raw USD convex hull mesh to generate the volume checker functions
+class PointsInVolumeChecker:
+    """
+    Compiled checker for quickly checking which of a group of points are contained within any container volumes.
+    Five volume types are supported:
+        "Cylinder" - Cylinder volume
+        "Cone" - Cone volume
+        "Cube" - Cube volume
+        "Sphere" - Sphere volume
+        "Mesh" - Convex hull volume
 
-    Returns:
-        2-tuple:
-            - function: Generated lambda function with signature:
+    The container volumes' parameters and local poses are read from the USD stage once when the checker is compiled,
+    and are assumed to stay fixed relative to the volume link afterwards. Primitive volumes are stored as stacked
+    (link frame -> volume frame) affine transforms and dimensions, and convex hulls as half-spaces expressed in the
+    volume link frame, so that all sub-volumes are evaluated in one vectorized pass.
 
-                    in_range = check_in_volume(mesh, particle_positions)
+    The container's (unscaled) volume is additionally cached in memory and on disk (if m.VOLUME_CACHE_DIR is set),
+    keyed by the object's model and a digest of the compiled volumes, since its Monte-Carlo estimate is expensive
+    """
+    # Maps volume cache keys to computed unscaled volumes
+    _VOLUME_CACHE = dict()
+
+    def __init__(self, obj, volume_link, use_visual_meshes=True, mesh_name_prefixes=None):
+        """
+        @volume_link should have any number of nested, visual-only meshes of types {Sphere, Cylinder, Cone, Cube, Mesh}
+        with naming prefix "container[...]"
+
+        Args:
+            obj (EntityPrim): Object which contains @volume_link as one of its links
+            volume_link (RigidPrim): Link to use to grab container volumes composing the values for checking the points
+            use_visual_meshes (bool): Whether to use @volume_link's visual or collision meshes to generate the checker
+            mesh_name_prefixes (None or str): If specified, specifies the substring that must exist in @volume_link's
+                mesh names in order for that mesh to be included in the volume checker. If None, no filtering
+                will be used.
+        """
+        self._obj = obj
+        self._volume_link = volume_link
+
+        # Iterate through all meshes and keep track of any that are prefixed with container
+        meshes = volume_link.visual_meshes if use_visual_meshes else volume_link.collision_meshes
+        self._container_meshes = [container_mesh for container_mesh_name, container_mesh in meshes.items()
+                                  if mesh_name_prefixes is None or mesh_name_prefixes in container_mesh_name]
+
+        # Compiled primitive volumes: (K, 3, 4) affine transforms from the volume link frame into each volume's frame,
+        # as well as each volume's type and (radius / half size, height) dimensions
+        primitive_tfs, primitive_types, primitive_dims = [], [], []
+        # Compiled convex hull volumes: (P, 3) normals and (P,) offsets of all half-spaces expressed in the volume link
+        # frame, as well as the index of the first half-space of each hull
+        hull_normals, hull_offsets, hull_starts = [], [], []
+        # (x,y,z) corners of each volume's bounding box, expressed in the volume link frame
+        corners = []
+        for container_mesh in self._container_meshes:
+            mesh = container_mesh.prim
+            mesh_type = mesh.GetTypeName()
+            pos = np.array(mesh.GetAttribute("xformOp:translate").Get())
+            orient = mesh.GetAttribute("xformOp:orient").Get()
+            quat = np.array([*orient.imaginary, orient.real])
+            scale = np.array(mesh.GetAttribute("xformOp:scale").Get())
+            # A point p in the volume link frame maps to (R^T (p - pos)) / scale in the volume frame
+            rot = T.quat2mat(quat)
+            mat = rot.T / scale.reshape(3, 1)
+            if mesh_type == "Mesh":
+                trimesh_mesh = mesh_prim_to_trimesh_mesh(mesh, include_normals=False, include_texcoord=False).convex_hull
+                assert trimesh_mesh.is_convex, \
+                    f"Trying to generate a volume checker for a non-convex mesh {mesh.GetPath().pathString}"
+                face_centroids = trimesh_mesh.vertices[trimesh_mesh.faces].mean(axis=1)
+                face_normals = trimesh_mesh.face_normals
+                # (mat @ (p - pos) - c) . n < 0  <=>  p . (mat^T n) < (c + mat @ pos) . n
+                hull_starts.append(sum(len(normals) for normals in hull_normals))
+                hull_normals.append(face_normals @ mat)
+                hull_offsets.append(((face_centroids + mat @ pos) * face_normals).sum(axis=-1))
+                local_corners = trimesh_mesh.vertices
+            else:
+                if mesh_type == "Sphere":
+                    radius = mesh.GetAttribute("radius").Get()
+                    dims = [radius, 2 * radius]
+                elif mesh_type in {"Cylinder", "Cone"}:
+                    dims = [mesh.GetAttribute("radius").Get(), mesh.GetAttribute("height").Get()]
+                elif mesh_type == "Cube":
+                    size = mesh.GetAttribute("size").Get()
+                    dims = [size / 2.0, size]
+                else:
+                    raise ValueError(f"Cannot create volume checker function for mesh of type: {mesh_type}")
+                primitive_tfs.append(np.concatenate([mat, -(mat @ pos).reshape(3, 1)], axis=1))
+                primitive_types.append(mesh_type)
+                primitive_dims.append(dims)
+                radius, height = dims
+                local_corners = np.array(list(itertools.product([-radius, radius], [-radius, radius], [-height / 2.0, height / 2.0])))
+            corners.append((local_corners * scale) @ rot.T + pos)
+
+        self._primitive_tfs = np.array(primitive_tfs, dtype=float).reshape(-1, 3, 4)
+        self._primitive_types = np.array(primitive_types, dtype=str)
+        self._primitive_dims = np.array(primitive_dims, dtype=float).reshape(-1, 2)
+        self._hull_normals = np.concatenate(hull_normals, axis=0) if len(hull_normals) > 0 else np.zeros((0, 3))
+        self._hull_offsets = np.concatenate(hull_offsets, axis=0) if len(hull_offsets) > 0 else np.zeros(0)
+        self._hull_starts = np.array(hull_starts, dtype=int)
+        corners = np.concatenate(corners, axis=0) if len(corners) > 0 else np.zeros((0, 3))
+        self._local_aabb = (corners.min(axis=0), corners.max(axis=0)) if len(corners) > 0 else None
+
+    def __call__(self, particle_positions):
+        """
+        Args:
+            particle_positions ((N, 3) array): positions to check, specified in global coordinates
+
+        Returns:
+            (N,) array: boolean numpy array specifying whether each point lies in any of the container volumes
+        """
+        particle_positions = np.asarray(particle_positions, dtype=float).reshape(-1, 3)
+        # Transform the points into the volume link frame
+        # NOTE: This assumes there is no relative scaling between obj and volume link
+        volume_link_pos, volume_link_quat = self._volume_link.get_position_orientation()
+        particle_positions = get_particle_positions_in_frame(
+            pos=volume_link_pos,
+            quat=volume_link_quat,
+            scale=self._obj.scale,
+            particle_positions=particle_positions,
+        )
+        return self.check_local_points(particle_positions)
+
+    def check_local_points(self, particle_positions):
+        """
+        Args:
+            particle_positions ((N, 3) array): positions to check, specified in the (unscaled) volume link frame
+
+        Returns:
+            (N,) array: boolean numpy array specifying whether each point lies in any of the container volumes
+        """
+        in_volumes = np.zeros(len(particle_positions), dtype=bool)
+
+        if len(self._primitive_tfs) > 0:
+            # Transform the points into every primitive volume's frame at once, giving a (K, N, 3) array
+            local = np.einsum("kij,nj->kni", self._primitive_tfs[:, :, :3], particle_positions) + \
+                self._primitive_tfs[:, None, :, 3]
+            radius, height = self._primitive_dims[:, 0:1], self._primitive_dims[:, 1:2]
+            z = local[:, :, 2]
+            dist_xy = np.linalg.norm(local[:, :, :2], axis=-1)
+            in_height = np.abs(z) < height / 2.0
+            # See check_points_in_[...] for the individual checks
+            in_primitives = np.select(
+                [
+                    (self._primitive_types == "Sphere")[:, None],
+                    (self._primitive_types == "Cylinder")[:, None],
+                    (self._primitive_types == "Cone")[:, None],
+                ],
+                [
+                    np.linalg.norm(local, axis=-1) < radius,
+                    in_height & (dist_xy < radius),
+                    in_height & (dist_xy < radius * (1 - (z + height / 2.0) / height)),
+                ],
+                default=np.all(np.abs(local) < radius[:, :, None], axis=-1),
+            )
+            in_volumes |= in_primitives.any(axis=0)
 
-                where @in_range is a N-array boolean numpy array, (True where the particle is in the convex hull mesh
-                    volume), @mesh is the raw USD mesh, and @particle_positions is a (N, 3) array specifying the particle
-                    positions in the SAME coordinate frame as @mesh
+        if len(self._hull_starts) > 0:
+            # A point is inside a hull if it lies behind all of the hull's half-spaces
+            behind = particle_positions @ self._hull_normals.T < self._hull_offsets
+            in_volumes |= np.logical_and.reduceat(behind, self._hull_starts, axis=1).any(axis=1)
 
-            - function: Function for grabbing real-time LOCAL scale volume of the container. Signature:
+        return in_volumes
 
-                vol = calc_volume(mesh)
+    def calculate_volume(self, precision=1e-5):
+        """
+        Calculates the real-time global scale volume of the container, aggregated across all container sub-volumes
+
+        Args:
+            precision (float): RELATIVE precision of the volume computation, i.e.: the relative error with respect to
+                the container volumes' local AABB
+
+        Returns:
+            float: total volume being checked, expressed in global scale
+        """
+        return self.calculate_unscaled_volume(precision=precision) * np.prod(self._obj.scale)
+
+    def calculate_unscaled_volume(self, precision=1e-5):
+        """
+        Calculates the volume of the container in the (unscaled) volume link frame, loading it from the in-memory cache
+        or the on-disk store (if m.VOLUME_CACHE_DIR is set) when available, and computing it otherwise
+
+        Args:
+            precision (float): RELATIVE precision of the volume computation, i.e.: the relative error with respect to
+                the container volumes' local AABB
+
+        Returns:
+            float: total volume being checked, expressed in the volume link's local scale
+        """
+        if self._local_aabb is None:
+            return 0.0
+
+        key = self._get_volume_cache_key(precision=precision)
+        if key in self._VOLUME_CACHE:
+            return self._VOLUME_CACHE[key]
+
+        volume_file = None
+        if m.VOLUME_CACHE_DIR is not None:
+            volume_file = os.path.join(m.VOLUME_CACHE_DIR, f"{key}.json")
+
+        volume = None
+        if volume_file is not None and os.path.isfile(volume_file):
+            try:
+                with open(volume_file, "r") as f:
+                    volume = json.load(f)["volume"]
+            except (OSError, ValueError, KeyError) as e:
+                log.warning(f"Failed to load container volume from {volume_file}: {e}")
+
+        if volume is None:
+            volume = self._estimate_unscaled_volume(precision=precision)
+            if volume_file is not None:
+                # Write to a temporary file first so that concurrent readers never see a partially written volume
+                tmp_file = f"{volume_file[:-5]}.{os.getpid()}.tmp.json"
+                try:
+                    os.makedirs(m.VOLUME_CACHE_DIR, exist_ok=True)
+                    with open(tmp_file, "w+") as f:
+                        json.dump(dict(volume=volume), f)
+                    os.replace(tmp_file, volume_file)
+                except OSError as e:
+                    log.warning(f"Failed to store container volume to {volume_file}: {e}")
+
+        self._VOLUME_CACHE[key] = volume
+        return volume
+
+    def _estimate_unscaled_volume(self, precision):
+        """
+        Estimates the volume of the container in the (unscaled) volume link frame by sampling a regular grid of points
+        covering the container volumes' local AABB
+
+        Args:
+            precision (float): RELATIVE precision of the volume computation, i.e.: the relative error with respect to
+                the container volumes' local AABB
+
+        Returns:
+            float: total volume being checked, expressed in the volume link's local scale
+        """
+        # Convert precision to minimum number of particles to sample
+        min_n_particles = int(np.ceil(1. / precision))
 
-            where @vol is the total volume being checked (expressed in the mesh's LOCAL scale), and @mesh is the raw
-                USD mesh
-    """
-    # For efficiency, we pre-compute the mesh using trimesh and find its corresponding faces and normals
-    trimesh_mesh = mesh_prim_to_trimesh_mesh(convex_hull_mesh, include_normals=False, include_texcoord=False).convex_hull
-    assert trimesh_mesh.is_convex, \
-        f"Trying to generate a volume checker function for a non-convex mesh {convex_hull_mesh.GetPath().pathString}"
-    face_centroids = trimesh_mesh.vertices[trimesh_mesh.faces].mean(axis=1)
-    face_normals = trimesh_mesh.face_normals
-
-    # This function assumes that:
-    # 1. @particle_positions are in the local container_link frame
-    # 2. the @check_points_in_[...] function will convert them into the local @mesh frame
-    in_volume = lambda mesh, particle_positions: check_points_in_convex_hull_mesh(
-        mesh_face_centroids=face_centroids,
-        mesh_face_normals=face_normals,
-        pos=np.array(mesh.GetAttribute("xformOp:translate").Get()),
-        quat=np.array(
-            [*(mesh.GetAttribute("xformOp:orient").Get().imaginary), mesh.GetAttribute("xformOp:orient").Get().real]),
-        scale=np.array(mesh.GetAttribute("xformOp:scale").Get()),
-        particle_positions=particle_positions,
-    )
-    calc_volume = lambda mesh: trimesh_mesh.volume if trimesh_mesh.is_volume else trimesh_mesh.convex_hull.volume
-    return in_volume, calc_volume
+        # Determine equally-spaced sampling distance to achieve this minimum particle count
+        low, high = self._local_aabb
+        aabb_volume = np.prod(high - low)
+        sampling_distance = np.cbrt(aabb_volume / min_n_particles)
+        assert sampling_distance > 0, "Cannot calculate the volume of a degenerate container volume!"
+        n_particles_per_axis = np.ceil((high - low) / sampling_distance).astype(int)
+        # Sample the center of each grid cell, so that each point accounts for exactly one cell's volume
+        arrs = [lo + (np.arange(n) + 0.5) * sampling_distance for lo, n in zip(low, n_particles_per_axis)]
+        # Generate 3D-rectangular grid of points, and only keep the ones inside the volumes
+        points = np.stack([arr.flatten() for arr in np.meshgrid(*arrs)]).T
+
+        # Return the total volume of the cells whose center lies within the volumes
+        return float(self.check_local_points(points).sum() * sampling_distance ** 3)
+
+    def _get_volume_cache_key(self, precision):
+        """
+        Args:
+            precision (float): RELATIVE precision of the volume computation
+
+        Returns:
+            str: Key under which this container's unscaled volume is cached. This consists of the object's model (if
+                any) and volume link name, as well as a digest of the compiled volumes so that stale entries are never
+                reused if the underlying asset changes
+        """
+        digest = hashlib.sha1()
+        for arr in (self._primitive_tfs, self._primitive_dims, self._hull_normals, self._hull_offsets, self._hull_starts):
+            digest.update(np.ascontiguousarray(arr).tobytes())
+        digest.update(",".join(self._primitive_types).encode())
+        digest.update(str(precision).encode())
+        model = getattr(self._obj, "model", None) or self._obj.name
+        return f"{model}_{self._volume_link.prim_path.split('/')[-1]}_{digest.hexdigest()[:16]}"
+
+    @property
+    def container_meshes(self):
+        """
+        Returns:
+            list of VisualGeomPrim or CollisionGeomPrim: Meshes composing the container volumes being checked
+        """
+        return self._container_meshes
 
 
 def generate_points_in_volume_checker_function(obj, volume_link, use_visual_meshes=True, mesh_name_prefixes=None):
     """
     Generates a function for quickly checking which of a group of points are contained within any container volumes.
-    Four volume types are supported:
-        "Cylinder" - Cylinder volume
-        "Cube" - Cube volume
-        "Sphere" - Sphere volume
-        "Mesh" - Convex hull volume
+    See PointsInVolumeChecker for the supported volume types.
 
-    @volume_link should have any number of nested, visual-only meshes of types {Sphere, Cylinder, Cube, Mesh} with
-    naming prefix "container[...]"
+    @volume_link should have any number of nested, visual-only meshes of types {Sphere, Cylinder, Cone, Cube, Mesh}
+    with naming prefix "container[...]"
 
     Args:
         obj (EntityPrim): Object which contains @volume_link as one of its links
@@ -282,7 +577,7 @@ def generate_points_in_volume_checker_function(obj, volume_link, use_visual_mesh
 
     Returns:
         2-tuple:
-            - function: Function with signature:
+            - PointsInVolumeChecker: Compiled checker, callable with signature:
 
                 in_range = check_in_volumes(particle_positions)
 
@@ -296,111 +591,10 @@ def generate_points_in_volume_checker_function(obj, volume_link, use_visual_mesh
             where @vol is the total volume being checked (expressed in global scale) aggregated across
             all container sub-volumes
     """
-    # Iterate through all visual meshes and keep track of any that are prefixed with container
-    container_meshes = []
-    meshes = volume_link.visual_meshes if use_visual_meshes else volume_link.collision_meshes
-    for container_mesh_name, container_mesh in meshes.items():
-        if mesh_name_prefixes is None or mesh_name_prefixes in container_mesh_name:
-            container_meshes.append(container_mesh)
-
-    # Programmatically define the volume checker functions based on each container found
-    volume_checker_fcns = []
-    for sub_container_mesh in container_meshes:
-        mesh_type = sub_container_mesh.prim.GetTypeName()
-        if mesh_type == "Mesh":
-            fcn, vol_fcn = _generate_convex_hull_volume_checker_functions(convex_hull_mesh=sub_container_mesh.prim)
-        elif mesh_type == "Sphere":
-            fcn = lambda mesh, particle_positions: check_points_in_sphere(
-                size=mesh.GetAttribute("radius").Get(),
-                pos=np.array(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=np.array([*(mesh.GetAttribute("xformOp:orient").Get().imaginary), mesh.GetAttribute("xformOp:orient").Get().real]),
-                scale=np.array(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
-            )
-        elif mesh_type == "Cylinder":
-            fcn = lambda mesh, particle_positions: check_points_in_cylinder(
-                size=[mesh.GetAttribute("radius").Get(), mesh.GetAttribute("height").Get()],
-                pos=np.array(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=np.array([*(mesh.GetAttribute("xformOp:orient").Get().imaginary), mesh.GetAttribute("xformOp:orient").Get().real]),
-                scale=np.array(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
-            )
-        elif mesh_type == "Cone":
-            fcn = lambda mesh, particle_positions: check_points_in_cone(
-                size=[mesh.GetAttribute("radius").Get(), mesh.GetAttribute("height").Get()],
-                pos=np.array(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=np.array([*(mesh.GetAttribute("xformOp:orient").Get().imaginary), mesh.GetAttribute("xformOp:orient").Get().real]),
-                scale=np.array(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
-            )
-        elif mesh_type == "Cube":
-            fcn = lambda mesh, particle_positions: check_points_in_cube(
-                size=mesh.GetAttribute("size").Get(),
-                pos=np.array(mesh.GetAttribute("xformOp:translate").Get()),
-                quat=np.array([*(mesh.GetAttribute("xformOp:orient").Get().imaginary), mesh.GetAttribute("xformOp:orient").Get().real]),
-                scale=np.array(mesh.GetAttribute("xformOp:scale").Get()),
-                particle_positions=particle_positions,
-            )
-        else:
-            raise ValueError(f"Cannot create volume checker function for mesh of type: {mesh_type}")
-
-        volume_checker_fcns.append(fcn)
-
-    # Define the actual volume checker function
-    def check_points_in_volumes(particle_positions):
-        # Algo
-        # 1. Particles in global frame --> particles in volume link frame (including scaling)
-        # 2. For each volume checker function, apply volume checking
-        # 3. Aggregate across all functions with OR condition (any volume satisfied for that point)
-        ######
-
-        n_particles = len(particle_positions)
-        # Get pose of origin (global frame) in frame of volume link
-        # NOTE: This assumes there is no relative scaling between obj and volume link
-        volume_link_pos, volume_link_quat = volume_link.get_position_orientation()
-        particle_positions = get_particle_positions_in_frame(
-            pos=volume_link_pos,
-            quat=volume_link_quat,
-            scale=obj.scale,
-            particle_positions=particle_positions,
-        )
-
-        in_volumes = np.zeros(n_particles).astype(bool)
-        for checker_fcn, mesh in zip(volume_checker_fcns, container_meshes):
-            in_volumes |= checker_fcn(mesh.prim, particle_positions)
-
-        return in_volumes
-
-    # Define the actual volume calculator function
-    def calculate_volume(precision=1e-5):
-        # We use monte-carlo sampling to approximate the voluem up to @precision
-        # NOTE: precision defines the RELATIVE precision of the volume computation -- i.e.: the relative error with
-        # respect to the volume link's global AABB
-
-        # Convert precision to minimum number of particles to sample
-        min_n_particles = int(np.ceil(1. / precision))
-
-        # Make sure container meshes are visible so AABB computation is correct
-        for mesh in container_meshes:
-            mesh.visible = True
-
-        # Determine equally-spaced sampling distance to achieve this minimum particle count
-        aabb_volume = np.product(volume_link.aabb_extent)
-        sampling_distance = np.cbrt(aabb_volume / min_n_particles)
-        low, high = volume_link.aabb
-        n_particles_per_axis = ((high - low) / sampling_distance).astype(int) + 1
-        assert np.all(n_particles_per_axis), "Must increase precision for calculate_volume -- too coarse for sampling!"
-        # 1e-10 is added because the extent might be an exact multiple of particle radius
-        arrs = [np.arange(lo, hi, sampling_distance)
-                for lo, hi, n in zip(low, high, n_particles_per_axis)]
-        # Generate 3D-rectangular grid of points, and only keep the ones inside the mesh
-        points = np.stack([arr.flatten() for arr in np.meshgrid(*arrs)]).T
-
-        # Re-hide container meshes
-        for mesh in container_meshes:
-            mesh.visible = False
-
-        # Return the fraction of the link AABB's volume based on fraction of points enclosed within it
-        return aabb_volume * np.mean(check_points_in_volumes(points))
-
-    return check_points_in_volumes, calculate_volume
+    checker = PointsInVolumeChecker(
+        obj=obj,
+        volume_link=volume_link,
+        use_visual_meshes=use_visual_meshes,
+        mesh_name_prefixes=mesh_name_prefixes,
+    )
+    return checker, checker.calculate_volume
@@ -0,0 +1,249 @@
+"""
+Set of utilities for operating directly on 2D traversability grids (e.g.: the floor maps owned by TraversableMap),
+such as nearest traversable pixel lookups, shortest path search and geodesic distance fields
+"""
+import heapq
+import math
+
+import numpy as np
+from scipy import ndimage, sparse
+from scipy.sparse import csgraph
+
+
+# Cost of a diagonal move between two 8-connected pixels
+SQRT2 = math.sqrt(2.0)
+
+
+def get_nearest_traversable_pixels(trav_map):
+    """
+    Computes, for every pixel in @trav_map, the (row, col) coordinates of its closest traversable pixel. Traversable
+    pixels map onto themselves. This is computed once with an exact euclidean distance transform, so that subsequent
+    nearest-pixel queries are a single array lookup
+
+    Args:
+        trav_map ((H, W)-array): traversability map, where nonzero pixels are traversable
+
+    Returns:
+        (H, W, 2)-array: (row, col) coordinates of the closest traversable pixel for every pixel in @trav_map
+    """
+    traversable = trav_map > 0
+    assert np.any(traversable), "Cannot compute nearest traversable pixels for a map with no traversable pixels!"
+    # The distance transform finds the closest zero-valued pixel, so we pass in the non-traversable mask
+    indices = ndimage.distance_transform_edt(~traversable, return_distances=False, return_indices=True)
+    return np.moveaxis(indices, 0, -1)
+
+
+def get_nearest_traversable_pixel(trav_map, nearest_pixels, pixel):
+    """
+    Finds the closest traversable pixel to @pixel, which may lie outside of @trav_map's bounds
+
+    Args:
+        trav_map ((H, W)-array): traversability map, where nonzero pixels are traversable
+        nearest_pixels ((H, W, 2)-array): precomputed nearest traversable pixel lookup for @trav_map, as returned
+            by get_nearest_traversable_pixels()
+        pixel (2-array): (row, col) pixel to query
+
+    Returns:
+        2-array: (row, col) coordinates of the closest traversable pixel to @pixel
+    """
+    row, col = int(pixel[0]), int(pixel[1])
+    height, width = trav_map.shape
+    if 0 <= row < height and 0 <= col < width:
+        return nearest_pixels[row, col]
+
+    # Out of bounds queries are rare, so we simply brute-force search over all traversable pixels
+    traversable_pixels = np.argwhere(trav_map > 0)
+    return traversable_pixels[np.argmin(np.linalg.norm(traversable_pixels - np.array([row, col]), axis=1))]
+
+
+def astar_grid(trav_map, source, target):
+    """
+    Computes the shortest 8-connected path between @source and @target over the traversable pixels of @trav_map
+    using A* search. Moving between two adjacent pixels costs their euclidean distance (1 for horizontal / vertical
+    moves, sqrt(2) for diagonal moves), and the octile distance is used as an (admissible and consistent) heuristic.
+
+    The search operates on a flattened, zero-padded copy of @trav_map so that no bounds checks are needed when
+    expanding neighbors, and @trav_map itself is never modified
+
+    Args:
+        trav_map ((H, W)-array): traversability map, where nonzero pixels are traversable
+        source (2-array): (row, col) start pixel. Must be traversable
+        target (2-array): (row, col) goal pixel. Must be traversable
+
+    Returns:
+        None or (N, 2)-array: (row, col) pixels along the shortest path, including @source and @target, or None
+            if no path exists
+    """
+    height, width = trav_map.shape
+    padded_width = width + 2
+    traversable = np.pad(trav_map > 0, 1).astype(np.uint8).tobytes()
+
+    start = (int(source[0]) + 1) * padded_width + int(source[1]) + 1
+    goal = (int(target[0]) + 1) * padded_width + int(target[1]) + 1
+    assert traversable[start], f"Source pixel {tuple(source)} is not traversable!"
+    assert traversable[goal], f"Target pixel {tuple(target)} is not traversable!"
+
+    neighbor_offsets = (
+        (-padded_width - 1, SQRT2),
+        (-padded_width, 1.0),
+        (-padded_width + 1, SQRT2),
+        (-1, 1.0),
+        (1, 1.0),
+        (padded_width - 1, SQRT2),
+        (padded_width, 1.0),
+        (padded_width + 1, SQRT2),
+    )
+    goal_row, goal_col = divmod(goal, padded_width)
+    diagonal_discount = SQRT2 - 2.0
+
+    g_scores = {start: 0.0}
+    parents = {start: -1}
+    closed = bytearray(len(traversable))
+    # Heap entries are (f, -g, node) -- ties in f are broken in favor of nodes further along the path
+    open_heap = [(0.0, 0.0, start)]
+    while open_heap:
+        _, neg_g, node = heapq.heappop(open_heap)
+        if node == goal:
+            break
+        if closed[node]:
+            continue
+        closed[node] = 1
+        g = -neg_g
+        for offset, cost in neighbor_offsets:
+            neighbor = node + offset
+            if not traversable[neighbor] or closed[neighbor]:
+                continue
+            new_g = g + cost
+            if new_g < g_scores.get(neighbor, math.inf):
+                g_scores[neighbor] = new_g
+                parents[neighbor] = node
+                row, col = divmod(neighbor, padded_width)
+                d_row, d_col = abs(row - goal_row), abs(col - goal_col)
+                h = d_row + d_col + diagonal_discount * min(d_row, d_col)
+                heapq.heappush(open_heap, (new_g + h, -new_g, neighbor))
+    else:
+        # We exhausted the search without reaching the goal
+        return None
+
+    # Walk back from the goal to recover the path
+    path = []
+    node = goal
+    while node != -1:
+        path.append(node)
+        node = parents[node]
+    path = np.array(path[::-1])
+
+    return np.stack([path // padded_width - 1, path % padded_width - 1], axis=1)
+
+
+def get_largest_connected_component(trav_map):
+    """
+    Finds the largest 8-connected component of traversable pixels in @trav_map
+
+    Args:
+        trav_map ((H, W)-array): traversability map, where nonzero pixels are traversable
+
+    Returns:
+        (H, W)-array: boolean mask that is True only for pixels belonging to the largest connected component
+    """
+    labels, n_components = ndimage.label(trav_map > 0, structure=np.ones((3, 3), dtype=bool))
+    if n_components == 0:
+        return np.zeros(trav_map.shape, dtype=bool)
+    # Label 0 is the non-traversable background, so we skip it when searching for the largest component
+    component_sizes = np.bincount(labels.ravel())
+    return labels == (np.argmax(component_sizes[1:]) + 1)
+
+
+def build_grid_adjacency(trav_map):
+    """
+    Builds the weighted 8-connected adjacency matrix between the traversable pixels of @trav_map. Node i of the
+    graph corresponds to the i-th traversable pixel in row-major order, i.e.: np.flatnonzero(trav_map)[i], and edges
+    are weighted by the euclidean distance between pixels (1 or sqrt(2))
+
+    Args:
+        trav_map ((H, W)-array): traversability map, where nonzero pixels are traversable
+
+    Returns:
+        2-tuple:
+            - N-array: flattened pixel indices of the N graph nodes
+            - csr_matrix: (N, N) symmetric sparse adjacency matrix with edge weights
+    """
+    traversable = trav_map > 0
+    height, width = traversable.shape
+    nodes = np.flatnonzero(traversable)
+    node_ids = np.full(traversable.shape, -1, dtype=np.int64)
+    node_ids.flat[nodes] = np.arange(len(nodes))
+
+    # Only half of the 8 neighbor directions are needed since the graph is undirected
+    rows, cols, weights = [], [], []
+    for d_row, d_col, weight in ((0, 1, 1.0), (1, 0, 1.0), (1, 1, SQRT2), (1, -1, SQRT2)):
+        src = node_ids[: height - d_row, max(0, -d_col): width - max(0, d_col)]
+        dst = node_ids[d_row:, max(0, d_col): width - max(0, -d_col)]
+        valid = (src >= 0) & (dst >= 0)
+        rows.append(src[valid])
+        cols.append(dst[valid])
+        weights.append(np.full(np.count_nonzero(valid), weight))
+    rows, cols, weights = np.concatenate(rows), np.concatenate(cols), np.concatenate(weights)
+
+    adjacency = sparse.coo_matrix(
+        (np.concatenate([weights, weights]), (np.concatenate([rows, cols]), np.concatenate([cols, rows]))),
+        shape=(len(nodes), len(nodes)),
+    ).tocsr()
+
+    return nodes, adjacency
+
+
+def compute_distance_field(adjacency, nodes, shape, target):
+    """
+    Computes the dense geodesic distance field towards @target over the graph defined by @adjacency, using a single
+    Dijkstra flood from @target. Since the graph is undirected, the Dijkstra predecessor of every pixel is its next
+    hop along the shortest path towards @target
+
+    Args:
+        adjacency (csr_matrix): (N, N) symmetric weighted adjacency matrix, as returned by build_grid_adjacency()
+        nodes (N-array): flattened pixel indices of the graph nodes, as returned by build_grid_adjacency()
+        shape (2-tuple): (H, W) shape of the traversability map from which the graph was built
+        target (int): flattened pixel index of the target. Must be one of @nodes
+
+    Returns:
+        2-tuple:
+            - (H * W)-array: geodesic distance (in pixels) from every pixel to @target. Pixels that are not
+                connected to @target are set to inf
+            - (H * W)-array: flattened pixel index of the next pixel along the shortest path towards @target for
+                every pixel. Pixels that are not connected to @target, as well as @target itself, are set to -1
+    """
+    target_id = np.searchsorted(nodes, target)
+    assert target_id < len(nodes) and nodes[target_id] == target, "Target pixel is not part of the graph!"
+    distances, predecessors = csgraph.dijkstra(adjacency, directed=True, indices=target_id, return_predecessors=True)
+
+    dist_field = np.full(shape[0] * shape[1], np.inf)
+    dist_field[nodes] = distances
+    next_pixels = np.full(shape[0] * shape[1], -1, dtype=np.int64)
+    has_next = predecessors >= 0
+    next_pixels[nodes[has_next]] = nodes[predecessors[has_next]]
+
+    return dist_field, next_pixels
+
+
+def trace_distance_field(next_pixels, width, source, max_length=None):
+    """
+    Recovers the shortest path from @source by following the next-hop pointers of a distance field
+
+    Args:
+        next_pixels ((H * W)-array): next-hop pointers, as returned by compute_distance_field()
+        width (int): width W of the traversability map
+        source (2-array): (row, col) start pixel. Must be connected to the distance field's target
+        max_length (None or int): If specified, the maximum number of pixels to return. Otherwise, the path is
+            traced all the way to the target
+
+    Returns:
+        (N, 2)-array: (row, col) pixels along the path, starting at @source
+    """
+    node = int(source[0]) * width + int(source[1])
+    path = [node]
+    while next_pixels[node] != -1 and (max_length is None or len(path) < max_length):
+        node = next_pixels[node]
+        path.append(node)
+    path = np.array(path)
+
+    return np.stack([path // width, path % width], axis=1)
@@ -37,6 +37,22 @@ def recursively_generate_flat_dict(dic, prefix=None):
     return out
 
 
+def recursively_stack_dicts(dics):
+    """
+    Helper function to stack a list of identically structured (potentially nested) dictionaries @dics into a single
+    dictionary of batched arrays, e.g.: the observations of multiple environment instances
+
+    Args:
+        dics (list of dict): (Potentially nested) dictionaries to stack. All of them must have the same keys
+
+    Returns:
+        dict: Dictionary with the same structure as each entry in @dics, where each leaf value is the stacked array of
+            the corresponding leaf values in @dics, with the batch dimension first
+    """
+    return {k: recursively_stack_dicts(dics=[dic[k] for dic in dics]) if isinstance(v, dict) else
+            np.stack([dic[k] for dic in dics]) for k, v in dics[0].items()}
+
+
 class GymObservable(metaclass=ABCMeta):
     """
     Simple class interface for observable objects. These objects should implement a way to grab observations,
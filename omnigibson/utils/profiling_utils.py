@@ -0,0 +1,189 @@
+"""
+A set of utility functions for instrumenting and profiling how each simulator / environment step is spent
+"""
+import json
+import time
+from collections import defaultdict, deque
+from contextlib import nullcontext
+
+from omnigibson.macros import gm, create_module_macros
+
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Number of most recent frames (i.e.: top-level profiled blocks, such as a single env / sim step) to keep in memory
+m.BUFFER_SIZE = 1000
+
+# Shared no-op context returned when profiling is disabled, so that profiled blocks incur (almost) no overhead
+_NULL_CONTEXT = nullcontext()
+
+
+class _ProfiledBlock:
+    """
+    Context manager timing a single named block and reporting it to the StepProfiler
+    """
+    __slots__ = ("name", "depth", "start")
+
+    def __init__(self, name):
+        self.name = name
+        self.depth = None
+        self.start = None
+
+    def __enter__(self):
+        self.depth = StepProfiler.depth
+        StepProfiler.depth += 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self.start
+        StepProfiler.depth -= 1
+        StepProfiler.add_event(name=self.name, start=self.start, duration=duration, depth=self.depth)
+
+
+class StepProfiler:
+    """
+    Monolithic class for recording named timers around the phases of each simulator / environment step.
+
+    Blocks are profiled with:
+
+        with StepProfiler.profile("sim.physics"):
+            ...
+
+    Blocks can be nested arbitrarily. Every time a top-level (i.e.: non-nested) block finishes, all events recorded
+    within it are stored as a single frame in a ring buffer holding the last m.BUFFER_SIZE frames, which can then be
+    summarized or exported to JSON / Chrome trace format (viewable in chrome://tracing or https://ui.perfetto.dev).
+
+    Profiling is toggled with gm.ENABLE_PROFILING. When disabled, profile() returns a shared no-op context.
+    """
+    # Current nesting depth of profiled blocks
+    depth = 0
+
+    # Events recorded for the frame currently in progress, as (name, start, duration, depth) tuples
+    _CURRENT_EVENTS = []
+
+    # Ring buffer of completed frames
+    _FRAMES = None
+
+    @classmethod
+    def profile(cls, name):
+        """
+        Creates a context for timing the block named @name. Names are expected to be of the form
+        "<category>.<phase>" or "<category>/<item>", e.g.: "sim.physics" or "object_states/Temperature"
+
+        Args:
+            name (str): Name of the block to profile
+
+        Returns:
+            context manager: Context timing the block if profiling is enabled, otherwise a no-op context
+        """
+        return _ProfiledBlock(name) if gm.ENABLE_PROFILING else _NULL_CONTEXT
+
+    @classmethod
+    def add_event(cls, name, start, duration, depth):
+        """
+        Records a single profiled event, finishing the current frame if it is a top-level event
+
+        Args:
+            name (str): Name of the profiled block
+            start (float): Start time of the block, as given by time.perf_counter()
+            duration (float): Duration of the block, in seconds
+            depth (int): Nesting depth of the block, where 0 corresponds to a top-level block
+        """
+        cls._CURRENT_EVENTS.append((name, start, duration, depth))
+        if depth == 0:
+            # Events are appended upon exiting, so the top-level event is always last. Store them in start order
+            events = sorted(cls._CURRENT_EVENTS, key=lambda event: (event[1], event[3]))
+            cls._CURRENT_EVENTS = []
+            frames = cls._get_frames()
+            frames.append(dict(name=name, start=start, duration=duration, events=events))
+
+    @classmethod
+    def _get_frames(cls):
+        """
+        Returns:
+            deque: Ring buffer of completed frames, (re-)created if the configured buffer size has changed
+        """
+        if cls._FRAMES is None or cls._FRAMES.maxlen != m.BUFFER_SIZE:
+            cls._FRAMES = deque(() if cls._FRAMES is None else cls._FRAMES, maxlen=m.BUFFER_SIZE)
+        return cls._FRAMES
+
+    @classmethod
+    def get_frames(cls):
+        """
+        Returns:
+            list of dict: Most recent completed frames, from oldest to newest. Each frame is a dictionary with keys
+                "name", "start", "duration" (seconds), and "events", a list of (name, start, duration, depth) tuples
+                of all blocks recorded within the frame, including the top-level block itself
+        """
+        return list(cls._get_frames())
+
+    @classmethod
+    def get_summary(cls):
+        """
+        Aggregates the timings of all named blocks over the buffered frames
+
+        Returns:
+            dict: Maps each block name to a dictionary with keys "count", "total", "mean", and "max" (seconds),
+                sorted by decreasing total time
+        """
+        summary = defaultdict(lambda: dict(count=0, total=0.0, mean=0.0, max=0.0))
+        for frame in cls._get_frames():
+            for name, _, duration, _ in frame["events"]:
+                entry = summary[name]
+                entry["count"] += 1
+                entry["total"] += duration
+                entry["max"] = max(entry["max"], duration)
+        for entry in summary.values():
+            entry["mean"] = entry["total"] / entry["count"]
+
+        return dict(sorted(summary.items(), key=lambda item: -item[1]["total"]))
+
+    @classmethod
+    def export_json(cls, fpath):
+        """
+        Exports the summary and all buffered frames to a JSON file
+
+        Args:
+            fpath (str): Absolute path to the JSON file to write
+        """
+        frames = [dict(
+            name=frame["name"],
+            start=frame["start"],
+            duration=frame["duration"],
+            events=[dict(name=name, start=start, duration=duration, depth=depth)
+                    for name, start, duration, depth in frame["events"]],
+        ) for frame in cls._get_frames()]
+        with open(fpath, "w+") as f:
+            json.dump(dict(summary=cls.get_summary(), frames=frames), f, indent=4)
+
+    @classmethod
+    def export_chrome_trace(cls, fpath):
+        """
+        Exports all buffered frames to a file in Chrome trace event format, which can be loaded in chrome://tracing
+        or https://ui.perfetto.dev
+
+        Args:
+            fpath (str): Absolute path to the JSON trace file to write
+        """
+        trace_events = [dict(
+            name=name,
+            cat=name.replace("/", ".").split(".")[0],
+            ph="X",
+            ts=start * 1e6,
+            dur=duration * 1e6,
+            pid=0,
+            tid=0,
+        ) for frame in cls._get_frames() for name, start, duration, _ in frame["events"]]
+        with open(fpath, "w+") as f:
+            json.dump(dict(traceEvents=trace_events, displayTimeUnit="ms"), f)
+
+    @classmethod
+    def clear(cls):
+        """
+        Clears all recorded frames and any partially recorded frame
+        """
+        cls.depth = 0
+        cls._CURRENT_EVENTS = []
+        cls._FRAMES = None
@@ -489,6 +489,29 @@ class Registerable:
         raise NotImplementedError()
 
 
+# Maps Serializable / SerializableNonInstance class to whether in-place serialization via _serialize_into() is valid
+# for that class
+_SUPPORTS_SERIALIZE_INTO = dict()
+
+
+def _supports_serialize_into(cls):
+    """
+    Checks whether in-place serialization via _serialize_into() is valid for class @cls, i.e.: whether _serialize_into()
+    is implemented at least as deep in the class hierarchy of @cls as _serialize(). Otherwise, a subclass that only
+    extends _serialize() would have its additional states skipped, so the default _serialize_into() should be used
+
+    Args:
+        cls (type): Serializable / SerializableNonInstance class to check
+
+    Returns:
+        bool: Whether cls._serialize_into() can be used
+    """
+    if cls not in _SUPPORTS_SERIALIZE_INTO:
+        owners = [next(c for c in cls.__mro__ if name in c.__dict__) for name in ("_serialize_into", "_serialize")]
+        _SUPPORTS_SERIALIZE_INTO[cls] = issubclass(owners[0], owners[1])
+    return _SUPPORTS_SERIALIZE_INTO[cls]
+
+
 class Serializable:
     """
     Simple class that provides an abstract interface to dump / load states, optionally with serialized functionality
@@ -511,21 +534,24 @@ class Serializable:
         """
         raise NotImplementedError()
 
-    def dump_state(self, serialized=False):
+    def dump_state(self, serialized=False, out=None):
         """
         Dumps the state of this object in either dictionary of flattened numerical form.
 
         Args:
             serialized (bool): If True, will return the state of this object as a 1D numpy array. Otherewise, will return
                 a (potentially nested) dictionary of states for this object
+            out (None or n-array): If specified and @serialized is True, preallocated 1D float array (with at least
+                @self.state_size entries) into which the serialized state will be written in-place
 
         Returns:
             dict or n-array: Either:
                 - Keyword-mapped states of this object, or
-                - encoded + serialized, 1D numerical np.array capturing this object's state, where n is @self.state_size
+                - encoded + serialized, 1D numerical np.array capturing this object's state, where n is @self.state_size.
+                    If @out is specified, this is a view into @out
         """
         state = self._dump_state()
-        return self.serialize(state=state) if serialized else state
+        return self.serialize(state=state, out=out) if serialized else state
 
     def _load_state(self, state):
         """
@@ -564,7 +590,7 @@ class Serializable:
         """
         raise NotImplementedError()
 
-    def serialize(self, state):
+    def serialize(self, state, out=None):
         """
         Serializes nested dictionary state @state into a flattened 1D numpy array for encoding efficiency.
         Should be implemented by subclass.
@@ -572,12 +598,59 @@ class Serializable:
         Args:
             state (dict): Keyword-mapped states of this object to encode. Should match structure of output from
                 self._dump_state()
+            out (None or n-array): If specified, preallocated 1D float array (with at least @self.state_size entries)
+                into which the serialized state will be written in-place
 
         Returns:
-            n-array: encoded + serialized, 1D numerical np.array capturing this object's state
+            n-array: encoded + serialized, 1D numerical np.array capturing this object's state. If @out is specified,
+                this is a view into @out
+        """
+        if out is None:
+            return self._serialize(state=state)
+        return out[:self.serialize_into(state=state, out=out)]
+
+    def _serialize_into(self, state, out):
+        """
+        Serializes nested dictionary state @state in-place into the beginning of the flat 1D numpy array @out.
+        Subclasses composed of other Serializables should override this to directly write each of their
+        components into the relevant slice of @out, avoiding intermediate allocations. By default, this copies the
+        output of self._serialize() into @out.
+
+        NOTE: If a subclass overrides _serialize(), it must also override this function, otherwise this default
+        implementation will be used for that subclass.
+
+        Args:
+            state (dict): Keyword-mapped states of this object to encode. Should match structure of output from
+                self._dump_state()
+            out (n-array): Preallocated 1D float array to write the serialized state into
+
+        Returns:
+            int: Number of values written into @out
+        """
+        state_flat = self._serialize(state=state)
+        out[:len(state_flat)] = state_flat
+        return len(state_flat)
+
+    def serialize_into(self, state, out):
+        """
+        Serializes nested dictionary state @state in-place into the beginning of the flat 1D numpy array @out
+
+        NOTE: Only the serialization itself is in-place, i.e.: it avoids allocating and concatenating intermediate
+        flattened arrays. @state itself is still the full nested dictionary returned by self._dump_state(), and there is
+        no in-place counterpart for loading: load_state(serialized=True) still deserializes @state sequentially into a
+        nested dictionary before loading it
+
+        Args:
+            state (dict): Keyword-mapped states of this object to encode. Should match structure of output from
+                self._dump_state()
+            out (n-array): Preallocated 1D float array to write the serialized state into
+
+        Returns:
+            int: Number of values written into @out
         """
-        # Simply returns self._serialize() for now. this is for future proofing
-        return self._serialize(state=state)
+        if _supports_serialize_into(type(self)):
+            return self._serialize_into(state=state, out=out)
+        return Serializable._serialize_into(self, state=state, out=out)
 
     def _deserialize(self, state):
         """
@@ -640,21 +713,24 @@ class SerializableNonInstance:
         raise NotImplementedError()
 
     @classmethod
-    def dump_state(cls, serialized=False):
+    def dump_state(cls, serialized=False, out=None):
         """
         Dumps the state of this object in either dictionary of flattened numerical form.
 
         Args:
             serialized (bool): If True, will return the state of this object as a 1D numpy array. Otherewise, will return
                 a (potentially nested) dictionary of states for this object
+            out (None or n-array): If specified and @serialized is True, preallocated 1D float array (with at least
+                @self.state_size entries) into which the serialized state will be written in-place
 
         Returns:
             dict or n-array: Either:
                 - Keyword-mapped states of this object, or
-                - encoded + serialized, 1D numerical np.array capturing this object's state, where n is @self.state_size
+                - encoded + serialized, 1D numerical np.array capturing this object's state, where n is @self.state_size.
+                    If @out is specified, this is a view into @out
         """
         state = cls._dump_state()
-        return cls.serialize(state=state) if serialized else state
+        return cls.serialize(state=state, out=out) if serialized else state
 
     @classmethod
     def _load_state(cls, state):
@@ -697,7 +773,7 @@ class SerializableNonInstance:
         raise NotImplementedError()
 
     @classmethod
-    def serialize(cls, state):
+    def serialize(cls, state, out=None):
         """
         Serializes nested dictionary state @state into a flattened 1D numpy array for encoding efficiency.
         Should be implemented by subclass.
@@ -705,12 +781,61 @@ class SerializableNonInstance:
         Args:
             state (dict): Keyword-mapped states of this object to encode. Should match structure of output from
                 self._dump_state()
+            out (None or n-array): If specified, preallocated 1D float array (with at least @self.state_size entries)
+                into which the serialized state will be written in-place
 
         Returns:
-            n-array: encoded + serialized, 1D numerical np.array capturing this object's state
+            n-array: encoded + serialized, 1D numerical np.array capturing this object's state. If @out is specified,
+                this is a view into @out
+        """
+        if out is None:
+            return cls._serialize(state=state)
+        return out[:cls.serialize_into(state=state, out=out)]
+
+    @classmethod
+    def _serialize_into(cls, state, out):
+        """
+        Serializes nested dictionary state @state in-place into the beginning of the flat 1D numpy array @out.
+        Subclasses composed of other Serializables should override this to directly write each of their
+        components into the relevant slice of @out, avoiding intermediate allocations. By default, this copies the
+        output of self._serialize() into @out.
+
+        NOTE: If a subclass overrides _serialize(), it must also override this function, otherwise this default
+        implementation will be used for that subclass.
+
+        Args:
+            state (dict): Keyword-mapped states of this object to encode. Should match structure of output from
+                self._dump_state()
+            out (n-array): Preallocated 1D float array to write the serialized state into
+
+        Returns:
+            int: Number of values written into @out
+        """
+        state_flat = cls._serialize(state=state)
+        out[:len(state_flat)] = state_flat
+        return len(state_flat)
+
+    @classmethod
+    def serialize_into(cls, state, out):
+        """
+        Serializes nested dictionary state @state in-place into the beginning of the flat 1D numpy array @out
+
+        NOTE: Only the serialization itself is in-place, i.e.: it avoids allocating and concatenating intermediate
+        flattened arrays. @state itself is still the full nested dictionary returned by self._dump_state(), and there is
+        no in-place counterpart for loading: load_state(serialized=True) still deserializes @state sequentially into a
+        nested dictionary before loading it
+
+        Args:
+            state (dict): Keyword-mapped states of this object to encode. Should match structure of output from
+                self._dump_state()
+            out (n-array): Preallocated 1D float array to write the serialized state into
+
+        Returns:
+            int: Number of values written into @out
         """
-        # Simply returns self._serialize() for now. this is for future proofing
-        return cls._serialize(state=state)
+        if _supports_serialize_into(cls):
+            return cls._serialize_into(state=state, out=out)
+        return SerializableNonInstance._serialize_into.__func__(cls, state=state, out=out)
 
     @classmethod
     def _deserialize(cls, state):
@@ -307,7 +307,18 @@ class SerializableRegistry(Registry, Serializable):
     Registry that is serializable, i.e.: entries contain states that can themselves be serialized /deserialized.
 
     Note that this assumes that any objects added to this registry are themselves of @Serializable type!
+
+    The flattened state of this registry is the concatenation of all of its entries' flattened states. The resulting
+    layout (i.e.: where each entry's state lives within the flattened state) is cached, and is only recomputed when
+    entries are added / removed or when an entry's state size changes (e.g.: when particles are added to a system).
     """
+    def __init__(self, *args, **kwargs):
+        # Cached state layout, as (sizes, offsets) where sizes is a tuple of (name, state_size) pairs and offsets maps
+        # each entry name to its corresponding slice within the flattened state
+        self._state_layout = None
+
+        # Run super
+        super().__init__(*args, **kwargs)
 
     def add(self, obj):
         # In addition to any other class types, we make sure that the object is a serializable instance / class
@@ -316,10 +327,43 @@ class SerializableRegistry(Registry, Serializable):
             f"Added object must be either an instance or subclass of Serializable or SerializableNonInstance!"
         # Run super like normal
         super().add(obj=obj)
+        self._state_layout = None
+
+    def remove(self, obj):
+        # Run super like normal
+        super().remove(obj=obj)
+        self._state_layout = None
+
+    def clear(self):
+        # Run super like normal
+        super().clear()
+        self._state_layout = None
+
+    def update(self, keys=None):
+        # Run super like normal
+        super().update(keys=keys)
+        self._state_layout = None
+
+    @property
+    def state_layout(self):
+        """
+        Returns:
+            dict: Maps each entry name to the slice of the flattened state of this registry that corresponds to that
+                entry's flattened state
+        """
+        sizes = tuple((obj.name, obj.state_size) for obj in self.objects)
+        if self._state_layout is None or self._state_layout[0] != sizes:
+            offsets, idx = dict(), 0
+            for name, size in sizes:
+                offsets[name] = slice(idx, idx + size)
+                idx += size
+            self._state_layout = (sizes, offsets)
+        return self._state_layout[1]
 
     @property
     def state_size(self):
-        return sum(obj.state_size for obj in self.objects)
+        layout = self.state_layout
+        return next(reversed(layout.values())).stop if len(layout) > 0 else 0
 
     def _dump_state(self):
         # Iterate over all objects and grab their states
@@ -344,10 +388,18 @@ class SerializableRegistry(Registry, Serializable):
         return np.concatenate([obj.serialize(state[obj.name]) for obj in self.objects]) if \
             len(self.objects) > 0 else np.array([])
 
+    def _serialize_into(self, state, out):
+        # Iterate over all objects and write their states contiguously into @out
+        idx = 0
+        for obj in self.objects:
+            idx += obj.serialize_into(state=state[obj.name], out=out[idx:])
+        return idx
+
     def _deserialize(self, state):
         state_dict = dict()
         # Iterate over all the objects and deserialize their individual states, incrementing the index counter
-        # along the way
+        # along the way. Note that we cannot use the cached layout here, since deserializing an object (e.g.: a particle
+        # system) may dynamically change its state size
         idx = 0
         for obj in self.objects:
             log.debug(f"obj: {obj.name}, state size: {obj.state_size}, idx: {idx}, passing in state length: {len(state[idx:])}")
@@ -356,4 +408,3 @@ class SerializableRegistry(Registry, Serializable):
             state_dict[obj.name] = obj.deserialize(state[idx:])
             idx += obj.state_size
         return state_dict, idx
-
@@ -250,6 +250,332 @@ def sample_origin_positions(mins, maxes, count, bimodal_mean_fraction, bimodal_s
     return results
 
 
+class BaseRaytestBackend:
+    """
+    Backend used to compute batched raytests. Subclasses should implement _raycast(), which only needs to report
+    the raw (flattened) hits for all rays -- composing these into the structured arrays returned by
+    raytest_batch_arrays() is handled by this class
+    """
+
+    def raycast(self, start_points, end_points, only_closest=True, ignore_bodies=None, ignore_collisions=None):
+        """
+        Computes raytest collisions for a set of rays cast from @start_points to @end_points
+
+        Args:
+            start_points ((N, 3)-array): (x,y,z) global start locations of the rays
+            end_points ((N, 3)-array): (x,y,z) global end locations of the rays
+            only_closest (bool): Whether we report the first (closest) hit from each ray or grab all hits
+            ignore_bodies (None or list of str): If specified, specifies absolute USD paths to rigid bodies
+                whose collisions should be ignored
+            ignore_collisions (None or list of str): If specified, specifies absolute USD paths to collision geoms
+                whose collisions should be ignored
+
+        Returns:
+            dict: Structured raytest results. See raytest_batch_arrays() for more information
+        """
+        start_points = np.array(start_points, dtype=float).reshape(-1, 3)
+        end_points = np.array(end_points, dtype=float).reshape(-1, 3)
+        point_diffs = end_points - start_points
+        distances = np.linalg.norm(point_diffs, axis=-1)
+        directions = point_diffs / distances[:, None]
+
+        # Resolve the ignore filters once for the whole batch
+        ignore_bodies = set() if ignore_bodies is None else set(ignore_bodies)
+        ignore_collisions = set() if ignore_collisions is None else set(ignore_collisions)
+
+        (ray_idxs, positions, normals, hit_distances, face_idxs, collisions, rigid_bodies, proto_idxs,
+         materials) = self._raycast(
+            start_points=start_points,
+            directions=directions,
+            distances=distances,
+            only_closest=only_closest,
+            ignore_bodies=ignore_bodies,
+            ignore_collisions=ignore_collisions,
+        )
+
+        return self._compose_results(
+            n_rays=len(start_points),
+            ray_idxs=np.array(ray_idxs, dtype=int),
+            positions=np.array(positions, dtype=float).reshape(-1, 3),
+            normals=np.array(normals, dtype=float).reshape(-1, 3),
+            distances=np.array(hit_distances, dtype=float),
+            face_idxs=np.array(face_idxs, dtype=np.int64),
+            collisions=collisions,
+            rigid_bodies=rigid_bodies,
+            proto_idxs=np.array(proto_idxs, dtype=np.int64),
+            materials=materials,
+            only_closest=only_closest,
+        )
+
+    def _raycast(self, start_points, directions, distances, only_closest, ignore_bodies, ignore_collisions):
+        """
+        Computes the raw hits for a set of rays. Should be implemented by subclass
+
+        Args:
+            start_points ((N, 3)-array): (x,y,z) global start locations of the rays
+            directions ((N, 3)-array): unit (x,y,z) directions of the rays
+            distances (N-array): lengths of the rays
+            only_closest (bool): Whether only the closest hit needs to be reported for each ray. Note that
+                reporting additional hits is allowed, since they will be filtered out afterwards
+            ignore_bodies (set of str): absolute USD paths to rigid bodies whose collisions should be ignored
+            ignore_collisions (set of str): absolute USD paths to collision geoms whose collisions should be ignored
+
+        Returns:
+            9-tuple: Flattened information for all M valid hits:
+                - M-list: index of the ray corresponding to each hit
+                - M-list: (x,y,z) hit positions
+                - M-list: (x,y,z) normals of the faces hit
+                - M-list: distances from the rays' start points at which the hits occurred
+                - M-list: indices of the faces hit within their collision geoms
+                - M-list: absolute USD paths to the collision geoms hit
+                - M-list: absolute USD paths to the associated rigid bodies hit
+                - M-list: point instancer prototype indices of the geoms hit, as reported by PhysX (0xFFFFFFFF if the
+                    geom is not point instanced)
+                - M-list: absolute USD paths to the physics materials of the geoms hit ("" if there is none)
+        """
+        raise NotImplementedError()
+
+    @staticmethod
+    def _compose_results(n_rays, ray_idxs, positions, normals, distances, face_idxs, collisions, rigid_bodies,
+                         proto_idxs, materials, only_closest):
+        """
+        Composes the flattened hits returned by _raycast() into structured raytest results. See
+        raytest_batch_arrays() for more information on the arguments and returned values
+        """
+        if only_closest and len(ray_idxs) > 0:
+            # Only keep the closest hit for each ray: sort by ray, then distance and keep the first entry per ray
+            order = np.lexsort((distances, ray_idxs))
+            _, first_hits = np.unique(ray_idxs[order], return_index=True)
+            keep = order[first_hits]
+            ray_idxs, positions, normals, distances = ray_idxs[keep], positions[keep], normals[keep], distances[keep]
+            face_idxs, proto_idxs = face_idxs[keep], proto_idxs[keep]
+            collisions, rigid_bodies = [collisions[i] for i in keep], [rigid_bodies[i] for i in keep]
+            materials = [materials[i] for i in keep]
+
+        # Map USD paths to indices into lists of unique paths
+        unique_bodies, body_idxs = np.unique(np.array(rigid_bodies, dtype=str), return_inverse=True)
+        unique_collisions, collision_idxs = np.unique(np.array(collisions, dtype=str), return_inverse=True)
+        unique_materials, material_idxs = np.unique(np.array(materials, dtype=str), return_inverse=True)
+        body_idxs, collision_idxs = body_idxs.reshape(-1), collision_idxs.reshape(-1)
+        material_idxs = material_idxs.reshape(-1)
+
+        if only_closest:
+            hit = np.zeros(n_rays, dtype=bool)
+            hit[ray_idxs] = True
+            ray_positions, ray_normals = np.zeros((n_rays, 3)), np.zeros((n_rays, 3))
+            ray_positions[ray_idxs], ray_normals[ray_idxs] = positions, normals
+            ray_distances = np.full(n_rays, np.inf)
+            ray_distances[ray_idxs] = distances
+            ray_body_idxs, ray_collision_idxs = np.full(n_rays, -1), np.full(n_rays, -1)
+            ray_body_idxs[ray_idxs], ray_collision_idxs[ray_idxs] = body_idxs, collision_idxs
+            ray_face_idxs, ray_proto_idxs, ray_material_idxs = \
+                np.full(n_rays, -1, dtype=np.int64), np.full(n_rays, -1, dtype=np.int64), np.full(n_rays, -1)
+            ray_face_idxs[ray_idxs], ray_proto_idxs[ray_idxs] = face_idxs, proto_idxs
+            ray_material_idxs[ray_idxs] = material_idxs
+            return {
+                "hit": hit,
+                "position": ray_positions,
+                "normal": ray_normals,
+                "distance": ray_distances,
+                "face_idx": ray_face_idxs,
+                "body_idx": ray_body_idxs,
+                "collision_idx": ray_collision_idxs,
+                "proto_idx": ray_proto_idxs,
+                "material_idx": ray_material_idxs,
+                "rigid_bodies": unique_bodies.tolist(),
+                "collisions": unique_collisions.tolist(),
+                "materials": unique_materials.tolist(),
+            }
+        else:
+            return {
+                "ray_idx": ray_idxs,
+                "position": positions,
+                "normal": normals,
+                "distance": distances,
+                "face_idx": face_idxs,
+                "body_idx": body_idxs,
+                "collision_idx": collision_idxs,
+                "proto_idx": proto_idxs,
+                "material_idx": material_idxs,
+                "rigid_bodies": unique_bodies.tolist(),
+                "collisions": unique_collisions.tolist(),
+                "materials": unique_materials.tolist(),
+            }
+
+
+class PhysXRaytestBackend(BaseRaytestBackend):
+    """
+    Raytest backend that queries omni's PhysX scene query interface. This is the default backend
+    """
+
+    def _raycast(self, start_points, directions, distances, only_closest, ignore_bodies, ignore_collisions):
+        ray_idxs, positions, normals, hit_distances, face_idxs, collisions, rigid_bodies, proto_idxs, materials = \
+            [], [], [], [], [], [], [], [], []
+
+        # For efficiency's sake, we handle special case of no ignore_bodies, ignore_collisions, and closest_hit
+        if only_closest and len(ignore_bodies) == 0 and len(ignore_collisions) == 0:
+            for i, (start_point, direction, distance) in enumerate(zip(start_points, directions, distances)):
+                hit = og.sim.psqi.raycast_closest(origin=start_point, dir=direction, distance=distance)
+                if hit["hit"]:
+                    ray_idxs.append(i)
+                    positions.append(hit["position"])
+                    normals.append(hit["normal"])
+                    hit_distances.append(hit["distance"])
+                    face_idxs.append(hit["faceIndex"])
+                    collisions.append(hit["collision"])
+                    rigid_bodies.append(hit["rigidBody"])
+                    proto_idxs.append(hit["protoIndex"])
+                    materials.append(hit["material"])
+        else:
+            for i, (start_point, direction, distance) in enumerate(zip(start_points, directions, distances)):
+                def callback(hit, ray_idx=i):
+                    # Only add to hits if we're not ignoring this body or collision
+                    if hit.rigid_body not in ignore_bodies and hit.collision not in ignore_collisions:
+                        ray_idxs.append(ray_idx)
+                        positions.append(hit.position)
+                        normals.append(hit.normal)
+                        hit_distances.append(hit.distance)
+                        face_idxs.append(hit.face_index)
+                        collisions.append(hit.collision)
+                        rigid_bodies.append(hit.rigid_body)
+                        proto_idxs.append(hit.protoIndex)
+                        materials.append(hit.material)
+                    # We always want to continue traversing to collect all hits
+                    return True
+
+                # Grab all collisions
+                og.sim.psqi.raycast_all(origin=start_point, dir=direction, distance=distance, reportFn=callback)
+
+        return ray_idxs, positions, normals, hit_distances, face_idxs, collisions, rigid_bodies, proto_idxs, materials
+
+
+class TrimeshRaytestBackend(BaseRaytestBackend):
+    """
+    Pure-python raytest backend that casts rays against a fixed set of trimesh meshes instead of the simulator.
+    This is useful as a stand-in for testing raytest-based logic without a GPU or a running simulator. Every ray is
+    tested against every triangle in a single vectorized (Moller-Trumbore) pass, so this is only intended for small
+    numbers of rays and triangles
+
+    Args:
+        meshes (dict): Maps absolute USD paths of rigid bodies to their collision meshes (trimesh.Trimesh), expressed
+            in the global frame. Hits on each mesh report its rigid body path as both the hit rigid body and the hit
+            collision geom, the index of the face hit within that mesh, no physics material, and no point instancer
+            prototype
+    """
+
+    def __init__(self, meshes):
+        self._bodies = list(meshes.keys())
+        mesh = trimesh.util.concatenate(list(meshes.values()))
+        self._triangles = mesh.triangles
+        self._face_normals = mesh.face_normals
+        n_faces = [len(mesh.faces) for mesh in meshes.values()]
+        self._face_body_idxs = np.repeat(np.arange(len(self._bodies)), n_faces)
+        # Index of each face within its own mesh
+        self._face_local_idxs = np.arange(len(self._face_body_idxs)) - np.repeat(np.cumsum(n_faces) - n_faces, n_faces)
+
+    def _raycast(self, start_points, directions, distances, only_closest, ignore_bodies, ignore_collisions):
+        # Moller-Trumbore ray-triangle intersection between all (ray, triangle) pairs, with shape (N, T, ...)
+        v0 = self._triangles[:, 0]
+        edge1, edge2 = self._triangles[:, 1] - v0, self._triangles[:, 2] - v0
+        p = np.cross(directions[:, None, :], edge2[None, :, :])
+        det = np.einsum("ntj,tj->nt", p, edge1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_det = 1.0 / det
+            t_vec = start_points[:, None, :] - v0[None, :, :]
+            u = np.einsum("ntj,ntj->nt", t_vec, p) * inv_det
+            q = np.cross(t_vec, edge1[None, :, :])
+            v = np.einsum("nj,ntj->nt", directions, q) * inv_det
+            hit_distances = np.einsum("tj,ntj->nt", edge2, q) * inv_det
+            valid = (np.abs(det) > 1e-12) & (u >= 0) & (v >= 0) & (u + v <= 1)
+            valid &= (hit_distances >= 0) & (hit_distances <= distances[:, None])
+
+        # Filter out ignored bodies
+        ignored = np.array([body in ignore_bodies or body in ignore_collisions for body in self._bodies])
+        valid &= ~ignored[self._face_body_idxs][None, :]
+
+        ray_idxs, face_idxs = np.nonzero(valid)
+        hit_distances = hit_distances[ray_idxs, face_idxs]
+        bodies = [self._bodies[idx] for idx in self._face_body_idxs[face_idxs]]
+
+        return (
+            ray_idxs,
+            start_points[ray_idxs] + directions[ray_idxs] * hit_distances[:, None],
+            self._face_normals[face_idxs],
+            hit_distances,
+            self._face_local_idxs[face_idxs],
+            bodies,
+            bodies,
+            np.full(len(ray_idxs), 0xFFFFFFFF, dtype=np.int64),
+            [""] * len(ray_idxs),
+        )
+
+
+# Backend used by all raytests. Defaults to PhysX, see set_raytest_backend()
+_RAYTEST_BACKEND = PhysXRaytestBackend()
+
+
+def set_raytest_backend(backend):
+    """
+    Sets the backend used to compute all raytests
+
+    Args:
+        backend (BaseRaytestBackend): Backend to use, e.g.: PhysXRaytestBackend() or TrimeshRaytestBackend(meshes)
+    """
+    global _RAYTEST_BACKEND
+    _RAYTEST_BACKEND = backend
+
+
+def get_raytest_backend():
+    """
+    Returns:
+        BaseRaytestBackend: Backend currently used to compute all raytests
+    """
+    return _RAYTEST_BACKEND
+
+
+def raytest_batch_arrays(start_points, end_points, only_closest=True, ignore_bodies=None, ignore_collisions=None):
+    """
+    Computes raytest collisions for a set of rays cast from @start_points to @end_points, returning the results as
+    structured numpy arrays instead of per-ray dictionaries.
+
+    Args:
+        start_points ((N, 3)-array): (x,y,z) global start locations of the rays
+        end_points ((N, 3)-array): (x,y,z) global end locations of the rays
+        only_closest (bool): Whether we report the first (closest) hit from each ray or grab all hits
+        ignore_bodies (None or list of str): If specified, specifies absolute USD paths to rigid bodies
+            whose collisions should be ignored
+        ignore_collisions (None or list of str): If specified, specifies absolute USD paths to collision geoms
+            whose collisions should be ignored
+
+    Returns:
+        dict: Structured raytest results. If @only_closest=True, each array has one entry per ray:
+
+            "hit" (N-array): Whether each ray hit an object or not
+            "position" ((N, 3)-array): Location of each hit position, zeros if no hit
+            "normal" ((N, 3)-array): normal vector of each face hit, zeros if no hit
+            "distance" (N-array): distance from each ray's start point the hit occurred, inf if no hit
+            "face_idx" (N-array): index of the face hit within its collision geom, -1 if no hit
+            "body_idx" (N-array): index into "rigid_bodies" of the rigid body hit, -1 if no hit
+            "collision_idx" (N-array): index into "collisions" of the collision geom hit, -1 if no hit
+            "proto_idx" (N-array): point instancer prototype index of the geom hit as reported by PhysX (0xFFFFFFFF if
+                it is not point instanced), -1 if no hit
+            "material_idx" (N-array): index into "materials" of the physics material of the geom hit, -1 if no hit
+            "rigid_bodies" (list of str): absolute USD paths to the unique rigid bodies hit
+            "collisions" (list of str): absolute USD paths to the unique collision geoms hit
+            "materials" (list of str): absolute USD paths to the unique physics materials hit ("" if there is none)
+
+            Otherwise, each array has one entry per hit, across all M (unordered) hits from all rays. "hit" is
+            replaced by "ray_idx" (M-array), the index of the ray corresponding to each hit
+    """
+    return _RAYTEST_BACKEND.raycast(
+        start_points=start_points,
+        end_points=end_points,
+        only_closest=only_closest,
+        ignore_bodies=ignore_bodies,
+        ignore_collisions=ignore_collisions,
+    )
+
+
 def raytest_batch(start_points, end_points, only_closest=True, ignore_bodies=None, ignore_collisions=None):
     """
     Computes raytest collisions for a set of rays cast from @start_points to @end_points.
@@ -274,23 +600,43 @@ def raytest_batch(start_points, end_points, only_closest=True, ignore_bodies=Non
             "position" (3-array): Location of the hit position
             "normal" (3-array): normal vector of the face hit
             "distance" (float): distance from @start_point the hit occurred
+            "faceIndex" (int): index of the face hit within the collision body
             "collision" (str): absolute USD path to the collision body hit
             "rigidBody" (str): absolute USD path to the associated rigid body hit
+            "protoIndex" (int): point instancer prototype index of the collision body hit (0xFFFFFFFF if none)
+            "material" (str): absolute USD path to the physics material of the collision body hit
 
             Note that only "hit" = False exists in the dict if no hit was found
     """
-    # For now, we do a naive for loop over individual raytests until a better API comes out
-    results = []
-    for start_point, end_point in zip(start_points, end_points):
-        results.append(raytest(
-            start_point=start_point,
-            end_point=end_point,
-            only_closest=only_closest,
-            ignore_bodies=ignore_bodies,
-            ignore_collisions=ignore_collisions,
-        ))
+    # Prefer raytest_batch_arrays() for performance-sensitive code, which skips generating these per-hit dicts
+    results = raytest_batch_arrays(
+        start_points=start_points,
+        end_points=end_points,
+        only_closest=only_closest,
+        ignore_bodies=ignore_bodies,
+        ignore_collisions=ignore_collisions,
+    )
 
-    return results
+    def get_hit_info(i):
+        return {
+            "hit": True,
+            "position": results["position"][i],
+            "normal": results["normal"][i],
+            "distance": results["distance"][i],
+            "faceIndex": int(results["face_idx"][i]),
+            "collision": results["collisions"][results["collision_idx"][i]],
+            "rigidBody": results["rigid_bodies"][results["body_idx"][i]],
+            "protoIndex": int(results["proto_idx"][i]),
+            "material": results["materials"][results["material_idx"][i]],
+        }
+
+    if only_closest:
+        return [get_hit_info(i) if hit else {"hit": False} for i, hit in enumerate(results["hit"])]
+    else:
+        hits = [[] for _ in range(len(start_points))]
+        for i, ray_idx in enumerate(results["ray_idx"]):
+            hits[ray_idx].append(get_hit_info(i))
+        return hits
 
 
 def raytest(
@@ -321,59 +667,21 @@ def raytest(
             "position" (3-array): Location of the hit position
             "normal" (3-array): normal vector of the face hit
             "distance" (float): distance from @start_point the hit occurred
+            "faceIndex" (int): index of the face hit within the collision body
             "collision" (str): absolute USD path to the collision body hit
             "rigidBody" (str): absolute USD path to the associated rigid body hit
+            "protoIndex" (int): point instancer prototype index of the collision body hit (0xFFFFFFFF if none)
+            "material" (str): absolute USD path to the physics material of the collision body hit
 
             Note that only "hit" = False exists in the dict if no hit was found
     """
-    # Make sure start point, end point are numpy arrays
-    start_point, end_point = np.array(start_point), np.array(end_point)
-    point_diff = end_point - start_point
-    distance = np.linalg.norm(point_diff)
-    direction = point_diff / distance
-
-    # For efficiency's sake, we handle special case of no ignore_bodies, ignore_collisions, and closest_hit
-    if only_closest and ignore_bodies is None and ignore_collisions is None:
-        return og.sim.psqi.raycast_closest(
-            origin=start_point,
-            dir=direction,
-            distance=distance,
-        )
-    else:
-        # Compose callback function for finding raycasts
-        hits = []
-        ignore_bodies = set() if ignore_bodies is None else set(ignore_bodies)
-        ignore_collisions = set() if ignore_collisions is None else set(ignore_collisions)
-
-        def callback(hit):
-            # Only add to hits if we're not ignoring this body or collision
-            if hit.rigid_body not in ignore_bodies and hit.collision not in ignore_collisions:
-                hits.append({
-                    "hit": True,
-                    "position": np.array(hit.position),
-                    "normal": np.array(hit.normal),
-                    "distance": hit.distance,
-                    "collision": hit.collision,
-                    "rigidBody": hit.rigid_body,
-                })
-            # We always want to continue traversing to collect all hits
-            return True
-
-        # Grab all collisions
-        og.sim.psqi.raycast_all(
-            origin=start_point,
-            dir=direction,
-            distance=distance,
-            reportFn=callback,
-        )
-
-        # If we only want the closest, we need to sort these hits, otherwise we return them all
-        if only_closest:
-            # Return the empty hit dictionary if our ray did not hit anything, otherwise we return the closest
-            return {"hit": False} if len(hits) == 0 else sorted(hits, key=lambda hit: hit["distance"])[0]
-        else:
-            # Return all hits (list)
-            return hits
+    return raytest_batch(
+        start_points=[start_point],
+        end_points=[end_point],
+        only_closest=only_closest,
+        ignore_bodies=ignore_bodies,
+        ignore_collisions=ignore_collisions,
+    )[0]
 
 
 def sample_raytest_start_end_symmetric_bimodal_distribution(
@@ -782,7 +1090,9 @@ def sample_cuboid_on_object(
                 destinations = np.array([end_pos])
 
             # Time to cast the rays.
-            cast_results = raytest_batch(start_points=sources, end_points=destinations, ignore_bodies=ignore_rigid_bodies)
+            cast_results = raytest_batch_arrays(
+                start_points=sources, end_points=destinations, ignore_bodies=ignore_rigid_bodies,
+            )
 
             # Check whether sufficient number of rays hit the object
             hits = check_rays_hit_object(
@@ -795,21 +1105,14 @@ def sample_cuboid_on_object(
             if not hits[center_idx]:
                 continue
 
-            filtered_cast_results = []
-            filtered_center_idx = None
-            for idx, hit in enumerate(hits):
-                if hit:
-                    filtered_cast_results.append(cast_results[idx])
-                    if idx == center_idx:
-                        filtered_center_idx = len(filtered_cast_results) - 1
+            filtered_center_idx = np.count_nonzero(hits[:center_idx])
 
             # Process the hit positions and normals.
-            hit_positions = np.array([ray_res["position"] for ray_res in filtered_cast_results])
-            hit_normals = np.array([ray_res["normal"] for ray_res in filtered_cast_results])
+            hit_positions = cast_results["position"][hits]
+            hit_normals = cast_results["normal"][hits]
             hit_normals /= np.linalg.norm(hit_normals, axis=1, keepdims=True)
 
-            assert filtered_center_idx is not None
-            hit_link = filtered_cast_results[filtered_center_idx]["rigidBody"]
+            hit_link = cast_results["rigid_bodies"][cast_results["body_idx"][center_idx]]
             center_hit_pos = hit_positions[filtered_center_idx]
             center_hit_normal = hit_normals[filtered_center_idx]
 
@@ -850,7 +1153,7 @@ def sample_cuboid_on_object(
                     continue
 
                 # Get projection of the base onto the plane, fit a rotation, and compute the new center hit / corners.
-                hit_positions = np.array([ray_res.get("position", np.zeros(3)) for ray_res in cast_results])
+                hit_positions = cast_results["position"]
                 projected_hits = get_projection_onto_plane(hit_positions, plane_centroid, plane_normal)
                 padding = cuboid_bottom_padding * plane_normal
                 projected_hits += padding
@@ -989,7 +1292,7 @@ def check_rays_hit_object(cast_results, threshold, refusal_log, body_names=None)
     Checks whether rays hit a specific object, as specified by a list of @body_names
 
     Args:
-        cast_results (list of dict): Output from raycast_batch.
+        cast_results (dict): Output from raytest_batch_arrays with only_closest=True.
         threshold (float): Relative ratio in [0, 1] specifying proportion of rays from @cast_results are
             required to hit @body_names to count as the object being hit
         refusal_log (list of str): Logging array for adding debug logs
@@ -997,17 +1300,18 @@ def check_rays_hit_object(cast_results, threshold, refusal_log, body_names=None)
             specified, then any valid hit will be accepted
 
     Returns:
-        None or list of bool: Individual T/F for each ray -- whether it hit the object or not
+        None or n-array: Individual T/F for each ray -- whether it hit the object or not
     """
-    body_names = None if body_names is None else set(body_names)
-    ray_hits = [
-        ray_res["hit"] and
-        (body_names is None or ray_res["rigidBody"] in body_names)
-        for ray_res in cast_results
-    ]
-    if sum(ray_hits) / len(cast_results) < threshold:
+    ray_hits = cast_results["hit"].copy()
+    if body_names is not None:
+        body_names = set(body_names)
+        # The trailing False entry handles rays that did not hit anything, which have body index -1
+        valid_bodies = np.array([body in body_names for body in cast_results["rigid_bodies"]] + [False])
+        ray_hits &= valid_bodies[cast_results["body_idx"]]
+    if np.count_nonzero(ray_hits) / len(ray_hits) < threshold:
         if gm.DEBUG:
-            refusal_log.append(f"{sum(ray_hits)} / {len(cast_results)} < {threshold} hits: {[ray_res['rigidBody'] for ray_res in cast_results if ray_res['hit']]}")
+            hit_bodies = [cast_results["rigid_bodies"][idx] for idx in cast_results["body_idx"][cast_results["hit"]]]
+            refusal_log.append(f"{np.count_nonzero(ray_hits)} / {len(ray_hits)} < {threshold} hits: {hit_bodies}")
 
         return None
 
@@ -1117,8 +1421,8 @@ def check_cuboid_empty(hit_normal, bottom_corner_positions, this_cuboid_dimensio
 
     # Combine all these pairs, cast the rays, and make sure the rays don't hit anything.
     all_pairs = np.array(top_to_bottom_pairs + bottom_pairs + top_pairs)
-    check_cast_results = raytest_batch(start_points=all_pairs[:, 0, :], end_points=all_pairs[:, 1, :])
-    if any(ray["hit"] for ray in check_cast_results):
+    check_cast_results = raytest_batch_arrays(start_points=all_pairs[:, 0, :], end_points=all_pairs[:, 1, :])
+    if np.any(check_cast_results["hit"]):
         if gm.DEBUG:
             refusal_log.append("check ray info: %r" % (check_cast_results))
 
@@ -0,0 +1,606 @@
+"""
+A set of utility functions for reading / writing simulator snapshots in a binary, chunked format.
+
+A snapshot file consists of:
+
+    - An 8-byte magic string, identifying the file as a snapshot
+    - An 8-byte little-endian unsigned integer, specifying the size of the header in bytes
+    - A JSON header, containing the snapshot's data tree where every numpy array has been replaced by a reference, the
+      layout of every referenced array, and the layout of every chunk
+    - The data section, consisting of the chunks. Each chunk contains the raw (C-contiguous) bytes of all arrays found
+      under the same top-level subtree (e.g.: "state/object_registry/<obj_name>"), and is optionally compressed
+
+Since arrays are stored as raw bytes, they can be loaded without any parsing, partially (only the chunks belonging to
+the requested subtrees are read), or memory-mapped directly from the file if the snapshot is not compressed.
+
+Scene files (either JSON or snapshot files) are parsed at most once per modification through a shared cache, see
+get_scene_file(). JSON scene files can additionally be converted into a binary sidecar snapshot file, which is used
+automatically whenever it is present and up-to-date, see convert_scene_file().
+"""
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Mapping
+from pathlib import Path
+
+import numpy as np
+
+from omnigibson.macros import create_module_macros
+
+
+# Create settings for this module
+m = create_module_macros(module_path=__file__)
+
+# Default compression to use when writing snapshots. Can be None (uncompressed) or "zstd"
+m.DEFAULT_COMPRESSION = None
+
+# Compression level to use for zstd-compressed snapshots
+m.ZSTD_COMPRESSION_LEVEL = 3
+
+# Number of leading path components of a subtree whose arrays are grouped into a single chunk, e.g.: 3 results in
+# one chunk per "state/object_registry/<obj_name>"
+m.CHUNK_DEPTH = 3
+
+# Maximum number of parsed scene files kept in memory. Least recently used files are evicted first
+m.SCENE_FILE_CACHE_SIZE = 2
+
+# File extension used for snapshot files
+SNAPSHOT_FILE_EXTENSION = ".ogsnap"
+
+# Magic string identifying snapshot files, followed by the format version
+_MAGIC = b"OGSNAP01"
+
+# Alignment (in bytes) of the data section, every uncompressed chunk, and every array within a chunk
+_ALIGNMENT = 64
+
+# Key used within the header data tree to reference a stored array
+_ARRAY_KEY = "__ndarray__"
+
+# Maps absolute scene file path to (file signature, SceneFile) for the most recently used scene files
+_SCENE_FILES = OrderedDict()
+
+
+def _align(n):
+    """
+    Args:
+        n (int): Number of bytes
+
+    Returns:
+        int: @n rounded up to the next multiple of _ALIGNMENT
+    """
+    return -(-n // _ALIGNMENT) * _ALIGNMENT
+
+
+def _extract_arrays(data, path, arrays):
+    """
+    Recursively copies the (nested) data tree @data, replacing every numpy array / numpy scalar with a reference to
+    the array's entry in @arrays
+
+    Args:
+        data (any): Data tree to process. Can be any JSON-serializable type, nested with numpy arrays / scalars
+        path (tuple of str): Path of @data within the full data tree
+        arrays (list): List to which (path, array, is_scalar) tuples are appended for every extracted array
+
+    Returns:
+        any: Copy of @data, JSON-serializable
+    """
+    if isinstance(data, dict):
+        return {str(k): _extract_arrays(v, path + (str(k),), arrays) for k, v in data.items()}
+    elif isinstance(data, (list, tuple)):
+        return [_extract_arrays(v, path + (str(i),), arrays) for i, v in enumerate(data)]
+    elif isinstance(data, (np.ndarray, np.generic)):
+        array = np.asarray(data)
+        # Object arrays have no raw binary representation, so we store them as nested lists
+        if array.dtype.hasobject:
+            return _extract_arrays(array.tolist(), path, arrays)
+        # Note: np.ascontiguousarray() is not used since it promotes 0-dimensional arrays to 1-dimensional ones
+        arrays.append((path, np.require(array, requirements="C"), isinstance(data, np.generic)))
+        return {_ARRAY_KEY: len(arrays) - 1}
+    return data
+
+
+def _insert_arrays(data, arrays):
+    """
+    Recursively copies the (nested) header data tree @data, replacing every array reference with its loaded array.
+    References to arrays that have not been loaded are left as-is
+
+    Args:
+        data (any): Header data tree to process
+        arrays (dict): Maps array reference idx to loaded array
+
+    Returns:
+        any: Copy of @data with loaded arrays inserted
+    """
+    if isinstance(data, dict):
+        if len(data) == 1 and _ARRAY_KEY in data:
+            return arrays.get(data[_ARRAY_KEY], data)
+        return {k: _insert_arrays(v, arrays) for k, v in data.items()}
+    elif isinstance(data, list):
+        return [_insert_arrays(v, arrays) for v in data]
+    return data
+
+
+def _get_array_refs(data):
+    """
+    Args:
+        data (any): Header data tree to process
+
+    Returns:
+        list of int: All array reference idxs found within @data
+    """
+    if isinstance(data, dict):
+        if len(data) == 1 and _ARRAY_KEY in data:
+            return [data[_ARRAY_KEY]]
+        return [idx for v in data.values() for idx in _get_array_refs(v)]
+    elif isinstance(data, list):
+        return [idx for v in data for idx in _get_array_refs(v)]
+    return []
+
+
+def select_keys(data, keys):
+    """
+    Selects the subtrees specified by @keys from the nested dictionary @data
+
+    Args:
+        data (dict): Nested dictionary to select subtrees from
+        keys (list of str): Paths of the subtrees to select, where nested keys are separated by "/",
+            e.g.: "state/object_registry". Paths that do not exist in @data are skipped
+
+    Returns:
+        dict: Nested dictionary only containing the subtrees specified by @keys, preserving their full paths
+    """
+    selected = dict()
+    for key in keys:
+        parts = key.strip("/").split("/")
+        subtree = data
+        for part in parts:
+            if not isinstance(subtree, dict) or part not in subtree:
+                break
+            subtree = subtree[part]
+        else:
+            # Valid path, so we add it to the selected tree
+            node = selected
+            for part in parts[:-1]:
+                node = node.setdefault(part, dict())
+            node[parts[-1]] = subtree
+    return selected
+
+
+def _get_zstd():
+    """
+    Returns:
+        module: zstandard module, which is an optional dependency only required for compressed snapshots
+    """
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstandard must be installed in order to read / write zstd-compressed snapshots! "
+                          "Install it with: pip install zstandard")
+    return zstandard
+
+
+def save_snapshot(fpath, data, compression=None):
+    """
+    Saves the (nested) data tree @data as a snapshot file to @fpath
+
+    Args:
+        fpath (str): Absolute path to the snapshot file to write
+        data (dict): Data tree to save. Can contain any JSON-serializable types, nested with numpy arrays / scalars
+        compression (None or str): Compression to apply to every chunk. Can be None (uncompressed) or "zstd". If
+            None, m.DEFAULT_COMPRESSION will be used
+    """
+    compression = m.DEFAULT_COMPRESSION if compression is None else compression
+    assert compression in {None, "zstd"}, f"Got invalid snapshot compression: {compression}"
+    compressor = None if compression is None else \
+        _get_zstd().ZstdCompressor(level=m.ZSTD_COMPRESSION_LEVEL)
+
+    # Replace all arrays with references, and group them into chunks according to their path
+    arrays = []
+    tree = _extract_arrays(data, path=tuple(), arrays=arrays)
+    chunk_arrays = dict()
+    for idx, (path, _, _) in enumerate(arrays):
+        chunk_arrays.setdefault("/".join(path[:m.CHUNK_DEPTH]), []).append(idx)
+
+    # Compose every chunk and record the layout of every array within it
+    array_infos = [None] * len(arrays)
+    chunk_infos, chunk_buffers = [], []
+    data_size = 0
+    for chunk_idx, (name, idxs) in enumerate(chunk_arrays.items()):
+        raw_size = 0
+        for idx in idxs:
+            _, array, is_scalar = arrays[idx]
+            array_infos[idx] = dict(
+                chunk=chunk_idx,
+                offset=raw_size,
+                dtype=array.dtype.str,
+                shape=list(array.shape),
+                scalar=is_scalar,
+            )
+            raw_size = _align(raw_size + array.nbytes)
+        buffer = bytearray(raw_size)
+        for idx in idxs:
+            array = arrays[idx][1]
+            offset = array_infos[idx]["offset"]
+            buffer[offset:offset + array.nbytes] = array.tobytes()
+        if compressor is not None:
+            buffer = compressor.compress(bytes(buffer))
+        chunk_infos.append(dict(name=name, offset=data_size, nbytes=len(buffer), raw_nbytes=raw_size))
+        chunk_buffers.append(buffer)
+        data_size = _align(data_size + len(buffer))
+
+    header = json.dumps(dict(
+        compression=compression,
+        data=tree,
+        arrays=array_infos,
+        chunks=chunk_infos,
+    )).encode("utf-8")
+
+    # Write everything to disk
+    Path(os.path.dirname(fpath)).mkdir(parents=True, exist_ok=True)
+    with open(fpath, "wb") as f:
+        f.write(_MAGIC)
+        f.write(np.uint64(len(header)).astype("<u8").tobytes())
+        f.write(header)
+        data_start = _align(f.tell())
+        for info, buffer in zip(chunk_infos, chunk_buffers):
+            f.seek(data_start + info["offset"])
+            f.write(buffer)
+
+
+def _read_header(f):
+    """
+    Reads the header of the snapshot file opened as @f
+
+    Args:
+        f (file): Snapshot file opened in binary mode, positioned at its beginning
+
+    Returns:
+        2-tuple:
+            - dict: Parsed header
+            - int: Absolute offset of the data section within the file
+    """
+    assert f.read(len(_MAGIC)) == _MAGIC, "Invalid snapshot file!"
+    header_size = int(np.frombuffer(f.read(8), dtype="<u8")[0])
+    header = json.loads(f.read(header_size).decode("utf-8"))
+    return header, _align(len(_MAGIC) + 8 + header_size)
+
+
+def is_snapshot_file(fpath):
+    """
+    Args:
+        fpath (str): Absolute path to the file to check
+
+    Returns:
+        bool: Whether @fpath is a snapshot file
+    """
+    with open(fpath, "rb") as f:
+        return f.read(len(_MAGIC)) == _MAGIC
+
+
+def _load_arrays(fpath, f, header, data_start, tree, mmap=False):
+    """
+    Loads all arrays referenced within the header data tree @tree from the snapshot file @fpath opened as @f
+
+    Args:
+        fpath (str): Absolute path to the snapshot file
+        f (file): Snapshot file opened in binary mode
+        header (dict): Parsed header of the snapshot file
+        data_start (int): Absolute offset of the data section within the file
+        tree (any): (Subtree of the) header data tree whose arrays should be loaded
+        mmap (bool): Whether to memory-map the arrays instead of reading them into memory
+
+    Returns:
+        any: Copy of @tree, where all numpy arrays / scalars are restored with their original dtypes and shapes
+    """
+    assert not (mmap and header["compression"] is not None), "Compressed snapshots cannot be memory-mapped!"
+
+    # Group all requested arrays by the chunk they live in, and only read those chunks
+    array_infos = header["arrays"]
+    chunk_arrays = dict()
+    for idx in _get_array_refs(tree):
+        chunk_arrays.setdefault(array_infos[idx]["chunk"], []).append(idx)
+
+    decompressor = None if header["compression"] is None else _get_zstd().ZstdDecompressor()
+    arrays = dict()
+    for chunk_idx, idxs in chunk_arrays.items():
+        chunk_info = header["chunks"][chunk_idx]
+        if mmap:
+            buffer = np.memmap(fpath, dtype=np.uint8, mode="c", offset=data_start + chunk_info["offset"],
+                               shape=(chunk_info["nbytes"],)) if chunk_info["nbytes"] > 0 else bytearray()
+        else:
+            f.seek(data_start + chunk_info["offset"])
+            buffer = bytearray(chunk_info["nbytes"])
+            f.readinto(buffer)
+            if decompressor is not None:
+                buffer = bytearray(decompressor.decompress(bytes(buffer), max_output_size=chunk_info["raw_nbytes"]))
+        for idx in idxs:
+            info = array_infos[idx]
+            dtype, shape = np.dtype(info["dtype"]), tuple(info["shape"])
+            array = np.frombuffer(buffer, dtype=dtype, count=int(np.prod(shape)), offset=info["offset"])
+            array = array.reshape(shape)
+            arrays[idx] = array[()] if info["scalar"] else array
+
+    return _insert_arrays(tree, arrays=arrays)
+
+
+def load_snapshot(fpath, keys=None, mmap=False):
+    """
+    Loads the (nested) data tree from the snapshot file @fpath
+
+    Args:
+        fpath (str): Absolute path to the snapshot file to load
+        keys (None or list of str): If specified, paths of the subtrees to load, where nested keys are separated by
+            "/", e.g.: ["init_info", "state/object_registry"]. Only the chunks containing arrays from these subtrees
+            will be read. Paths that do not exist are skipped. If None, the full data tree will be loaded
+        mmap (bool): Whether to memory-map the arrays instead of reading them into memory. Memory-mapped arrays are
+            copy-on-write, i.e.: modifying them does not modify the file. Only supported for uncompressed snapshots
+
+    Returns:
+        dict: Loaded data tree, where all numpy arrays / scalars are restored with their original dtypes and shapes
+    """
+    with open(fpath, "rb") as f:
+        header, data_start = _read_header(f)
+        tree = header["data"] if keys is None else select_keys(header["data"], keys=keys)
+        return _load_arrays(fpath, f, header=header, data_start=data_start, tree=tree, mmap=mmap)
+
+
+def _contains_bool(data):
+    """
+    Args:
+        data (any): (Nested) list to check
+
+    Returns:
+        bool: Whether @data contains any boolean value
+    """
+    if isinstance(data, list):
+        return any(_contains_bool(v) for v in data)
+    return isinstance(data, bool)
+
+
+def _lists_to_arrays(data):
+    """
+    Recursively copies the (nested) data tree @data, replacing every non-empty, rectangular list of (nested) numbers
+    with its corresponding numpy array, so that it can be stored as raw bytes in a snapshot file
+
+    Args:
+        data (any): Data tree to process, e.g.: as parsed from a JSON file
+
+    Returns:
+        any: Copy of @data with numerical lists replaced by numpy arrays
+    """
+    if isinstance(data, dict):
+        return {k: _lists_to_arrays(v) for k, v in data.items()}
+    elif isinstance(data, list):
+        if len(data) > 0 and not _contains_bool(data):
+            try:
+                array = np.array(data)
+            except ValueError:
+                # Ragged list, which cannot be converted
+                array = None
+            if array is not None and array.dtype.kind in "if":
+                return array
+        return [_lists_to_arrays(v) for v in data]
+    return data
+
+
+def get_sidecar_path(fpath):
+    """
+    Args:
+        fpath (str): Absolute path to a JSON scene file
+
+    Returns:
+        str: Absolute path to the binary sidecar snapshot file corresponding to @fpath, see convert_scene_file()
+    """
+    return f"{fpath}{SNAPSHOT_FILE_EXTENSION}"
+
+
+def convert_scene_file(fpath, compression=None):
+    """
+    Converts the JSON scene file @fpath into a binary sidecar snapshot file (see get_sidecar_path()), which is used
+    automatically when loading @fpath as long as it is not older than @fpath. All numerical lists within the scene's
+    "state" subtree are stored as raw arrays, so that the state of every object / system can be loaded on its own
+
+    Args:
+        fpath (str): Absolute path to the JSON scene file to convert
+        compression (None or str): Compression to apply to the sidecar, see save_snapshot()
+
+    Returns:
+        str: Absolute path to the written sidecar snapshot file
+    """
+    assert not is_snapshot_file(fpath), f"Scene file {fpath} is already a snapshot file!"
+    with open(fpath, "r") as f:
+        scene_info = json.load(f)
+    if "state" in scene_info:
+        scene_info["state"] = _lists_to_arrays(scene_info["state"])
+
+    # Write to a temporary file first so that concurrent readers never see a partially written sidecar
+    sidecar_path = get_sidecar_path(fpath)
+    tmp_path = f"{sidecar_path}.{os.getpid()}.tmp"
+    save_snapshot(tmp_path, data=scene_info, compression=compression)
+    os.replace(tmp_path, sidecar_path)
+    return sidecar_path
+
+
+class _LazySnapshotTree(Mapping):
+    """
+    Read-only mapping over a subtree of a snapshot file, whose values are only loaded from the file once they are
+    accessed
+    """
+    def __init__(self, scene_file, tree):
+        """
+        Args:
+            scene_file (SceneFile): Snapshot-backed scene file that @tree belongs to
+            tree (dict): Subtree of the snapshot's header data tree
+        """
+        self._scene_file = scene_file
+        self._tree = tree
+        self._loaded = dict()
+
+    def __getitem__(self, key):
+        if key not in self._loaded:
+            self._loaded[key] = self._scene_file._load_tree(self._tree[key])
+        return self._loaded[key]
+
+    def __iter__(self):
+        return iter(self._tree)
+
+    def __len__(self):
+        return len(self._tree)
+
+
+class SceneFile:
+    """
+    Parsed scene file, which can either be a JSON file or a snapshot file. JSON files are parsed once in full, while
+    only the header of snapshot files is parsed and arrays are read from the file on demand.
+
+    If a JSON scene file has an up-to-date binary sidecar snapshot file (see convert_scene_file()), the sidecar is
+    read instead.
+
+    NOTE: Data returned from JSON-backed scene files is shared by all consumers, and should be treated as read-only
+    """
+    def __init__(self, fpath):
+        """
+        Args:
+            fpath (str): Absolute path to the scene file to parse
+        """
+        self.fpath = fpath
+
+        # Use the sidecar if it exists and is at least as recent as the scene file itself
+        sidecar_path = get_sidecar_path(fpath)
+        if os.path.isfile(sidecar_path) and os.path.getmtime(sidecar_path) >= os.path.getmtime(fpath):
+            self.source_path = sidecar_path
+        else:
+            self.source_path = fpath
+
+        self._header, self._data_start, self._data = None, None, None
+        if is_snapshot_file(self.source_path):
+            with open(self.source_path, "rb") as f:
+                self._header, self._data_start = _read_header(f)
+        else:
+            with open(self.source_path, "r") as f:
+                self._data = json.load(f)
+
+    @property
+    def is_snapshot(self):
+        """
+        Returns:
+            bool: Whether this scene file is read from a snapshot file
+        """
+        return self._header is not None
+
+    def _load_tree(self, tree):
+        """
+        Args:
+            tree (any): (Subtree of the) snapshot's header data tree
+
+        Returns:
+            any: Copy of @tree with all of its arrays loaded from the snapshot file
+        """
+        with open(self.source_path, "rb") as f:
+            return _load_arrays(self.source_path, f, header=self._header, data_start=self._data_start, tree=tree)
+
+    def load(self, keys=None):
+        """
+        Args:
+            keys (None or list of str): If specified, paths of the subtrees to load, where nested keys are separated by
+                "/", e.g.: ["init_info", "state/object_registry"]. Paths that do not exist are skipped. If None, the
+                full scene information will be loaded
+
+        Returns:
+            dict: Loaded scene information
+        """
+        if not self.is_snapshot:
+            return self._data if keys is None else select_keys(self._data, keys=keys)
+        tree = self._header["data"] if keys is None else select_keys(self._header["data"], keys=keys)
+        return self._load_tree(tree)
+
+    def load_lazy(self, key):
+        """
+        Args:
+            key (str): Path of the subtree to load, where nested keys are separated by "/", e.g.:
+                "state/object_registry"
+
+        Returns:
+            Mapping: Read-only mapping over the subtree found at @key, whose values are only loaded once they are
+                accessed (if this scene file is read from a snapshot file), e.g.: so that the state of objects that are
+                never accessed is never loaded. Missing paths result in an empty mapping
+        """
+        parts = key.strip("/").split("/")
+        if not self.is_snapshot:
+            # Everything is already parsed
+            return self._select(self._data, parts)
+        return _LazySnapshotTree(scene_file=self, tree=self._select(self._header["data"], parts))
+
+    @staticmethod
+    def _select(tree, parts):
+        """
+        Args:
+            tree (dict): Nested dictionary to select the subtree from
+            parts (list of str): Path of the subtree to select
+
+        Returns:
+            dict: Subtree found at @parts, or an empty dictionary if it does not exist
+        """
+        for part in parts:
+            if not isinstance(tree, dict) or part not in tree:
+                return dict()
+            tree = tree[part]
+        return tree
+
+
+def get_scene_file(fpath):
+    """
+    Grabs the parsed scene file @fpath, which is shared by all consumers and only re-parsed if the file (or its
+    sidecar) has been modified since it was last parsed
+
+    Args:
+        fpath (str): Absolute path to the scene file to parse
+
+    Returns:
+        SceneFile: Parsed scene file
+    """
+    fpath = os.path.abspath(fpath)
+    signature = []
+    for path in (fpath, get_sidecar_path(fpath)):
+        if os.path.isfile(path):
+            stat = os.stat(path)
+            signature.append((stat.st_mtime_ns, stat.st_size))
+    signature = tuple(signature)
+
+    entry = _SCENE_FILES.get(fpath, None)
+    if entry is not None and entry[0] == signature:
+        _SCENE_FILES.move_to_end(fpath)
+        return entry[1]
+
+    scene_file = SceneFile(fpath)
+    _SCENE_FILES[fpath] = (signature, scene_file)
+    _SCENE_FILES.move_to_end(fpath)
+    while len(_SCENE_FILES) > m.SCENE_FILE_CACHE_SIZE:
+        _SCENE_FILES.popitem(last=False)
+    return scene_file
+
+
+def clear_scene_file_cache():
+    """
+    Clears all cached parsed scene files
+    """
+    _SCENE_FILES.clear()
+
+
+def load_scene_info(fpath, keys=None):
+    """
+    Loads the scene information stored in the scene file @fpath, which can either be a JSON file or a snapshot file.
+    The file is only parsed once, see get_scene_file()
+
+    NOTE: Data loaded from JSON scene files is shared by all consumers, and should be treated as read-only
+
+    Args:
+        fpath (str): Absolute path to the scene file to load
+        keys (None or list of str): If specified, paths of the subtrees to load, where nested keys are separated by
+            "/", e.g.: ["init_info", "state/object_registry"]. Paths that do not exist are skipped. If None, the full
+            scene information will be loaded
+
+    Returns:
+        dict: Loaded scene information
+    """
+    return get_scene_file(fpath).load(keys=keys)
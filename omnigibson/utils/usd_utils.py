@@ -15,7 +15,7 @@ from omni.kit.primitive.mesh.evaluators.torus import TorusEvaluator
 from omni.kit.primitive.mesh.evaluators.cone import ConeEvaluator
 from omni.kit.primitive.mesh.evaluators.cube import CubeEvaluator
 
-from pxr import Gf, Vt, Usd, Sdf, UsdGeom, UsdShade, UsdPhysics, PhysxSchema
+from pxr import Gf, Vt, Usd, Sdf, UsdGeom, UsdShade, UsdPhysics, PhysxSchema, PhysicsSchemaTools
 import carb
 import numpy as np
 import trimesh
@@ -225,6 +225,7 @@ def create_joint(prim_path, joint_type, body0=None, body1=None, enabled=True,
     if og.sim.is_playing():
         with suppress_omni_log(channels=["omni.physx.plugin"]):
             og.sim.pi.update_simulation(elapsedStep=0, currentTime=og.sim.current_time)
+            PhysicsStateCacheAPI.clear()
 
     # Return this joint
     return joint_prim
@@ -232,16 +233,31 @@ def create_joint(prim_path, joint_type, body0=None, body1=None, enabled=True,
 
 class RigidContactAPI:
     """
-    Class containing class methods to aggregate rigid body contacts across all rigid bodies in the simulator
+    Class containing class methods to aggregate rigid body contacts across all rigid bodies in the simulator.
+
+    Contacts are read sparsely from PhysX's per-step contact report (every non-visual rigid body has the contact report
+    API applied, see RigidPrim), and stored as (body idx, body idx) pairs with their corresponding impulses, so both
+    reading and querying contacts scale with the number of contacts rather than with the (squared) number of rigid
+    bodies. Since no dense contact view is needed, adding / removing rigid bodies only adds / removes entries from the
+    body idx mapping, and the idxs of all other bodies remain valid
     """
-    # Dictionary mapping rigid body prim path to corresponding index in the contact view matrix
+    # Dictionary mapping rigid body prim path to corresponding idx
     _PATH_TO_IDX = None
 
-    # Contact view for generating contact matrices at each timestep
-    _CONTACT_VIEW = None
+    # Dictionary mapping integer-encoded rigid body prim path (as reported by PhysX) to corresponding idx
+    _PATH_INT_TO_IDX = None
+
+    # List of rigid body prim paths, ordered by their corresponding idx. Entries of removed bodies are None
+    _BODY_PATHS = None
+
+    # Counter incremented every time the rigid body path to idx mapping is regenerated, invalidating previous idxs
+    _IDX_MAPPING_VERSION = 0
 
-    # Current aggregated contacts over all rigid bodies at the current timestep. Shape: (N, N, 3)
-    _CONTACT_MATRIX = None
+    # Current sparse contacts over all rigid bodies at the current timestep, in COO format
+    # Shape: (K, 2) unique pairs of (body idx, other body idx) with nonzero impulses, and (K, 3) corresponding impulses
+    # applied to the first body by the other body
+    _CONTACT_PAIRS = None
+    _CONTACT_IMPULSES = None
 
     # Current cache, mapping 2-tuple (prim_paths_a, prim_paths_b) to contact values
     _CONTACT_CACHE = None
@@ -249,44 +265,69 @@ class RigidContactAPI:
     @classmethod
     def initialize_view(cls):
         """
-        Initializes the rigid contact view. Note: Can only be done when sim is playing!
-        """
-        assert og.sim.is_playing(), "Cannot create rigid contact view while sim is not playing!"
-
-        # Compile deterministic mapping from rigid body path to idx
-        # Note that omni's ordering is based on the top-down object ordering path on the USD stage, which coincidentally
-        # matches the same ordering we store objects in our registry. So the mapping we generate from our registry
-        # mapping aligns with omni's ordering!
-        i = 0
-        cls._PATH_TO_IDX = dict()
-        for obj in og.sim.scene.objects:
-            if obj.prim_type == PrimType.RIGID:
-                for link in obj.links.values():
-                    if not link.kinematic_only:
-                        cls._PATH_TO_IDX[link.prim_path] = i
-                        i += 1
-
-        # If there are no valid objects, clear the view and terminate early
-        if i == 0:
-            cls._CONTACT_VIEW = None
+        Updates the rigid body path to idx mapping to match the current set of contact-enabled rigid bodies. Note: Can
+        only be done when sim is playing!
+
+        The mapping is updated incrementally: newly added bodies are assigned new idxs and removed bodies release
+        theirs, while the idxs of all other bodies remain unchanged. Only if more than half of the idxs belong to
+        removed bodies is the mapping compacted, in which case the idx mapping version is incremented
+        """
+        assert og.sim.is_playing(), "Cannot update rigid body mapping while sim is not playing!"
+
+        body_paths = [
+            link.prim_path
+            for obj in og.sim.scene.objects if obj.prim_type == PrimType.RIGID
+            for link in obj.links.values() if not link.kinematic_only
+        ]
+        current_paths = set(body_paths)
+
+        if cls._PATH_TO_IDX is None:
+            cls._PATH_TO_IDX, cls._PATH_INT_TO_IDX, cls._BODY_PATHS = dict(), dict(), []
+            cls._IDX_MAPPING_VERSION += 1
+
+        # Release the idxs of removed bodies and assign new idxs to added bodies
+        removed_paths = [path for path in cls._PATH_TO_IDX if path not in current_paths]
+        added_paths = [path for path in body_paths if path not in cls._PATH_TO_IDX]
+        if len(removed_paths) == 0 and len(added_paths) == 0:
             return
+        for path in removed_paths:
+            idx = cls._PATH_TO_IDX.pop(path)
+            cls._PATH_INT_TO_IDX.pop(PhysicsSchemaTools.sdfPathToInt(path))
+            cls._BODY_PATHS[idx] = None
+        for path in added_paths:
+            cls._add_body(path=path)
+
+        # Compact the mapping if it mostly consists of removed bodies
+        if len(cls._BODY_PATHS) > 2 * len(cls._PATH_TO_IDX):
+            cls._PATH_TO_IDX, cls._PATH_INT_TO_IDX, cls._BODY_PATHS = dict(), dict(), []
+            for path in body_paths:
+                cls._add_body(path=path)
+            cls._IDX_MAPPING_VERSION += 1
+
+        # Any contacts computed so far may refer to removed bodies, so clear them
+        cls.clear()
 
-        # Generate rigid body view, making sure to update the simulation first (without physics) so that the physx
-        # backend is synchronized with any newly added objects
-        # We also suppress the omni tensor plugin from giving warnings we expect
-        og.sim.pi.update_simulation(elapsedStep=0, currentTime=og.sim.current_time)
-        with suppress_omni_log(channels=["omni.physx.tensors.plugin"]):
-            cls._CONTACT_VIEW = og.sim.physics_sim_view.create_rigid_contact_view(
-                pattern="/World/*/*",
-                filter_patterns=list(cls._PATH_TO_IDX.keys()),
-            )
-
-        # Sanity check generated view -- this should generate square matrices of shape (N, N, 3)
-        n_bodies = len(cls._PATH_TO_IDX)
-        # from IPython import embed; embed()
-        assert cls._CONTACT_VIEW.sensor_count == n_bodies and cls._CONTACT_VIEW.filter_count == n_bodies, \
-            f"Got unexpected contact view shape. Expected: ({n_bodies}, {n_bodies}); " \
-            f"got: ({cls._CONTACT_VIEW.sensor_count}, {cls._CONTACT_VIEW.filter_count})"
+    @classmethod
+    def _add_body(cls, path):
+        """
+        Assigns the next free idx to the rigid body defined by @path
+
+        Args:
+            path (str): Rigid body prim path
+        """
+        idx = len(cls._BODY_PATHS)
+        cls._PATH_TO_IDX[path] = idx
+        cls._PATH_INT_TO_IDX[PhysicsSchemaTools.sdfPathToInt(path)] = idx
+        cls._BODY_PATHS.append(path)
+
+    @classmethod
+    def get_idx_mapping_version(cls):
+        """
+        Returns:
+            int: Version of the rigid body path to idx mapping. This changes whenever previously assigned idxs are
+                invalidated, i.e.: any idxs retrieved under a different version should be re-queried
+        """
+        return cls._IDX_MAPPING_VERSION
 
     @classmethod
     def get_body_idx(cls, prim_path):
@@ -296,20 +337,82 @@ class RigidContactAPI:
         """
         return cls._PATH_TO_IDX[prim_path]
 
+    @classmethod
+    def get_body_idxs(cls, prim_paths):
+        """
+        Returns:
+            n-array: idxs assigned to the rigid bodies defined by @prim_paths
+        """
+        return np.array([cls._PATH_TO_IDX[path] for path in prim_paths], dtype=int)
+
+    @classmethod
+    def get_contacts(cls):
+        """
+        Grab all nonzero contacts at the current timestep in sparse (COO) form
+
+        Returns:
+            2-tuple:
+                - (K, 2)-array: unique (body idx, other body idx) pairs of rigid bodies with nonzero impulses between
+                    them. Each contact is included in both directions
+                - (K, 3)-array: impulses applied to the first body of each pair by the other body
+        """
+        # Generate the sparse contacts if they don't already exist
+        if cls._CONTACT_PAIRS is None:
+            pairs, impulses = [], []
+            if cls._PATH_INT_TO_IDX:
+                # Only the reported contact pairs are read, each of which can consist of multiple contact points
+                contact_headers, contact_data = og.sim.psi.get_contact_report()
+                for header in contact_headers:
+                    idx0 = cls._PATH_INT_TO_IDX.get(header.actor0, None)
+                    idx1 = cls._PATH_INT_TO_IDX.get(header.actor1, None)
+                    if idx0 is None or idx1 is None or header.num_contact_data == 0:
+                        continue
+                    impulse = np.sum([contact_data[i].impulse for i in range(
+                        header.contact_data_offset, header.contact_data_offset + header.num_contact_data)], axis=0)
+                    pairs += [(idx0, idx1), (idx1, idx0)]
+                    impulses += [impulse, -impulse]
+            cls._CONTACT_PAIRS, cls._CONTACT_IMPULSES = cls._aggregate_contacts(pairs=pairs, impulses=impulses)
+
+        return cls._CONTACT_PAIRS, cls._CONTACT_IMPULSES
+
+    @classmethod
+    def _aggregate_contacts(cls, pairs, impulses):
+        """
+        Sums the impulses of duplicate body pairs (e.g.: from multiple colliders of the same bodies) and drops pairs
+        whose total impulse is zero
+
+        Args:
+            pairs (list of 2-tuple): (body idx, other body idx) pair of each contact
+            impulses (list of 3-array): impulse of each contact
+
+        Returns:
+            2-tuple:
+                - (K, 2)-array: unique (body idx, other body idx) pairs with nonzero total impulses
+                - (K, 3)-array: total impulse of each pair
+        """
+        if len(pairs) == 0:
+            return np.zeros((0, 2), dtype=int), np.zeros((0, 3))
+        pairs, inverse = np.unique(np.array(pairs, dtype=int), axis=0, return_inverse=True)
+        total_impulses = np.zeros((len(pairs), 3))
+        np.add.at(total_impulses, inverse.reshape(-1), np.array(impulses, dtype=float))
+        nonzero = np.any(total_impulses != 0, axis=-1)
+        return pairs[nonzero], total_impulses[nonzero]
+
     @classmethod
     def get_all_impulses(cls):
         """
-        Grab all impulses at the current timestep
+        Grab all impulses at the current timestep. Note that this densifies the internal sparse contacts, so
+        get_contacts() should be preferred for large scenes
 
         Returns:
             n-array: (N, N, 3) impulse array defining current impulses between all N contact-sensor enabled rigid bodies
-                in the simulator
+                in the simulator, indexed by their idxs. Entries of removed bodies are zero
         """
-        # Generate the contact matrix if it doesn't already exist
-        if cls._CONTACT_MATRIX is None:
-            cls._CONTACT_MATRIX = cls._CONTACT_VIEW.get_contact_force_matrix(dt=1.0)
-
-        return cls._CONTACT_MATRIX
+        pairs, impulses = cls.get_contacts()
+        n_bodies = 0 if cls._BODY_PATHS is None else len(cls._BODY_PATHS)
+        all_impulses = np.zeros((n_bodies, n_bodies, 3))
+        all_impulses[pairs[:, 0], pairs[:, 1]] = impulses
+        return all_impulses
 
     @classmethod
     def get_impulses(cls, prim_paths_a, prim_paths_b):
@@ -327,10 +430,30 @@ class RigidContactAPI:
             n-array: (N, M, 3) impulse array defining current impulses between N bodies from @prim_paths_a and M bodies
                 from @prim_paths_b
         """
-        # Compute subset of matrix and return
-        idxs_a = [cls._PATH_TO_IDX[path] for path in prim_paths_a]
-        idxs_b = [cls._PATH_TO_IDX[path] for path in prim_paths_b]
-        return cls.get_all_impulses()[idxs_a][:, idxs_b]
+        idxs_a, idxs_b = cls.get_body_idxs(prim_paths_a), cls.get_body_idxs(prim_paths_b)
+        pairs, impulses = cls.get_contacts()
+
+        # Only scatter the few contacts that involve both groups into the (N, M) output. Each body pair appears at most
+        # once, so summing over matching contacts simply places each impulse
+        relevant = np.isin(pairs[:, 0], idxs_a) & np.isin(pairs[:, 1], idxs_b)
+        pairs, impulses = pairs[relevant], impulses[relevant]
+        match_a = idxs_a[:, None] == pairs[None, :, 0]
+        match_b = idxs_b[:, None] == pairs[None, :, 1]
+        return np.einsum("nk,mk,kj->nmj", match_a, match_b, impulses)
+
+    @classmethod
+    def get_contacting_body_idxs(cls, idxs):
+        """
+        Grabs all rigid bodies that are currently in contact with any of the bodies defined by @idxs
+
+        Args:
+            idxs (list of int): idxs of the rigid bodies to check contacts against
+
+        Returns:
+            set of int: idxs of all rigid bodies with nonzero impulses against any body from @idxs
+        """
+        pairs, _ = cls.get_contacts()
+        return set(pairs[np.isin(pairs[:, 1], idxs), 0].tolist())
 
     @classmethod
     def in_contact(cls, prim_paths_a, prim_paths_b):
@@ -349,18 +472,33 @@ class RigidContactAPI:
         # Check if the contact tuple already exists in the cache; if so, return the value
         key = (tuple(prim_paths_a), tuple(prim_paths_b))
         if key not in cls._CONTACT_CACHE:
-            # In contact if any of the matrix values representing the interaction between the two groups is non-zero
-            cls._CONTACT_CACHE[key] = np.any(cls.get_impulses(prim_paths_a=prim_paths_a, prim_paths_b=prim_paths_b))
+            # In contact if any of the nonzero contacts is between the two groups
+            pairs, _ = cls.get_contacts()
+            cls._CONTACT_CACHE[key] = bool(np.any(
+                np.isin(pairs[:, 0], cls.get_body_idxs(prim_paths_a)) &
+                np.isin(pairs[:, 1], cls.get_body_idxs(prim_paths_b))
+            ))
         return cls._CONTACT_CACHE[key]
 
     @classmethod
     def clear(cls):
         """
-        Clears the internal contact matrix and cache
+        Clears the internal contacts and cache
         """
-        cls._CONTACT_MATRIX = None
+        cls._CONTACT_PAIRS = None
+        cls._CONTACT_IMPULSES = None
         cls._CONTACT_CACHE = dict()
 
+    @classmethod
+    def reset(cls):
+        """
+        Resets the internal rigid body mapping, in addition to the contacts and cache
+        """
+        cls._PATH_TO_IDX = None
+        cls._PATH_INT_TO_IDX = None
+        cls._BODY_PATHS = None
+        cls.clear()
+
 
 class CollisionAPI:
     """
@@ -552,6 +690,35 @@ class BoundingBoxAPI:
         return np.less_equal(lower, point).all() and np.less_equal(point, upper).all()
 
 
+class PhysicsStateCacheAPI:
+    """
+    Class containing class methods to facilitate caching of physics state reads (e.g.: joint states and root poses).
+
+    A global version number is incremented every time the physics state may have changed, i.e.: after every physics
+    step and every time a state is explicitly set. Cached reads are only valid as long as this version number is
+    unchanged.
+    """
+    # Current version of the physics state
+    _VERSION = 0
+
+    @classmethod
+    def get_version(cls):
+        """
+        Returns:
+            int: Current version of the physics state. Any value read from the physics engine while this version was
+                active can be re-used as long as this value is unchanged
+        """
+        return cls._VERSION
+
+    @classmethod
+    def clear(cls):
+        """
+        Invalidates all cached physics state reads. This should occur at least once per physics step, and every time
+        a physics state is set.
+        """
+        cls._VERSION += 1
+
+
 class FlatcacheAPI:
     """
     Monolithic class for leveraging functionality meant to be used EXCLUSIVELY with flatcache.
@@ -603,6 +770,10 @@ class FlatcacheAPI:
             # timestep are respected
             og.sim.pi.update_simulation(elapsedStep=0, currentTime=og.sim.current_time)
 
+        # The link poses / joint states were written and physics was updated, so any cached physics state reads may
+        # be stale now
+        PhysicsStateCacheAPI.clear()
+
         # Add this prim to the set of modified prims
         cls.MODIFIED_PRIMS.add(prim)
 
@@ -643,6 +814,10 @@ class FlatcacheAPI:
             # timestep are respected
             og.sim.pi.update_simulation(elapsedStep=0, currentTime=og.sim.current_time)
 
+        # The link poses / joint states were written and physics was updated, so any cached physics state reads may
+        # be stale now
+        PhysicsStateCacheAPI.clear()
+
     @classmethod
     def reset(cls):
         """
@@ -660,6 +835,8 @@ def clear():
     """
     CollisionAPI.clear()
     BoundingBoxAPI.clear()
+    RigidContactAPI.reset()
+    PhysicsStateCacheAPI.clear()
 
 
 def create_mesh_prim_with_default_xform(primitive_type, prim_path, u_patches=None, v_patches=None, stage=None):
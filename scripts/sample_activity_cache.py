@@ -0,0 +1,16 @@
+"""
+Helper script to pre-sample a cache of validated BEHAVIOR activity instances, see
+omnigibson.utils.activity_cache_utils. Example usage:
+
+    python scripts/sample_activity_cache.py --scene Rs_int --activity prepare_sea_salt_soak -n 32 -w 4
+"""
+import os
+
+
+if __name__ == "__main__":
+    # This process only orchestrates the sampling workers, so it should not launch omniverse itself. Note that this is
+    # only set when run as a script, since spawned workers re-import this module and must launch omniverse
+    os.environ["OMNIGIBSON_NO_OMNIVERSE"] = "1"
+
+    from omnigibson.utils.activity_cache_utils import main
+    main()
@@ -0,0 +1,89 @@
+"""
+Script to benchmark the save / load times and file sizes of the binary snapshot format vs. the legacy JSON format used
+by og.sim.save() / og.sim.restore().
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import omnigibson as og
+from omnigibson.macros import gm
+from omnigibson.scenes.interactive_traversable_scene import InteractiveTraversableScene
+from omnigibson.utils.config_utils import NumpyEncoder
+from omnigibson.utils.snapshot_utils import load_snapshot, save_snapshot
+
+
+# Params to be set as needed.
+SCENES = ["Rs_int"]
+NUM_TRIALS = 5              # No. of times each save / load is repeated.
+COMPRESSIONS = [None]       # Snapshot compressions to benchmark. Add "zstd" if zstandard is installed.
+OUTPUT_DIR = tempfile.mkdtemp()
+gm.ENABLE_OBJECT_STATES = True
+
+
+def _time(func, n_trials=NUM_TRIALS):
+    times = []
+    for _ in range(n_trials):
+        start = time.time()
+        func()
+        times.append(time.time() - start)
+    return np.mean(times)
+
+
+def benchmark_scene(scene_name):
+    og.sim.import_scene(InteractiveTraversableScene(scene_name))
+    og.sim.play()
+    og.sim.step()
+
+    # Compile the scene info exactly as og.sim.save() does
+    og.sim.scene.update_objects_info()
+    scene_info = {
+        "metadata": og.sim.world_prim.GetCustomData(),
+        "state": og.sim.scene.dump_state(serialized=False),
+        "init_info": og.sim.scene.get_init_info(),
+        "objects_info": og.sim.scene.get_objects_info(),
+    }
+
+    json_path = os.path.join(OUTPUT_DIR, f"{scene_name}.json")
+
+    def save_json():
+        with open(json_path, "w+") as f:
+            json.dump(scene_info, f, cls=NumpyEncoder, indent=4)
+
+    def load_json():
+        with open(json_path, "r") as f:
+            json.load(f)
+
+    print(f"\n{scene_name}: {len(og.sim.scene.objects)} objects, {len(og.sim.scene.systems)} systems")
+    print(f"{'format':<16}{'size (MB)':>12}{'save (s)':>12}{'load (s)':>12}{'mmap (s)':>12}{'partial (s)':>14}")
+    save_time = _time(save_json)
+    load_time = _time(load_json)
+    print(f"{'json':<16}{os.path.getsize(json_path) / 1e6:>12.2f}{save_time:>12.4f}{load_time:>12.4f}"
+          f"{'-':>12}{'-':>14}")
+
+    for compression in COMPRESSIONS:
+        snapshot_path = os.path.join(OUTPUT_DIR, f"{scene_name}_{compression}.ogsnap")
+        save_time = _time(lambda: save_snapshot(snapshot_path, data=scene_info, compression=compression))
+        load_time = _time(lambda: load_snapshot(snapshot_path))
+        mmap_time = _time(lambda: load_snapshot(snapshot_path, mmap=True)) if compression is None else np.nan
+        # Partial load of what is needed to re-create the scene's objects
+        partial_time = _time(lambda: load_snapshot(snapshot_path, keys=["objects_info/init_info", "state/object_registry"]))
+        print(f"{f'snapshot ({compression})':<16}{os.path.getsize(snapshot_path) / 1e6:>12.2f}{save_time:>12.4f}"
+              f"{load_time:>12.4f}{mmap_time:>12.4f}{partial_time:>14.4f}")
+
+    og.sim.stop()
+
+
+def main():
+    for scene_name in SCENES:
+        benchmark_scene(scene_name)
+
+    og.shutdown()
+
+
+if __name__ == "__main__":
+    main()
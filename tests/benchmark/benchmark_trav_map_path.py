@@ -0,0 +1,85 @@
+"""
+Script to benchmark TraversableMap's grid-based shortest path search against the legacy networkx implementation
+on the shipped scene traversability maps.
+"""
+
+import os
+import time
+
+import networkx as nx
+import numpy as np
+
+from omnigibson.maps.traversable_map import TraversableMap
+from omnigibson.utils.asset_utils import get_available_og_scenes, get_og_scene_path
+import omnigibson.utils.transform_utils as T
+
+
+# Params to be set as needed.
+SCENES = None               # None results in all available scenes being benchmarked.
+MAP_RESOLUTION = 0.1        # Traversability map resolution to use.
+NUM_QUERIES = 100           # No. of random (source, target) queries per scene.
+SEED = 0
+
+
+def _build_nx_graph(trav_map):
+    # Mirrors the legacy per-pixel 8-connected graph construction
+    g = nx.Graph()
+    map_size = trav_map.shape[0]
+    for i in range(map_size):
+        for j in range(map_size):
+            if trav_map[i, j] == 0:
+                continue
+            g.add_node((i, j))
+            for n in [(i - 1, j - 1), (i, j - 1), (i + 1, j - 1), (i - 1, j)]:
+                if 0 <= n[0] < map_size and 0 <= n[1] < map_size and trav_map[n[0], n[1]] > 0:
+                    g.add_edge(n, (i, j), weight=T.l2_distance(n, (i, j)))
+    return g
+
+
+def _nx_shortest_path(trav_map_obj, g, source_world, target_world):
+    # Mirrors the legacy networkx-based TraversableMap.get_shortest_path, including its graph mutation
+    source_map = tuple(trav_map_obj.world_to_map(source_world))
+    target_map = tuple(trav_map_obj.world_to_map(target_world))
+    for node in (target_map, source_map):
+        if not g.has_node(node):
+            nodes = np.array(g.nodes)
+            closest_node = tuple(nodes[np.argmin(np.linalg.norm(nodes - node, axis=1))])
+            g.add_edge(closest_node, node, weight=T.l2_distance(closest_node, node))
+    path_map = np.array(nx.astar_path(g, source_map, target_map, heuristic=T.l2_distance))
+    path_world = trav_map_obj.map_to_world(path_map)
+    return path_world, np.sum(np.linalg.norm(path_world[1:] - path_world[:-1], axis=1))
+
+
+def benchmark_scene(scene_name):
+    trav_map = TraversableMap(map_resolution=MAP_RESOLUTION)
+    trav_map.load_map(os.path.join(get_og_scene_path(scene_name), "layout"))
+
+    np.random.seed(SEED)
+    queries = [(trav_map.get_random_point(floor=0)[1][:2], trav_map.get_random_point(floor=0)[1][:2])
+               for _ in range(NUM_QUERIES)]
+
+    g = _build_nx_graph(trav_map.floor_map[0])
+    nx_time, grid_time, max_dist_err = 0.0, 0.0, 0.0
+    for source, target in queries:
+        start = time.time()
+        _, nx_dist = _nx_shortest_path(trav_map, g, source, target)
+        nx_time += time.time() - start
+
+        start = time.time()
+        _, grid_dist = trav_map.get_shortest_path(0, source, target, entire_path=True)
+        grid_time += time.time() - start
+
+        max_dist_err = max(max_dist_err, abs(nx_dist - grid_dist))
+
+    print(f"{scene_name}: networkx {1000 * nx_time / NUM_QUERIES:.2f} ms/query, "
+          f"grid {1000 * grid_time / NUM_QUERIES:.2f} ms/query, "
+          f"speedup {nx_time / grid_time:.1f}x, max geodesic distance error {max_dist_err:.2e} m")
+
+
+def main():
+    for scene_name in (get_available_og_scenes() if SCENES is None else SCENES):
+        benchmark_scene(scene_name)
+
+
+if __name__ == "__main__":
+    main()
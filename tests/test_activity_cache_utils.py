@@ -0,0 +1,49 @@
+import os
+
+from omnigibson.utils.activity_cache_utils import (
+    _update_activity_cache_index,
+    get_activity_cache_index_key,
+    get_cached_activity_instances,
+    get_objects_signature,
+    load_activity_cache_index,
+)
+
+
+def _get_record(instance_id, valid, fname=None):
+    return dict(instance_id=instance_id, seed=instance_id, fname=fname, valid=valid, feedback=None,
+                objects_signature=None, sampling_time=1.0)
+
+
+def test_activity_cache_index(tmp_path):
+    cache_dir = str(tmp_path)
+    assert load_activity_cache_index(cache_dir=cache_dir) == dict()
+
+    key = get_activity_cache_index_key(scene_model="Rs_int", activity_name="dummy", activity_definition_id=0)
+    for fname in ("a.json", "b.json"):
+        with open(os.path.join(cache_dir, fname), "w+") as f:
+            f.write("{}")
+    _update_activity_cache_index(cache_dir=cache_dir, key=key, records=[
+        _get_record(instance_id=2, valid=True, fname="b.json"),
+        _get_record(instance_id=0, valid=True, fname="a.json"),
+        _get_record(instance_id=1, valid=False),
+    ])
+    # Instances whose scene files were removed are ignored
+    _update_activity_cache_index(cache_dir=cache_dir, key=key, records=[
+        _get_record(instance_id=3, valid=True, fname="missing.json"),
+    ])
+
+    kwargs = dict(scene_model="Rs_int", activity_name="dummy", activity_definition_id=0, cache_dir=cache_dir)
+    assert [r["instance_id"] for r in get_cached_activity_instances(**kwargs)] == [0, 2]
+    assert [r["instance_id"] for r in get_cached_activity_instances(**kwargs, validated_only=False)] == [0, 1, 2]
+    assert get_cached_activity_instances(**dict(kwargs, activity_definition_id=1)) == []
+
+
+def test_objects_signature():
+    init_info = dict(
+        apple_0=dict(class_name="DatasetObject", args=dict(name="apple_0", category="apple", model="agveuv")),
+        robot0=dict(class_name="Fetch", args=dict(name="robot0")),
+    )
+    signature = get_objects_signature(init_info)
+    assert signature == get_objects_signature(dict(reversed(list(init_info.items()))))
+    init_info["apple_0"]["args"]["model"] = "omzprq"
+    assert signature != get_objects_signature(init_info)
@@ -0,0 +1,74 @@
+import os
+
+from cryptography.fernet import Fernet
+
+from omnigibson.macros import gm
+from omnigibson.utils import asset_utils
+from omnigibson.utils.asset_utils import AssetPrimSummary, DecryptedAssetCache, decrypted, encrypt_file
+
+
+def _write_encrypted(tmp_path, name, content):
+    original = os.path.join(tmp_path, f"{name}.usd")
+    with open(original, "wb") as f:
+        f.write(content)
+    encrypted = os.path.join(tmp_path, f"{name}.encrypted.usd")
+    encrypt_file(original_filename=original, encrypted_filename=encrypted)
+    return encrypted
+
+
+def test_decrypted_asset_cache(tmp_path):
+    key_path, cache_dir, cache_size = gm.KEY_PATH, asset_utils.m.DECRYPTED_ASSET_CACHE_DIR, \
+        asset_utils.m.DECRYPTED_ASSET_CACHE_SIZE_MB
+    gm.KEY_PATH = os.path.join(tmp_path, "test.key")
+    with open(gm.KEY_PATH, "wb") as f:
+        f.write(Fernet.generate_key())
+    asset_utils.m.DECRYPTED_ASSET_CACHE_DIR = os.path.join(tmp_path, "cache")
+    asset_utils.m.DECRYPTED_ASSET_CACHE_SIZE_MB = 0
+    DecryptedAssetCache.clear()
+
+    try:
+        apple = _write_encrypted(tmp_path, "apple", b"apple")
+        apple_copy = os.path.join(tmp_path, "apple_copy.encrypted.usd")
+        with open(apple) as f, open(apple_copy, "w+") as f_copy:
+            f_copy.write(f.read())
+        banana = _write_encrypted(tmp_path, "banana", b"banana")
+
+        # Repeated loads of the same asset (even from different files) should share one decrypted file
+        path = DecryptedAssetCache.acquire(apple)
+        with open(path, "rb") as f:
+            assert f.read() == b"apple"
+        assert DecryptedAssetCache.acquire(apple) == path
+        with decrypted(apple_copy) as copy_path:
+            assert copy_path == path
+
+        # Referenced assets should never be evicted, unreferenced ones should be once the cache is too large
+        with decrypted(banana) as banana_path:
+            assert os.path.isfile(path)
+        assert not os.path.isfile(banana_path)
+        DecryptedAssetCache.release(path)
+        assert os.path.isfile(path)
+        DecryptedAssetCache.release(path)
+        assert not os.path.isfile(path)
+
+        # Evicted assets should be decrypted again when needed
+        with decrypted(apple) as path:
+            with open(path, "rb") as f:
+                assert f.read() == b"apple"
+    finally:
+        gm.KEY_PATH = key_path
+        asset_utils.m.DECRYPTED_ASSET_CACHE_DIR = cache_dir
+        asset_utils.m.DECRYPTED_ASSET_CACHE_SIZE_MB = cache_size
+        DecryptedAssetCache.clear()
+
+
+def test_asset_prim_summary():
+    summary = AssetPrimSummary("apple", "Xform", children=[
+        AssetPrimSummary("base_link", "Xform", children=[AssetPrimSummary("visuals", "Mesh")]),
+        AssetPrimSummary("container_0_0", "Xform"),
+        AssetPrimSummary("joint_0", "PhysicsRevoluteJoint"),
+    ])
+    loaded = AssetPrimSummary.from_dict(summary.to_dict())
+    assert loaded.to_dict() == summary.to_dict()
+    assert loaded.GetName() == "apple" and loaded.GetTypeName() == "Xform"
+    assert [child.GetName() for child in loaded.GetChildren()] == ["base_link", "container_0_0", "joint_0"]
+    assert loaded.GetChildren()[0].GetChildren()[0].GetTypeName() == "Mesh"
@@ -0,0 +1,69 @@
+from functools import partial
+
+import gym
+import numpy as np
+
+from omnigibson.utils.env_pool_utils import EnvironmentPool, FakeEnvironment, SharedSpaceBuffer
+
+
+def test_shared_space_buffer():
+    space = FakeEnvironment().observation_space
+    buf = SharedSpaceBuffer(space=space, batch_size=3)
+    attached_buf = SharedSpaceBuffer(space=space, batch_size=3, name=buf.name)
+
+    value = space.sample()
+    attached_buf.write(value, idx=1)
+    read_value = buf.read(idx=1)
+    assert np.array_equal(read_value["robot0"]["proprio"], value["robot0"]["proprio"])
+    assert np.array_equal(read_value["task"]["low_dim"], value["task"]["low_dim"])
+    assert buf.read()["robot0"]["proprio"].shape == (3, *space["robot0"]["proprio"].shape)
+
+    # Non-dict spaces are supported as well
+    box_buf = SharedSpaceBuffer(space=gym.spaces.Box(low=-1.0, high=1.0, shape=(2,)), batch_size=2)
+    box_buf.write(np.ones(2), idx=0)
+    assert np.array_equal(box_buf.read(), np.array([[1.0, 1.0], [0.0, 0.0]]))
+
+    for b in (attached_buf, buf, box_buf):
+        b.close()
+
+
+def test_env_pool():
+    pool = EnvironmentPool(env_fns=[partial(FakeEnvironment, episode_length=3)] * 2, start_omniverse=False)
+    try:
+        obs = pool.reset()
+        assert np.all(obs["robot0"]["proprio"] == 0)
+
+        for i in range(1, 4):
+            actions = pool.action_space.sample()
+            pool.step_async(actions)
+            obs, rewards, dones, infos = pool.step_wait()
+            assert np.allclose(rewards, actions.sum(axis=-1))
+            if i < 3:
+                assert not np.any(dones)
+                assert np.allclose(obs["task"]["low_dim"], actions)
+                assert np.all(obs["robot0"]["proprio"] == i)
+            else:
+                # Episodes should have been automatically reset
+                assert np.all(dones)
+                assert np.all(obs["robot0"]["proprio"] == 0)
+                assert np.all(infos[0]["last_observation"]["robot0"]["proprio"] == 3)
+    finally:
+        pool.close()
+
+
+def test_env_pool_restart():
+    env_fns = [partial(FakeEnvironment, episode_length=10), partial(FakeEnvironment, episode_length=10, crash_at_step=2)]
+    pool = EnvironmentPool(env_fns=env_fns, start_omniverse=False)
+    try:
+        pool.reset()
+        pool.step(pool.action_space.sample())
+        obs, rewards, dones, infos = pool.step(pool.action_space.sample())
+
+        # The crashed worker should have been restarted and reset, while the other one keeps running
+        assert pool.n_restarts == [0, 1]
+        assert not dones[0] and dones[1]
+        assert infos[1]["worker_restarted"]
+        assert np.all(obs["robot0"]["proprio"][0] == 2)
+        assert np.all(obs["robot0"]["proprio"][1] == 0)
+    finally:
+        pool.close()
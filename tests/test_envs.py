@@ -1,8 +1,12 @@
 import omnigibson as og
 from omnigibson.macros import gm
+from omnigibson.controllers.controller_base import ControlType
 
+import numpy as np
+import pytest
 
-def task_tester(task_type):
+
+def task_tester(task_type, check_fcn=None):
     cfg = {
         "scene": {
             "type": "InteractiveTraversableScene",
@@ -40,12 +44,41 @@ def task_tester(task_type):
     for _ in range(5):
         env.step(env.robots[0].action_space.sample())
 
+    # Run any additional task-specific checks
+    if check_fcn is not None:
+        check_fcn(env)
+
     # Clear the sim
     og.sim.clear()
 
 
 def test_dummy_task():
-    task_tester("DummyTask")
+    def check_dummy_task(env):
+        robot = env.robots[0]
+        # All steps used the same controllers, so a single control plan should have been compiled
+        assert len(robot._control_plans) == 1
+
+        # The deployed position targets should match the controllers' commands
+        control, control_type = robot._actions_to_control(action=robot.action_space.sample())
+        robot.deploy_control(control=control, control_type=control_type)
+        pos_idx = np.flatnonzero(control_type == ControlType.POSITION)
+        targets = robot._dc.get_articulation_dof_position_targets(robot._handle)
+        assert np.allclose(targets[pos_idx], control[pos_idx], atol=1e-4)
+
+        # Overriding control types for a single step (e.g.: Fetch's rigid trunk) should not leak into later steps
+        rigid_trunk = robot.rigid_trunk
+        try:
+            robot.rigid_trunk = True
+            _, rigid_control_type = robot._actions_to_control(action=robot.action_space.sample())
+            assert np.all(rigid_control_type[robot.trunk_control_idx] == ControlType.POSITION)
+            robot.rigid_trunk = False
+            _, control_type = robot._actions_to_control(action=robot.action_space.sample())
+            assert np.all(control_type == robot._control_type_vec)
+            assert control_type is not robot._control_type_vec
+        finally:
+            robot.rigid_trunk = rigid_trunk
+
+    task_tester("DummyTask", check_fcn=check_dummy_task)
 
 
 def test_point_reaching_task():
@@ -57,4 +90,77 @@ def test_point_navigation_task():
 
 
 def test_behavior_task():
-    task_tester("BehaviorTask")
+    def check_behavior_task(env):
+        from omnigibson.utils.bddl_utils import BDDLPredicateCache
+        # Goal predicates are evaluated by both the potential reward and the predicate goal, so the shared cache
+        # should have been hit
+        stats = BDDLPredicateCache.get_stats()
+        assert stats["n_evaluated"] > 0
+        assert stats["n_cached"] > 0
+
+        # The flattened low dim observations should match the named ones
+        low_dim_obs = env.task.get_obs(env=env, flatten_low_dim=False)["low_dim"]
+        low_dim_obs_flat = env.task.get_obs(env=env, flatten_low_dim=True)["low_dim"]
+        assert np.allclose(np.concatenate(list(low_dim_obs.values())), low_dim_obs_flat)
+        for name, obs_slice in env.task.low_dim_obs_layout.items():
+            assert np.allclose(low_dim_obs[name], low_dim_obs_flat[obs_slice])
+
+        # The in-gripper observations should match querying each entity individually
+        agent = env.task.get_agent(env=env)
+        for entity in env.task.object_scope.values():
+            if entity.is_system or not entity.exists or entity.synset == "agent.n.01":
+                continue
+            for arm in agent.arm_names:
+                expected = float(agent.is_grasping(arm=arm, candidate_obj=entity.wrapped_obj))
+                assert low_dim_obs[f"{entity.bddl_inst}_in_gripper_{arm}"][0] == expected
+
+    task_tester("BehaviorTask", check_fcn=check_behavior_task)
+
+
+def test_vector_env():
+    from omnigibson.envs import VectorEnvironment
+    cfg = {
+        "scene": {
+            "type": "Scene",
+        },
+        "robots": [
+            {
+                "type": "Turtlebot",
+                "obs_modalities": [],
+            }
+        ],
+        "task": {
+            "type": "DummyTask",
+        },
+    }
+
+    # Make sure sim is stopped
+    og.sim.stop()
+
+    env = VectorEnvironment(num_envs=2, configs=cfg, action_timestep=1 / 60., physics_timestep=1 / 60.,
+                            flatten_action_space=True)
+    assert len(env.scene.robots) == 2
+    robot0, robot1 = env.envs[0].robots[0], env.envs[1].robots[0]
+    assert not np.allclose(robot0.get_position(), robot1.get_position())
+
+    obs = env.reset()
+    for _ in range(5):
+        obs, rewards, dones, infos = env.step(env.action_space.sample())
+        assert rewards.shape == dones.shape == (2,)
+        assert len(infos) == 2
+        assert obs["task"]["low_dim"].shape[0] == 2
+
+    # Resetting a single instance should not affect the other one
+    pos1 = robot1.get_position()
+    env.envs[0].reset_scene()
+    assert np.allclose(robot1.get_position(), pos1)
+
+    # Clear the sim
+    og.sim.clear()
+
+    # Instances can only share a plain scene
+    cfg["scene"] = {"type": "InteractiveTraversableScene", "scene_model": "Rs_int"}
+    og.sim.stop()
+    with pytest.raises(AssertionError):
+        VectorEnvironment(num_envs=2, configs=cfg, action_timestep=1 / 60., physics_timestep=1 / 60.)
+    og.sim.clear()
@@ -0,0 +1,108 @@
+from omnigibson.utils import geometry_utils
+from omnigibson.utils.geometry_utils import (
+    PointsInVolumeChecker,
+    check_points_in_cone,
+    check_points_in_cube,
+    check_points_in_cylinder,
+    check_points_in_sphere,
+)
+
+import numpy as np
+
+
+class _Quat:
+    def __init__(self, quat):
+        self.imaginary, self.real = quat[:3], quat[3]
+
+
+class _Attribute:
+    def __init__(self, value):
+        self._value = value
+
+    def Get(self):
+        return self._value
+
+
+class _Prim:
+    # Minimal stand-in for a USD geom prim, exposing only what the volume checker reads
+    def __init__(self, type_name, pos, quat, scale, **attrs):
+        self._type_name = type_name
+        self._attrs = {"xformOp:translate": pos, "xformOp:orient": _Quat(quat), "xformOp:scale": scale, **attrs}
+
+    def GetTypeName(self):
+        return self._type_name
+
+    def GetAttribute(self, name):
+        return _Attribute(self._attrs[name])
+
+
+class _Mesh:
+    def __init__(self, prim):
+        self.prim = prim
+
+
+class _Link:
+    prim_path = "/World/container/base_link"
+
+    def __init__(self, meshes, pos, quat):
+        self.visual_meshes = {f"container_{i}": _Mesh(mesh) for i, mesh in enumerate(meshes)}
+        self._pose = (np.array(pos), np.array(quat))
+
+    def get_position_orientation(self):
+        return self._pose
+
+
+class _Obj:
+    name = "container"
+    scale = np.array([1.0, 2.0, 0.5])
+
+
+def _get_checker():
+    quat = np.array([0, 0, np.sin(np.pi / 8), np.cos(np.pi / 8)])
+    meshes = [
+        _Prim("Cube", pos=np.array([0.5, 0, 0]), quat=quat, scale=np.array([1.0, 0.5, 1.0]), size=1.0),
+        _Prim("Sphere", pos=np.array([-0.5, 0.2, 0]), quat=np.array([0, 0, 0, 1.0]), scale=np.ones(3), radius=0.3),
+        _Prim("Cylinder", pos=np.array([0, 0.5, 0.2]), quat=quat, scale=np.ones(3), radius=0.2, height=0.6),
+        _Prim("Cone", pos=np.array([0, -0.5, 0]), quat=np.array([0, 0, 0, 1.0]), scale=np.ones(3), radius=0.3, height=0.5),
+    ]
+    link = _Link(meshes=meshes, pos=[1.0, -1.0, 0.5], quat=quat)
+    return PointsInVolumeChecker(obj=_Obj(), volume_link=link), meshes, link
+
+
+def test_points_in_volume_checker():
+    checker, meshes, link = _get_checker()
+    points = np.random.uniform(-1.5, 1.5, size=(5000, 3)) + np.array([1.0, -1.0, 0.5])
+
+    # Compare against checking each sub-volume individually
+    local_points = geometry_utils.get_particle_positions_in_frame(*link.get_position_orientation(), _Obj.scale, points)
+    expected = np.zeros(len(points), dtype=bool)
+    for mesh, fcn in zip(meshes, (check_points_in_cube, check_points_in_sphere, check_points_in_cylinder, check_points_in_cone)):
+        attrs = mesh._attrs
+        size = attrs["size"] if "size" in attrs else \
+            attrs["radius"] if "height" not in attrs else [attrs["radius"], attrs["height"]]
+        expected |= fcn(
+            size=size,
+            pos=attrs["xformOp:translate"],
+            quat=np.array([*attrs["xformOp:orient"].imaginary, attrs["xformOp:orient"].real]),
+            scale=attrs["xformOp:scale"],
+            particle_positions=local_points,
+        )
+    assert expected.any()
+    assert np.array_equal(checker(points), expected)
+
+
+def test_points_in_volume_checker_volume(tmp_path, monkeypatch):
+    monkeypatch.setattr(geometry_utils.m, "VOLUME_CACHE_DIR", str(tmp_path))
+    PointsInVolumeChecker._VOLUME_CACHE.clear()
+
+    # A single unit sphere
+    meshes = [_Prim("Sphere", pos=np.zeros(3), quat=np.array([0, 0, 0, 1.0]), scale=np.ones(3), radius=1.0)]
+    checker = PointsInVolumeChecker(obj=_Obj(), volume_link=_Link(meshes=meshes, pos=np.zeros(3), quat=[0, 0, 0, 1.0]))
+    volume = checker.calculate_volume()
+    assert np.isclose(volume, 4 / 3 * np.pi * np.prod(_Obj.scale), rtol=1e-2)
+
+    # The volume should be stored on disk and re-used by a fresh checker
+    assert len(list(tmp_path.iterdir())) == 1
+    PointsInVolumeChecker._VOLUME_CACHE.clear()
+    checker._estimate_unscaled_volume = None
+    assert checker.calculate_volume() == volume
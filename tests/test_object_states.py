@@ -1,5 +1,6 @@
 from omnigibson.macros import macros as m
 from omnigibson.object_states import *
+from omnigibson.object_states.update_scheduler import ObjectStateUpdateScheduler
 from omnigibson.systems import get_system, is_physical_particle_system, is_visual_particle_system
 from omnigibson.utils.constants import PrimType
 from omnigibson.utils.physx_utils import apply_force_at_pos, apply_torque
@@ -9,6 +10,8 @@ import omnigibson as og
 
 from utils import og_test, get_random_pose, place_objA_on_objB_bbox, place_obj_on_floor_plane
 
+from unittest.mock import MagicMock
+
 import pytest
 import numpy as np
 
@@ -436,6 +439,46 @@ def test_max_temperature():
     assert dishtowel.states[MaxTemperature].get_value() > m.object_states.temperature.DEFAULT_TEMPERATURE
 
 
+@og_test
+def test_state_update_scheduler():
+    bagel = og.sim.scene.object_registry("name", "bagel")
+    place_obj_on_floor_plane(bagel, x_offset=-0.5)
+    bagel.states[Temperature].set_value(m.object_states.temperature.DEFAULT_TEMPERATURE)
+    og.sim.step()
+
+    # Nothing changed, so states that only depend on other states should be skipped
+    ObjectStateUpdateScheduler.reset_timings()
+    assert bagel.states[MaxTemperature].set_value(m.object_states.temperature.DEFAULT_TEMPERATURE - 1)
+    og.sim.step()
+    assert bagel.states[MaxTemperature].get_value() == m.object_states.temperature.DEFAULT_TEMPERATURE
+    og.sim.step()
+    assert not ObjectStateUpdateScheduler.is_dirty(bagel)
+
+    timings = ObjectStateUpdateScheduler.get_timings()
+    assert timings["MaxTemperature"]["n_steps"] == 2
+    assert timings["MaxTemperature"]["n_skipped"] > 0
+    assert "update_visuals" in timings
+
+    # Changing the temperature should mark the object as dirty and propagate to the dependent states
+    bagel.states[Temperature].set_value(m.object_states.temperature.DEFAULT_TEMPERATURE + 10)
+    assert ObjectStateUpdateScheduler.is_dirty(bagel)
+    og.sim.step()
+    assert bagel.states[MaxTemperature].get_value() > m.object_states.temperature.DEFAULT_TEMPERATURE
+
+
+def test_state_update_scheduler_remove_object():
+    obj = MagicMock()
+    ObjectStateUpdateScheduler.mark_dirty(obj)
+    assert ObjectStateUpdateScheduler.is_dirty(obj)
+    assert ObjectStateUpdateScheduler.get_version(obj) == 1
+
+    # Removed objects should no longer be referenced by the scheduler
+    ObjectStateUpdateScheduler.remove_object(obj)
+    assert not ObjectStateUpdateScheduler.is_dirty(obj)
+    assert obj not in ObjectStateUpdateScheduler._VERSIONS
+    assert ObjectStateUpdateScheduler.get_version(obj) == 0
+
+
 @og_test
 def test_heat_source_or_sink():
     microwave = og.sim.scene.object_registry("name", "microwave")
@@ -1166,5 +1209,132 @@ def test_covered():
         obj.set_position_orientation(position=np.ones(3) * 75.0, orientation=[0, 0, 0, 1.0])
 
 
+@og_test
+def test_macro_particle_scales_round_trip():
+    breakfast_table = og.sim.scene.object_registry("name", "breakfast_table")
+    place_obj_on_floor_plane(breakfast_table)
+    og.sim.step()
+
+    stain = get_system("stain")
+    assert breakfast_table.states[Covered].set_value(stain, True)
+    og.sim.step()
+
+    def get_cached_and_prim_scales():
+        names = list(stain.particles.keys())
+        cached = stain._particles_scale[stain._get_particle_slots(particles=names)]
+        return cached, np.array([stain.particles[name].scale for name in names])
+
+    # The cached particle scales should match the particle prims after loading a state with different scales
+    state = og.sim.dump_state(serialized=False)
+    for particle in stain.particles.values():
+        particle.scale = particle.scale * 2.0
+    og.sim.load_state(state, serialized=False)
+    cached, prim_scales = get_cached_and_prim_scales()
+    assert np.allclose(cached, prim_scales)
+    assert np.allclose(prim_scales, state["system_registry"][stain.name]["scales"])
+
+    # The same should hold if the particle groups are re-created when loading the state
+    stain.remove_all_particles()
+    og.sim.load_state(state, serialized=False)
+    cached, prim_scales = get_cached_and_prim_scales()
+    assert np.allclose(cached, prim_scales)
+    assert np.allclose(prim_scales, state["system_registry"][stain.name]["scales"])
+
+    stain.remove_all_particles()
+
+
+@og_test
+def test_serialize_into():
+    breakfast_table = og.sim.scene.object_registry("name", "breakfast_table")
+    place_obj_on_floor_plane(breakfast_table)
+    og.sim.step()
+
+    # Writing into a preallocated buffer should produce the same flattened state as the standard serialization,
+    # without reallocating the buffer
+    state_flat = og.sim.dump_state(serialized=True)
+    buffer = np.zeros(len(state_flat) + 10)
+    state_view = og.sim.dump_state(serialized=True, out=buffer)
+    assert np.shares_memory(state_view, buffer)
+    assert np.allclose(state_view, state_flat)
+
+    # The registry layouts should match the flattened state
+    registry_state = state_view[og.sim.scene._registry.state_layout["object_registry"]]
+    obj_state = registry_state[og.sim.scene.object_registry.state_layout[breakfast_table.name]]
+    assert np.allclose(obj_state, breakfast_table.dump_state(serialized=True))
+
+    # The in-place state should be loadable like any other serialized state
+    breakfast_table.set_position(np.ones(3) * 10.0)
+    og.sim.load_state(state_view, serialized=True)
+    assert np.allclose(og.sim.dump_state(serialized=True), state_flat)
+
+
+@og_test
+def test_checkpoint_rollback():
+    breakfast_table = og.sim.scene.object_registry("name", "breakfast_table")
+    bowl = og.sim.scene.object_registry("name", "bowl")
+    place_obj_on_floor_plane(breakfast_table)
+    bowl.set_position(np.ones(3) * 10.0)
+    og.sim.step()
+
+    checkpoint_id = og.sim.checkpoint()
+    og.sim.checkpoint(name="named")
+    assert og.sim.scene.checkpoint_ids == [checkpoint_id, "named"]
+    assert og.sim.scene.get_checkpoint_diff(checkpoint_id, "named") == []
+
+    # Only the moved object should be restored
+    bowl.set_position(np.ones(3) * 20.0)
+    assert og.sim.scene.get_checkpoint_diff(checkpoint_id) == [bowl.name]
+    assert og.sim.rollback(checkpoint_id) == [bowl.name]
+    assert np.allclose(bowl.get_position(), np.ones(3) * 10.0)
+    assert bowl.name not in og.sim.rollback("named")
+
+    # Oldest checkpoints should be evicted once the ring is full
+    for _ in range(m.scenes.scene_base.MAX_CHECKPOINTS):
+        og.sim.checkpoint()
+    assert len(og.sim.scene.checkpoint_ids) == m.scenes.scene_base.MAX_CHECKPOINTS
+    assert checkpoint_id not in og.sim.scene.checkpoint_ids
+
+    og.sim.scene.clear_checkpoints()
+    assert og.sim.scene.checkpoint_ids == []
+
+
+@og_test
+def test_entity_state_cache():
+    bottom_cabinet = og.sim.scene.object_registry("name", "bottom_cabinet")
+    og.sim.step()
+
+    # Wrap the dynamic control interface so that we can count the calls made through it
+    dc = bottom_cabinet._dc
+    bottom_cabinet._dc = MagicMock(wraps=dc)
+    try:
+        bottom_cabinet.reset_state_cache_stats()
+
+        # All joint states should be read with a single call
+        positions = bottom_cabinet.get_joint_positions()
+        bottom_cabinet.get_joint_velocities()
+        bottom_cabinet.get_joint_efforts()
+        assert bottom_cabinet._dc.get_articulation_dof_states.call_count == 1
+        assert bottom_cabinet.state_cache_stats == dict(hits=2, misses=1)
+
+        # Same for the root pose
+        bottom_cabinet.get_position_orientation()
+        bottom_cabinet.get_position_orientation()
+        assert bottom_cabinet.state_cache_stats == dict(hits=3, misses=2)
+
+        # Returned values should not alias the cache
+        positions[:] = 100.0
+        assert not np.allclose(bottom_cabinet.get_joint_positions(), 100.0)
+
+        # Setting a state or stepping physics should invalidate the cache
+        bottom_cabinet.set_joint_positions(positions * 0.0)
+        assert np.allclose(bottom_cabinet.get_joint_positions(), 0.0)
+        assert bottom_cabinet._dc.get_articulation_dof_states.call_count == 2
+        og.sim.step()
+        bottom_cabinet.get_joint_positions()
+        assert bottom_cabinet._dc.get_articulation_dof_states.call_count == 3
+    finally:
+        bottom_cabinet._dc = dc
+
+
 def test_clear_sim():
     og.sim.clear()
@@ -0,0 +1,48 @@
+import json
+import os
+
+from omnigibson.macros import gm
+from omnigibson.utils.profiling_utils import StepProfiler
+
+
+def test_step_profiler(tmp_path):
+    original_enable_profiling = gm.ENABLE_PROFILING
+    StepProfiler.clear()
+    try:
+        # Nothing should be recorded while profiling is disabled
+        gm.ENABLE_PROFILING = False
+        with StepProfiler.profile("env.step"):
+            pass
+        assert len(StepProfiler.get_frames()) == 0
+
+        gm.ENABLE_PROFILING = True
+        for _ in range(3):
+            with StepProfiler.profile("env.step"):
+                with StepProfiler.profile("env.apply_action"):
+                    pass
+                with StepProfiler.profile("sim.step"):
+                    with StepProfiler.profile("object_states/Temperature"):
+                        pass
+
+        frames = StepProfiler.get_frames()
+        assert len(frames) == 3
+        assert [event[0] for event in frames[0]["events"]] == \
+            ["env.step", "env.apply_action", "sim.step", "object_states/Temperature"]
+        assert [event[3] for event in frames[0]["events"]] == [0, 1, 1, 2]
+
+        summary = StepProfiler.get_summary()
+        assert summary["sim.step"]["count"] == 3
+        assert summary["env.step"]["total"] >= summary["sim.step"]["total"]
+
+        json_path, trace_path = os.path.join(tmp_path, "profile.json"), os.path.join(tmp_path, "trace.json")
+        StepProfiler.export_json(json_path)
+        StepProfiler.export_chrome_trace(trace_path)
+        with open(json_path, "r") as f:
+            assert len(json.load(f)["frames"]) == 3
+        with open(trace_path, "r") as f:
+            trace_events = json.load(f)["traceEvents"]
+        assert len(trace_events) == 12
+        assert {event["cat"] for event in trace_events} == {"env", "sim", "object_states"}
+    finally:
+        gm.ENABLE_PROFILING = original_enable_profiling
+        StepProfiler.clear()
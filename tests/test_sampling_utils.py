@@ -0,0 +1,100 @@
+from omnigibson.utils.sampling_utils import (
+    TrimeshRaytestBackend,
+    check_rays_hit_object,
+    get_raytest_backend,
+    raytest_batch,
+    raytest_batch_arrays,
+    set_raytest_backend,
+)
+
+import numpy as np
+import trimesh
+
+
+def _use_trimesh_backend(func):
+    # Two unit cubes stacked along the z-axis, centered at z=0 and z=3
+    def wrapper():
+        lower_box = trimesh.creation.box(extents=[1, 1, 1])
+        upper_box = trimesh.creation.box(extents=[1, 1, 1])
+        upper_box.apply_translation([0, 0, 3])
+        original_backend = get_raytest_backend()
+        set_raytest_backend(TrimeshRaytestBackend({
+            "/World/lower/base_link": lower_box,
+            "/World/upper/base_link": upper_box,
+        }))
+        try:
+            func()
+        finally:
+            set_raytest_backend(original_backend)
+    return wrapper
+
+
+@_use_trimesh_backend
+def test_raytest_batch_arrays_closest():
+    start_points = np.array([[0, 0, -2.0], [5, 5, -2.0], [0, 0, 10.0]])
+    end_points = np.array([[0, 0, 10.0], [5, 5, 10.0], [0, 0, -10.0]])
+
+    results = raytest_batch_arrays(start_points, end_points)
+    assert np.all(results["hit"] == [True, False, True])
+    assert np.allclose(results["position"][[0, 2]], [[0, 0, -0.5], [0, 0, 3.5]])
+    assert np.allclose(results["normal"][[0, 2]], [[0, 0, -1], [0, 0, 1]])
+    assert np.allclose(results["distance"][[0, 2]], [1.5, 6.5])
+    assert np.isinf(results["distance"][1])
+    assert results["body_idx"][1] == -1
+    assert results["rigid_bodies"][results["body_idx"][0]] == "/World/lower/base_link"
+    assert results["rigid_bodies"][results["body_idx"][2]] == "/World/upper/base_link"
+
+    # Ignored bodies should be skipped entirely
+    results = raytest_batch_arrays(start_points, end_points, ignore_bodies=["/World/lower/base_link"])
+    assert np.allclose(results["position"][0], [0, 0, 2.5])
+    assert results["rigid_bodies"] == ["/World/upper/base_link"]
+
+    # Rays that stop short of any geometry should not hit anything
+    results = raytest_batch_arrays(np.array([[0, 0, -2.0]]), np.array([[0, 0, -1.0]]))
+    assert not np.any(results["hit"])
+
+
+@_use_trimesh_backend
+def test_raytest_batch_arrays_all_hits():
+    results = raytest_batch_arrays(
+        np.array([[0, 0, -2.0], [5, 5, -2.0]]), np.array([[0, 0, 10.0], [5, 5, 10.0]]), only_closest=False,
+    )
+    assert np.all(results["ray_idx"] == 0)
+    assert set(results["rigid_bodies"]) == {"/World/lower/base_link", "/World/upper/base_link"}
+    assert np.allclose(np.unique(np.round(results["distance"], 6)), [1.5, 2.5, 4.5, 5.5])
+
+
+@_use_trimesh_backend
+def test_raytest_batch_matches_arrays():
+    start_points = np.array([[0, 0, -2.0], [5, 5, -2.0]])
+    end_points = np.array([[0, 0, 10.0], [5, 5, 10.0]])
+    array_results = raytest_batch_arrays(start_points, end_points)
+    dict_results = raytest_batch(start_points, end_points)
+
+    assert dict_results[1] == {"hit": False}
+    assert dict_results[0]["hit"]
+    assert np.allclose(dict_results[0]["position"], array_results["position"][0])
+    assert dict_results[0]["rigidBody"] == "/World/lower/base_link"
+
+    # Hits should report the same keys as PhysX's raycast_closest()
+    assert set(dict_results[0].keys()) == \
+        {"hit", "position", "normal", "distance", "faceIndex", "collision", "rigidBody", "protoIndex", "material"}
+    assert dict_results[0]["collision"] == "/World/lower/base_link"
+    assert dict_results[0]["material"] == ""
+    assert dict_results[0]["protoIndex"] == 0xFFFFFFFF
+    # The ray enters the bottom face of the lower box
+    face_normals = trimesh.creation.box(extents=[1, 1, 1]).face_normals
+    assert np.allclose(face_normals[dict_results[0]["faceIndex"]], [0, 0, -1])
+    assert array_results["face_idx"][1] == -1 and array_results["material_idx"][1] == -1
+
+
+@_use_trimesh_backend
+def test_check_rays_hit_object():
+    results = raytest_batch_arrays(
+        np.array([[0, 0, -2.0], [5, 5, -2.0], [0, 0, 10.0]]), np.array([[0, 0, 10.0], [5, 5, 10.0], [0, 0, -10.0]])
+    )
+    hits = check_rays_hit_object(results, 0.5, [])
+    assert np.all(hits == [True, False, True])
+    assert check_rays_hit_object(results, 0.5, [], body_names=["/World/upper/base_link"]) is None
+    hits = check_rays_hit_object(results, 0.3, [], body_names=["/World/upper/base_link"])
+    assert np.all(hits == [False, False, True])
@@ -0,0 +1,90 @@
+import os
+
+import numpy as np
+from PIL import Image
+
+from omnigibson.macros import gm
+from omnigibson.maps.segmentation_map import SegmentationMap
+
+
+def create_scene_dir(tmp_path):
+    # Four rooms: a kitchen, two bathrooms and a bedroom, separated by room boundaries (id 0)
+    img_sem = np.zeros((200, 200), dtype=np.uint8)
+    img_ins = np.zeros((200, 200), dtype=np.uint8)
+    img_sem[10:90, 10:90], img_ins[10:90, 10:90] = 1, 1
+    img_sem[100:190, 10:90], img_ins[100:190, 10:90] = 2, 2
+    img_sem[10:90, 100:190], img_ins[10:90, 100:190] = 2, 3
+    img_sem[100:190, 100:190], img_ins[100:190, 100:190] = 3, 4
+
+    scene_dir = tmp_path / "scene"
+    os.makedirs(scene_dir / "layout")
+    Image.fromarray(img_ins).save(scene_dir / "layout" / "floor_insseg_0.png")
+    Image.fromarray(img_sem).save(scene_dir / "layout" / "floor_semseg_0.png")
+
+    dataset_dir = tmp_path / "dataset"
+    os.makedirs(dataset_dir / "metadata")
+    with open(dataset_dir / "metadata" / "room_categories.txt", "w+") as f:
+        f.write("kitchen\nbathroom\nbedroom\n")
+
+    return str(scene_dir), str(dataset_dir)
+
+
+def test_segmentation_map_room_indices(tmp_path, monkeypatch):
+    scene_dir, dataset_dir = create_scene_dir(tmp_path)
+    monkeypatch.setattr(gm, "DATASET_PATH", dataset_dir)
+    layout_dir = os.path.join(scene_dir, "layout")
+
+    seg_map = SegmentationMap(scene_dir=scene_dir, map_resolution=0.1)
+    assert seg_map.room_sem_name_to_ins_name == {
+        "kitchen": ["kitchen_0"], "bathroom": ["bathroom_0", "bathroom_1"], "bedroom": ["bedroom_0"],
+    }
+
+    # The pixels of each room id should match the (row-major) pixels found by scanning the whole map
+    for img, pixels, offsets in (
+        (seg_map.room_sem_map, seg_map._sem_pixels, seg_map._sem_offsets),
+        (seg_map.room_ins_map, seg_map._ins_pixels, seg_map._ins_offsets),
+    ):
+        assert offsets[0] == 0 and offsets[-1] == img.size
+        assert len(offsets) == img.max() + 2
+        for room_id in range(len(offsets) - 1):
+            expected = np.ravel_multi_index(np.where(img == room_id), img.shape)
+            assert np.array_equal(pixels[offsets[room_id]:offsets[room_id + 1]], expected)
+
+    # The indices should be cached, and loaded from the cache the next time without being recomputed
+    index_files = [fname for fname in os.listdir(layout_dir) if fname.endswith(".npz")]
+    assert len(index_files) == 1 and not any(".tmp" in fname for fname in index_files)
+
+    def fail_argsort(*args, **kwargs):
+        raise AssertionError("Room indices should have been loaded from the cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(np, "argsort", fail_argsort)
+        cached_seg_map = SegmentationMap(scene_dir=scene_dir, map_resolution=0.1)
+    for attr in ("_sem_pixels", "_sem_offsets", "_ins_pixels", "_ins_offsets"):
+        assert np.array_equal(getattr(cached_seg_map, attr), getattr(seg_map, attr))
+    assert [fname for fname in os.listdir(layout_dir) if fname.endswith(".npz")] == index_files
+
+    # Sampled points should lie within the requested rooms
+    for _ in range(50):
+        _, point = seg_map.get_random_point_by_room_instance("bathroom_1")
+        assert seg_map.get_room_instance_by_point(point[:2]) == "bathroom_1"
+        _, point = seg_map.get_random_point_by_room_type("bedroom")
+        assert seg_map.get_room_type_by_point(point[:2]) == "bedroom"
+
+
+def test_segmentation_map_batch_lookups(tmp_path, monkeypatch):
+    scene_dir, dataset_dir = create_scene_dir(tmp_path)
+    monkeypatch.setattr(gm, "DATASET_PATH", dataset_dir)
+    seg_map = SegmentationMap(scene_dir=scene_dir, map_resolution=0.1)
+
+    # The 200 x 200 pixel images at 0.01 meters per pixel span [-1, 1] meters along each axis, so some of these
+    # points are off the map
+    points = np.random.default_rng(0).uniform(-1.5, 1.5, size=(500, 2))
+    points[:3] = [[-1.2, 0.0], [0.0, 1.4], [2.0, -2.0]]
+
+    room_types = seg_map.get_room_types_by_points(points)
+    room_instances = seg_map.get_room_instances_by_points(points)
+    assert room_types == [seg_map.get_room_type_by_point(point) for point in points]
+    assert room_instances == [seg_map.get_room_instance_by_point(point) for point in points]
+    assert room_types[:3] == [None] * 3 and room_instances[:3] == [None] * 3
+    assert {"kitchen", "bathroom", "bedroom", None} == set(room_types)
@@ -0,0 +1,71 @@
+from omnigibson.sensors import VisionSensor
+import omnigibson as og
+
+from utils import og_test
+
+import numpy as np
+
+
+def create_camera(name, async_obs):
+    cam = VisionSensor(
+        prim_path=f"/World/{name}",
+        name=name,
+        modalities=["rgb", "depth_linear", "seg_semantic"],
+        image_height=64,
+        image_width=64,
+        async_obs=async_obs,
+    )
+    cam.load()
+    cam.set_position_orientation(position=[0.0, 0.0, 2.0], orientation=[0.0, 0.0, 0.0, 1.0])
+    cam.initialize()
+    return cam
+
+
+@og_test
+def test_vision_sensor_async_obs():
+    cam = create_camera(name="async_cam", async_obs=True)
+    try:
+        # Segmentations query the stage, so they must never be read back in the background
+        assert cam.modalities & cam._IMAGE_MODALITIES == {"rgb", "depth_linear"}
+
+        og.sim.step()
+        cam.await_obs()
+        obs_0 = cam.get_obs()
+        # The awaited observations should match a synchronous readback of the latest render
+        sync_obs = cam._read_modalities()
+        for modality in cam.modalities:
+            assert np.all(obs_0[modality] == sync_obs[modality])
+        obs_0_values = {modality: np.array(obs_0[modality]) for modality in cam.modalities}
+
+        # Without awaiting, the observations of the previous render are delivered while the next readback is pending
+        og.sim.step()
+        assert cam._pending_readback is not None
+        obs_1_pending = cam.get_obs()
+        for modality in cam.modalities:
+            assert obs_1_pending[modality] is obs_0[modality]
+            assert np.all(obs_1_pending[modality] == obs_0_values[modality])
+        cam.await_obs()
+        obs_1 = cam.get_obs()
+
+        # Image buffers alternate between consecutive readbacks, and are reused after two steps
+        og.sim.step()
+        cam.await_obs()
+        obs_2 = cam.get_obs()
+        for modality in ("rgb", "depth_linear"):
+            assert obs_1[modality] is not obs_0[modality]
+            assert obs_2[modality] is obs_0[modality]
+        # Segmentations are read back synchronously into new arrays
+        assert obs_2["seg_semantic"] is not obs_0["seg_semantic"]
+
+        # Disabling async readback falls back to synchronous reads of the latest render
+        cam.async_obs = False
+        assert cam._pending_readback is None and cam._ready_obs is None
+        og.sim.step()
+        assert cam._pending_readback is None
+        obs_3 = cam.get_obs()
+        sync_obs = cam._read_modalities()
+        for modality in cam.modalities:
+            assert np.all(obs_3[modality] == sync_obs[modality])
+        assert obs_3["rgb"] is not obs_0["rgb"] and obs_3["rgb"] is not obs_1["rgb"]
+    finally:
+        cam.remove()
@@ -0,0 +1,165 @@
+import json
+import os
+
+from omnigibson.utils.snapshot_utils import (
+    convert_scene_file,
+    get_scene_file,
+    get_sidecar_path,
+    is_snapshot_file,
+    load_scene_info,
+    load_snapshot,
+    save_snapshot,
+)
+
+import numpy as np
+import pytest
+
+
+def _get_scene_info():
+    # Mirrors the structure of the scene info dumped by og.sim.save()
+    return dict(
+        metadata=dict(task="dummy"),
+        init_info=dict(class_name="Scene", args=dict(scene_file=None, use_floor_plane=True)),
+        objects_info=dict(init_info=dict(apple=dict(class_name="DatasetObject", args=dict(scale=np.ones(3))))),
+        state=dict(
+            object_registry=dict(apple=dict(
+                root_link=dict(pos=np.arange(3, dtype=float), ori=np.array([0, 0, 0, 1], dtype=np.float32)),
+                joints=np.zeros((0, 3)),
+                non_kinematic_states=dict(Temperature=np.float64(23.0), ToggledOn=np.bool_(False)),
+            )),
+            system_registry=dict(water=dict(
+                n_particles=2,
+                positions=np.random.rand(2, 3),
+                particle_idns=np.array([3, 7]),
+                groups=dict(),
+                names=["a", "b"],
+            )),
+        ),
+    )
+
+
+def _assert_equal(a, b):
+    if isinstance(a, dict):
+        assert isinstance(b, dict) and a.keys() == b.keys()
+        for k in a.keys():
+            _assert_equal(a[k], b[k])
+    elif isinstance(a, (list, tuple)):
+        assert isinstance(b, list) and len(a) == len(b)
+        for x, y in zip(a, b):
+            _assert_equal(x, y)
+    elif isinstance(a, (np.ndarray, np.generic)):
+        assert type(a) == type(b) and a.dtype == b.dtype and np.shape(a) == np.shape(b)
+        assert np.array_equal(a, b)
+    else:
+        assert type(a) == type(b) and a == b
+
+
+def test_snapshot_round_trip(tmp_path):
+    scene_info = _get_scene_info()
+    fpath = os.path.join(tmp_path, "scene.ogsnap")
+    save_snapshot(fpath, data=scene_info)
+
+    assert is_snapshot_file(fpath)
+    _assert_equal(scene_info, load_snapshot(fpath))
+    _assert_equal(scene_info, load_scene_info(fpath))
+
+
+def test_snapshot_partial_load(tmp_path):
+    scene_info = _get_scene_info()
+    fpath = os.path.join(tmp_path, "scene.ogsnap")
+    save_snapshot(fpath, data=scene_info)
+
+    loaded = load_snapshot(fpath, keys=["init_info", "state/object_registry/apple/root_link", "state/nonexistent"])
+    _assert_equal(loaded, dict(
+        init_info=scene_info["init_info"],
+        state=dict(object_registry=dict(apple=dict(root_link=scene_info["state"]["object_registry"]["apple"]["root_link"]))),
+    ))
+
+
+def test_snapshot_mmap(tmp_path):
+    scene_info = _get_scene_info()
+    fpath = os.path.join(tmp_path, "scene.ogsnap")
+    save_snapshot(fpath, data=scene_info)
+
+    loaded = load_snapshot(fpath, mmap=True)
+    _assert_equal(scene_info, loaded)
+
+    # Memory-mapped arrays are copy-on-write, so the file should remain untouched
+    loaded["state"]["object_registry"]["apple"]["root_link"]["pos"][:] = -1
+    _assert_equal(scene_info, load_snapshot(fpath))
+
+
+def test_snapshot_zstd(tmp_path):
+    pytest.importorskip("zstandard")
+    scene_info = _get_scene_info()
+    fpath = os.path.join(tmp_path, "scene.ogsnap")
+    save_snapshot(fpath, data=scene_info, compression="zstd")
+
+    _assert_equal(scene_info, load_snapshot(fpath))
+    with pytest.raises(AssertionError):
+        load_snapshot(fpath, mmap=True)
+
+
+def test_load_scene_info_json(tmp_path):
+    scene_info = dict(init_info=dict(class_name="Scene"), state=dict(object_registry=dict()))
+    fpath = os.path.join(tmp_path, "scene.json")
+    with open(fpath, "w+") as f:
+        json.dump(scene_info, f)
+
+    assert not is_snapshot_file(fpath)
+    assert load_scene_info(fpath) == scene_info
+    assert load_scene_info(fpath, keys=["state"]) == dict(state=scene_info["state"])
+
+
+def test_scene_file_cache(tmp_path):
+    scene_info = dict(init_info=dict(class_name="Scene"), state=dict(object_registry=dict()))
+    fpath = os.path.join(tmp_path, "scene.json")
+    with open(fpath, "w+") as f:
+        json.dump(scene_info, f)
+
+    # The file should only be parsed once, and re-parsed once it is modified
+    scene_file = get_scene_file(fpath)
+    assert get_scene_file(fpath) is scene_file
+    assert load_scene_info(fpath, keys=["init_info"]) == dict(init_info=scene_info["init_info"])
+    scene_info["init_info"]["class_name"] = "InteractiveTraversableScene"
+    with open(fpath, "w+") as f:
+        json.dump(scene_info, f)
+    assert get_scene_file(fpath) is not scene_file
+    assert load_scene_info(fpath) == scene_info
+
+
+def test_scene_file_sidecar(tmp_path):
+    scene_info = dict(
+        init_info=dict(class_name="Scene", args=dict(scene_file=None, use_floor_plane=True)),
+        state=dict(
+            object_registry=dict(apple=dict(
+                root_link=dict(pos=[0.0, 1.0, 2.0], ori=[0, 0, 0, 1]),
+                non_kinematic_states=dict(Temperature=23.0, ToggledOn=False),
+            )),
+            system_registry=dict(water=dict(n_particles=2, positions=[[0.0, 0.5, 1.0], [1, 2, 3]], names=["a", "b"])),
+        ),
+    )
+    fpath = os.path.join(tmp_path, "scene.json")
+    with open(fpath, "w+") as f:
+        json.dump(scene_info, f)
+
+    # The sidecar should be used automatically, with the numerical state lists stored as arrays
+    assert convert_scene_file(fpath) == get_sidecar_path(fpath)
+    scene_file = get_scene_file(fpath)
+    assert scene_file.is_snapshot
+    state = scene_file.load(keys=["state"])["state"]
+    assert isinstance(state["object_registry"]["apple"]["root_link"]["pos"], np.ndarray)
+    assert state["system_registry"]["water"]["positions"].shape == (2, 3)
+    assert state["system_registry"]["water"]["names"] == ["a", "b"]
+    assert state["object_registry"]["apple"]["non_kinematic_states"]["ToggledOn"] is False
+    assert load_scene_info(fpath, keys=["init_info"]) == dict(init_info=scene_info["init_info"])
+
+    # Object states should only be loaded once they are accessed
+    object_states = scene_file.load_lazy("state/object_registry")
+    assert list(object_states.keys()) == ["apple"] and len(object_states._loaded) == 0
+    assert np.array_equal(object_states["apple"]["root_link"]["ori"], [0, 0, 0, 1])
+    assert len(scene_file.load_lazy("state/nonexistent")) == 0
+
+    # Outdated sidecars should be ignored
+    os.utime(get_sidecar_path(fpath), (0, 0))
+    assert not get_scene_file(fpath).is_snapshot
@@ -6,6 +6,7 @@ from omnigibson.utils.physx_utils import apply_force_at_pos, apply_torque
 import omnigibson.utils.transform_utils as T
 from omnigibson.utils.usd_utils import BoundingBoxAPI
 from omnigibson.objects import DatasetObject
+from omnigibson.transition_rules import BlenderRule, ObjectCandidateIndex, TransitionRuleAPI, RULES_REGISTRY
 import omnigibson as og
 
 from utils import og_test, get_random_pose, place_objA_on_objB_bbox, place_obj_on_floor_plane
@@ -99,3 +100,110 @@ def test_cooking_rule():
     if dough_exists:
         og.sim.remove_object(dough)
     og.sim.remove_object(sheet)
+
+
+@og_test
+def test_recipe_cache_container_filled():
+    blender = og.sim.scene.object_registry("name", "blender")
+
+    blender.set_orientation([0, 0, 0, 1])
+    place_obj_on_floor_plane(blender)
+    og.sim.step()
+
+    # The recipe's systems start outside of the blender
+    milk = get_system("whole_milk")
+    chocolate_sauce = get_system("chocolate_sauce")
+    milkshake = get_system("milkshake")
+    milk.generate_particles(positions=np.array([[1.0, 1.0, 0.05]]))
+    chocolate_sauce.generate_particles(positions=np.array([[1.0, 1.2, 0.05]]))
+
+    ice_cream = DatasetObject(
+        name="ice_cream",
+        category="scoop_of_ice_cream",
+        model="dodndj",
+        bounding_box=[0.076, 0.077, 0.065],
+    )
+    og.sim.import_object(ice_cream)
+    ice_cream.set_position([0, 0, 0.52])
+
+    # Let the ice cream settle within the blender
+    for i in range(30):
+        og.sim.step()
+    ice_cream.keep_still()
+
+    try:
+        object_candidates = BlenderRule.get_object_candidates(index=ObjectCandidateIndex(objects=og.sim.scene.objects))
+        BlenderRule.refresh(object_candidates=object_candidates)
+        assert blender in object_candidates["container"]
+
+        # No recipe is executable yet, which should be cached for the blender
+        global_info = BlenderRule._compute_global_rule_info(object_candidates=object_candidates)
+        name, _ = BlenderRule._find_executable_recipe(
+            object_candidates=object_candidates,
+            container=blender,
+            global_info=global_info,
+        )
+        assert name is None
+        assert BlenderRule._CONTAINER_RECIPES[blender][1] is None
+
+        # Pour the systems into the blender, without changing any system's number of particles
+        n_particles = (milk.n_particles, chocolate_sauce.n_particles)
+        milk.set_particles_position_orientation(positions=np.array([[0, 0.02, 0.47]]))
+        chocolate_sauce.set_particles_position_orientation(positions=np.array([[0, -0.02, 0.47]]))
+        for i in range(5):
+            og.sim.step()
+        assert (milk.n_particles, chocolate_sauce.n_particles) == n_particles
+        assert blender.states[Contains].get_value(milk) and blender.states[Contains].get_value(chocolate_sauce)
+
+        # Only the contained systems should have changed the blender's contents signature
+        assert blender in BlenderRule._CONTAINER_RECIPES
+        cached_signature = BlenderRule._CONTAINER_RECIPES[blender][0]
+        signature = BlenderRule._compute_container_contents_signature(
+            container=blender,
+            global_info=BlenderRule._compute_global_rule_info(object_candidates=object_candidates),
+        )
+        changed = [i for i, (a, b) in enumerate(zip(cached_signature, signature)) if a != b]
+        assert changed == [4]
+
+        # The cached miss should be invalidated, so the recipe executes now
+        assert milkshake.n_particles == 0
+        BlenderRule.transition(object_candidates=object_candidates)
+        assert milk.n_particles == 0
+        assert chocolate_sauce.n_particles == 0
+        assert milkshake.n_particles > 0
+    finally:
+        # Remove objects and systems from recipe output
+        milkshake.remove_all_particles()
+        if og.sim.scene.object_registry("name", "ice_cream") is not None:
+            og.sim.remove_object(obj=ice_cream)
+
+
+@og_test
+def test_rule_candidate_index():
+    def check_candidates():
+        objects = og.sim.scene.objects
+        index = ObjectCandidateIndex(objects=objects)
+        for rule in RULES_REGISTRY.objects:
+            # Candidates inferred from the index should match evaluating every filter over all objects
+            candidates = rule.get_object_candidates(index=index)
+            for filter_name, f in rule.candidate_filters.items():
+                assert candidates[filter_name] == [obj for obj in objects if f(obj)]
+                # Incrementally updated candidates should match as well
+                if rule in TransitionRuleAPI._RULE_CANDIDATES:
+                    assert set(TransitionRuleAPI._RULE_CANDIDATES[rule][filter_name]) == set(candidates[filter_name])
+
+    check_candidates()
+
+    sheet = DatasetObject(
+        name="sheet",
+        category="baking_sheet",
+        model="yhurut",
+        bounding_box=[0.520, 0.312, 0.0395],
+    )
+    og.sim.import_object(sheet)
+    sheet.set_position_orientation([5.0, 5.0, 0.1], [0, 0, 0, 1])
+    og.sim.step()
+    check_candidates()
+
+    og.sim.remove_object(sheet)
+    check_candidates()